@@ -3,6 +3,7 @@ from utils.emojis import *
 from utils.format import IsSeperateBot
 from utils.ui import BasicPaginator
 from utils.HelpEmbeds import NotYourPanel
+from utils.config import LoadConfig, SavePanel
 
 
 class PermissionsDropdown(discord.ui.Select):
@@ -209,7 +210,7 @@ class RemoveCommands(discord.ui.Select):
         if interaction.user.id != self.author.id:
             return await interaction.followup.send(embed=NotYourPanel(), ephemeral=True)
 
-        config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        config = await LoadConfig(interaction.client, interaction.guild.id)
 
         if config is None or "Advanced Permissions" not in config:
             return await interaction.followup.send(
@@ -219,9 +220,8 @@ class RemoveCommands(discord.ui.Select):
         for command in self.values:
             if command in config["Advanced Permissions"]:
                 del config["Advanced Permissions"][command]
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": config}
-        )
+        if await SavePanel(interaction, config) is None:
+            return
         await interaction.edit_original_response(
             content=f"{tick} **{interaction.user.display_name},** I've successfully reset advanced permissions.",
             view=None,
@@ -334,7 +334,7 @@ class RoleSelect(discord.ui.RoleSelect):
         if interaction.user.id != self.author.id:
             return await interaction.followup.send(embed=NotYourPanel(), ephemeral=True)
 
-        config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        config = await LoadConfig(interaction.client, interaction.guild.id)
 
         if config is None:
             config = {"_id": interaction.guild.id, "Advanced Permissions": {}}
@@ -348,9 +348,8 @@ class RoleSelect(discord.ui.RoleSelect):
                 [role.id for role in self.values]
             )
 
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": config}
-        )
+        if await SavePanel(interaction, config) is None:
+            return
         await interaction.edit_original_response(
             content=f"{tick} **{interaction.user.display_name},** I've successfully updated advanced permissions.",
             view=None,
@@ -347,7 +347,7 @@ class NoEmbed(discord.ui.View):
 
             return await interaction.followup.send(embed=NotYourPanel(), ephemeral=True)
         try:
-            await interaction.client.config.delete_one(
+            await interaction.client.db["Customisation"].delete_one(
                 {"guild_id": interaction.guild.id, "type": self.typed}
             )
             if self.typed == "Promotions":
@@ -757,6 +757,9 @@ class Embed(discord.ui.View):
             await interaction.client.db["Customisation"].delete_one(
                 {"guild_id": interaction.guild.id, "type": self.typed}
             )
+            interaction.client.dispatch(
+                "customisation_update", interaction.guild.id, self.typed
+            )
             if self.typed == "Promotions":
                 from Cogs.Configuration.Components.Promotions import (
                     PSelect,
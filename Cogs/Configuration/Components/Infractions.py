@@ -10,6 +10,7 @@ from utils.HelpEmbeds import NotYourPanel
 from utils.format import IsSeperateBot
 from utils.permissions import premium
 from utils.HelpEmbeds import NoPremium, Support
+from utils.config import LoadConfig, SavePanel
 
 
 class InfractionOption(discord.ui.Select):
@@ -371,7 +372,7 @@ class ApprovalChannel(discord.ui.ChannelSelect):
 
             return await interaction.followup.send(embed=NotYourPanel(), ephemeral=True)
 
-        config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        config = await LoadConfig(interaction.client, interaction.guild.id)
         if config is None:
             config = {"_id": interaction.guild.id, "Infraction": {}}
         elif "Infraction" not in config:
@@ -382,12 +383,9 @@ class ApprovalChannel(discord.ui.ChannelSelect):
         config["Infraction"]["Approval"]["channel"] = (
             self.values[0].id if self.values else None if self.values else None
         )
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": config}
-        )
-        Updated = await interaction.client.config.find_one(
-            {"_id": interaction.guild.id}
-        )
+        Updated = await SavePanel(interaction, config)
+        if Updated is None:
+            return
 
         await interaction.edit_original_response(content=None)
         try:
@@ -424,7 +422,7 @@ class ApprovalRole(discord.ui.RoleSelect):
         if interaction.user.id != self.author.id:
             return await interaction.followup.send(embed=NotYourPanel(), ephemeral=True)
 
-        config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        config = await LoadConfig(interaction.client, interaction.guild.id)
         if config is None:
             config = {"_id": interaction.guild.id, "Infraction": {}}
         elif "Infraction" not in config:
@@ -435,12 +433,9 @@ class ApprovalRole(discord.ui.RoleSelect):
         config["Infraction"]["Approval"]["Ping"] = (
             self.values[0].id if self.values else None if self.values else None
         )
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": config}
-        )
-        Updated = await interaction.client.config.find_one(
-            {"_id": interaction.guild.id}
-        )
+        Updated = await SavePanel(interaction, config)
+        if Updated is None:
+            return
 
         await interaction.edit_original_response(content=None)
         try:
@@ -519,7 +514,7 @@ class AddAndRemove(discord.ui.Modal, title="Preset Reasons"):
         if interaction.user.id != self.author.id:
             return await interaction.followup.send(embed=NotYourPanel(), ephemeral=True)
 
-        Config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        Config = await LoadConfig(interaction.client, interaction.guild.id)
         if not Config:
             Config = {
                 "Infraction": {},
@@ -544,9 +539,8 @@ class AddAndRemove(discord.ui.Modal, title="Preset Reasons"):
                 )
                 return await interaction.followup.send(embed=embed, ephemeral=True)
             Config["Infraction"]["reasons"].remove(self.reason.value)
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": Config}
-        )
+        if await SavePanel(interaction, Config) is None:
+            return
         await interaction.edit_original_response(
             content=f"{tick} **{interaction.user.display_name}**, {self.reason.value} has been {'added' if self.type == 'add' else 'removed'} to the preset reasons!",
             view=None,
@@ -569,7 +563,7 @@ class Preferences(discord.ui.View):
     async def ToggleOption(
         self, interaction: discord.Interaction, button: discord.ui.Button, Option: str
     ):
-        Config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        Config = await LoadConfig(interaction.client, interaction.guild.id)
         if not Config:
             Config = {
                 "Infraction": {},
@@ -587,9 +581,8 @@ class Preferences(discord.ui.View):
             button.style = discord.ButtonStyle.green
             button.label = button.label.replace("(Disabled)", "(Enabled)")
 
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": Config}
-        )
+        if await SavePanel(interaction, Config) is None:
+            return
         await interaction.response.edit_message(view=self)
 
     @discord.ui.button(
@@ -745,7 +738,7 @@ class InfractionTypeModal(discord.ui.Modal, title="Infraction Type"):
             Value = self.name.component.values[0]
         print(Value)
 
-        config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        config = await LoadConfig(interaction.client, interaction.guild.id)
         if config is None:
             config = {"_id": interaction.guild.id, "Infraction": {}}
         elif "Infraction" not in config:
@@ -773,12 +766,9 @@ class InfractionTypeModal(discord.ui.Modal, title="Infraction Type"):
                     return await interaction.followup.send(embed=embed, ephemeral=True)
                 config["Infraction"]["types"].remove(Value)
         view = discord.ui.View()
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": config}
-        )
-        Updated = await interaction.client.config.find_one(
-            {"_id": interaction.guild.id}
-        )
+        Updated = await SavePanel(interaction, config)
+        if Updated is None:
+            return
         if self.type == "add":
             view = NoThanks()
             view.add_item(InfractionTypesAction(self.author, Value))
@@ -852,7 +842,7 @@ class InfractionChannel(discord.ui.ChannelSelect):
         if interaction.user.id != self.author.id:
             return await interaction.followup.send(embed=NotYourPanel(), ephemeral=True)
 
-        config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        config = await LoadConfig(interaction.client, interaction.guild.id)
         if config is None:
             config = {"_id": interaction.guild.id, "Infraction": {}}
         elif "Infraction" not in config:
@@ -861,12 +851,9 @@ class InfractionChannel(discord.ui.ChannelSelect):
             config["Infraction"]["channel"] = None
 
         config["Infraction"]["channel"] = self.values[0].id if self.values else None
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": config}
-        )
-        Updated = await interaction.client.config.find_one(
-            {"_id": interaction.guild.id}
-        )
+        Updated = await SavePanel(interaction, config)
+        if Updated is None:
+            return
 
         await interaction.edit_original_response(content=None)
         try:
@@ -934,7 +921,7 @@ class WebhookToggle(discord.ui.Select):
         if interaction.user.id != self.author.id:
             return await interaction.followup.send(embed=NotYourPanel(), ephemeral=True)
 
-        Config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        Config = await LoadConfig(interaction.client, interaction.guild.id)
         if not Config:
             Config = {"Infraction": {}, "_id": interaction.guild.id}
 
@@ -949,18 +936,16 @@ class WebhookToggle(discord.ui.Select):
         selection = self.values[0]
         if selection == "enable":
             Config["Infraction"]["Webhook"]["Enabled"] = True
-            await interaction.client.config.update_one(
-                {"_id": interaction.guild.id}, {"$set": Config}
-            )
+            if await SavePanel(interaction, Config) is None:
+                return
             await interaction.edit_original_response(
                 embed=await WebhookEmbed(interaction, Config)
             )
 
         elif selection == "disable":
             Config["Infraction"]["Webhook"]["Enabled"] = False
-            await interaction.client.config.update_one(
-                {"_id": interaction.guild.id}, {"$set": Config}
-            )
+            if await SavePanel(interaction, Config) is None:
+                return
 
             await interaction.edit_original_response(
                 embed=await WebhookEmbed(interaction, Config)
@@ -1000,7 +985,7 @@ class WebhookDesign(discord.ui.Modal):
             return await interaction.followup.send(embed=NotYourPanel(), ephemeral=True)
         if not await premium(interaction.guild.id):
             return await interaction.followup.send(embed=NoPremium(), view=Support())
-        Config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        Config = await LoadConfig(interaction.client, interaction.guild.id)
         if Config is None:
             Config = {"_id": interaction.guild.id, "Infraction": {"Webhook": {}}}
         if "Infraction" not in Config:
@@ -1022,9 +1007,8 @@ class WebhookDesign(discord.ui.Modal):
             "Username": self.username.value,
             "Avatar": self.AvatarURL.value,
         }
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": Config}
-        )
+        if await SavePanel(interaction, Config) is None:
+            return
         await interaction.edit_original_response(
             embed=await WebhookEmbed(interaction, Config)
         )
@@ -1053,17 +1037,14 @@ class LogChannel(discord.ui.ChannelSelect):
         if interaction.user.id != self.author.id:
             return await interaction.followup.send(embed=NotYourPanel(), ephemeral=True)
 
-        config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        config = await LoadConfig(interaction.client, interaction.guild.id)
         if self.values:
             config["Infraction"]["LogChannel"] = self.values[0].id
         else:
             config["Infraction"].pop("LogChannel", None)
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": config}
-        )
-        Updated = await interaction.client.config.find_one(
-            {"_id": interaction.guild.id}
-        )
+        Updated = await SavePanel(interaction, config)
+        if Updated is None:
+            return
 
         await interaction.edit_original_response(content=None)
         try:
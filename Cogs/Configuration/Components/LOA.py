@@ -1,6 +1,7 @@
 import discord
 from utils.emojis import *
 from utils.HelpEmbeds import NotYourPanel
+from utils.config import LoadConfig, SavePanel
 
 
 class LOAOptions(discord.ui.Select):
@@ -106,7 +107,7 @@ class LogChannel(discord.ui.ChannelSelect):
                 embed=NotYourPanel(), ephemeral=True
             )
 
-        config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        config = await LoadConfig(interaction.client, interaction.guild.id)
         if config is None:
             config = {"_id": interaction.guild.id, "LOA": {}}
         elif "LOA" not in config:
@@ -118,12 +119,9 @@ class LogChannel(discord.ui.ChannelSelect):
         else:
             config["LOA"].pop("LogChannel", None)
 
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": config}
-        )
-        Updated = await interaction.client.config.find_one(
-            {"_id": interaction.guild.id}
-        )
+        Updated = await SavePanel(interaction, config)
+        if Updated is None:
+            return
 
         await interaction.response.edit_message(content=None)
         try:
@@ -164,19 +162,16 @@ class LOAChannel(discord.ui.ChannelSelect):
                 embed=NotYourPanel(), ephemeral=True
             )
 
-        config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        config = await LoadConfig(interaction.client, interaction.guild.id)
         if config is None:
             config = {"_id": interaction.guild.id, "LOA": {}}
         elif "LOA" not in config:
             config["LOA"] = {}
 
         config["LOA"]["channel"] = self.values[0].id if self.values else None
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": config}
-        )
-        Updated = await interaction.client.config.find_one(
-            {"_id": interaction.guild.id}
-        )
+        Updated = await SavePanel(interaction, config)
+        if Updated is None:
+            return
 
         await interaction.response.edit_message(content=None)
         try:
@@ -213,19 +208,16 @@ class LOARole(discord.ui.RoleSelect):
                 embed=NotYourPanel(), ephemeral=True
             )
 
-        config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        config = await LoadConfig(interaction.client, interaction.guild.id)
         if config is None:
             config = {"_id": interaction.guild.id, "LOA": {}}
         elif "LOA" not in config:
             config["LOA"] = {}
 
         config["LOA"]["role"] = self.values[0].id if self.values else None
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": config}
-        )
-        Updated = await interaction.client.config.find_one(
-            {"_id": interaction.guild.id}
-        )
+        Updated = await SavePanel(interaction, config)
+        if Updated is None:
+            return
         await interaction.response.edit_message(content=None)
         try:
             await self.message.edit(
@@ -4,6 +4,7 @@ from datetime import datetime, timedelta
 from utils.ui import BasicPaginator
 from utils.format import IsSeperateBot
 from utils.HelpEmbeds import NotYourPanel
+from utils.config import LoadConfig, SavePanel
 
 
 class QuotaOptions(discord.ui.Select):
@@ -140,9 +141,7 @@ class IgnoredChannels(discord.ui.ChannelSelect):
                 ephemeral=True,
             )
 
-        Config = await interaction.client.config.find_one(
-            {"_id": interaction.guild.id}
-        ) or {
+        Config = await LoadConfig(interaction.client, interaction.guild.id) or {
             "Message Quota": {"Ignored Channels": []},
             "_id": interaction.guild.id,
         }
@@ -164,12 +163,9 @@ class IgnoredChannels(discord.ui.ChannelSelect):
             if channel.id not in Config["Message Quota"]["Ignored Channels"]
         ]
 
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": Config}, upsert=True
-        )
-        Updated = await interaction.client.config.find_one(
-            {"_id": interaction.guild.id}
-        )
+        Updated = await SavePanel(interaction, Config)
+        if Updated is None:
+            return
         view = discord.ui.View()
         view.add_item(QuotaOptions(interaction.user))
         await interaction.response.edit_message(view=view)
@@ -316,9 +312,7 @@ class RoleQuotaModal(discord.ui.Modal):
                 ephemeral=True,
             )
 
-        config = await interaction.client.db["Config"].find_one(
-            {"_id": interaction.guild.id}
-        )
+        config = await LoadConfig(interaction.client, interaction.guild.id)
         if not config:
             config = {"_id": interaction.guild.id, "Message Quota": {"Roles": []}}
         elif "Message Quota" not in config:
@@ -335,9 +329,8 @@ class RoleQuotaModal(discord.ui.Modal):
         else:
             roles.append({"ID": self.Role.id, "Quota": self.RoleQuota.value})
 
-        await interaction.client.db["Config"].update_one(
-            {"_id": interaction.guild.id}, {"$set": config}, upsert=True
-        )
+        if await SavePanel(interaction, config) is None:
+            return
         await interaction.response.edit_message(
             view=None,
             content=f"{tick} **{interaction.user.display_name},** successfully added the role quota.",
@@ -358,9 +351,7 @@ class RoleQuotaDelete(discord.ui.Select):
                 ephemeral=True,
             )
 
-        config = await interaction.client.db["Config"].find_one(
-            {"_id": interaction.guild.id}
-        )
+        config = await LoadConfig(interaction.client, interaction.guild.id)
         if (
             not config
             or "Message Quota" not in config
@@ -374,9 +365,8 @@ class RoleQuotaDelete(discord.ui.Select):
         Roles = [r for r in roles if str(r["ID"]) not in self.values]
         config["Message Quota"]["Roles"] = Roles
 
-        await interaction.client.db["Config"].update_one(
-            {"_id": interaction.guild.id}, {"$set": config}, upsert=True
-        )
+        if await SavePanel(interaction, config) is None:
+            return
         await interaction.edit_original_response(
             view=None,
             content=f"{tick} **{interaction.user.display_name},** successfully deleted the role quota.",
@@ -408,18 +398,15 @@ class MessageQuota(discord.ui.Modal, title="Message Quota"):
                 content=f"{redx} **{interaction.user.display_name},** please enter a valid number.",
                 ephemeral=True,
             )
-        Config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        Config = await LoadConfig(interaction.client, interaction.guild.id)
         if not Config:
             Config = {"Message Quota": {}, "_id": interaction.guild.id}
         if not Config.get("Message Quota"):
             Config["Message Quota"] = {}
         Config["Message Quota"]["quota"] = int(self.Quota.value)
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": Config}, upsert=True
-        )
-        Updated = await interaction.client.config.find_one(
-            {"_id": interaction.guild.id}
-        )
+        Updated = await SavePanel(interaction, Config)
+        if Updated is None:
+            return
         await interaction.edit_original_response(content="")
         try:
             await self.message.edit(
@@ -457,14 +444,15 @@ class ModcasesQuota(discord.ui.Modal, title="Modcases Quota"):
                 content=f"{redx} **{interaction.user.display_name},** please enter a valid number.",
                 ephemeral=True,
             )
-        Config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        Config = await LoadConfig(interaction.client, interaction.guild.id)
         if not Config:
             Config = {"Modcases Quota": {}, "_id": interaction.guild.id}
         if not Config.get("Modcases Quota"):
             Config["Modcases Quota"] = {}
         Config["Modcases Quota"]["quota"] = int(self.Quota.value)
-        await interaction.client.config.update_one({"_id": interaction.guild.id}, {"$set": Config}, upsert=True)
-        Updated = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        Updated = await SavePanel(interaction, Config)
+        if Updated is None:
+            return
         await interaction.edit_original_response(content="")
         try:
             # reuse MessageQuotaEmbed to show updated config; it will still display message quota but we'll update that to include modcases later
@@ -887,9 +875,7 @@ class ModcasesRoleQuotaModal(discord.ui.Modal):
                 ephemeral=True,
             )
 
-        config = await interaction.client.db["Config"].find_one(
-            {"_id": interaction.guild.id}
-        )
+        config = await LoadConfig(interaction.client, interaction.guild.id)
         if not config:
             config = {"_id": interaction.guild.id, "Modcases Quota": {"Roles": []}}
         elif "Modcases Quota" not in config:
@@ -906,9 +892,8 @@ class ModcasesRoleQuotaModal(discord.ui.Modal):
         else:
             roles.append({"ID": self.Role.id, "Quota": self.RoleQuota.value})
 
-        await interaction.client.db["Config"].update_one(
-            {"_id": interaction.guild.id}, {"$set": config}, upsert=True
-        )
+        if await SavePanel(interaction, config) is None:
+            return
         await interaction.response.edit_message(
             view=None,
             content=f"{tick} **{interaction.user.display_name},** successfully added the modcases role quota.",
@@ -929,9 +914,7 @@ class ModcasesRoleQuotaDelete(discord.ui.Select):
                 ephemeral=True,
             )
 
-        config = await interaction.client.db["Config"].find_one(
-            {"_id": interaction.guild.id}
-        )
+        config = await LoadConfig(interaction.client, interaction.guild.id)
         if (
             not config
             or "Modcases Quota" not in config
@@ -945,9 +928,8 @@ class ModcasesRoleQuotaDelete(discord.ui.Select):
         Roles = [r for r in roles if str(r["ID"]) not in self.values]
         config["Modcases Quota"]["Roles"] = Roles
 
-        await interaction.client.db["Config"].update_one(
-            {"_id": interaction.guild.id}, {"$set": config}, upsert=True
-        )
+        if await SavePanel(interaction, config) is None:
+            return
         await interaction.edit_original_response(
             view=None,
             content=f"{tick} **{interaction.user.display_name},** successfully deleted the modcases role quota.",
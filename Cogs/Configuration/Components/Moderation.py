@@ -1,6 +1,7 @@
 import discord
 from utils.emojis import *
 from utils.HelpEmbeds import NotYourPanel, BotNotConfigured
+from utils.config import PatchConfig
 
 
 class ModerationOption(discord.ui.Select):
@@ -151,14 +152,10 @@ class RoleSelector(discord.ui.RoleSelect):
         db_key = key_mapping.get(self.config_key, self.config_key)
         
         try:
-            await interaction.client.config.update_one(
-                {"_id": interaction.guild.id},
-                {
-                    "$set": {
-                        f"moderation.{db_key}": selected_role.id
-                    }
-                },
-                upsert=True,
+            await PatchConfig(
+                interaction.client,
+                interaction.guild.id,
+                Set={f"moderation.{db_key}": selected_role.id},
             )
             await interaction.followup.send(
                 f"{tick} {self.label_text} set to {selected_role.mention}",
@@ -208,14 +205,10 @@ class ChannelSelector(discord.ui.ChannelSelect):
         db_key = key_mapping.get(self.config_key, self.config_key)
         
         try:
-            await interaction.client.config.update_one(
-                {"_id": interaction.guild.id},
-                {
-                    "$set": {
-                        f"moderation.{db_key}": selected_channel.id
-                    }
-                },
-                upsert=True,
+            await PatchConfig(
+                interaction.client,
+                interaction.guild.id,
+                Set={f"moderation.{db_key}": selected_channel.id},
             )
             await interaction.followup.send(
                 f"{tick} {self.label_text} set to {selected_channel.mention}",
@@ -6,6 +6,7 @@ import traceback
 from utils.emojis import *
 from utils.HelpEmbeds import NotYourPanel
 from utils.permissions import premium
+from utils.config import LoadConfig, SavePanel
 
 
 class ModmailOptions(discord.ui.Select):
@@ -235,18 +236,15 @@ class ThreadsChannel(discord.ui.ChannelSelect):
         if interaction.user.id != self.author.id:
 
             return await interaction.followup.send(embed=NotYourPanel(), ephemeral=True)
-        config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        config = await LoadConfig(interaction.client, interaction.guild.id)
         if not config:
             config = {"Modmail": {}, "_id": interaction.guild.id}
         if not config.get("Modmail"):
             config["Modmail"] = {}
         config["Modmail"]["threads"] = self.values[0].id if self.values else None
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": config}, upsert=True
-        )
-        Updated = await interaction.client.config.find_one(
-            {"_id": interaction.guild.id}
-        )
+        Updated = await SavePanel(interaction, config)
+        if Updated is None:
+            return
         await interaction.edit_original_response(content=None)
         try:
             await self.message.edit(
@@ -269,7 +267,7 @@ class Preferences(discord.ui.View):
     async def ToggleOption(
         self, interaction: discord.Interaction, button: discord.ui.Button, Option: str
     ):
-        config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        config = await LoadConfig(interaction.client, interaction.guild.id)
         if not config:
             config = {"Module Options": {}, "_id": interaction.guild.id}
         if not config.get("Module Options"):
@@ -294,9 +292,8 @@ class Preferences(discord.ui.View):
                 button.label = "Use Messages (Enabled)"
                 button.style = discord.ButtonStyle.green
 
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": config}
-        )
+        if await SavePanel(interaction, config) is None:
+            return
         await interaction.response.edit_message(view=self)
 
     @discord.ui.button(label="Auto Message (Disabled)", style=discord.ButtonStyle.red)
@@ -353,15 +350,14 @@ class SelectModmailType(discord.ui.Select):
             )
         from Cogs.Configuration.Configuration import ConfigMenu, Options
 
-        config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        config = await LoadConfig(interaction.client, interaction.guild.id)
         if not config:
             config = {"Module Options": {}, "_id": interaction.guild.id}
         if not config.get("Module Options"):
             config["Module Options"] = {}
         config["Module Options"]["ModmailType"] = self.values[0]
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": config}
-        )
+        if await SavePanel(interaction, config) is None:
+            return
         await interaction.response.edit_message(
             content=f"{tick} {interaction.user.display_name}, the modmail type has been updated to {self.values[0]}.",
             view=None,
@@ -466,7 +462,7 @@ class DeleteCategory(discord.ui.Modal):
             )
             return await interaction.response.send_message(embed=embed, ephemeral=True)
         name = self.children[0].value
-        config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        config = await LoadConfig(interaction.client, interaction.guild.id)
         if not config:
             config = {"Modmail": {}, "_id": interaction.guild.id}
         if not config.get("Modmail"):
@@ -484,9 +480,8 @@ class DeleteCategory(discord.ui.Modal):
             )
             return await interaction.response.send_message(embed=embed, ephemeral=True)
         del config["Modmail"]["Categories"][name]
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": config}
-        )
+        if await SavePanel(interaction, config) is None:
+            return
         await interaction.response.edit_message(
             content=f"{tick} **{interaction.user.display_name},** the category `{name}` has been deleted.",
             view=None,
@@ -600,7 +595,7 @@ class NoThanks(discord.ui.View):
             )
             return await interaction.response.send_message(embed=embed, ephemeral=True)
 
-        config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        config = await LoadConfig(interaction.client, interaction.guild.id)
         if not config:
             config = {"Modmail": {}, "_id": interaction.guild.id}
         if not config.get("Modmail"):
@@ -615,9 +610,8 @@ class NoThanks(discord.ui.View):
             return await interaction.response.send_message(embed=embed, ephemeral=True)
 
         config["Modmail"]["Categories"].append(self.name)
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": config}
-        )
+        if await SavePanel(interaction, config) is None:
+            return
 
         await interaction.response.edit_message(
             content=f"{tick} **{interaction.user.display_name}**, No problem! I've created the modmail category for you!",
@@ -673,7 +667,7 @@ class Threads(discord.ui.ChannelSelect):
                 color=discord.Colour.brand_red(),
             )
             return await interaction.response.send_message(embed=embed, ephemeral=True)
-        config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        config = await LoadConfig(interaction.client, interaction.guild.id)
         if not config:
             config = {"Modmail": {}, "_id": interaction.guild.id}
         if "Modmail" not in config:
@@ -685,9 +679,8 @@ class Threads(discord.ui.ChannelSelect):
         config["Modmail"]["Categories"][self.name]["threads"] = (
             self.values[0].id if self.values else None
         )
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": config}
-        )
+        if await SavePanel(interaction, config) is None:
+            return
         await interaction.response.edit_message(
             content=f"{tick} **{interaction.user.display_name},** Successfully set threads channel for `{self.name}`.",
             view=None,
@@ -710,7 +703,7 @@ class TranscriptChannel(discord.ui.ChannelSelect):
                 color=discord.Colour.brand_red(),
             )
             return await interaction.response.send_message(embed=embed, ephemeral=True)
-        config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        config = await LoadConfig(interaction.client, interaction.guild.id)
         if not config:
             config = {"Modmail": {}, "_id": interaction.guild.id}
         if "Modmail" not in config:
@@ -722,9 +715,8 @@ class TranscriptChannel(discord.ui.ChannelSelect):
         config["Modmail"]["Categories"][self.name]["transcript"] = (
             self.values[0].id if self.values else None
         )
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": config}
-        )
+        if await SavePanel(interaction, config) is None:
+            return
         await interaction.response.edit_message(
             content=f"{tick} **{interaction.user.display_name},** Successfully set transcript channel for `{self.name}`.",
             view=None,
@@ -747,7 +739,7 @@ class CategoryChannel(discord.ui.ChannelSelect):
                 color=discord.Colour.brand_red(),
             )
             return await interaction.response.send_message(embed=embed, ephemeral=True)
-        config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        config = await LoadConfig(interaction.client, interaction.guild.id)
         if not config:
             config = {"Modmail": {}, "_id": interaction.guild.id}
         if "Modmail" not in config:
@@ -759,9 +751,8 @@ class CategoryChannel(discord.ui.ChannelSelect):
         config["Modmail"]["Categories"][self.name]["category"] = (
             self.values[0].id if self.values else None
         )
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": config}
-        )
+        if await SavePanel(interaction, config) is None:
+            return
         await interaction.response.edit_message(
             content=f"{tick} **{interaction.user.display_name},** Successfully set category for `{self.name}`.",
             view=None,
@@ -781,7 +772,7 @@ class PingRoles(discord.ui.RoleSelect):
                 color=discord.Colour.brand_red(),
             )
             return await interaction.response.send_message(embed=embed, ephemeral=True)
-        config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        config = await LoadConfig(interaction.client, interaction.guild.id)
         if not config:
             config = {"Modmail": {}, "_id": interaction.guild.id}
         if "Modmail" not in config:
@@ -793,9 +784,8 @@ class PingRoles(discord.ui.RoleSelect):
         config["Modmail"]["Categories"][self.name]["ping"] = [
             role.id for role in self.values
         ]
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": config}
-        )
+        if await SavePanel(interaction, config) is None:
+            return
         await interaction.response.edit_message(
             content=f"{tick} **{interaction.user.display_name},** Successfully set ping roles for `{self.name}`.",
             view=None,
@@ -822,7 +812,7 @@ class ModmailPings(discord.ui.RoleSelect):
             return await interaction.response.send_message(
                 embed=NotYourPanel(), ephemeral=True
             )
-        config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        config = await LoadConfig(interaction.client, interaction.guild.id)
         if not config:
             config = {"Modmail": {}, "_id": interaction.guild.id}
         if not config.get("Modmail"):
@@ -831,12 +821,9 @@ class ModmailPings(discord.ui.RoleSelect):
             config["Modmail"]["ping"] = [role.id for role in self.values]
         else:
             config["Modmail"].pop("ping", None)
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": config}, upsert=True
-        )
-        Updated = await interaction.client.config.find_one(
-            {"_id": interaction.guild.id}
-        )
+        Updated = await SavePanel(interaction, config)
+        if Updated is None:
+            return
         try:
             await self.message.edit(
                 embed=await ModmailEmbed(
@@ -865,20 +852,15 @@ class Category(discord.ui.ChannelSelect):
                 embed=NotYourPanel(), ephemeral=True
             )
         try:
-            config = await interaction.client.config.find_one(
-                {"_id": interaction.guild.id}
-            )
+            config = await LoadConfig(interaction.client, interaction.guild.id)
             if not config:
                 config = {"Modmail": {}, "_id": interaction.guild.id}
             if not config.get("Modmail"):
                 config["Modmail"] = {}
             config["Modmail"]["category"] = self.values[0].id if self.values else None
-            await interaction.client.config.update_one(
-                {"_id": interaction.guild.id}, {"$set": config}, upsert=True
-            )
-            Updated = await interaction.client.config.find_one(
-                {"_id": interaction.guild.id}
-            )
+            Updated = await SavePanel(interaction, config)
+            if Updated is None:
+                return
             await self.message.edit(
                 embed=await ModmailEmbed(
                     interaction,
@@ -906,9 +888,7 @@ class Transcript(discord.ui.ChannelSelect):
             )
         await interaction.response.defer()
         try:
-            config = await interaction.client.config.find_one(
-                {"_id": interaction.guild.id}
-            )
+            config = await LoadConfig(interaction.client, interaction.guild.id)
             if not config:
                 config = {"Modmail": {}, "_id": interaction.guild.id}
             if not config.get("Modmail"):
@@ -917,12 +897,9 @@ class Transcript(discord.ui.ChannelSelect):
             config["Modmail"]["transcripts"] = (
                 self.values[0].id if self.values else None
             )
-            await interaction.client.config.update_one(
-                {"_id": interaction.guild.id}, {"$set": config}, upsert=True
-            )
-            Updated = await interaction.client.config.find_one(
-                {"_id": interaction.guild.id}
-            )
+            Updated = await SavePanel(interaction, config)
+            if Updated is None:
+                return
             await interaction.edit_original_response(content=None)
             try:
                 await self.message.edit(
@@ -1,6 +1,8 @@
 import discord
 from utils.emojis import *
 from utils.HelpEmbeds import NotYourPanel
+from utils.config import LoadConfig, SavePanel
+from utils.membercache import ChunkGuild
 
 
 async def ModuleOptions(Config, data=None):
@@ -228,7 +230,7 @@ class ModuleToggle(discord.ui.Select):
 
         await interaction.response.defer(ephemeral=True)
 
-        config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        config = await LoadConfig(interaction.client, interaction.guild.id)
         if not config:
             config = {"_id": interaction.guild.id, "Modules": {}}
         elif "Modules" not in config:
@@ -241,7 +243,7 @@ class ModuleToggle(discord.ui.Select):
             config["Modules"][module] = True
 
         if "Modmail" in Selected and not interaction.guild.chunked:
-            await interaction.guild.chunk()
+            await ChunkGuild(interaction.guild)
 
         if "promotions" in Selected:
             from Cogs.Modules.promotions import SyncServer
@@ -250,10 +252,9 @@ class ModuleToggle(discord.ui.Select):
             except:
                 pass
 
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": config}, upsert=True
-        )
-        Updated = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        Updated = await SavePanel(interaction, config)
+        if Updated is None:
+            return
 
         view = discord.ui.View()
         view.add_item(ModuleToggle(interaction.user, await ModuleOptions(Updated)))
@@ -1,6 +1,7 @@
 import discord
 from utils.emojis import *
 from utils.HelpEmbeds import NotYourPanel
+from utils.config import LoadConfig, SavePanel
 
 
 class PermissionsUpdate(discord.ui.RoleSelect):
@@ -29,7 +30,7 @@ class PermissionsUpdate(discord.ui.RoleSelect):
                 embed=NotYourPanel(), ephemeral=True
             )
 
-        config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        config = await LoadConfig(interaction.client, interaction.guild.id)
         if config is None:
             config = {"_id": interaction.guild.id, "Permissions": {}}
         elif "Permissions" not in config:
@@ -38,12 +39,9 @@ class PermissionsUpdate(discord.ui.RoleSelect):
             config["Permissions"][self.typed] = [role.id for role in self.values]
         else:
             config["Permissions"].pop(self.typed, None)
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": config}
-        )
-        Updated = await interaction.client.config.find_one(
-            {"_id": interaction.guild.id}
-        )
+        Updated = await SavePanel(interaction, config)
+        if Updated is None:
+            return
         view = discord.ui.View()
         view.add_item(
             PermissionsUpdate(
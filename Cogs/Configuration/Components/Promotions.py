@@ -5,6 +5,7 @@ import re
 import typing
 from utils.permissions import premium
 from utils.HelpEmbeds import NoPremium, Support, NotYourPanel
+from utils.config import LoadConfig, SavePanel
 
 
 class PSelect(discord.ui.Select):
@@ -92,7 +93,7 @@ class PSelect(discord.ui.Select):
             )
             return
         await interaction.response.defer()
-        Config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        Config = await LoadConfig(interaction.client, interaction.guild.id)
         if not Config:
             Config = {
                 "Promo": {},
@@ -371,9 +372,8 @@ class PSelect(discord.ui.Select):
                 ephemeral=True,
                 embed=embed,
             )
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": Config}
-        )
+        if await SavePanel(interaction, Config) is None:
+            return
         await interaction.response.edit_message(view=self, content=None)
 
 
@@ -454,7 +454,7 @@ class LogChannel(discord.ui.ChannelSelect):
                 embed=NotYourPanel(), ephemeral=True
             )
 
-        config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        config = await LoadConfig(interaction.client, interaction.guild.id)
         if config is None:
             config = {"_id": interaction.guild.id, "Promo": {}}
         elif "Promo" not in config:
@@ -463,12 +463,9 @@ class LogChannel(discord.ui.ChannelSelect):
             config["Promo"]["LogChannel"] = None
 
         config["Promo"]["LogChannel"] = self.values[0].id if self.values else None
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": config}
-        )
-        Updated = await interaction.client.config.find_one(
-            {"_id": interaction.guild.id}
-        )
+        Updated = await SavePanel(interaction, config)
+        if Updated is None:
+            return
 
         await interaction.response.edit_message(content=None)
         try:
@@ -502,7 +499,7 @@ class CoolDown(discord.ui.Modal):
             return await interaction.response.send_message(
                 embed=NotYourPanel(), ephemeral=True
             )
-        config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        config = await LoadConfig(interaction.client, interaction.guild.id)
         if config is None:
             config = {"_id": interaction.guild.id, "Promo": {}}
         elif "Promo" not in config:
@@ -510,12 +507,9 @@ class CoolDown(discord.ui.Modal):
         elif "Cooldown" not in config.get("Promo", {}):
             config["Promo"]["Cooldown"] = None
         config["Promo"]["Cooldown"] = self.Days.value if self.Days else None
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": config}
-        )
-        Updated = await interaction.client.config.find_one(
-            {"_id": interaction.guild.id}
-        )
+        Updated = await SavePanel(interaction, config)
+        if Updated is None:
+            return
 
         await interaction.response.edit_message(content=None)
         try:
@@ -538,7 +532,7 @@ class Preferences(discord.ui.View):
     async def ToggleOption(
         self, interaction: discord.Interaction, button: discord.ui.Button, Option: str
     ):
-        Config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        Config = await LoadConfig(interaction.client, interaction.guild.id)
         if not Config:
             Config = {
                 "Infraction": {},
@@ -567,9 +561,8 @@ class Preferences(discord.ui.View):
             elif Option == "autorole":
                 button.label = f"Auto Role ({'Enabled' if Config.get('Module Options', {}).get('autorole', True) else 'Disabled'})"
 
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": Config}
-        )
+        if await SavePanel(interaction, Config) is None:
+            return
         await interaction.response.edit_message(content=None, view=self)
 
     @discord.ui.button(label="Auto Role (Enabled)", style=discord.ButtonStyle.green)
@@ -695,7 +688,7 @@ class SingleHierarchy(discord.ui.RoleSelect):
             )
 
         Selected = [RoleID.id for RoleID in self.values]
-        config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        config = await LoadConfig(interaction.client, interaction.guild.id)
         if not config:
             config = {
                 "_id": interaction.guild.id,
@@ -706,9 +699,8 @@ class SingleHierarchy(discord.ui.RoleSelect):
             config["Promo"]["System"]["single"] = {"Hierarchy": []}
 
         config["Promo"]["System"]["single"]["Hierarchy"] = Selected
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": config}
-        )
+        if await SavePanel(interaction, config) is None:
+            return
 
         await interaction.response.edit_message(
             view=None,
@@ -732,7 +724,7 @@ class ModmailSystem(discord.ui.Select):
         from Cogs.Configuration.Configuration import ConfigMenu, Options
         from Cogs.Modules.promotions import SyncServer
 
-        config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        config = await LoadConfig(interaction.client, interaction.guild.id)
         if not config:
             config = {
                 "_id": interaction.guild.id,
@@ -750,9 +742,8 @@ class ModmailSystem(discord.ui.Select):
                 content=f"{crisis} **{interaction.user.display_name}**, no system type selected.",
                 ephemeral=True,
             )
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": config}
-        )
+        if await SavePanel(interaction, config) is None:
+            return
 
         await interaction.response.edit_message(
             content=f"{tick} **{interaction.user.display_name}**, the promotions system has been updated to {self.values[0]}!",
@@ -865,7 +856,7 @@ class MultiHierarchy(discord.ui.RoleSelect):
             )
 
         Selected = [role.id for role in self.values]
-        config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        config = await LoadConfig(interaction.client, interaction.guild.id)
         if not config:
             config = {
                 "_id": interaction.guild.id,
@@ -882,9 +873,8 @@ class MultiHierarchy(discord.ui.RoleSelect):
                     department["ranks"] = Selected
                     break
 
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": config}
-        )
+        if await SavePanel(interaction, config) is None:
+            return
         await interaction.response.edit_message(
             view=None,
             content=f"{tick} **{interaction.user.display_name}**, the hierarchy for the department `{self.department}` has been updated!",
@@ -906,7 +896,7 @@ class CreateDeleteDepartment(discord.ui.Modal):
         self.add_item(self.name)
 
     async def on_submit(self, interaction: discord.Interaction):
-        config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        config = await LoadConfig(interaction.client, interaction.guild.id)
         if not config:
             config = {
                 "_id": interaction.guild.id,
@@ -934,9 +924,8 @@ class CreateDeleteDepartment(discord.ui.Modal):
                 [{"name": DepartmentName, "ranks": []}]
             )
 
-            await interaction.client.config.update_one(
-                {"_id": interaction.guild.id}, {"$set": config}
-            )
+            if await SavePanel(interaction, config) is None:
+                return
 
             view = discord.ui.View()
             view.add_item(MultiHierarchy(interaction.user, DepartmentName, []))
@@ -958,9 +947,8 @@ class CreateDeleteDepartment(discord.ui.Modal):
                 ]
             ]
 
-            await interaction.client.config.update_one(
-                {"_id": interaction.guild.id}, {"$set": config}
-            )
+            if await SavePanel(interaction, config) is None:
+                return
 
             await interaction.response.edit_message(
                 content=f"{tick} **{interaction.user.display_name}**, the department `{DepartmentName}` has been deleted!",
@@ -995,19 +983,16 @@ class PromotionChannel(discord.ui.ChannelSelect):
                 embed=NotYourPanel(), ephemeral=True
             )
 
-        config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        config = await LoadConfig(interaction.client, interaction.guild.id)
         if config is None:
             config = {"_id": interaction.guild.id, "Promo": {}}
         elif "Promo" not in config:
             config["Promo"] = {}
 
         config["Promo"]["channel"] = self.values[0].id if self.values else None
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": config}
-        )
-        Updated = await interaction.client.config.find_one(
-            {"_id": interaction.guild.id}
-        )
+        Updated = await SavePanel(interaction, config)
+        if Updated is None:
+            return
 
         await interaction.response.edit_message(content=None)
         try:
@@ -1046,7 +1031,7 @@ class WebhookDesign(discord.ui.Modal):
             return await interaction.response.send_message(
                 embed=NoPremium(), view=Support()
             )
-        Config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        Config = await LoadConfig(interaction.client, interaction.guild.id)
         if Config is None:
             Config = {"_id": interaction.guild.id, "Promo": {"Webhook": {}}}
         if "Promo" not in Config:
@@ -1068,9 +1053,8 @@ class WebhookDesign(discord.ui.Modal):
             "Username": self.username.value,
             "Avatar": self.AvatarURL.value,
         }
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": Config}
-        )
+        if await SavePanel(interaction, Config) is None:
+            return
         await interaction.response.edit_message(
             embed=await WebhookEmbed(interaction, Config)
         )
@@ -1097,7 +1081,7 @@ class WebhookToggle(discord.ui.Select):
                 embed=NotYourPanel(), ephemeral=True
             )
 
-        Config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        Config = await LoadConfig(interaction.client, interaction.guild.id)
         if not Config:
             Config = {"Promo": {}, "_id": interaction.guild.id}
         if "Promo" not in Config:
@@ -1111,18 +1095,16 @@ class WebhookToggle(discord.ui.Select):
         if selection == "enable":
 
             Config["Promo"]["Webhook"]["Enabled"] = True
-            await interaction.client.config.update_one(
-                {"_id": interaction.guild.id}, {"$set": Config}
-            )
+            if await SavePanel(interaction, Config) is None:
+                return
             await interaction.response.edit_message(
                 embed=await WebhookEmbed(interaction, Config)
             )
 
         elif selection == "disable":
             Config["Promo"]["Webhook"]["Enabled"] = False
-            await interaction.client.config.update_one(
-                {"_id": interaction.guild.id}, {"$set": Config}
-            )
+            if await SavePanel(interaction, Config) is None:
+                return
 
             await interaction.response.edit_message(
                 embed=await WebhookEmbed(interaction, Config)
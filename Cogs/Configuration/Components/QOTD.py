@@ -4,6 +4,7 @@ from datetime import datetime, timedelta
 import re
 from utils.permissions import premium
 from utils.HelpEmbeds import NoPremium, Support, NotYourPanel
+from utils.config import LoadConfig, SavePanel
 
 
 class QOTDOptions(discord.ui.Select):
@@ -346,7 +347,7 @@ class WebhookDesign(discord.ui.Modal):
             return await interaction.response.send_message(
                 embed=NoPremium(), view=Support()
             )
-        Config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        Config = await LoadConfig(interaction.client, interaction.guild.id)
         if Config is None:
             Config = {"_id": interaction.guild.id, "QOTD": {"Webhook": {}}}
 
@@ -370,9 +371,8 @@ class WebhookDesign(discord.ui.Modal):
             "Username": self.username.value,
             "Avatar": self.AvatarURL.value,
         }
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": Config}
-        )
+        if await SavePanel(interaction, Config) is None:
+            return
         await interaction.response.edit_message(
             embed=await WebhookEmbed(interaction, Config)
         )
@@ -399,7 +399,7 @@ class WebhookToggle(discord.ui.Select):
                 embed=NotYourPanel(), ephemeral=True
             )
 
-        Config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        Config = await LoadConfig(interaction.client, interaction.guild.id)
         if not Config:
             Config = {"QOTD": {}, "_id": interaction.guild.id}
         if "QOTD" not in Config:
@@ -413,9 +413,8 @@ class WebhookToggle(discord.ui.Select):
             if "Webhook" not in Config["QOTD"]:
                 Config["QOTD"]["Webhook"] = {}
             Config["QOTD"]["Webhook"]["Enabled"] = True
-            await interaction.client.config.update_one(
-                {"_id": interaction.guild.id}, {"$set": Config}
-            )
+            if await SavePanel(interaction, Config) is None:
+                return
             await interaction.response.edit_message(
                 embed=await WebhookEmbed(interaction, Config)
             )
@@ -424,9 +423,8 @@ class WebhookToggle(discord.ui.Select):
             if "Webhook" not in Config["QOTD"]:
                 Config["QOTD"]["Webhook"] = {}
             Config["QOTD"]["Webhook"]["Enabled"] = False
-            await interaction.client.config.update_one(
-                {"_id": interaction.guild.id}, {"$set": Config}
-            )
+            if await SavePanel(interaction, Config) is None:
+                return
 
             await interaction.response.edit_message(
                 embed=await WebhookEmbed(interaction, Config)
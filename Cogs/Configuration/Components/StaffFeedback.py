@@ -2,6 +2,7 @@ import discord
 from utils.emojis import *
 from utils.HelpEmbeds import NotYourPanel
 import traceback
+from utils.config import LoadConfig, SavePanel
 
 
 class StaffFeedback(discord.ui.Select):
@@ -224,7 +225,7 @@ class Preferences(discord.ui.View):
     async def ToggleOption(
         self, interaction: discord.Interaction, button: discord.ui.Button, Option: str
     ):
-        Config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        Config = await LoadConfig(interaction.client, interaction.guild.id)
         if not Config:
             Config = {
                 "Infraction": {},
@@ -243,9 +244,8 @@ class Preferences(discord.ui.View):
                 button.label = "Multiple Feedback (Enabled)"
                 button.style = discord.ButtonStyle.green
 
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": Config}
-        )
+        if await SavePanel(interaction, Config) is None:
+            return
         await interaction.response.edit_message(view=self)
 
     @discord.ui.button(
@@ -281,19 +281,16 @@ class FeedbackChannel(discord.ui.ChannelSelect):
                 embed=NotYourPanel(), ephemeral=True
             )
 
-        config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        config = await LoadConfig(interaction.client, interaction.guild.id)
         if config is None:
             config = {"_id": interaction.guild.id, "Feedback": {}}
         elif "Feedback" not in config:
             config["Feedback"] = {}
 
         config["Feedback"]["channel"] = self.values[0].id if self.values else None
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": config}
-        )
-        Updated = await interaction.client.config.find_one(
-            {"_id": interaction.guild.id}
-        )
+        Updated = await SavePanel(interaction, config)
+        if Updated is None:
+            return
         await interaction.response.edit_message(content=None)
         try:
             await self.message.edit(
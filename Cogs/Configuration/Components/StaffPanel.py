@@ -2,6 +2,7 @@ import discord
 import traceback
 from utils.emojis import *
 from utils.HelpEmbeds import NotYourPanel
+from utils.config import LoadConfig, SavePanel
 
 
 class StaffPanelOptions(discord.ui.Select):
@@ -143,15 +144,14 @@ class DropDownLabel(discord.ui.Modal):
             return await interaction.response.send_message(
                 embed=NotYourPanel(), ephemeral=True
             )
-        Config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        Config = await LoadConfig(interaction.client, interaction.guild.id)
         if not Config:
             Config = {"_id": interaction.guild.id, "Staff Utils": {"Label": ""}}
         if not Config.get("Staff Utils"):
             Config["Staff Utils"] = {}
         Config["Staff Utils"]["Label"] = self.label.value
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": Config}, upsert=True
-        )
+        if await SavePanel(interaction, Config) is None:
+            return
         embed = discord.Embed(
             description=f"{greencheck} **{interaction.user.display_name},** you have successfully updated the panel label to **{self.label.value}**!",
             color=discord.Colour.brand_green(),
@@ -1,6 +1,7 @@
 import discord
 from utils.emojis import *
 from utils.HelpEmbeds import NotYourPanel
+from utils.config import PatchConfig
 
 
 class PremiumButtons(discord.ui.View):
@@ -55,8 +56,8 @@ class PremiumButtons(discord.ui.View):
             features = Config.get("Features", [])
             if "PREMIUM" not in features:
                 features.append("PREMIUM")
-                await interaction.client.config.update_one(
-                    {"_id": interaction.guild.id}, {"$set": {"Features": features}}
+                await PatchConfig(
+                    interaction.client, interaction.guild.id, Add={"Features": "PREMIUM"}
                 )
 
         view = PremiumButtons(interaction.user)
@@ -88,8 +89,8 @@ class PremiumButtons(discord.ui.View):
             features = Config.get("Features", [])
             if "PREMIUM" in features:
                 features.remove("PREMIUM")
-                await interaction.client.config.update_one(
-                    {"_id": interaction.guild.id}, {"$set": {"Features": features}}
+                await PatchConfig(
+                    interaction.client, interaction.guild.id, Pull={"Features": "PREMIUM"}
                 )
 
         view = PremiumButtons(interaction.user)
@@ -2,6 +2,7 @@ import discord
 from utils.emojis import *
 import traceback
 from utils.HelpEmbeds import NotYourPanel
+from utils.config import LoadConfig, SavePanel
 
 
 class Suggestions(discord.ui.Select):
@@ -96,7 +97,7 @@ class Preferences(discord.ui.View):
     async def ToggleOption(
         self, interaction: discord.Interaction, button: discord.ui.Button, Option: str
     ):
-        Config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        Config = await LoadConfig(interaction.client, interaction.guild.id)
         if not Config:
             Config = {
                 "Infraction": {},
@@ -114,9 +115,8 @@ class Preferences(discord.ui.View):
             button.style = discord.ButtonStyle.green
             button.label = button.label.replace("(Disabled)", "(Enabled)")
 
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": Config}
-        )
+        if await SavePanel(interaction, Config) is None:
+            return
         await interaction.response.edit_message(view=self)
 
     @discord.ui.button(
@@ -153,19 +153,16 @@ class SuggestionsChannel(discord.ui.ChannelSelect):
                 embed=NotYourPanel(), ephemeral=True
             )
 
-        config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        config = await LoadConfig(interaction.client, interaction.guild.id)
         if config is None:
             config = {"_id": interaction.guild.id, "Suggestions": {}}
         elif "Suggestions" not in config:
             config["Suggestions"] = {}
 
         config["Suggestions"]["channel"] = self.values[0].id if self.values else None
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": config}
-        )
-        Updated = await interaction.client.config.find_one(
-            {"_id": interaction.guild.id}
-        )
+        Updated = await SavePanel(interaction, config)
+        if Updated is None:
+            return
 
         await interaction.response.edit_message(content=None)
         try:
@@ -323,6 +320,9 @@ async def FinalFunction(interaction: discord.Interaction, d={}):
         {"$set": data},
         upsert=True,
     )
+    interaction.client.dispatch(
+        "customisation_update", interaction.guild.id, d.get("option")
+    )
     Config = await interaction.client.config.find_one({"_id": interaction.guild.id})
 
     view = discord.ui.View()
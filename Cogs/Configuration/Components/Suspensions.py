@@ -2,6 +2,7 @@ import discord
 import traceback
 from utils.emojis import *
 from utils.HelpEmbeds import NotYourPanel
+from utils.config import LoadConfig, SavePanel
 
 
 class SuspensionOptions(discord.ui.Select):
@@ -224,19 +225,16 @@ class SuspensionChannel(discord.ui.ChannelSelect):
                 embed=NotYourPanel(), ephemeral=True
             )
 
-        config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        config = await LoadConfig(interaction.client, interaction.guild.id)
         if config is None:
             config = {"_id": interaction.guild.id, "Suspension": {}}
         elif "Suspension" not in config:
             config["Suspension"] = {}
 
         config["Suspension"]["channel"] = self.values[0].id if self.values else None
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": config}
-        )
-        Updated = await interaction.client.config.find_one(
-            {"_id": interaction.guild.id}
-        )
+        Updated = await SavePanel(interaction, config)
+        if Updated is None:
+            return
 
         await interaction.response.edit_message(content=None)
         try:
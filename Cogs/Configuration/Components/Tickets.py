@@ -4,6 +4,7 @@ from utils.format import IsSeperateBot
 from utils.emojis import *
 from utils.HelpEmbeds import NotYourPanel
 from typing import Literal
+from utils.config import LoadConfig, SavePanel
 
 
 
@@ -73,10 +74,8 @@ class TicketQuota(discord.ui.Modal):
             }
 
         Config["Tickets"]["quota"] = quota
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id},
-            {"$set": Config},
-        )
+        if await SavePanel(interaction, Config) is None:
+            return
         await interaction.response.send_message(
             content=f"{tick} **{interaction.user.display_name},** ticket quota updated successfully.",
             ephemeral=True,
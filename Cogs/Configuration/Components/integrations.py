@@ -1,6 +1,7 @@
 import discord
 from utils.emojis import *
 from utils.HelpEmbeds import NotYourPanel
+from utils.config import LoadConfig, SavePanel
 
 
 class Integrations(discord.ui.Select):
@@ -67,7 +68,7 @@ class EnterGroup(discord.ui.Modal):
         await interaction.response.defer()
         if interaction.user.id != self.author.id:
             return await interaction.followup.send(embed=NotYourPanel(), ephemeral=True)
-        config = await interaction.client.config.find_one({"_id": interaction.guild.id})
+        config = await LoadConfig(interaction.client, interaction.guild.id)
         if not config:
             config = {"_id": interaction.guild.id, "groups": {}}
         if not config.get("groups"):
@@ -103,9 +104,8 @@ class EnterGroup(discord.ui.Modal):
             )
 
         config["groups"]["id"] = self.group_id.value
-        await interaction.client.config.update_one(
-            {"_id": interaction.guild.id}, {"$set": config}, upsert=True
-        )
+        if await SavePanel(interaction, config) is None:
+            return
         await interaction.edit_original_response(
             content=f"{tick} **{interaction.user.display_name}**, group successfullyy linked.",
             view=None,
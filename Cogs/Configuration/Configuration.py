@@ -5,6 +5,7 @@ from utils.emojis import *
 from utils.permissions import premium
 from utils.HelpEmbeds import NoPremium, Support, NotYourPanel
 from utils.ui import PMButton
+from utils.config import LoadConfig, SaveConfig
 
 
 async def Reset(i: discord.Interaction, *F):
@@ -543,7 +544,7 @@ class ConfigCog(commands.Cog):
     @commands.hybrid_command(description="Configure the bot for your servers needs")
     @commands.has_guild_permissions(manage_guild=True)
     async def config(self, ctx: commands.Context):
-        Config = await self.client.config.find_one({"_id": ctx.guild.id})
+        Config = await LoadConfig(self.client, ctx.guild.id)
         if (
             not Config
             or "Infraction" not in Config
@@ -565,9 +566,7 @@ class ConfigCog(commands.Cog):
                 "Demotion",
                 "Termination",
             ]
-            await self.client.config.update_one(
-                {"_id": ctx.guild.id}, {"$set": Config}, upsert=True
-            )
+            await SaveConfig(self.client, ctx.guild.id, Config)
 
         options = Options(Config)
         view = discord.ui.View()
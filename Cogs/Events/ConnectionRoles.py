@@ -3,56 +3,80 @@ from discord.ext import commands
 from utils.emojis import *
 
 from utils.Module import ModuleCheck
+from utils.indexes import Declare
+
+Declare("connectionroles", "guild", "parent", "child")
 
 class ConnectionRolesEvent(commands.Cog):
     def __init__(self, client):
         self.client = client
+        self.graphs = {}  # {guild_id: ({parent: {children}}, {child: {parents}})}
+
+    async def Graph(self, guild_id: int):
+        graph = self.graphs.get(guild_id)
+        if graph is not None:
+            return graph
+        children, parents = {}, {}
+        async for doc in self.client.db["connectionroles"].find(
+            {"guild": guild_id}, {"parent": 1, "child": 1}
+        ):
+            children.setdefault(doc["parent"], set()).add(doc["child"])
+            parents.setdefault(doc["child"], set()).add(doc["parent"])
+        graph = self.graphs[guild_id] = (children, parents)
+        return graph
+
+    @commands.Cog.listener()
+    async def on_connectionroles_edit(self, guild_id: int):
+        self.graphs.pop(guild_id, None)
 
     @commands.Cog.listener()
-    async def on_member_update(self, before, after):
-        added_roles = set(after.roles) - set(before.roles)
-        removed_roles = set(before.roles) - set(after.roles)
-        guild = after.guild
-        if not await ModuleCheck(guild.id, "connectionroles"):
+    async def on_guild_role_delete(self, role: discord.Role):
+        self.graphs.pop(role.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        if before.roles == after.roles:
+            return
+        before_ids = {role.id for role in before.roles}
+        after_ids = {role.id for role in after.roles}
+        added_roles = after_ids - before_ids
+        removed_roles = before_ids - after_ids
+
+        children, parents = await self.Graph(after.guild.id)
+        if not children:
+            return
+        if not any(role in children for role in added_roles | removed_roles):
+            return
+        if not await ModuleCheck(after.guild.id, "connectionroles"):
             return
 
+        add = set()
         for role in added_roles:
-            parent_roles_data = await self.client.db['connectionroles'].find({"parent": role.id}).to_list(
-                length=1000
-            )
-            for parent_role_data in parent_roles_data:
-                child_role_id = parent_role_data["child"]
-                child_role = after.guild.get_role(child_role_id)
-                if child_role:
-                    try:
-                        await after.add_roles(child_role)
-                    except discord.Forbidden:
-                        print("[⚠️] I don't have permission to add roles to this user")
-                        return
+            add.update(children.get(role, ()))
 
+        remove = set()
         for role in removed_roles:
-            parent_roles_data = await self.client.db['connectionroles'].find({"parent": role.id}).to_list(
-                length=1000
-            )
-            for parent_role_data in parent_roles_data:
-                child_role_id = parent_role_data["child"]
-                child_role = after.guild.get_role(child_role_id)
-                parent_roles = await self.client.db['connectionroles'].find(
-                    {"child": child_role_id}
-                ).to_list(length=1000)
-                has_other_parent_role = any(
-                    after.guild.get_role(pr["parent"]) in after.roles
-                    for pr in parent_roles
-                )
-
-                if not has_other_parent_role and child_role:
-                    try:
-                        await after.remove_roles(child_role)
-                    except discord.Forbidden:
-                        print(
-                            "[⚠️] I don't have permission to remove roles from this user"
-                        )
-                        return
+            for child in children.get(role, ()):
+                if not parents.get(child, set()) & after_ids:
+                    remove.add(child)
+
+        add -= after_ids
+        remove &= after_ids
+        remove -= add
+        if not add and not remove:
+            return
+
+        roles = [
+            role
+            for role_id in (after_ids | add) - remove
+            if (role := after.guild.get_role(role_id)) and not role.is_default()
+        ]
+        try:
+            await after.edit(roles=roles, reason="Connection Roles")
+        except discord.Forbidden:
+            print("[⚠️] I don't have permission to update roles for this user")
+        except discord.HTTPException:
+            return
 
 
 async def setup(client: commands.Bot) -> None:
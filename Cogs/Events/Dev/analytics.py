@@ -1,31 +1,74 @@
-from discord.ext import commands
+import discord
+from discord.ext import commands, tasks
+from datetime import datetime, timezone
 import time
+from utils.telemetry import Telemetry
+
+
+def Latency(created: datetime) -> float:
+    return (datetime.now(timezone.utc) - created).total_seconds() * 1000
+
+
 class analyticss(commands.Cog):
     def __init__(self, client: commands.Bot):
         self.client = client
+        # Kept across reloads, so histograms not yet flushed aren't dropped.
+        if getattr(self.client, "telemetry", None) is None:
+            self.client.telemetry = Telemetry()
+        self.FlushTelemetry.start()
 
-    @commands.Cog.listener()
-    async def on_command(self, ctx: commands.Context):
-        if ctx.guild is None:
-            return
-        start_execution_time = time.perf_counter()
-        prfx = time.strftime("%H:%M:%S GMT", time.gmtime())
+    def cog_unload(self):
+        self.FlushTelemetry.cancel()
 
-        prfx = f"[🤖] {prfx}"
-        await self.client.db['analytics'].update_one(
-            {}, {"$inc": {f"{ctx.command.qualified_name}": 1}}, upsert=True
-        )
+    @tasks.loop(minutes=1, reconnect=True)
+    async def FlushTelemetry(self):
+        try:
+            await self.client.telemetry.Flush(self.client.db["Command Telemetry"])
+        except Exception as e:
+            print(f"[❌] Failed to flush command telemetry: {e}")
+
+    @FlushTelemetry.after_loop
+    async def FinalFlush(self):
+        try:
+            await self.client.telemetry.Flush(self.client.db["Command Telemetry"])
+        except Exception:
+            pass
 
+    @commands.Cog.listener()
+    async def on_command_completion(self, ctx: commands.Context):
+        if ctx.guild is None or not ctx.command:
+            return
         command = ctx.command.qualified_name
-        end_execution_time = time.perf_counter()
-        execution_duration = end_execution_time - start_execution_time
-        execution_duration = round(execution_duration, 3)
+        duration = Latency(ctx.message.created_at)
+        self.client.telemetry.Record(command, "prefix", duration)
 
+        prfx = time.strftime("%H:%M:%S GMT", time.gmtime())
+        prfx = f"[🤖] {prfx}"
         print(
             prfx
-            + f" Command '{command}' executed in {execution_duration} seconds by @{(ctx.author)} at {ctx.guild}"
+            + f" Command '{command}' executed in {duration / 1000:.3f} seconds by @{(ctx.author)} at {ctx.guild}"
+        )
+
+    @commands.Cog.listener()
+    async def on_command_error(self, ctx: commands.Context, error: Exception):
+        if ctx.guild is None or not ctx.command:
+            return
+        self.client.telemetry.Record(
+            ctx.command.qualified_name,
+            "prefix",
+            Latency(ctx.message.created_at),
+            failed=True,
         )
 
+    @commands.Cog.listener()
+    async def on_app_command_completion(
+        self,
+        interaction: discord.Interaction,
+        command: discord.app_commands.Command | discord.app_commands.ContextMenu,
+    ):
+        name = getattr(command, "qualified_name", command.name)
+        self.client.telemetry.Record(name, "app", Latency(interaction.created_at))
+
 
 async def setup(client: commands.Bot) -> None:
     await client.add_cog(analyticss(client))
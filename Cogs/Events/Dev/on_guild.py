@@ -4,7 +4,9 @@ import os
 
 from utils.emojis import *
 from Cogs.Modules.promotions import SyncServer
-from datetime import datetime
+from datetime import datetime, timedelta
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
 
 PrimaryServers = [int(x) for x in os.getenv("DEFAULT_ALLOWED_SERVERS").split(",")] if os.getenv("DEFAULT_ALLOWED_SERVERS") else []
 class GuildJoins(commands.Cog):
@@ -154,47 +156,90 @@ class GuildJoins(commands.Cog):
         await self.LogLeave(guild)
         await self.UpdateData(datetime.now().strftime("%Y-%m-%d"), "left")
 
-    async def UpdateData(self, TodayDate, action):
-        Data = await self.client.db["Servers"].find_one({"_id": "Data"})
-        if not Data:
-            Data = {
-                "_id": "Data",
-                "today": {"new": 0, "left": 0},
-                "total": {"new": 0, "left": 0},
-                "stats": [],
-            }
-            await self.client.db["Servers"].insert_one(Data)
-
-        TodayStat = next((stat for stat in Data["stats"] if TodayDate in stat), None)
-        if TodayStat:
-            TodayStat[TodayDate][action] += 1
-        else:
-            Data["stats"].append(
-                {
-                    TodayDate: {
-                        "new": 1 if action == "new" else 0,
-                        "left": 1 if action == "left" else 0,
-                    }
-                }
-            )
+    async def cog_load(self):
+        try:
+            await self.MigrateLegacyStats()
+        except Exception as e:
+            print(f"[❌] Failed to migrate guild stats, will retry next start: {e}")
 
-        increment = {
-            f"total.{action}": 1,
-        }
-        if action == "new":
-            increment["today.new"] = 1
-        elif action == "left":
-            increment["today.left"] = 1
+    async def MigrateLegacyStats(self):
+        # Safe to re-run or run from several clusters at once: each day is marked
+        # "legacy" when credited so it's never counted twice, and the old array
+        # is only dropped once every day has been written.
+        Legacy = await self.client.db["Servers"].find_one(
+            {"_id": "Data", "stats": {"$exists": True}}, {"stats": 1}
+        )
+        if not Legacy:
+            return
+        Days = {}
+        for stat in Legacy.get("stats", []):
+            for date, counts in stat.items():
+                Day = Days.setdefault(date, {"new": 0, "left": 0})
+                Day["new"] += counts.get("new", 0)
+                Day["left"] += counts.get("left", 0)
+        Operations = [
+            UpdateOne(
+                {"_id": date, "legacy": {"$ne": True}},
+                {"$inc": counts, "$set": {"legacy": True}},
+                upsert=True,
+            )
+            for date, counts in Days.items()
+        ]
+        if Operations:
+            try:
+                await self.client.db["Server Stats"].bulk_write(
+                    Operations, ordered=False
+                )
+            except BulkWriteError as e:
+                # Days credited by an earlier run don't match and collide on upsert.
+                if any(
+                    error.get("code") != 11000
+                    for error in e.details.get("writeErrors", [])
+                ):
+                    raise
+        await self.client.db["Servers"].update_one(
+            {"_id": "Data"},
+            {"$unset": {"stats": ""}, "$set": {"statsMigrated": True}},
+        )
+        print(f"[✅] Migrated {len(Operations)} days of guild stats.")
 
+    async def UpdateData(self, TodayDate, action):
+        await self.client.db["Server Stats"].update_one(
+            {"_id": TodayDate}, {"$inc": {action: 1}}, upsert=True
+        )
         await self.client.db["Servers"].update_one(
             {"_id": "Data"},
-            {
-                "$inc": increment,
-                "$set": {
-                    "stats": Data["stats"],
+            {"$inc": {f"total.{action}": 1, f"today.{action}": 1}},
+            upsert=True,
+        )
+
+
+async def GuildStats(db, days: int = 30):
+    since = (datetime.now() - timedelta(days=days - 1)).strftime("%Y-%m-%d")
+    Rollup = await (
+        db["Server Stats"]
+        .aggregate(
+            [
+                {"$match": {"_id": {"$gte": since}}},
+                {"$sort": {"_id": -1}},
+                {
+                    "$group": {
+                        "_id": None,
+                        "new": {"$sum": "$new"},
+                        "left": {"$sum": "$left"},
+                        "days": {
+                            "$push": {"date": "$_id", "new": "$new", "left": "$left"}
+                        },
+                    }
                 },
-            },
+            ]
         )
+        .to_list(length=1)
+    )
+    Data = await db["Servers"].find_one({"_id": "Data"}) or {}
+    Result = Rollup[0] if Rollup else {"new": 0, "left": 0, "days": []}
+    Result["total"] = Data.get("total", {"new": 0, "left": 0})
+    return Result
 
 
 async def setup(client: commands.Bot) -> None:
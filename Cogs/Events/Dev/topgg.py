@@ -1,6 +1,7 @@
 from discord.ext import commands, tasks
 from utils.emojis import *
 import topgg
+from utils.cluster import Aggregate, Primary
 
 import os
 
@@ -14,15 +15,17 @@ class Topgg(commands.Cog):
         self.client = client
 
         self.topggpy = topgg.DBLClient(self.client, dbl_token)
-        self.update_stats.start()
+        if Primary:
+            self.update_stats.start()
 
     @tasks.loop(minutes=30)
     async def update_stats(self):
         if environment == "custom":
             return
         try:
-            await self.topggpy.post_guild_count()
-            print(f"[🔝] Posted server count ({self.topggpy.guild_count})")
+            guilds = sum(cluster["guilds"] for cluster in await Aggregate(self.client))
+            await self.topggpy.post_guild_count(guild_count=guilds)
+            print(f"[🔝] Posted server count ({guilds})")
         except Exception as e:
             print("[⬇️] Failed to post server count")
 
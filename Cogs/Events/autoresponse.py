@@ -3,25 +3,27 @@ from discord.ext import commands
 from utils.emojis import *
 import re
 import random
-from fuzzywuzzy import fuzz
+from utils.lazy import Lazy
 from datetime import datetime
-from utils.permissions import premium
+from utils.indexes import Declare
+from utils.router import MessageContext, Subscribe, Unsubscribe
+
+Declare("Auto Responders", "guild_id")
+
+fuzz = Lazy("fuzzywuzzy.fuzz")
 
 
 class autoresponse(commands.Cog):
     def __init__(self, client: commands.Bot):
         self.client = client
+        Subscribe("autoresponse", self.on_routed_message, "guild")
 
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message):
-        if message.guild is None:
-            return
-        if message.author == self.client.user:
-            return
-        if message.author.bot:
-            return
+    def cog_unload(self):
+        Unsubscribe("autoresponse")
 
-        if not await premium(message.guild.id):
+    async def on_routed_message(self, ctx: MessageContext):
+        message = ctx.message
+        if not await ctx.Premium():
             return
 
         autoresponses = (
@@ -4,10 +4,25 @@ from datetime import datetime, timedelta
 
 
 from utils.emojis import *
-import chat_exporter
 import traceback
 import random
 import io
+import asyncio
+from bson import ObjectId
+from utils.indexes import Declare
+from utils.router import MessageContext, Subscribe, Unsubscribe
+from utils.modmail import (
+    Active,
+    Closed,
+    GuildSettings,
+    MutualGuilds,
+    Opened,
+    RelayChannel,
+    ResolveGuild,
+)
+from utils.transcripts import Link, RenderHTML, Read, Render, Store, Write
+
+Declare("modmail", "user_id", "channel_id")
 
 
 async def Reply(
@@ -17,13 +32,8 @@ async def Reply(
     ModmailData: dict,
     Guild: discord.Guild,
 ):
-    try:
-        Channel = await Guild.fetch_channel(int(ModmailData.get("channel_id", 0)))
-    except (discord.NotFound, discord.HTTPException):
-        traceback.format_exc(e)
-        return await self.db["modmail"].delete_one({"user_id": message.author.id})
-    if not Channel:
-        return await message.add_reaction("⚠️")
+    # Sent straight to the cached channel id, a deleted channel shows up as NotFound.
+    Channel = RelayChannel(self, ModmailData)
 
     embed = discord.Embed(
         color=discord.Color.dark_embed(),
@@ -44,11 +54,17 @@ async def Reply(
                     f" {message.author.name}: {message.content}",
                     files=files,
                 )
+            except discord.NotFound:
+                await Closed(self, ModmailData)
+                return await message.add_reaction("⚠️")
             except Exception as e:
                 return await message.add_reaction("⚠️")
             return await message.add_reaction("📨")
     try:
         await Channel.send(embed=embed, files=files)
+    except discord.NotFound:
+        await Closed(self, ModmailData)
+        return await message.add_reaction("⚠️")
     except Exception as e:
         print(e)
         return await message.add_reaction("⚠️")
@@ -56,24 +72,21 @@ async def Reply(
 
 
 async def Close(interaction: discord.Interaction, reason=None):
-    Text = None
+    Writer = None
+    Messages = [] if RenderHTML else None
     TranscriptMSG = None
     msg = await interaction.followup.send(
         content=" Closing..."
     )
     if isinstance(interaction.channel, discord.DMChannel):
-        Modmail = await interaction.client.db["modmail"].find_one(
-            {"user_id": interaction.user.id}
-        )
+        Modmail = await Active(interaction.client, user_id=interaction.user.id)
     else:
-        Modmail = await interaction.client.db["modmail"].find_one(
-            {"channel_id": interaction.channel.id}
-        )
+        Modmail = await Active(interaction.client, channel_id=interaction.channel.id)
     if not Modmail:
         return await msg.edit(
             content=f"{no} **{interaction.user.display_name},** you have no active modmail."
         )
-    Server = await interaction.client.fetch_guild(Modmail.get("guild_id"))
+    Server = await ResolveGuild(interaction.client, Modmail.get("guild_id"))
     if not Server:
         return await msg.edit(
             content=f"{no} **{interaction.user.display_name},** no idea how but the guild can't be found from the modmail."
@@ -92,24 +105,10 @@ async def Close(interaction: discord.Interaction, reason=None):
 
     channelcreated = f"{channel.created_at.strftime('%d/%m/%Y')}"
     TranscriptID = random.randint(100, 50000)
-    await interaction.client.db["modmail"].delete_one({"user_id": interaction.user.id})
+    await Closed(interaction.client, Modmail)
     if channel and ModmailType == "channel":
-        Text = ""
-        async for message in channel.history(limit=None, oldest_first=True):
-
-            text = message.content
-            author = message.author.name
-            if not text and message.embeds:
-                embed = message.embeds[0]
-                if embed.title:
-                    author = embed.title
-
-                if embed.description:
-                    text = embed.description.strip("`")
-                else:
-                    text = "No content"
-            time = message.created_at.strftime("%d/%m/%Y %H:%M:%S")
-            Text += f"{time} | @{author}: {text}\n"
+        # Compressed as it's read, long threads never sit in memory as one string.
+        Writer = await Write(channel, Messages)
         if ModmailType == "channel":
             try:
                 await channel.delete()
@@ -118,6 +117,7 @@ async def Close(interaction: discord.Interaction, reason=None):
                 await msg.edit(
                     content=f"{no} **{interaction.user.display_name},** I can't delete this channel please contact the server admins.",
                 )
+                Writer.close()
                 return
     user = await interaction.client.fetch_user(Modmail.get("user_id"))
     if reason is None:
@@ -209,18 +209,27 @@ async def Close(interaction: discord.Interaction, reason=None):
                 except:
                     pass
 
-    await interaction.client.db["Transcripts"].insert_one(
-        {
-            "transcriptid": TranscriptID,
-            "guild_id": Server.id,
-            "closedby": interaction.user.id,
-            "reason": reason,
-            "author": user.id,
-            "timestamp": datetime.now(),
-            "transcript": TranscriptMSG.id if TranscriptMSG else None,
-            "text": Text if Text else "Nothin",
-        }
-    )
+    DocumentID = ObjectId()
+    Transcript = {
+        "_id": DocumentID,
+        "transcriptid": TranscriptID,
+        "guild_id": Server.id,
+        "closedby": interaction.user.id,
+        "reason": reason,
+        "author": user.id,
+        "timestamp": datetime.now(),
+        "transcript": TranscriptMSG.id if TranscriptMSG else None,
+    }
+    if Writer:
+        try:
+            Transcript.update(await Store(Writer, DocumentID))
+        finally:
+            Writer.close()
+    await interaction.client.db["Transcripts"].insert_one(Transcript)
+    if Messages:
+        asyncio.create_task(
+            Render(interaction.client, DocumentID, channel, Messages, Server)
+        )
     if ModmailType == "channel":
         await msg.delete()
     else:
@@ -260,14 +269,30 @@ class Links(discord.ui.View):
             return await interaction.followup.send(
                 content=f"{no} **{interaction.user.display_name},** you have no active modmail."
             )
-        if Modmail.get("text"):
-            Text = Modmail.get("text")
-            if not isinstance(Text, str):
-                return await interaction.followup.send(
-                    content=f"{no} **{interaction.user.display_name},** this isn't a valid transcript."
-                )
-            file = discord.File(io.BytesIO(Text.encode()), filename="transcript.txt")
-            await interaction.followup.send(file=file, ephemeral=True)
+        if Modmail.get("text") is not None and not isinstance(
+            Modmail.get("text"), str
+        ):
+            return await interaction.followup.send(
+                content=f"{no} **{interaction.user.display_name},** this isn't a valid transcript."
+            )
+        Text = await Read(Modmail)
+        Limit = (
+            interaction.guild.filesize_limit if interaction.guild else 8 * 1024 * 1024
+        )
+        if Text and len(Text) <= Limit:
+            file = discord.File(io.BytesIO(Text), filename="transcript.txt")
+            return await interaction.followup.send(file=file, ephemeral=True)
+        URL = await Link(Modmail)
+        if URL:
+            await interaction.followup.send(
+                content=f"{tick} **{interaction.user.display_name},** the transcript is too large to attach, it's here: {URL}",
+                ephemeral=True,
+            )
+        elif Text:
+            await interaction.followup.send(
+                content=f"{no} **{interaction.user.display_name},** the transcript is too large to attach.",
+                ephemeral=True,
+            )
         else:
             await interaction.followup.send(
                 content=f"{no} **{interaction.user.display_name},** there is no transcript to generate.",
@@ -286,14 +311,7 @@ class Select(discord.ui.Select):
     async def callback(self, interaction: discord.Interaction):
         await interaction.response.defer()
 
-        try:
-            Guild = await interaction.client.fetch_guild(self.values[0])
-        except (discord.NotFound, discord.HTTPException):
-            return await interaction.followup.send(
-                f"{crisis} **{interaction.user.display_name},** I can't find the server anymore.",
-                ephemeral=True,
-            )
-
+        Guild = await ResolveGuild(interaction.client, int(self.values[0]))
         if not Guild:
             return await interaction.followup.send(
                 f"{crisis} **{interaction.user.display_name},** I can't find the server anymore.",
@@ -309,9 +327,7 @@ class Select(discord.ui.Select):
                 ephemeral=True,
             )
 
-        Modmail = await interaction.client.db["modmail"].find_one(
-            {"user_id": interaction.user.id}
-        )
+        Modmail = await Active(interaction.client, user_id=interaction.user.id)
         if Modmail:
             return await interaction.edit_original_response(
                 content=f"{no} {interaction.user.display_name}, you've already started a Modmail, calm down.",
@@ -523,7 +539,7 @@ async def OpenModmail(
     }
     if Categoriesed:
         ModmailData["Category"] = Categoriesed
-    await interaction.client.db["modmail"].insert_one(ModmailData)
+    await Opened(interaction.client, ModmailData)
     await Reply(
         interaction.client,
         message=message,
@@ -561,28 +577,34 @@ class ModmailEvent(commands.Cog):
     def __init__(self, client: commands.Bot):
         self.client = client
         self.LastSelection = {}
+        Subscribe("modmail", self.on_routed_message)
+
+    def cog_unload(self):
+        Unsubscribe("modmail")
 
     @commands.Cog.listener()
     async def on_guild_channel_delete(self, channel: discord.TextChannel):
-        Modmail = await self.client.db["modmail"].find_one({"channel_id": channel.id})
+        Modmail = await Active(self.client, channel_id=channel.id)
         if not Modmail:
             return
-        await self.client.db["modmail"].delete_one({"channel_id": channel.id})
-
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message):
-        if message.author.bot:
-            return
-
-        if await self.client.db["Appeal Sessions"].find_one(
-            {"user_id": message.author.id}
+        await Closed(self.client, Modmail)
+
+    async def on_routed_message(self, ctx: MessageContext):
+        message = ctx.message
+        # Only modmail channels matter in servers, check that before anything else.
+        if ctx.category == "guild" and (
+            not isinstance(message.channel, discord.TextChannel)
+            or not await ctx.Modmail()
         ):
             return
-        Modmail = await self.client.db["modmail"].find_one(
-            {"user_id": message.author.id}
-        )
+
+        Modmail = await ctx.Modmail()
         if isinstance(message.channel, discord.DMChannel):
             if not Modmail:
+                if await self.client.db["Appeal Sessions"].find_one(
+                    {"user_id": message.author.id}
+                ):
+                    return
                 Message = await message.reply(
                     content=" Wait..."
                 )
@@ -601,18 +623,7 @@ class ModmailEvent(commands.Cog):
                             content=f"{no} **{message.author.display_name},** Please wait {int(Remaining.total_seconds())} seconds before opening another modmail panel."
                         )
                         return
-                    Mutual = []
-                    for guilds in self.client.guilds:
-                        member = discord.utils.get(guilds.members, id=message.author.id)
-                        if not member:
-                            continue
-                        Config = await self.client.config.find_one({"_id": guilds.id})
-                        if (
-                            Config
-                            and Config.get("Modules", {}).get("Modmail") == True
-                            and Config.get("Modmail", {}).get("category")
-                        ):
-                            Mutual.append(guilds)
+                    Mutual = await MutualGuilds(self.client, message.author)
                     if len(Mutual) == 0:
                         return await Message.edit(
                             content=f"{crisis} **{message.author.display_name},** you aren't in any mutual servers with modmail enabled."
@@ -623,7 +634,7 @@ class ModmailEvent(commands.Cog):
                             discord.SelectOption(
                                 label=Guild.name,
                                 value=Guild.id,
-                                description=f"{Guild.member_count} members",
+                                description=f"{Guild.member_count or Guild.approximate_member_count or 0} members",
                             )
                         )
                     if len(Options) == 0:
@@ -649,12 +660,10 @@ class ModmailEvent(commands.Cog):
                 except Exception as e:
                     traceback.format_exc(e)
             else:
-                Config = await self.client.config.find_one(
-                    {"_id": Modmail.get("guild_id")}
-                )
+                Config = await GuildSettings(self.client, Modmail.get("guild_id"))
                 if not Config:
                     return await message.add_reaction("⚠️")
-                Guild = await self.client.fetch_guild(Modmail.get("guild_id"))
+                Guild = await ResolveGuild(self.client, Modmail.get("guild_id"))
                 if not Guild:
                     return await message.add_reaction("⚠️")
                 await Reply(
@@ -665,12 +674,9 @@ class ModmailEvent(commands.Cog):
                     Guild=Guild,
                 )
         if isinstance(message.channel, discord.TextChannel):
-            Modmail = await self.client.db["modmail"].find_one(
-                {"channel_id": message.channel.id}
-            )
             if not Modmail:
                 return
-            Config = await self.client.config.find_one({"_id": Modmail.get("guild_id")})
+            Config = await GuildSettings(self.client, Modmail.get("guild_id"))
             if not Config:
                 return
             if not Config.get("Modmail"):
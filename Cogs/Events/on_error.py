@@ -23,6 +23,14 @@ class Tree(app_commands.CommandTree):
         interaction: discord.Interaction,
         error: app_commands.AppCommandError | Exception,
     ):
+        telemetry = getattr(self.client, "telemetry", None)
+        if telemetry and interaction.command:
+            telemetry.Record(
+                interaction.command.qualified_name,
+                "app",
+                (discord.utils.utcnow() - interaction.created_at).total_seconds() * 1000,
+                failed=True,
+            )
 
         if isinstance(error, app_commands.errors.CommandNotFound):
             # Show which application command wasn't found and give generic guidance
@@ -2,7 +2,6 @@ import discord
 from discord.ext import commands
 import os
 from bson import ObjectId
-import aiohttp
 import logging
 import asyncio
 import datetime
@@ -11,10 +10,15 @@ import random
 import string
 from Cogs.Configuration.Components.EmbedBuilder import DisplayEmbed
 import traceback
+from pymongo import UpdateOne
+from utils.events import Event, Hydrate
 
 logger = logging.getLogger(__name__)
 MONGO_URL = os.getenv("MONGO_URL")
 
+# Log messages posted at once during a batch, discord.py handles the route limits.
+Concurrency = 5
+
 
 def Replacements(staff: discord.Member, Infraction: dict, manager: discord.Member):
     def get_attr_or_key(obj, key):
@@ -145,39 +149,40 @@ class on_infractions(commands.Cog):
 
     @commands.Cog.listener()
     async def on_infraction(
-        self, objectid: ObjectId, Settings: dict, Actions: dict, Type: str = None
+        self,
+        objectid: Event | ObjectId,
+        Settings: dict,
+        Actions: dict,
+        Type: str = None,
     ):
         print("[🏠 on_infraction] Trigged")
-        if Type is None:
-            InfractionData = await self.client.db["infractions"].find_one(
-                {"_id": objectid}
-            )
-        else:
-            InfractionData = await self.client.db["Suspensions"].find_one(
-                {"_id": objectid}
-            )
+        E = Hydrate(
+            self.client,
+            "infractions" if Type is None else "Suspensions",
+            objectid,
+            config=Settings,
+            MemberKey="staff",
+        )
+        objectid = E.id
+        InfractionData = await E.Document()
+        if InfractionData is None:
+            return
         Infraction = InfractItem(InfractionData)
-        guild = await self.client.fetch_guild(Infraction.guild_id)
+        guild = await E.Guild()
         if guild is None:
             logging.warning(
                 f"[🏠 on_infraction] {Infraction.guild_id} is None and can't be found..?"
             )
             return
 
-        try:
-            staff = await guild.fetch_member(int(Infraction.staff))
-        except:
-            staff = None
+        staff = await E.Member()
         if staff is None:
             logging.warning(
                 f"[🏠 on_infraction] @{guild.name} staff member {Infraction.staff} can't be found."
             )
             return
 
-        try:
-            manager = await guild.fetch_member(int(Infraction.management))
-        except:
-            manager = None
+        manager = await E.Member(int(Infraction.management))
         if manager is None:
             logging.warning(
                 f"[🏠 on_infraction] @{guild.name} manager {Infraction.management} can't be found."
@@ -192,15 +197,10 @@ class on_infractions(commands.Cog):
                 f"[🏠 on_infraction] @{guild.name} no channel ID found in settings."
             )
             return
-        try:
-            channel = await guild.fetch_channel(int(ChannelID))
-        except Exception as e:
-            return print(
-                f"[🏠 on_infraction] @{guild.name} the infraction channel can't be found. [1]"
-            )
+        channel = await E.Channel(ChannelID)
         if channel is None:
             logging.warning(
-                f"[🏠 on_infraction] @{guild.name} the infraction channel can't be found. [2]"
+                f"[🏠 on_infraction] @{guild.name} the infraction channel can't be found."
             )
             return
 
@@ -210,7 +210,246 @@ class on_infractions(commands.Cog):
                 "type": "Infractions" if Type is None else "Suspension",
             }
         )
-        embed = discord.Embed()
+        embeds, embed, view = await self.Render(
+            InfractionData, staff, manager, Settings, custom, Type
+        )
+
+        ch = await self.InfractionTypes(Actions, staff, manager, config=Settings)
+        if ch and ch.get("Channel"):
+            N = await E.Channel(ch.get("Channel"))
+            if N:
+                channel = N
+
+        hook = None
+        if self.UsesWebhook(Settings) and await premium(guild.id):
+            hook = await self.Webhook(guild, channel)
+            if not hook:
+                return
+
+        msg = await self.Send(channel, hook, Settings, staff, embeds, embed, view)
+        if msg is None:
+            return None
+
+        if Type is None:
+            Sent = {
+                "jump_url": msg.jump_url,
+                "msg_id": msg.id,
+                "Updated": ch,
+                "WebhookID": hook.id if hook else None,
+            }
+            await self.client.db["infractions"].update_one(
+                {"_id": objectid}, {"$set": Sent}
+            )
+            InfractionData.update(Sent)
+            self.client.dispatch("infraction_log", E, "create", manager)
+        else:
+            await self.client.db["Suspensions"].update_one(
+                {"_id": objectid},
+                {"$set": {"jump_url": msg.jump_url, "msg_id": msg.id}},
+            )
+
+        consreult = await self.client.db["consent"].find_one({"user_id": staff.id})
+        if Settings.get("Module Options", {}).get("Direct Message", True):
+            if not consreult or consreult.get("infractionalert") is not False:
+                try:
+                    await staff.send(
+                        content=f"From  **{guild.name}**",
+                        embed=embed,
+                    )
+                except:
+                    pass
+
+    async def LogBatch(
+        self,
+        Infractions: list[dict],
+        Settings: dict,
+        Actions: dict,
+        members: list[discord.Member] = None,
+        progress=None,
+    ):
+        """Log freshly inserted infractions for one guild in a single pass.
+
+        The channel, customisation, premium status and webhook are resolved once
+        and the log messages are posted concurrently. ``progress`` is awaited
+        with ``(done, total)`` every couple of seconds."""
+        if not Infractions:
+            return 0
+        GuildID = Infractions[0].get("guild_id")
+        guild = self.client.get_guild(GuildID)
+        if guild is None:
+            try:
+                guild = await self.client.fetch_guild(GuildID)
+            except (discord.Forbidden, discord.NotFound, discord.HTTPException):
+                guild = None
+        if guild is None:
+            logging.warning(f"[🏠 LogBatch] {GuildID} is None and can't be found..?")
+            return 0
+
+        Members = {member.id: member for member in members or []}
+
+        async def Member(id: int):
+            if id not in Members:
+                try:
+                    Members[id] = guild.get_member(id) or await guild.fetch_member(
+                        id
+                    )
+                except (discord.NotFound, discord.HTTPException):
+                    Members[id] = None
+            return Members[id]
+
+        manager = await Member(int(Infractions[0].get("management")))
+        if manager is None:
+            logging.warning(
+                f"[🏠 LogBatch] @{guild.name} manager {Infractions[0].get('management')} can't be found."
+            )
+            return 0
+
+        ChannelID = Settings.get("Infraction", {}).get("channel")
+        if not ChannelID:
+            logging.warning(f"[🏠 LogBatch] @{guild.name} no channel ID found in settings.")
+            return 0
+        try:
+            channel = await self.client.fetch_channel(int(ChannelID))
+        except (discord.Forbidden, discord.NotFound, discord.HTTPException):
+            channel = None
+        if channel is None:
+            logging.warning(f"[🏠 LogBatch] @{guild.name} the infraction channel can't be found.")
+            return 0
+
+        custom = await self.client.db["Customisation"].find_one(
+            {"guild_id": guild.id, "type": "Infractions"}
+        )
+        UseWebhook = self.UsesWebhook(Settings) and await premium(guild.id)
+        Channels = {}
+        Hooks = {}
+
+        async def FetchChannel(id: int):
+            try:
+                return await self.client.fetch_channel(id)
+            except (discord.Forbidden, discord.NotFound):
+                return None
+
+        Limiter = asyncio.Semaphore(Concurrency)
+        Updates = []
+        Delivered = []
+        Total = len(Infractions)
+        Done = 0
+        LastReport = 0
+
+        async def Deliver(Data: dict):
+            nonlocal Done, LastReport
+            async with Limiter:
+                try:
+                    staff = await Member(int(Data.get("staff")))
+                    if staff is None:
+                        return
+                    embeds, embed, view = await self.Render(
+                        Data, staff, manager, Settings, custom
+                    )
+                    ch = await self.InfractionTypes(
+                        Actions.get(Data.get("action")), staff, manager, config=Settings
+                    )
+                    target = channel
+                    if ch and ch.get("Channel"):
+                        ID = int(ch.get("Channel"))
+                        if ID != channel.id:
+                            if ID not in Channels:
+                                Channels[ID] = asyncio.ensure_future(FetchChannel(ID))
+                            target = await Channels[ID] or channel
+                    hook = None
+                    if UseWebhook:
+                        if target.id not in Hooks:
+                            Hooks[target.id] = asyncio.ensure_future(
+                                self.Webhook(guild, target)
+                            )
+                        hook = await Hooks[target.id]
+                        if not hook:
+                            return
+                    msg = await self.Send(
+                        target, hook, Settings, staff, embeds, embed, view
+                    )
+                    if msg is None:
+                        return
+                    Sent = {
+                        "jump_url": msg.jump_url,
+                        "msg_id": msg.id,
+                        "Updated": ch,
+                        "WebhookID": hook.id if hook else None,
+                    }
+                    Data.update(Sent)
+                    Updates.append(UpdateOne({"_id": Data["_id"]}, {"$set": Sent}))
+                    Delivered.append((Data, staff, embed))
+                except Exception:
+                    traceback.print_exc()
+                finally:
+                    Done += 1
+                    if progress and (
+                        Done == Total or asyncio.get_running_loop().time() - LastReport > 2
+                    ):
+                        LastReport = asyncio.get_running_loop().time()
+                        try:
+                            await progress(Done, Total)
+                        except (discord.HTTPException, discord.NotFound):
+                            pass
+
+        await asyncio.gather(*(Deliver(Data) for Data in Infractions))
+
+        if Updates:
+            await self.client.db["infractions"].bulk_write(Updates, ordered=False)
+        for Data, staff, _ in Delivered:
+            self.client.dispatch(
+                "infraction_log",
+                Event(
+                    self.client,
+                    "infractions",
+                    Data,
+                    guild=guild,
+                    member=staff,
+                    config=Settings,
+                    MemberKey="staff",
+                ),
+                "create",
+                manager,
+            )
+
+        if Settings.get("Module Options", {}).get("Direct Message", True):
+            Optouts = {
+                consent["user_id"]
+                async for consent in self.client.db["consent"].find(
+                    {
+                        "user_id": {"$in": [staff.id for _, staff, _ in Delivered]},
+                        "infractionalert": False,
+                    },
+                    {"user_id": 1},
+                )
+            }
+
+            async def DirectMessage(staff: discord.Member, embed: discord.Embed):
+                async with Limiter:
+                    try:
+                        await staff.send(content=f"From  **{guild.name}**", embed=embed)
+                    except:
+                        pass
+
+            await asyncio.gather(
+                *(
+                    DirectMessage(staff, embed)
+                    for _, staff, embed in Delivered
+                    if staff.id not in Optouts
+                )
+            )
+        return len(Delivered)
+
+    async def Render(
+        self,
+        InfractionData: dict,
+        staff: discord.Member,
+        manager: discord.Member,
+        Settings: dict,
+        custom: dict = None,
+        Type: str = None,
+    ):
+        Infraction = InfractItem(InfractionData)
         view = None
         if Settings.get("Module Options", {}).get("infractedbybutton"):
             view = InfractionIssuer()
@@ -236,20 +475,10 @@ class on_infractions(commands.Cog):
         if not Type:
             embed.set_footer(text=f"Infraction ID | {Infraction.random_string}")
 
-        ch = await self.InfractionTypes(Actions, staff, manager, config=Settings)
-        if ch and ch.get("Channel"):
-            try:
-                N = await self.client.fetch_channel(int(ch.get("Channel")))
-            except (discord.Forbidden, discord.NotFound):
-                N = None
-            if N:
-                channel = N
-
         embeds = [embed]
 
         if Infraction.escalated_from and not Infraction.skipExec:
             CheckedActions = InfractionData.get("EscalationChain", [])
-            Org = Infraction.escalated_from
             action = Infraction.action
 
             parts = []
@@ -269,50 +498,56 @@ class on_infractions(commands.Cog):
                 icon_url="https://cdn.discordapp.com/emojis/1401307998260822028.webp?size=96",
             )
             embeds.append(EscFrom)
-        msg = None
-        hook = None
-        Status = await premium(guild.id)
+        return embeds, embed, view
 
-        if (
+    def UsesWebhook(self, Settings: dict):
+        return bool(
             Settings.get("Infraction", {}).get("Webhook", None)
-            and Status
             and Settings.get("Infraction", {}).get("Webhook", {}).get("Enabled") is True
-        ):
-            hook = None
-            Webhook = await self.client.db["Webhooks"].find_one(
-                {"Type": "IF", "Channel": channel.id, "Guild": guild.id}
-            )
+        )
 
-            async def CreateHook(channel: discord.TextChannel):
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(self.client.user.display_avatar.url) as resp:
-                        if resp.status != 200:
-                            return None
-                        Btyes = await resp.read()
-                try:
-                    hook = await channel.create_webhook(name="Birb", avatar=Btyes)
-                    await self.client.db["Webhooks"].update_one(
-                        {"Type": "IF", "Channel": channel.id, "Guild": guild.id},
-                        {"$set": {"Id": hook.id}},
-                        upsert=True,
-                    )
-                    return hook
-                except discord.Forbidden:
-                    return None
+    async def Webhook(self, guild: discord.Guild, channel: discord.TextChannel):
+        Webhook = await self.client.db["Webhooks"].find_one(
+            {"Type": "IF", "Channel": channel.id, "Guild": guild.id}
+        )
 
-            if not Webhook or not Webhook.get("Id"):
-                hook = await CreateHook(channel)
-            else:
-                try:
-                    hook = await self.client.fetch_webhook(Webhook.get("Id"))
-                except discord.NotFound:
-                    hook = await CreateHook(channel)
+        async def CreateHook(channel: discord.TextChannel):
+            try:
+                Btyes = await self.client.user.display_avatar.read()
+            except (discord.HTTPException, discord.NotFound):
+                return None
+            try:
+                hook = await channel.create_webhook(name="Birb", avatar=Btyes)
+                await self.client.db["Webhooks"].update_one(
+                    {"Type": "IF", "Channel": channel.id, "Guild": guild.id},
+                    {"$set": {"Id": hook.id}},
+                    upsert=True,
+                )
+                return hook
+            except discord.Forbidden:
+                return None
 
-            if not hook:
-                return
+        if not Webhook or not Webhook.get("Id"):
+            return await CreateHook(channel)
+        try:
+            return await self.client.fetch_webhook(Webhook.get("Id"))
+        except discord.NotFound:
+            return await CreateHook(channel)
+
+    async def Send(
+        self,
+        channel: discord.TextChannel,
+        hook: discord.Webhook,
+        Settings: dict,
+        staff: discord.Member,
+        embeds: list[discord.Embed],
+        embed: discord.Embed,
+        view: discord.ui.View = None,
+    ):
+        if hook:
             WS = Settings.get("Infraction").get("Webhook", {})
             if view is not None:
-                msg = await hook.send(
+                return await hook.send(
                     staff.mention,
                     embeds=embeds,
                     view=view,
@@ -321,57 +556,24 @@ class on_infractions(commands.Cog):
                     username=WS.get("Username") or "Birb",
                     wait=True,
                 )
-            else:
-                msg: discord.WebhookMessage = await hook.send(
-                    staff.mention,
-                    embeds=embeds,
-                    allowed_mentions=discord.AllowedMentions(users=True),
-                    avatar_url=WS.get("Avatar") or None,
-                    username=WS.get("Username") or "Birb",
-                    wait=True,
-                )
-
-        else:
-            try:
-                msg: discord.Message = await channel.send(
-                    staff.mention,
-                    embeds=[embed],
-                    view=view,
-                    allowed_mentions=discord.AllowedMentions(users=True),
-                )
-
-            except (discord.Forbidden, discord.HTTPException, discord.NotFound):
-                return None
-
-        if Type is None:
-            await self.client.db["infractions"].update_one(
-                {"_id": objectid},
-                {
-                    "$set": {
-                        "jump_url": msg.jump_url,
-                        "msg_id": msg.id,
-                        "Updated": ch,
-                        "WebhookID": hook.id if hook else None,
-                    }
-                },
-            )
-        else:
-            await self.client.db["Suspensions"].update_one(
-                {"_id": objectid},
-                {"$set": {"jump_url": msg.jump_url, "msg_id": msg.id}},
+            return await hook.send(
+                staff.mention,
+                embeds=embeds,
+                allowed_mentions=discord.AllowedMentions(users=True),
+                avatar_url=WS.get("Avatar") or None,
+                username=WS.get("Username") or "Birb",
+                wait=True,
             )
-        self.client.dispatch("infraction_log", objectid, "create", manager)
 
-        consreult = await self.client.db["consent"].find_one({"user_id": staff.id})
-        if Settings.get("Module Options", {}).get("Direct Message", True):
-            if not consreult or consreult.get("infractionalert") is not False:
-                try:
-                    await staff.send(
-                        content=f"From  **{guild.name}**",
-                        embed=embed,
-                    )
-                except:
-                    pass
+        try:
+            return await channel.send(
+                staff.mention,
+                embeds=[embed],
+                view=view,
+                allowed_mentions=discord.AllowedMentions(users=True),
+            )
+        except (discord.Forbidden, discord.HTTPException, discord.NotFound):
+            return None
 
     async def InfractionTypes(self, data, staff: discord.Member, manager: discord.Member, config: dict):
         if not data:
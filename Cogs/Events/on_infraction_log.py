@@ -1,6 +1,7 @@
 import discord
 from discord.ext import commands
 from bson import ObjectId
+from utils.events import Event, Hydrate
 
 
 class on_infraction_log(commands.Cog):
@@ -10,34 +11,30 @@ class on_infraction_log(commands.Cog):
     @commands.Cog.listener()
     async def on_infraction_log(
         self,
-        _id: ObjectId,
+        _id: Event | ObjectId,
         action: str,
         author: discord.Member,
         unmodified: dict = None,
     ):
-        inf = await self.client.db["infractions"].find_one({"_id": _id})
+        Infraction = Hydrate(self.client, "infractions", _id, MemberKey="staff")
+        inf = await Infraction.Document()
         if not inf:
             return
-        try:
-            guild = await self.client.fetch_guild(inf.get("guild_id"))
-        except (discord.NotFound, discord.HTTPException, discord.NotFound):
+        guild = await Infraction.Guild()
+        if guild is None:
             return
-        try:
-            staff = await guild.fetch_member(int(inf.get("staff")))
-        except (discord.NotFound, discord.HTTPException, discord.NotFound):
+        staff = await Infraction.Member()
+        if staff is None:
             return
 
-        config = await self.client.config.find_one({"_id": guild.id})
+        config = await Infraction.Config()
         if not config:
             return
         if not config.get("Infraction", None):
             return
-        try:
-            LogsChannel = await guild.fetch_channel(
-                int(config.get("Infraction", {}).get("LogChannel", None))
-            )
-        except (discord.Forbidden, discord.NotFound, TypeError):
-            return
+        LogsChannel = await Infraction.Channel(
+            config.get("Infraction", {}).get("LogChannel", None)
+        )
         if not LogsChannel:
             return
 
@@ -1,11 +1,13 @@
 import discord
 from discord.ext import commands
 from bson import ObjectId
+from pymongo import ReturnDocument
 from utils.emojis import *
 from utils import HelpEmbeds
 from datetime import datetime
 from Cogs.Modules.leaves import Duration
 from utils.permissions import has_admin_role
+from utils.events import Event, Hydrate
 
 
 class on_leave(commands.Cog):
@@ -13,23 +15,23 @@ class on_leave(commands.Cog):
         self.client = client
 
     @commands.Cog.listener()
-    async def on_leave_request(self, _id: ObjectId):
-        L = await self.client.db["loa"].find_one({"_id": _id})
+    async def on_leave_request(self, _id: Event | ObjectId):
+        E = Hydrate(self.client, "loa", _id)
+        L = await E.Document()
         if L is None:
             return
-        G = self.client.get_guild(L.get("guild_id"))
+        G = await E.Guild()
         if not G:
             return
-        C = await self.client.db["Config"].find_one({"_id": G.id})
+        C = await E.Config()
         if not C:
             return
         if not C.get("LOA", None):
             return
         if not C.get("LOA", {}).get("channel", None):
             return
-        try:
-            CH = await G.fetch_channel(int(C.get("LOA", {}).get("channel", 0)))
-        except (discord.NotFound, discord.HTTPException):
+        CH = await E.Channel(C.get("LOA", {}).get("channel"))
+        if not CH:
             return
 
         embed = discord.Embed(
@@ -67,22 +69,20 @@ class on_leave(commands.Cog):
         self.client.add_view(ExtRequest())
 
     @commands.Cog.listener()
-    async def on_leave_start(self, _id: ObjectId):
-        L = await self.client.db["loa"].find_one({"_id": _id})
+    async def on_leave_start(self, _id: Event | ObjectId):
+        E = Hydrate(self.client, "loa", _id)
+        L = await E.Document()
         if L is None:
             return
-        G = self.client.get_guild(L.get("guild_id"))
+        G = await E.Guild()
         if not G:
             return
-        C = await self.client.db["Config"].find_one({"_id": G.id})
+        C = await E.Config()
         if not C:
             return
         if not C.get("LOA", None):
             return
-        try:
-            Member = await G.fetch_member(L.get("user"))
-        except (discord.NotFound, discord.HTTPException):
-            Member = None
+        Member = await E.Member()
         if not Member:
             return
 
@@ -114,23 +114,23 @@ class on_leave(commands.Cog):
                     pass
 
     @commands.Cog.listener()
-    async def on_leave_end(self, _id: ObjectId):
-        L = await self.client.db["loa"].find_one({"_id": _id})
+    async def on_leave_end(self, _id: Event | ObjectId):
+        E = Hydrate(self.client, "loa", _id)
+        L = await E.Document()
         if L is None:
             return
-        G = self.client.get_guild(L.get("guild_id"))
+        G = await E.Guild()
         if not G:
             return
-        C = await self.client.db["Config"].find_one({"_id": G.id})
+        C = await E.Config()
         if not C:
             return
         if not C.get("LOA", None):
             return
         if not C.get("LOA", {}).get("channel", None):
             return
-        try:
-            CH = await G.fetch_channel(int(C.get("LOA", {}).get("channel", 0)))
-        except (discord.NotFound, discord.HTTPException):
+        CH = await E.Channel(C.get("LOA", {}).get("channel"))
+        if not CH:
             return
         embed = discord.Embed(
             color=discord.Color.dark_embed(),
@@ -150,10 +150,7 @@ class on_leave(commands.Cog):
             await CM.reply(embed=embed)
         except (discord.HTTPException, discord.Forbidden, discord.NotFound):
             return
-        try:
-            member = await G.fetch_member(L.get("user"))
-        except (discord.NotFound, discord.HTTPException):
-            member = None
+        member = await E.Member()
         if member:
             try:
 
@@ -174,25 +171,29 @@ class on_leave(commands.Cog):
 
     @commands.Cog.listener()
     async def on_leave_log(
-        self, _id: ObjectId, action: str, author: discord.User, unmodified: dict = None
+        self,
+        _id: Event | ObjectId,
+        action: str,
+        author: discord.User,
+        unmodified: dict = None,
     ):
 
-        L = await self.client.db["loa"].find_one({"_id": _id})
+        E = Hydrate(self.client, "loa", _id)
+        L = await E.Document()
         if L is None:
             return
-        G = self.client.get_guild(L.get("guild_id"))
+        G = await E.Guild()
         if not G:
             return
-        C = await self.client.db["Config"].find_one({"_id": G.id})
+        C = await E.Config()
         if not C:
             return
         if not C.get("LOA", None):
             return
         if not C.get("LOA", {}).get("LogChannel", None):
             return
-        try:
-            CH = await G.fetch_channel(int(C.get("LOA", {}).get("LogChannel", 0)))
-        except (discord.NotFound, discord.HTTPException):
+        CH = await E.Channel(C.get("LOA", {}).get("LogChannel"))
+        if not CH:
             return
         embed = discord.Embed()
         color = {
@@ -223,23 +224,23 @@ class on_leave(commands.Cog):
             return
 
     @commands.Cog.listener()
-    async def on_leave_ext_request(self, _id: ObjectId):
-        L = await self.client.db["ExtRequests"].find_one({"_id": _id})
+    async def on_leave_ext_request(self, _id: Event | ObjectId):
+        E = Hydrate(self.client, "ExtRequests", _id, GuildKey="guild")
+        L = await E.Document()
         if L is None:
             return
-        G = self.client.get_guild(L.get("guild"))
+        G = await E.Guild()
         if not G:
             return
-        C = await self.client.db["Config"].find_one({"_id": G.id})
+        C = await E.Config()
         if not C:
             return
         if not C.get("LOA", None):
             return
         if not C.get("LOA", {}).get("channel", None):
             return
-        try:
-            CH = await G.fetch_channel(int(C.get("LOA", {}).get("channel", 0)))
-        except (discord.NotFound, discord.HTTPException):
+        CH = await E.Channel(C.get("LOA", {}).get("channel"))
+        if not CH:
             return
         embed = discord.Embed(
             color=discord.Color.dark_embed(),
@@ -269,24 +270,24 @@ class on_leave(commands.Cog):
         )
 
     @commands.Cog.listener()
-    async def on_leave_request_cancel(self, _id: ObjectId):
-        L = await self.client.db["loa"].find_one({"_id": _id})
-        await self.client.db["loa"].delete_one({"_id": _id})
+    async def on_leave_request_cancel(self, _id: Event | ObjectId):
+        E = Hydrate(self.client, "loa", _id)
+        L = await E.Document()
+        await self.client.db["loa"].delete_one({"_id": E.id})
         if L is None:
             return
-        G = self.client.get_guild(L.get("guild_id"))
+        G = await E.Guild()
         if not G:
             return
-        C = await self.client.db["Config"].find_one({"_id": G.id})
+        C = await E.Config()
         if not C:
             return
         if not C.get("LOA", None):
             return
         if not C.get("LOA", {}).get("channel", None):
             return
-        try:
-            CH = await G.fetch_channel(int(C.get("LOA", {}).get("channel", 0)))
-        except (discord.NotFound, discord.HTTPException):
+        CH = await E.Channel(C.get("LOA", {}).get("channel"))
+        if not CH:
             return
         try:
             CM = await CH.fetch_message(L.get("messageid"))
@@ -296,27 +297,27 @@ class on_leave(commands.Cog):
 
     @commands.Cog.listener()
     async def on_leave_ext_update(
-        self, _id: ObjectId, status: str, author: discord.User
+        self, _id: Event | ObjectId, status: str, author: discord.User
     ):
-        L = await self.client.db["ExtRequests"].find_one({"_id": _id})
+        E = Hydrate(self.client, "ExtRequests", _id, GuildKey="guild")
+        L = await E.Document()
         if L is None:
             return
         LOA = await self.client.db["loa"].find_one({"LoaID": L.get("LoaID")})
         if LOA is None:
             return
-        G = self.client.get_guild(L.get("guild"))
+        G = await E.Guild()
         if not G:
             return
-        C = await self.client.db["Config"].find_one({"_id": G.id})
+        C = await E.Config()
         if not C:
             return
         if not C.get("LOA", None):
             return
         if not C.get("LOA", {}).get("channel", None):
             return
-        try:
-            CH = await G.fetch_channel(int(C.get("LOA", {}).get("channel", 0)))
-        except (discord.NotFound, discord.HTTPException):
+        CH = await E.Channel(C.get("LOA", {}).get("channel"))
+        if not CH:
             return
 
         embed = discord.Embed(
@@ -333,10 +334,7 @@ class on_leave(commands.Cog):
         embed.set_thumbnail(url=L.get("ExtendedUser", {}).get("thumbnail"))
         embed.set_footer(text=L.get("LoaID"))
         view = None
-        try:
-            member = await G.fetch_member(L.get("user"))
-        except (discord.NotFound, discord.HTTPException):
-            member = None
+        member = await E.Member()
         if status == "Accepted":
             view = discord.ui.View().add_item(
                 discord.ui.Button(
@@ -443,23 +441,23 @@ class on_leave(commands.Cog):
             return
 
     @commands.Cog.listener()
-    async def on_leave_create(self, _id: ObjectId):
-        L = await self.client.db["loa"].find_one({"_id": _id})
+    async def on_leave_create(self, _id: Event | ObjectId):
+        E = Hydrate(self.client, "loa", _id)
+        L = await E.Document()
         if L is None:
             return
-        G = self.client.get_guild(L.get("guild_id"))
+        G = await E.Guild()
         if not G:
             return
-        C = await self.client.db["Config"].find_one({"_id": G.id})
+        C = await E.Config()
         if not C:
             return
         if not C.get("LOA", None):
             return
         if not C.get("LOA", {}).get("channel", None):
             return
-        try:
-            CH = await G.fetch_channel(int(C.get("LOA", {}).get("channel", 0)))
-        except (discord.NotFound, discord.HTTPException):
+        CH = await E.Channel(C.get("LOA", {}).get("channel"))
+        if not CH:
             return
 
         embed = discord.Embed(
@@ -495,23 +493,23 @@ class on_leave(commands.Cog):
         )
 
     @commands.Cog.listener()
-    async def on_leave_update(self, _id: ObjectId, status: str, author: discord.User):
-        L = await self.client.db["loa"].find_one({"_id": _id})
+    async def on_leave_update(self, _id: Event | ObjectId, status: str, author: discord.User):
+        E = Hydrate(self.client, "loa", _id)
+        L = await E.Document()
         if L is None:
             return
-        G = self.client.get_guild(L.get("guild_id"))
+        G = await E.Guild()
         if not G:
             return
-        C = await self.client.db["Config"].find_one({"_id": G.id})
+        C = await E.Config()
         if not C:
             return
         if not C.get("LOA", None):
             return
         if not C.get("LOA", {}).get("channel", None):
             return
-        try:
-            CH = await G.fetch_channel(int(C.get("LOA", {}).get("channel", 0)))
-        except (discord.NotFound, discord.HTTPException):
+        CH = await E.Channel(C.get("LOA", {}).get("channel"))
+        if not CH:
             return
 
         embed = discord.Embed(
@@ -525,10 +523,7 @@ class on_leave(commands.Cog):
 
         embed.set_footer(text=L.get("LoaID"))
         view = None
-        try:
-            member = await G.fetch_member(L.get("user"))
-        except (discord.HTTPException, discord.NotFound):
-            member = None
+        member = await E.Member()
         if status == "Accepted":
             view = discord.ui.View().add_item(
                 discord.ui.Button(
@@ -627,16 +622,7 @@ class DenialReason(discord.ui.Modal, title="Leave Denial Reason"):
 
     async def on_submit(self, interaction: discord.Interaction):
         await interaction.response.defer(ephemeral=True)
-        LOA = await interaction.client.db["loa"].find_one(
-            {"messageid": interaction.message.id}
-        )
-        if LOA is None:
-            await interaction.followup.send(
-                embed=HelpEmbeds.CustomError("This isn't a valid LOA Request"),
-                ephemeral=True,
-            )
-            return
-        await interaction.client.db["loa"].update_one(
+        LOA = await interaction.client.db["loa"].find_one_and_update(
             {
                 "messageid": interaction.message.id,
                 "guild_id": interaction.guild.id,
@@ -652,10 +638,23 @@ class DenialReason(discord.ui.Modal, title="Leave Denial Reason"):
                     "request": False,
                 }
             },
+            return_document=ReturnDocument.AFTER,
         )
+        if LOA is None:
+            await interaction.followup.send(
+                embed=HelpEmbeds.CustomError("This isn't a valid LOA Request"),
+                ephemeral=True,
+            )
+            return
         interaction.client.dispatch(
             "leave_update",
-            LOA.get("_id"),
+            Event(
+                interaction.client,
+                "loa",
+                document=LOA,
+                guild=interaction.guild,
+                channel=interaction.channel,
+            ),
             "Declined",
             interaction.user,
         )
@@ -683,7 +682,14 @@ class ExtRequest(discord.ui.View):
             return
         interaction.client.dispatch(
             "leave_ext_update",
-            LOA.get("_id"),
+            Event(
+                interaction.client,
+                "ExtRequests",
+                document=LOA,
+                guild=interaction.guild,
+                channel=interaction.channel,
+                GuildKey="guild",
+            ),
             "Accepted",
             interaction.user,
         )
@@ -705,7 +711,14 @@ class ExtRequest(discord.ui.View):
             return
         interaction.client.dispatch(
             "leave_ext_update",
-            LOA.get("_id"),
+            Event(
+                interaction.client,
+                "ExtRequests",
+                document=LOA,
+                guild=interaction.guild,
+                channel=interaction.channel,
+                GuildKey="guild",
+            ),
             "Declined",
             interaction.user,
         )
@@ -732,7 +745,7 @@ class PendingActions(discord.ui.View):
             )
             return
 
-        Z = await interaction.client.db["loa"].update_one(
+        LOA = await interaction.client.db["loa"].find_one_and_update(
             {
                 "messageid": interaction.message.id,
                 "guild_id": interaction.guild.id,
@@ -747,15 +760,22 @@ class PendingActions(discord.ui.View):
                     "request": False,
                 }
             },
+            return_document=ReturnDocument.AFTER,
         )
-        if Z.modified_count == 0:
+        if LOA is None:
             await interaction.followup.send(
                 embed=HelpEmbeds.CustomError("Failed to accept LOA."), ephemeral=True
             )
             return
         interaction.client.dispatch(
             "leave_update",
-            LOA.get("_id"),
+            Event(
+                interaction.client,
+                "loa",
+                document=LOA,
+                guild=interaction.guild,
+                channel=interaction.channel,
+            ),
             "Accepted",
             interaction.user,
         )
@@ -3,7 +3,7 @@ from discord.ext import commands
 import os
 from utils.permissions import premium
 from bson import ObjectId
-import aiohttp
+from utils.events import Event, Hydrate
 from datetime import datetime
 import logging
 from Cogs.Configuration.Components.EmbedBuilder import DisplayEmbed
@@ -108,9 +108,9 @@ async def PromotionSystem(
     member: discord.Member,
 ):
     if not settings.get("Module Options", {}).get("autorole", True):
-        return await self.db["promotions"].find_one({"_id": PromotionData.get("_id")})
+        return PromotionData
     if not settings.get("Promo"):
-        return await self.db["promotions"].find_one({"_id": PromotionData.get("_id")})
+        return PromotionData
 
     PromoSystemType = settings.get("Promo", {}).get("System", {}).get("type", "old")
     if PromoSystemType == "old" or PromoSystemType == "og":
@@ -145,17 +145,13 @@ async def PromotionSystem(
             for dept in sublist
         ]
         if not DepartmentHierarchies or not Department:
-            return await self.db["promotions"].find_one(
-                {"_id": PromotionData.get("_id")}
-            )
+            return PromotionData
         DepartmentHierarchy = next(
             (dept for dept in DepartmentHierarchies if dept.get("name") == Department),
             None,
         )
         if not DepartmentHierarchy:
-            return await self.db["promotions"].find_one(
-                {"_id": PromotionData.get("_id")}
-            )
+            return PromotionData
 
         RoleIDs = DepartmentHierarchy.get("ranks", [])
 
@@ -189,9 +185,8 @@ async def PromotionSystem(
                 await self.db["promotions"].update_one(
                     {"_id": PromotionData.get("_id")}, {"$set": {"new": SkipRole.id}}
                 )
-                return await self.db["promotions"].find_one(
-                    {"_id": PromotionData.get("_id")}
-                )
+                PromotionData["new"] = SkipRole.id
+                return PromotionData
 
         for Index, CurrentRole in enumerate(SortedRoles):
             if CurrentRole in MemberRoles and Index + 1 < len(SortedRoles):
@@ -228,6 +223,7 @@ async def PromotionSystem(
             await self.db["promotions"].update_one(
                 {"_id": PromotionData.get("_id")}, {"$set": {"new": RoleID}}
             )
+            PromotionData["new"] = RoleID
 
     if PromoSystemType == "single":
         HierarchyRoles = (
@@ -240,9 +236,7 @@ async def PromotionSystem(
 
         if not HierarchyRoles:
             logger.warning("[Single] No roles found")
-            return await self.db["promotions"].find_one(
-                {"_id": PromotionData.get("_id")}
-            )
+            return PromotionData
 
         MemberRoles = set(member.roles)
         SortedRoles = [
@@ -273,9 +267,8 @@ async def PromotionSystem(
                 await self.db["promotions"].update_one(
                     {"_id": PromotionData.get("_id")}, {"$set": {"new": SkipRole.id}}
                 )
-                return await self.db["promotions"].find_one(
-                    {"_id": PromotionData.get("_id")}
-                )
+                PromotionData["new"] = SkipRole.id
+                return PromotionData
 
         for Index, CurrentRole in enumerate(SortedRoles):
             if CurrentRole in MemberRoles and Index + 1 < len(SortedRoles):
@@ -308,8 +301,9 @@ async def PromotionSystem(
             await self.db["promotions"].update_one(
                 {"_id": PromotionData.get("_id")}, {"$set": {"new": RoleID}}
             )
+            PromotionData["new"] = RoleID
 
-    return await self.db["promotions"].find_one({"_id": PromotionData.get("_id")})
+    return PromotionData
 
 
 class on_promotion(commands.Cog):
@@ -318,11 +312,17 @@ class on_promotion(commands.Cog):
 
     @commands.Cog.listener()
     async def on_promotion(
-        self, objectid: ObjectId, Settings: dict, edit: bool = False
+        self, objectid: Event | ObjectId, Settings: dict, edit: bool = False
     ):
-        PromotionData = await self.client.db["promotions"].find_one({"_id": objectid})
+        E = Hydrate(
+            self.client, "promotions", objectid, config=Settings, MemberKey="staff"
+        )
+        objectid = E.id
+        PromotionData = await E.Document()
+        if PromotionData is None:
+            return
         Infraction = Promotion(PromotionData)
-        guild = await self.client.fetch_guild(Infraction.guild_id)
+        guild = await E.Guild()
 
         if guild is None:
             logging.warning(
@@ -330,10 +330,7 @@ class on_promotion(commands.Cog):
             )
             return
 
-        try:
-            staff = await guild.fetch_member(int(Infraction.staff))
-        except:
-            staff = None
+        staff = await E.Member()
         if staff is None:
             logging.warning(
                 f"[🏠 on_promotion] @{guild.name} staff member {Infraction.staff} can't be found."
@@ -345,10 +342,7 @@ class on_promotion(commands.Cog):
             upsert=True,
         )
 
-        try:
-            manager = await guild.fetch_member(int(Infraction.management))
-        except:
-            manager = None
+        manager = await E.Member(int(Infraction.management))
         if manager is None:
             logging.warning(
                 f"[🏠 on_promotion] @{guild.name} manager {Infraction.management} can't be found."
@@ -361,15 +355,10 @@ class on_promotion(commands.Cog):
                 f"[🏠 on_promotion] @{guild.name} no channel ID found in settings."
             )
             return
-        try:
-            channel = await guild.fetch_channel(int(ChannelID))
-        except Exception as e:
-            return print(
-                f"[🏠 on_promotion] @{guild.name} the promotion channel can't be found. [1]"
-            )
+        channel = await E.Channel(ChannelID)
         if channel is None:
             logging.warning(
-                f"[🏠 on_promotion] @{guild.name} the promotion channel can't be found. [2]"
+                f"[🏠 on_promotion] @{guild.name} the promotion channel can't be found."
             )
             return
         Options = Settings.get("Module Options", {})
@@ -421,13 +410,10 @@ class on_promotion(commands.Cog):
                 )
 
                 async def CreateHook(channel: discord.TextChannel):
-                    async with aiohttp.ClientSession() as session:
-                        async with session.get(
-                            self.client.user.display_avatar.url
-                        ) as resp:
-                            if resp.status != 200:
-                                return None
-                            Btyes = await resp.read()
+                    try:
+                        Btyes = await self.client.user.display_avatar.read()
+                    except (discord.HTTPException, discord.NotFound):
+                        return None
                     try:
                         hook = await channel.create_webhook(name="Birb", avatar=Btyes)
 
@@ -500,7 +486,8 @@ class on_promotion(commands.Cog):
             {"_id": objectid},
             {"$set": {"jump_url": msg.jump_url, "msg_id": msg.id}},
         )
-        self.client.dispatch("promotion_log", objectid, "create", manager)
+        E.document.update({"jump_url": msg.jump_url, "msg_id": msg.id})
+        self.client.dispatch("promotion_log", E, "create", manager)
         consreult = await self.client.db["consent"].find_one({"user_id": staff.id})
         if not consreult or consreult.get("promotionalert") is not False and not edit:
             try:
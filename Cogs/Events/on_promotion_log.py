@@ -1,6 +1,7 @@
 import discord
 from discord.ext import commands
 from bson import ObjectId
+from utils.events import Event, Hydrate
 
 
 class on_promotion_log(commands.Cog):
@@ -10,34 +11,30 @@ class on_promotion_log(commands.Cog):
     @commands.Cog.listener()
     async def on_promotion_log(
         self,
-        _id: ObjectId,
+        _id: Event | ObjectId,
         action: str,
         author: discord.Member,
         unmodified: dict = None,
     ):
-        promotion = await self.client.db["promotions"].find_one({"_id": _id})
+        Promotion = Hydrate(self.client, "promotions", _id, MemberKey="staff")
+        promotion = await Promotion.Document()
         if not promotion:
             return
-        try:
-            guild = await self.client.fetch_guild(promotion.get("guild_id"))
-        except (discord.NotFound, discord.HTTPException):
+        guild = await Promotion.Guild()
+        if guild is None:
             return
-        try:
-            staff = await guild.fetch_member(int(promotion.get("staff")))
-        except (discord.NotFound, discord.HTTPException):
+        staff = await Promotion.Member()
+        if staff is None:
             return
 
-        config = await self.client.config.find_one({"_id": guild.id})
+        config = await Promotion.Config()
         if not config:
             return
         if not config.get("Promo", None):
             return
-        try:
-            LogsChannel = await guild.fetch_channel(
-                int(config.get("Promo", {}).get("LogChannel", None))
-            )
-        except (discord.Forbidden, discord.NotFound, TypeError):
-            return
+        LogsChannel = await Promotion.Channel(
+            config.get("Promo", {}).get("LogChannel", None)
+        )
         if not LogsChannel:
             return
 
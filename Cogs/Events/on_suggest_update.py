@@ -1,7 +1,11 @@
 import discord
 from discord.ext import commands
 import os
+import asyncio
+import copy
+import time
 from bson import ObjectId
+from utils.events import Event, Hydrate
 
 import logging
 from Cogs.Configuration.Components.EmbedBuilder import DisplayEmbed
@@ -13,51 +17,99 @@ from Cogs.Events.on_suggestion import Voting
 
 logger = logging.getLogger(__name__)
 
+# Seconds of votes folded into one message edit.
+Debounce = float(os.getenv("SUGGESTION_DEBOUNCE", 3))
+CustomisationTTL = 300
+
 
 class On_suggestions_edit(commands.Cog):
     def __init__(self, client: commands.Bot):
         self.client = client
+        self.Pending = {}  # {suggestion _id: (Event, flush task)}
+        self.Customisations = {}  # {(guild_id, type): (loaded at, document)}
+
+    def cog_unload(self):
+        for _, task in self.Pending.values():
+            task.cancel()
+
+    async def Customisation(self, guild_id: int, action: str):
+        key = (guild_id, action)
+        cached = self.Customisations.get(key)
+        if cached is None or time.monotonic() - cached[0] > CustomisationTTL:
+            document = await self.client.db["Customisation"].find_one(
+                {"guild_id": guild_id, "type": action}
+            )
+            cached = self.Customisations[key] = (time.monotonic(), document)
+        # DisplayEmbed fills in placeholders in place.
+        return copy.deepcopy(cached[1])
+
+    @commands.Cog.listener()
+    async def on_customisation_update(self, guild_id: int, action: str):
+        self.Customisations.pop((guild_id, action), None)
+
+    @commands.Cog.listener()
+    async def on_suggestion_vote(self, E: Event):
+        if E.id in self.Pending:
+            self.Pending[E.id] = (E, self.Pending[E.id][1])
+            return
+        self.Pending[E.id] = (E, asyncio.create_task(self.Flush(E.id)))
+
+    async def Flush(self, id: ObjectId):
+        await asyncio.sleep(Debounce)
+        E, _ = self.Pending.pop(id, (None, None))
+        if E is None:
+            return
+        # Votes can land out of order, render whatever is stored now.
+        E.document = None
+        try:
+            await self.Render(E, None, "Suggestion")
+        except Exception as e:
+            logging.warning(f"[on_suggestion_vote] failed to update {id}: {e}")
 
     @commands.Cog.listener()
-    async def on_suggestion_edit(self, objectID: ObjectId, settings: dict, action):
-        back = await self.client.db["suggestions"].find_one({"_id": objectID})
+    async def on_suggestion_edit(
+        self, objectID: Event | ObjectId, settings: dict, action
+    ):
+        E = Hydrate(
+            self.client, "suggestions", objectID, config=settings, MemberKey="author_id"
+        )
+        # This render includes the latest counts, drop any queued vote update.
+        _, task = self.Pending.pop(E.id, (None, None))
+        if task:
+            task.cancel()
+        await self.Render(E, settings, action)
+
+    async def Render(self, E: Event, settings: dict | None, action: str):
+        back = await E.Document()
         if not back:
             return logging.critical("[on_suggestion] I can't find the feedback.")
 
-        guild = await self.client.fetch_guild(back.get("guild_id"))
+        guild = await E.Guild()
         if not guild:
             return logging.critical("[on_suggestion] I can't find the server.")
-        author = await guild.fetch_member(back.get("author_id"))
+        author = await E.Member()
         if not author:
             return logger.critical("[on_suggestion] can't find the author")
 
-        ChannelID = settings.get("Suggestions").get("channel")
-        if not ChannelID:
-            logging.warning(
-                f"[🏠 on_feedback] @{guild.name} no channel ID found in settings."
-            )
-            return
-        try:
-            channel = await guild.fetch_channel(int(ChannelID))
-        except Exception as e:
-            return print(
-                f"[🏠 on_feedback] @{guild.name} the feedback channel can't be found. [1]"
-            )
+        # Votes come from a button on the suggestion itself, so the channel is known.
+        channel = E.channel
+        if channel is None:
+            ChannelID = (settings or await E.Config() or {}).get(
+                "Suggestions", {}
+            ).get("channel")
+            if not ChannelID:
+                logging.warning(
+                    f"[🏠 on_feedback] @{guild.name} no channel ID found in settings."
+                )
+                return
+            channel = await E.Channel(ChannelID)
         if channel is None:
             logging.warning(
-                f"[🏠 on_feedback] @{guild.name} the feedback channel can't be found. [2]"
-            )
-            return
-        MsgID = back.get("message_id")
-        message = await channel.fetch_message(MsgID)
-        if not message:
-            logging.warning(
-                f"[🏠 on_feedback] @{guild.name} I can't access the suggestion."
+                f"[🏠 on_feedback] @{guild.name} the feedback channel can't be found."
             )
             return
-        custom = await self.client.db["Customisation"].find_one(
-            {"guild_id": guild.id, "type": action}
-        )
+        message = channel.get_partial_message(back.get("message_id"))
+        custom = await self.Customisation(guild.id, action)
         view = Voting()
         if IsSeperateBot():
             view.settings.label = "Settings"
@@ -122,7 +174,12 @@ class On_suggestions_edit(commands.Cog):
                 view.upvote.disabled = True
                 view.downvote.disabled = True
                 view.settings.disabled = True
-        await message.edit(embed=embed, view=view)
+        try:
+            await message.edit(embed=embed, view=view)
+        except discord.NotFound:
+            logging.warning(
+                f"[🏠 on_feedback] @{guild.name} I can't access the suggestion."
+            )
 
 
 async def setup(client: commands.Bot) -> None:
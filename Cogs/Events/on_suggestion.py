@@ -1,6 +1,11 @@
 import discord
 from discord.ext import commands
 from bson import ObjectId
+from pymongo import ReturnDocument
+from utils.events import Event
+from utils.indexes import Declare
+
+Declare("suggestions", "message_id")
 from utils.format import IsSeperateBot
 
 import logging
@@ -108,6 +113,57 @@ class On_suggestions(commands.Cog):
         )
 
 
+def Without(field: str, user_id: int) -> dict:
+    return {
+        "$filter": {
+            "input": {"$ifNull": [f"${field}", []]},
+            "cond": {"$ne": ["$$this", user_id]},
+        }
+    }
+
+
+async def Vote(interaction: discord.Interaction, field: str, other: str):
+    """Toggle the user's vote in ``field`` and drop it from ``other`` in one update."""
+    user_id = interaction.user.id
+    current = {"$ifNull": [f"${field}", []]}
+    result = await interaction.client.db["suggestions"].find_one_and_update(
+        {"message_id": interaction.message.id},
+        [
+            {
+                "$set": {
+                    field: {
+                        "$cond": [
+                            {"$in": [user_id, current]},
+                            Without(field, user_id),
+                            {"$concatArrays": [current, [user_id]]},
+                        ]
+                    },
+                    other: Without(other, user_id),
+                }
+            }
+        ],
+        return_document=ReturnDocument.AFTER,
+    )
+    if not result:
+        return logging.critical(
+            f"[{field}] in {interaction.guild.name} I couldn't find the suggestion data to update it."
+        )
+
+    # Re-rendered by on_suggest_update once the burst of votes settles.
+    interaction.client.dispatch(
+        "suggestion_vote",
+        Event(
+            interaction.client,
+            "suggestions",
+            result,
+            guild=interaction.guild,
+            channel=interaction.channel,
+            MemberKey="author_id",
+        ),
+    )
+    await interaction.response.edit_message(content="")
+
+
 class Voting(discord.ui.View):
     def __init__(self):
         super().__init__(timeout=None)
@@ -119,37 +175,7 @@ class Voting(discord.ui.View):
         emoji = None,
     )
     async def upvote(self, interaction: discord.Interaction, button: discord.ui.Button):
-        settings = await interaction.client.config.find_one(
-            {"_id": interaction.guild.id}
-        )
-        result = await interaction.client.db["suggestions"].find_one(
-            {"message_id": interaction.message.id}
-        )
-        if not result:
-            return logging.critical(
-                f"[upvoting] in {interaction.guild.name} I couldn't find the suggestion data to update it."
-            )
-
-        if interaction.user.id in result.get("upvoters"):
-            await interaction.client.db["suggestions"].update_one(
-                {"message_id": interaction.message.id},
-                {"$pull": {"upvoters": interaction.user.id}},
-            )
-        else:
-            await interaction.client.db["suggestions"].update_one(
-                {"message_id": interaction.message.id},
-                {"$push": {"upvoters": interaction.user.id}},
-            )
-            if interaction.user.id in result.get("downvoters"):
-                await interaction.client.db["suggestions"].update_one(
-                    {"message_id": interaction.message.id},
-                    {"$pull": {"downvoters": interaction.user.id}},
-                )
-
-        interaction.client.dispatch(
-            "suggestion_edit", result.get("_id"), settings, "Suggestion"
-        )
-        await interaction.response.edit_message(content="")
+        await Vote(interaction, "upvoters", "downvoters")
 
     @discord.ui.button(
         label="Downvote",
@@ -160,37 +186,7 @@ class Voting(discord.ui.View):
     async def downvote(
         self, interaction: discord.Interaction, button: discord.ui.Button
     ):
-        settings = await interaction.client.config.find_one(
-            {"_id": interaction.guild.id}
-        )
-        result = await interaction.client.db["suggestions"].find_one(
-            {"message_id": interaction.message.id}
-        )
-        if not result:
-            return logging.critical(
-                f"[downvoting] in {interaction.guild.name} I couldn't find the suggestion data to update it."
-            )
-
-        if interaction.user.id in result.get("downvoters"):
-            await interaction.client.db["suggestions"].update_one(
-                {"message_id": interaction.message.id},
-                {"$pull": {"downvoters": interaction.user.id}},
-            )
-        else:
-            await interaction.client.db["suggestions"].update_one(
-                {"message_id": interaction.message.id},
-                {"$push": {"downvoters": interaction.user.id}},
-            )
-            if interaction.user.id in result.get("upvoters"):
-                await interaction.client.db["suggestions"].update_one(
-                    {"message_id": interaction.message.id},
-                    {"$pull": {"upvoters": interaction.user.id}},
-                )
-
-        interaction.client.dispatch(
-            "suggestion_edit", result.get("_id"), settings, "Suggestion"
-        )
-        await interaction.response.edit_message(content="")
+        await Vote(interaction, "downvoters", "upvoters")
 
     @discord.ui.button(
         label="Voters", style=discord.ButtonStyle.gray, custom_id="VOTING;RESADADJ"
@@ -309,7 +305,17 @@ class ManageSuggestion(discord.ui.Select):
 
         if selected_option == "Approve":
             interaction.client.dispatch(
-                "suggestion_edit", result.get("_id"), settings, "Accepted Suggestion"
+                "suggestion_edit",
+                Event(
+                    interaction.client,
+                    "suggestions",
+                    result,
+                    guild=interaction.guild,
+                    config=settings,
+                    MemberKey="author_id",
+                ),
+                settings,
+                "Accepted Suggestion",
             )
             await interaction.response.edit_message(
                 content=f"{tick} **{interaction.user.display_name}**, it has been marked as accepted.",
@@ -343,8 +349,19 @@ class DenialReason(discord.ui.Modal, title="Denial Reason"):
             {"message_id": self.msg.id},
             {"$set": {"reason": self.reason.value}},
         )
+        result["reason"] = self.reason.value
         interaction.client.dispatch(
-            "suggestion_edit", result.get("_id"), settings, "Denied Suggestion"
+            "suggestion_edit",
+            Event(
+                interaction.client,
+                "suggestions",
+                result,
+                guild=interaction.guild,
+                config=settings,
+                MemberKey="author_id",
+            ),
+            settings,
+            "Denied Suggestion",
         )
         await interaction.response.edit_message(
             content=f"{tick} **{interaction.user.display_name},** suggestion marked as denied.",
@@ -10,6 +10,18 @@ import datetime
 from utils.format import Replace
 import asyncio
 from utils.r2 import upload_file_to_r2, ClearOldFiles
+from utils.events import Event, Hydrate
+from utils.indexes import Declare
+from utils.cluster import Owns, Primary
+from utils.router import MessageContext, Subscribe, Unsubscribe
+
+Declare(
+    "Tickets",
+    "ChannelID",
+    "MessageID",
+    ["GuildID", "closed"],
+    ["UserID", "closed"],
+)
 
 
 async def TicketPermissions(interaction: discord.Interaction):
@@ -72,7 +84,17 @@ class PTicketControl(discord.ui.View):
                 "This isn't a ticket channel.", ephemeral=True
             )
         interaction.client.dispatch(
-            "pticket_close", Result.get("_id"), "No reason provided", interaction.user
+            "pticket_close",
+            Event(
+                interaction.client,
+                "Tickets",
+                _id=Result.get("_id"),
+                guild=interaction.guild,
+                channel=interaction.channel,
+                GuildKey="GuildID", MemberKey="UserID",
+            ),
+            "No reason provided",
+            interaction.user,
         )
 
     @discord.ui.button(
@@ -158,7 +180,12 @@ class TicketsPublic(commands.Cog):
     def __init__(self, client: commands.Bot):
         self.client = client
         self.AutomAtions.start()
-        self.ClearOld.start()
+        if Primary:
+            self.ClearOld.start()
+        Subscribe("tickets", self.on_routed_message, "guild")
+
+    def cog_unload(self):
+        Unsubscribe("tickets")
 
     @tasks.loop(seconds=360)
     async def AutomAtions(self):
@@ -166,6 +193,7 @@ class TicketsPublic(commands.Cog):
         if os.getenv("ENVIRONMENT") == "custom":
             Filter["GuildID"] = int(os.getenv("CUSTOM_GUILD"))
         Tickets = await self.client.db["Tickets"].find(Filter).to_list(length=None)
+        Tickets = [Ticket for Ticket in Tickets if Owns(Ticket.get("GuildID"))]
 
         async def SendAutoMation(Ticket, semaphore):
             async with semaphore:
@@ -231,23 +259,18 @@ class TicketsPublic(commands.Cog):
         semaphore = asyncio.Semaphore(5)
         await asyncio.gather(*[SendAutoMation(Ticket, semaphore) for Ticket in Tickets])
 
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message):
-        if not message.guild:
-            return
-        Ticket = await self.client.db["Tickets"].find_one(
-            {"ChannelID": message.channel.id}
-        )
+    async def on_routed_message(self, ctx: MessageContext):
+        Ticket = await ctx.Ticket()
         if not Ticket:
             return
-        if not int(Ticket.get("UserID")) == int(message.author.id):
+        if not int(Ticket.get("UserID")) == int(ctx.author.id):
             return
         await self.client.db["Tickets"].update_one(
-            {"ChannelID": message.channel.id},
+            {"ChannelID": ctx.channel.id},
             {
                 "$set": {
                     "lastMessageSent": datetime.datetime.utcnow(),
-                    "lastMessenger": message.author.id,
+                    "lastMessenger": ctx.author.id,
                     "LastMessageWasBot": False,
                 }
             },
@@ -255,17 +278,18 @@ class TicketsPublic(commands.Cog):
 
     @commands.Cog.listener()
     async def on_pticket_review(
-        self, objectID: ObjectId, rating: int, member: discord.Member
+        self, objectID: Event | ObjectId, rating: int, member: discord.Member
     ):
-        Result = await self.client.db["Tickets"].find_one({"_id": objectID})
+        E = Hydrate(self.client, "Tickets", objectID, GuildKey="GuildID", MemberKey="UserID")
+        Result = await E.Document()
         if not Result:
-            return logging.critical(f"[TICKETS] Ticket with ID {objectID} not found")
-        Guild = self.client.get_guild(Result.get("GuildID"))
+            return logging.critical(f"[TICKETS] Ticket with ID {E.id} not found")
+        Guild = await E.Guild()
         if not Guild:
             return logging.critical(
                 f"[TICKETS] Guild with ID {Result.get('GuildID')} not found"
             )
-        Channel = Guild.get_channel(Result.get("ReviewChannel"))
+        Channel = await E.Channel(Result.get("ReviewChannel"))
         if not Channel:
             return logging.critical(
                 f"[TICKETS] Channel with ID {Result.get('ReviewChannel')} not found"
@@ -289,15 +313,18 @@ class TicketsPublic(commands.Cog):
             )
 
     @commands.Cog.listener()
-    async def on_pticket_claim(self, objectID: ObjectId, member: discord.Member):
-        Result = await self.client.db["Tickets"].find_one({"_id": objectID})
+    async def on_pticket_claim(
+        self, objectID: Event | ObjectId, member: discord.Member
+    ):
+        E = Hydrate(self.client, "Tickets", objectID, GuildKey="GuildID", MemberKey="UserID")
+        Result = await E.Document()
         if not Result:
-            return logging.critical(f"[TICKETS] Ticket with ID {objectID} not found")
+            return logging.critical(f"[TICKETS] Ticket with ID {E.id} not found")
 
         Panel = await self.client.db["Panels"].find_one(
             {"name": Result.get("panel"), "guild": int(Result.get("GuildID"))}
         )
-        Channel = await self.client.fetch_channel(Result.get("ChannelID"))
+        Channel = await E.Channel(Result.get("ChannelID"))
         if not Channel:
             return logging.critical(
                 f"[TICKETS] Channel with ID {Result.get('ChannelID')} not found"
@@ -422,8 +449,10 @@ class TicketsPublic(commands.Cog):
             )
 
     @commands.Cog.listener()
-    async def on_pticket_open(self, objectID: ObjectId, Panelled: str):
-        Ticket = await self.client.db["Tickets"].find_one({"_id": objectID})
+    async def on_pticket_open(self, objectID: Event | ObjectId, Panelled: str):
+        E = Hydrate(self.client, "Tickets", objectID, GuildKey="GuildID", MemberKey="UserID")
+        objectID = E.id
+        Ticket = await E.Document()
         if not Ticket:
             return logging.critical("[on_pticket_open] I can't find the ticket.")
 
@@ -436,7 +465,7 @@ class TicketsPublic(commands.Cog):
             )
             return logging.critical("[on_pticket_open] I can't find the panel.")
         guild_id = Ticket.get("GuildID")
-        guild = await self.client.fetch_guild(guild_id)
+        guild = await E.Guild()
         if not guild:
             await self.client.db["Tickets"].update_one(
                 {"_id": objectID}, {"$set": {"error.message": "Guild not found."}}
@@ -446,7 +475,7 @@ class TicketsPublic(commands.Cog):
             )
 
         author_id = Ticket.get("UserID", {})
-        author = await guild.fetch_member(author_id)
+        author = await E.Member()
         if not author:
             await self.client.db["Tickets"].update_one(
                 {"_id": objectID}, {"$set": {"error.message": "Author not found."}}
@@ -647,27 +676,26 @@ class TicketsPublic(commands.Cog):
 
     @commands.Cog.listener()
     async def on_pticket_close(
-        self, ObjectID: ObjectId, reason: str, member: discord.Member
+        self, ObjectID: Event | ObjectId, reason: str, member: discord.Member
     ):
-        Result = await self.client.db["Tickets"].find_one({"_id": ObjectID})
+        E = Hydrate(self.client, "Tickets", ObjectID, GuildKey="GuildID", MemberKey="UserID")
+        ObjectID = E.id
+        Result = await E.Document()
         if not Result:
             return logging.critical(f"[TICKETS] Ticket with ID {ObjectID} not found")
 
-        Guild = self.client.get_guild(Result.get("GuildID"))
+        Guild = await E.Guild()
         if not Guild:
             return logging.critical(
                 f"[TICKETS] Guild with ID {Result.get('GuildID')} not found"
             )
 
-        Channel = Guild.get_channel(Result.get("ChannelID"))
+        Channel = await E.Channel(Result.get("ChannelID"))
         if not Channel:
             return logging.critical(
                 f"[TICKETS] Channel with ID {Result.get('ChannelID')} not found"
             )
-        try:
-            user = await Guild.fetch_member(Result.get("UserID"))
-        except (discord.NotFound, discord.HTTPException):
-            user = None
+        user = await E.Member()
         msg = await Channel.send(" Ticket closing...")
         messages = []
         compact = []
@@ -900,7 +928,10 @@ class FormalReview(discord.ui.Modal):
                 "I can't find the ticket.", ephemeral=True
             )
         interaction.client.dispatch(
-            "pticket_review", Result.get("_id"), self.rating, interaction.user
+            "pticket_review",
+            Event(interaction.client, "Tickets", Result, GuildKey="GuildID", MemberKey="UserID"),
+            self.rating,
+            interaction.user,
         )
         view = discord.ui.View()
         view.add_item(
@@ -1,59 +1,38 @@
 from discord.ext import commands
 import discord
+from utils.indexes import Declare
+from utils.router import MessageContext, Subscribe, Unsubscribe
+
+Declare("messages", ["guild_id", "user_id"], database="quotadb")
+Declare("modcases", ["guild_id", "user_id"], database="quotadb")
+
+
 class messageevent(commands.Cog):
     def __init__(self, client):
         self.client = client
+        Subscribe("quota", self.on_routed_message, "guild")
 
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message):
-        if message.guild is None:
-            return
-        if message.author.bot:
-            return
-        if message.author is None:
-            return
-        if message.channel is None:
-            return
+    def cog_unload(self):
+        Unsubscribe("quota")
 
-        config = await self.client.db["Config"].find_one({"_id": message.guild.id})
+    async def on_routed_message(self, ctx: MessageContext):
+        config = await ctx.Config()
         if not config:
             return
         if config.get("Modules", {}).get("Quota", False) is False:
             return
 
-        staff_role_ids = config.get("Permissions", {}).get("staffrole", [])
-        admin_role_ids = config.get("Permissions", {}).get("adminrole", [])
-
-        if message.channel.id in config.get("Message Quota", {}).get(
+        if ctx.channel.id in config.get("Message Quota", {}).get(
             "Ignored Channels", []
         ):
             return
 
-        if not isinstance(staff_role_ids, list):
-            staff_role_ids = [staff_role_ids]
-        if not isinstance(admin_role_ids, list):
-            admin_role_ids = [admin_role_ids]
-
-        if any(role.id in staff_role_ids for role in message.author.roles):
-            guild_id = message.guild.id
-            author_id = message.author.id
-
-            await self.client.qdb["messages"].update_one(
-                {"guild_id": guild_id, "user_id": author_id},
-                {"$inc": {"message_count": 1}},
-                upsert=True,
-            )
-            return
-        elif any(role.id in admin_role_ids for role in message.author.roles):
-            guild_id = message.guild.id
-            author_id = message.author.id
-
+        if await ctx.Staff() or await ctx.Admin():
             await self.client.qdb["messages"].update_one(
-                {"guild_id": guild_id, "user_id": author_id},
+                {"guild_id": ctx.guild.id, "user_id": ctx.author.id},
                 {"$inc": {"message_count": 1}},
                 upsert=True,
             )
-            return
 
 
 async def setup(client: commands.Bot) -> None:
@@ -5,6 +5,10 @@ import os
 from utils.emojis import *
 from typing import Optional, Literal
 from Cogs.Modules.Utilities.premium import premmies
+from Cogs.Events.Dev.on_guild import GuildStats
+from utils.telemetry import Summarise
+from utils.config import PatchConfig
+from io import BytesIO
 
 
 def is_owner(user_id: int) -> bool:
@@ -157,9 +161,7 @@ class management(commands.Cog):
         if not is_owner(ctx.author.id):
             await ctx.send("You do not have permission to use this command.")
             return
-        await self.client.db["Config"].update_one(
-            {"_id": server}, {"$addToSet": {"Features": feature}}, upsert=True
-        )
+        await PatchConfig(self.client, server, Add={"Features": feature})
         await ctx.send(
             f"` ✅ ` **{ctx.author.display_name},** feature added to server `{server}`."
         )
@@ -170,9 +172,7 @@ class management(commands.Cog):
         if not is_owner(ctx.author.id):
             await ctx.send("You do not have permission to use this command.")
             return
-        await self.client.db["Config"].update_one(
-            {"_id": server}, {"$pull": {"Features": features}}, upsert=True
-        )
+        await PatchConfig(self.client, server, Pull={"Features": features})
         await ctx.send(
             f"` ❌ ` **{ctx.author.display_name},** feature removed from server `{server}`."
         )
@@ -183,18 +183,57 @@ class management(commands.Cog):
         if not is_owner(ctx.author.id):
             await ctx.send("You do not have permission to use this command.")
             return
-        result = await self.client.db["analytics"].find({}).to_list(length=None)
+        telemetry = getattr(self.client, "telemetry", None)
+        if telemetry:
+            await telemetry.Flush(self.client.db["Command Telemetry"])
+        result = (
+            await self.client.db["Command Telemetry"]
+            .find({})
+            .sort("count", -1)
+            .to_list(length=None)
+        )
+        if not result:
+            return await ctx.send(
+                f"{no} **{ctx.author.display_name},** no command telemetry has been recorded yet."
+            )
+
+        content = f"{'command':<40} {'kind':<7} {'count':>8} {'errors':>7} {'avg':>8} {'p50':>7} {'p95':>7} {'p99':>7}\n"
+        for document in result:
+            stats = Summarise(document)
+            content += f"{str(stats['command']):<40} {str(stats['kind']):<7} {stats['count']:>8} {stats['errors']:>7} {str(stats['average']):>8} {str(stats['p50']):>7} {str(stats['p95']):>7} {str(stats['p99']):>7}\n"
 
-        content = ""
-        for x in result:
-            for key, value in x.items():
-                if key != "_id":
-                    content += f"{key}: {value}\n"
-            content += "\n"
-            with open("analytics.txt", "w", encoding="utf-8") as file:
-                file.write(content)
+        await ctx.send(
+            file=discord.File(BytesIO(content.encode("utf-8")), filename="analytics.txt")
+        )
 
-            await ctx.send(file=discord.File("analytics.txt"))
+    @commands.command()
+    @commands.is_owner()
+    async def guildstats(self, ctx: commands.Context, days: int = 30):
+        if not is_owner(ctx.author.id):
+            await ctx.send("You do not have permission to use this command.")
+            return
+        days = max(1, min(days, 365))
+        Stats = await GuildStats(self.client.db, days)
+
+        description = "\n".join(
+            f"> `{day.get('date')}` **+{day.get('new', 0)}** / **-{day.get('left', 0)}**"
+            for day in Stats.get("days", [])[:14]
+        )
+        embed = discord.Embed(
+            title=f"Guild Stats ({days}d)",
+            description=description or "No joins or leaves recorded.",
+            color=discord.Color.dark_embed(),
+        )
+        embed.add_field(
+            name="Period",
+            value=f"> **Joined:** {Stats.get('new', 0)}\n> **Left:** {Stats.get('left', 0)}\n> **Net:** {Stats.get('new', 0) - Stats.get('left', 0)}",
+        )
+        embed.add_field(
+            name="All Time",
+            value=f"> **Joined:** {Stats['total'].get('new', 0)}\n> **Left:** {Stats['total'].get('left', 0)}",
+        )
+        embed.set_footer(text=f"Currently in {len(self.client.guilds)} guilds")
+        await ctx.send(embed=embed)
 
     @commands.command()
     @commands.guild_only()
@@ -290,11 +329,9 @@ class ManageAccount(discord.ui.View):
                 for server in PR.get("guilds", []):
                     Config = await self.client.db["Config"].find_one({"_id": server})
                     if Config is not None:
-                        features = Config.get("Features", [])
-                        if "PREMIUM" in features:
-                            features.remove("PREMIUM")
-                            await self.client.db["Config"].update_one(
-                                {"_id": server}, {"$set": {"Features": features}}
+                        if "PREMIUM" in Config.get("Features", []):
+                            await PatchConfig(
+                                self.client, server, Pull={"Features": "PREMIUM"}
                             )
                 await interaction.client.db["Subscriptions"].delete_one(
                     {"user": self.user.id}
@@ -6,6 +6,7 @@ from datetime import datetime
 
 
 import aiohttp
+from utils.http import HTTP
 from utils.emojis import *
 
 
@@ -20,9 +21,7 @@ class Utility(commands.Cog):
     @app_commands.allowed_contexts(guilds=True, dms=True, private_channels=True)
     async def birb(self, interaction: discord.Interaction):
         try:
-            async with aiohttp.ClientSession() as session, session.get(
-                "https://api.alexflipnote.dev/birb"
-            ) as response:
+            async with HTTP.get("https://api.alexflipnote.dev/birb") as response:
                 response.raise_for_status()
                 data = await response.json()
 
@@ -1,23 +1,33 @@
 import discord
 from discord.ext import commands, tasks
 from io import BytesIO
-import matplotlib.pyplot as plt
-import matplotlib
+import math
 import aiohttp
+from utils.http import HTTP
 import os
 from discord import app_commands
 from datetime import datetime
 from utils.emojis import *
+from utils.lazy import Lazy
+from utils.cluster import Primary
 
-matplotlib.use("Agg")
-import numpy as np
-from scipy.interpolate import CubicSpline
+
+def Agg():
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+
+plt = Lazy("matplotlib.pyplot", Agg)
+np = Lazy("numpy")
+interpolate = Lazy("scipy.interpolate")
 
 
 class Ping(commands.Cog):
     def __init__(self, client: commands.Bot):
         self.client = client
-        self.SavePing.start()
+        if Primary:
+            self.SavePing.start()
 
     async def Gen(self, data: dict) -> BytesIO:
         blurple = "#5865F2"
@@ -51,7 +61,7 @@ class Ping(commands.Cog):
                 y = [float(x) if x not in ["N/A", "None"] else 0 for x in data[key]]
                 x = np.arange(len(y))
 
-                cs = CubicSpline(x, y)
+                cs = interpolate.CubicSpline(x, y)
                 x_new = np.linspace(x.min(), x.max(), 500)
                 y_new = cs(x_new)
 
@@ -86,8 +96,10 @@ class Ping(commands.Cog):
 
     async def APIConnection(self) -> str:
         try:
-            async with aiohttp.ClientSession() as session, session.get(
-                "https://api.astrobirb.dev/status"
+            async with HTTP.get(
+                "https://api.astrobirb.dev/status",
+                timeout=aiohttp.ClientTimeout(total=5),
+                retries=0,
             ) as response:
                 response.raise_for_status()
                 return await response.json()
@@ -100,7 +112,7 @@ class Ping(commands.Cog):
             return
         Latency = (
             round(self.client.latency * 1000)
-            if not np.isnan(self.client.latency)
+            if not math.isnan(self.client.latency)
             else 0
         )
         if Latency > 700:
@@ -152,7 +164,7 @@ class Ping(commands.Cog):
 
         Dis = (
             round(self.client.latency * 1000)
-            if not np.isnan(self.client.latency)
+            if not math.isnan(self.client.latency)
             else 0
         )
     
@@ -6,6 +6,8 @@ from typing import Optional
 import asyncio
 
 from utils.emojis import tick, star, wave
+from utils.waiters import WaitForReaction
+from utils.router import MessageContext, Subscribe, Unsubscribe
 
 # Get emojis
 try:
@@ -20,6 +22,10 @@ class AFK(commands.Cog):
     def __init__(self, client: commands.Bot):
         self.client = client
         self.afk_users = {}  # {user_id: {"status": str, "timestamp": datetime, "mentions": [...]}}
+        Subscribe("afk", self.on_routed_message)
+
+    def cog_unload(self):
+        Unsubscribe("afk")
 
     @commands.hybrid_command(name="afk", aliases=["away"])
     @app_commands.describe(status="Your AFK status (optional)")
@@ -61,12 +67,13 @@ class AFK(commands.Cog):
             print(f"Error in afk_cmd: {e}")
             await ctx.send(f"❌ An error occurred: {str(e)}")
 
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message):
-        """Listen for messages and handle AFK mentions and returning from AFK"""
-        if message.author.bot:
+    async def on_routed_message(self, ctx: MessageContext):
+        """Handle AFK mentions and returning from AFK"""
+        message = ctx.message
+        # Nothing to do unless someone is AFK, skip the per-message work.
+        if not self.afk_users:
             return
-        
+
         try:
             # Check if user is AFK and remove status if they send a message
             if message.author.id in self.afk_users:
@@ -101,7 +108,7 @@ class AFK(commands.Cog):
             # Check if message mentions any AFK users
             await self._check_mentions(message)
         except Exception as e:
-            print(f"Error in on_message: {e}")
+            print(f"Error in AFK message handler: {e}")
 
     async def _check_mentions(self, message: discord.Message):
         """Check if message mentions any AFK users"""
@@ -193,7 +200,7 @@ class AFK(commands.Cog):
                     
                     while True:
                         try:
-                            reaction, reacting_user = await self.client.wait_for("reaction_add", check=check, timeout=300)
+                            reaction, reacting_user = await WaitForReaction(self.client, msg.id, user.id, check=check, timeout=300)
                             
                             if str(reaction.emoji) == "➡️":
                                 current_page = min(current_page + 1, len(pages) - 1)
@@ -7,6 +7,7 @@ from utils.autocompletes import ConnectionRoles
 from utils.Module import ModuleCheck
 
 from utils.HelpEmbeds import ModuleNotEnabled, Support
+from utils.membercache import ChunkGuild
 
 class ConnectionRoles(commands.Cog):
     def __init__(self, client: commands.Bot):
@@ -39,8 +40,7 @@ class ConnectionRoles(commands.Cog):
                 f"{no} **{ctx.author.display_name}**, there are no connection roles.",
             )
             return
-        if not ctx.guild.chunked:
-            await ctx.guild.chunk()
+        await ChunkGuild(ctx.guild)
 
         Total = len(ctx.guild.members)
         Updated = 0
@@ -107,6 +107,7 @@ class ConnectionRoles(commands.Cog):
                 "name": child.name,
             }
         )
+        self.client.dispatch("connectionroles_edit", ctx.guild.id)
         await ctx.send(
             f"{tick} **{ctx.author.display_name}**, The connection role has been added."
         )
@@ -134,6 +135,7 @@ class ConnectionRoles(commands.Cog):
             return
 
         await self.client.db['connectionroles'].delete_many({"guild": ctx.guild.id, "name": name})
+        self.client.dispatch("connectionroles_edit", ctx.guild.id)
         await ctx.send(
             f"{tick} **{ctx.author.display_name}**, The connection role has been removed.",
         )
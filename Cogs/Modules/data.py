@@ -1,7 +1,16 @@
 import discord
+import gzip
+import logging
+import os
+import tempfile
+from datetime import datetime
 from discord.ext import commands
 from utils.emojis import *
 from utils.HelpEmbeds import NotYourPanel
+from utils.backup import ArchiveError, Export, Import
+from utils.r2 import ExportPrefix, PresignedURL, PrivateKey, UploadPrivate
+from utils.purge import Schedule
+from utils.config import PatchConfig
 
 class Data(commands.Cog):
     def __init__(self, client: commands.Bot):
@@ -45,6 +54,83 @@ class Data(commands.Cog):
         embed.description = " Select **an option** to manage your server's data."
         await ctx.send(view=view, embed=embed)
 
+    @data.command(description="Export your server's data as a compressed archive")
+    @commands.has_guild_permissions(administrator=True)
+    async def export(self, ctx: commands.Context):
+        await ctx.defer(ephemeral=True)
+        File, Counts = await Export(self.client, ctx.guild.id)
+        with File:
+            size = File.seek(0, os.SEEK_END)
+            File.seek(0)
+            filename = f"{ctx.guild.id}-{datetime.utcnow():%Y%m%d%H%M%S}.ndjson.gz"
+            summary = "\n".join(
+                f"> **{name.title()}:** {count}" for name, count in Counts.items()
+            )
+            if size <= ctx.guild.filesize_limit:
+                return await ctx.send(
+                    content=f"{tick} **{ctx.author.display_name}**, here's your server's data.\n{summary}",
+                    file=discord.File(File, filename=filename),
+                    ephemeral=True,
+                )
+            # The archive holds infractions, staff and tickets, so it's stored under
+            # a random key and shared through a link that expires within the hour.
+            key = PrivateKey(ExportPrefix, filename)
+            try:
+                url = None
+                if await UploadPrivate(File, key, "application/gzip"):
+                    url = await PresignedURL(key, expires=3600)
+            except Exception as e:
+                logging.warning(f"[Data] Export upload for {ctx.guild.id} failed: {e}")
+                return await ctx.send(
+                    f"{no} **{ctx.author.display_name}**, I couldn't upload the export, try again later.",
+                    ephemeral=True,
+                )
+        if not url:
+            return await ctx.send(
+                f"{no} **{ctx.author.display_name}**, the export is too large to attach.",
+                ephemeral=True,
+            )
+        await ctx.send(
+            f"{tick} **{ctx.author.display_name}**, your server's data is ready, this link expires in an hour: {url}\n{summary}",
+            ephemeral=True,
+        )
+
+    @data.command(
+        name="import", description="Restore your server's data from an export"
+    )
+    @commands.has_guild_permissions(administrator=True)
+    async def restore(self, ctx: commands.Context, archive: discord.Attachment):
+        await ctx.defer(ephemeral=True)
+        with tempfile.TemporaryFile() as File:
+            await archive.save(File)
+            File.seek(0)
+            try:
+                Counts = await Import(self.client, ctx.guild.id, File)
+            except ArchiveError as e:
+                return await ctx.send(
+                    f"{no} **{ctx.author.display_name}**, {e}", ephemeral=True
+                )
+            except (OSError, EOFError):
+                return await ctx.send(
+                    f"{no} **{ctx.author.display_name}**, that file isn't a valid export.",
+                    ephemeral=True,
+                )
+        if Counts.get("config"):
+            Config = await self.client.config.find_one({"_id": ctx.guild.id})
+            if Config:
+                self.client.dispatch(
+                    "config_update", ctx.guild.id, list(Config.keys()), Config
+                )
+        summary = "\n".join(
+            f"> **{name.title()}:** {count}" for name, count in Counts.items()
+        )
+        await ctx.send(
+            f"{tick} **{ctx.author.display_name}**, restored your server's data.\n{summary or '> Nothing to restore.'}",
+            ephemeral=True,
+        )
+
+    @export.error
+    @restore.error
     @manage.error
     async def PermsHandler(self, ctx: commands.Context, error):
         if isinstance(error, commands.MissingPermissions):
@@ -154,6 +240,19 @@ class ClearData(discord.ui.View):
         self.author = author
         self.Type = Type
 
+    async def Erase(
+        self, interaction: discord.Interaction, target: str, label: str
+    ):
+        # Large guilds can hold hundreds of thousands of documents, the purge
+        # worker deletes them in throttled batches and DMs the progress.
+        await Schedule(
+            interaction.client, interaction.guild.id, [target], user=interaction.user
+        )
+        await interaction.response.send_message(
+            f"{tick} Erasing all {label} in the background, I'll DM you the progress.",
+            ephemeral=True,
+        )
+
     @discord.ui.button(label="Reset Configuration", style=discord.ButtonStyle.danger)
     async def callback(
         self, interaction: discord.Interaction, button: discord.ui.Button
@@ -177,107 +276,71 @@ class ClearData(discord.ui.View):
 
         Embed = discord.Embed(color=discord.Color.dark_embed())
         if self.Type == "suspensions":
-            await interaction.client.config.update_one(
-                {"_id": interaction.guild.id}, {"$unset": {"Suspension": 1}}
-            )
-            config = await interaction.client.config.find_one(
-                {"_id": interaction.guild.id}
+            config = await PatchConfig(
+                interaction.client, interaction.guild.id, Unset=["Suspension"]
             )
             embed = await SuspensionEmbed(interaction, config, Embed)
         elif self.Type == "infractions":
-            await interaction.client.config.update_one(
-                {"_id": interaction.guild.id}, {"$unset": {"Infraction": 1}}
-            )
-            config = await interaction.client.config.find_one(
-                {"_id": interaction.guild.id}
+            config = await PatchConfig(
+                interaction.client, interaction.guild.id, Unset=["Infraction"]
             )
             embed = await InfractionEmbed(interaction, config, Embed)
 
         elif self.Type == "promotions":
-            await interaction.client.config.update_one(
-                {"_id": interaction.guild.id}, {"$unset": {"Promotions": 1}}
-            )
-            config = await interaction.client.config.find_one(
-                {"_id": interaction.guild.id}
+            config = await PatchConfig(
+                interaction.client, interaction.guild.id, Unset=["Promotions"]
             )
             embed = await PromotionEmbed(interaction, config, Embed)
 
         elif self.Type == "loa":
-            await interaction.client.config.update_one(
-                {"_id": interaction.guild.id}, {"$unset": {"LOA": 1}}
-            )
-            config = await interaction.client.config.find_one(
-                {"_id": interaction.guild.id}
+            config = await PatchConfig(
+                interaction.client, interaction.guild.id, Unset=["LOA"]
             )
             embed = await LOAEmbed(interaction, config, Embed)
 
         elif self.Type == "Modmail":
-            await interaction.client.config.update_one(
-                {"_id": interaction.guild.id}, {"$unset": {"Modmail": 1}}
-            )
-            config = await interaction.client.config.find_one(
-                {"_id": interaction.guild.id}
+            config = await PatchConfig(
+                interaction.client, interaction.guild.id, Unset=["Modmail"]
             )
             embed = await ModmailEmbed(interaction, config, Embed)
         elif self.Type == "Permissions":
-            await interaction.client.config.update_one(
-                {"_id": interaction.guild.id}, {"$unset": {"Permissions": 1}}
-            )
-            config = await interaction.client.config.find_one(
-                {"_id": interaction.guild.id}
+            config = await PatchConfig(
+                interaction.client, interaction.guild.id, Unset=["Permissions"]
             )
             embed = await PermissionsEmbed(interaction, config, Embed)
         elif self.Type == "Quota":
-            await interaction.client.config.update_one(
-                {"_id": interaction.guild.id}, {"$unset": {"Message Quota": 1}}
-            )
-            config = await interaction.client.config.find_one(
-                {"_id": interaction.guild.id}
+            config = await PatchConfig(
+                interaction.client, interaction.guild.id, Unset=["Message Quota"]
             )
             embed = await MessageQuotaEmbed(interaction, config, Embed)
 
         elif self.Type == "customcommands":
-            await interaction.client.config.update_one(
-                {"_id": interaction.guild.id}, {"$unset": {"Custom Commands": 1}}
-            )
-            config = await interaction.client.config.find_one(
-                {"_id": interaction.guild.id}
+            config = await PatchConfig(
+                interaction.client, interaction.guild.id, Unset=["Custom Commands"]
             )
             embed = await CustomCommandsEmbed(interaction, Embed)
 
         elif self.Type == "feedback":
-            await interaction.client.config.update_one(
-                {"_id": interaction.guild.id}, {"$unset": {"Feedback": 1}}
-            )
-            config = await interaction.client.config.find_one(
-                {"_id": interaction.guild.id}
+            config = await PatchConfig(
+                interaction.client, interaction.guild.id, Unset=["Feedback"]
             )
             embed = await StaffFeedbackEmbed(interaction, config, Embed)
 
         elif self.Type == "qotd":
-            await interaction.client.config.update_one(
-                {"_id": interaction.guild.id}, {"$unset": {"QOTD": 1}}
-            )
-            config = await interaction.client.config.find_one(
-                {"_id": interaction.guild.id}
+            config = await PatchConfig(
+                interaction.client, interaction.guild.id, Unset=["QOTD"]
             )
             embed = await QOTDEMbed(interaction, Embed)
 
         elif self.Type == "staffdb":
-            await interaction.client.config.update_one(
-                {"_id": interaction.guild.id}, {"$unset": {"Staff Database": 1}}
-            )
-            config = await interaction.client.config.find_one(
-                {"_id": interaction.guild.id}
+            config = await PatchConfig(
+                interaction.client, interaction.guild.id, Unset=["Staff Database"]
             )
             embed = await StaffPanelEmbed(interaction, Embed)
 
         elif self.Type == "suggestions":
-            await interaction.client.config.update_one(
-                {"_id": interaction.guild.id}, {"$unset": {"Suggestions": 1}}
-            )
-            config = await interaction.client.config.find_one(
-                {"_id": interaction.guild.id}
+            config = await PatchConfig(
+                interaction.client, interaction.guild.id, Unset=["Suggestions"]
             )
             embed = await SuggestionsEmbed(interaction, config, Embed)
 
@@ -290,12 +353,7 @@ class ClearData(discord.ui.View):
         if interaction.user.id != self.author.id:
              
             return await interaction.response.send_message(embed=NotYourPanel(), ephemeral=True)
-        await interaction.client.db["infractions"].delete_many(
-            {"guild_id": interaction.guild.id}
-        )
-        await interaction.response.send_message(
-            f"{tick} Successfully cleared all infractions.", ephemeral=True
-        )
+        await self.Erase(interaction, "infractions", "infractions")
 
     @discord.ui.button(label="Erase Promotions", style=discord.ButtonStyle.danger)
     async def clear_promotions(
@@ -304,12 +362,7 @@ class ClearData(discord.ui.View):
         if interaction.user.id != self.author.id:
              
             return await interaction.response.send_message(embed=NotYourPanel(), ephemeral=True)
-        await interaction.client.db["promotions"].delete_many(
-            {"guild_id": interaction.guild.id}
-        )
-        await interaction.response.send_message(
-            f"{tick} Successfully cleared all promotions.", ephemeral=True
-        )
+        await self.Erase(interaction, "promotions", "promotions")
 
     @discord.ui.button(label="Erase Suggestions", style=discord.ButtonStyle.danger)
     async def clear_suggestions(
@@ -318,12 +371,7 @@ class ClearData(discord.ui.View):
         if interaction.user.id != self.author.id:
              
             return await interaction.response.send_message(embed=NotYourPanel(), ephemeral=True)
-        await interaction.client.db["suggestions"].delete_many(
-            {"guild_id": interaction.guild.id}
-        )
-        await interaction.response.send_message(
-            f"{tick} Successfully cleared all suggestions.", ephemeral=True
-        )
+        await self.Erase(interaction, "suggestions", "suggestions")
 
     @discord.ui.button(label="Erase Custom Commands", style=discord.ButtonStyle.danger)
     async def clear_custom_commands(
@@ -332,12 +380,7 @@ class ClearData(discord.ui.View):
         if interaction.user.id != self.author.id:
              
             return await interaction.response.send_message(embed=NotYourPanel(), ephemeral=True)
-        await interaction.client.db["Custom Commands"].delete_many(
-            {"guild_id": interaction.guild.id}
-        )
-        await interaction.response.send_message(
-            f"{tick} Successfully cleared all custom commands.", ephemeral=True
-        )
+        await self.Erase(interaction, "custom commands", "custom commands")
 
     @discord.ui.button(label="Erase LOA", style=discord.ButtonStyle.danger)
     async def clear_loa(
@@ -346,12 +389,7 @@ class ClearData(discord.ui.View):
         if interaction.user.id != self.author.id:
              
             return await interaction.response.send_message(embed=NotYourPanel(), ephemeral=True)
-        await interaction.client.db["loa"].delete_many(
-            {"guild_id": interaction.guild.id}
-        )
-        await interaction.response.send_message(
-            f"{tick} Successfully cleared all LOA.", ephemeral=True
-        )
+        await self.Erase(interaction, "loa", "LOA")
 
     @discord.ui.button(
         label="Erase Forums (Configuration)", style=discord.ButtonStyle.danger
@@ -362,12 +400,7 @@ class ClearData(discord.ui.View):
         if interaction.user.id != self.author.id:
              
             return await interaction.response.send_message(embed=NotYourPanel(), ephemeral=True)
-        await interaction.client.db["Forum Configuration"].delete_many(
-            {"guild_id": interaction.guild.id}
-        )
-        await interaction.response.send_message(
-            f"{tick} Successfully cleared all forum configurations.", ephemeral=True
-        )
+        await self.Erase(interaction, "forums", "forum configurations")
 
     @discord.ui.button(label="Erase Staff Database", style=discord.ButtonStyle.danger)
     async def clear_staffdb(
@@ -376,12 +409,7 @@ class ClearData(discord.ui.View):
         if interaction.user.id != self.author.id:
              
             return await interaction.response.send_message(embed=NotYourPanel(), ephemeral=True)
-        await interaction.client.db["staff database"].delete_many(
-            {"guild_id": interaction.guild.id}
-        )
-        await interaction.response.send_message(
-            f"{tick} Successfully cleared all staff database.", ephemeral=True
-        )
+        await self.Erase(interaction, "staff database", "staff database")
 
     @discord.ui.button(label="Erase Feedback", style=discord.ButtonStyle.danger)
     async def clear_feedback(
@@ -390,12 +418,7 @@ class ClearData(discord.ui.View):
         if interaction.user.id != self.author.id:
              
             return await interaction.response.send_message(embed=NotYourPanel(), ephemeral=True)
-        await interaction.client.db["feedback"].delete_many(
-            {"guild_id": interaction.guild.id}
-        )
-        await interaction.response.send_message(
-            f"{tick} Successfully cleared all feedback.", ephemeral=True
-        )
+        await self.Erase(interaction, "feedback", "feedback")
 
     @discord.ui.button(label="Erase Responders", style=discord.ButtonStyle.danger)
     async def clear_responders(
@@ -404,12 +427,7 @@ class ClearData(discord.ui.View):
         if interaction.user.id != self.author.id:
              
             return await interaction.response.send_message(embed=NotYourPanel(), ephemeral=True)
-        await interaction.client.db["Auto Responders"].delete_many(
-            {"guild_id": interaction.guild.id}
-        )
-        await interaction.response.send_message(
-            f"{tick} Successfully cleared all responders.", ephemeral=True
-        )
+        await self.Erase(interaction, "responders", "responders")
 
     @discord.ui.button(label="Erase Suspensions", style=discord.ButtonStyle.danger)
     async def clear_suspensions(
@@ -418,12 +436,7 @@ class ClearData(discord.ui.View):
         if interaction.user.id != self.author.id:
              
             return await interaction.response.send_message(embed=NotYourPanel(), ephemeral=True)
-        await interaction.client.db["Suspensions"].delete_many(
-            {"guild_id": interaction.guild.id}
-        )
-        await interaction.response.send_message(
-            f"{tick} Successfully cleared all suspensions.", ephemeral=True
-        )
+        await self.Erase(interaction, "suspensions", "suspensions")
 
     @discord.ui.button(label="Erase Connection Roles", style=discord.ButtonStyle.danger)
     async def clear_connectionroles(
@@ -432,12 +445,7 @@ class ClearData(discord.ui.View):
         if interaction.user.id != self.author.id:
              
             return await interaction.response.send_message(embed=NotYourPanel(), ephemeral=True)
-        await interaction.client.db["connectionroles"].delete_many(
-            {"guild_id": interaction.guild.id}
-        )
-        await interaction.response.send_message(
-            f"{tick} Successfully cleared all connection roles.", ephemeral=True
-        )
+        await self.Erase(interaction, "connection roles", "connection roles")
 
 
 async def setup(client: commands.Bot) -> None:
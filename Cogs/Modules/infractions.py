@@ -12,6 +12,16 @@ from utils.permissions import has_admin_role, premium
 from utils.emojis import *
 from utils.Module import ModuleCheck
 from utils.autocompletes import infractiontypes, infractionreasons
+from utils.events import Event
+from utils.indexes import Declare
+
+Declare(
+    "infractions",
+    ["guild_id", "random_string"],
+    ["guild_id", "staff"],
+    "ApprovalMSG",
+)
+Declare("infractiontypeactions", ["guild_id", "name"])
 from utils.HelpEmbeds import (
     BotNotConfigured,
     NoPermissionChannel,
@@ -413,7 +423,18 @@ class Infractions(commands.Cog):
             )
 
         self.client.dispatch(
-            "infraction", InfractionResult.inserted_id, Config, TypeActions
+            "infraction",
+            Event(
+                self.client,
+                "infractions",
+                FormeData,
+                guild=ctx.guild,
+                channel=channel,
+                config=Config,
+                MemberKey="staff",
+            ),
+            Config,
+            TypeActions,
         )
 
         await msg.edit(
@@ -681,86 +702,37 @@ class InfractionMultiple(discord.ui.UserSelect):
         if expiration:
             expiration = await strtotime(expiration)
 
-        for staff in self.values:
-            if staff is None:
-                await interaction.followup.send(
-                    f"{no} **{interaction.user.display_name}**, this user can not be found.",
-                    ephemeral=True,
-                )
-                return
-
-            NextType = None
-            if TypeActions and TypeActions.get("Escalation", None):
-                Escalation = TypeActions.get("Escalation")
-                Threshold = Escalation.get("Threshold", None)
-                NextType = Escalation.get("Next Type")
-                if Threshold and NextType:
-                    InfractionsWithType = await interaction.client.db[
-                        "infractions"
-                    ].count_documents(
-                        {
-                            "guild_id": interaction.guild.id,
-                            "staff": staff.id,
-                            "action": action,
-                            "Upscaled": {"$exists": False},
-                        }
-                    )
-                    if isinstance(Threshold, str):
-                        if InfractionsWithType + 1 >= int(Threshold):
-                            isEscalated = True
-                            Org = action
-                            action = NextType
-
-            random_string = "".join(
-                random.choices(string.ascii_uppercase + string.digits, k=10)
+        if None in self.values:
+            return await interaction.followup.send(
+                f"{no} **{interaction.user.display_name}**, this user can not be found.",
+                ephemeral=True,
             )
 
-            FormeData = {
-                "guild_id": interaction.guild.id,
-                "staff": staff.id,
-                "management": interaction.user.id,
-                "action": action,
-                "reason": reason,
-                "notes": notes if notes else "`N/A`",
-                "expiration": expiration,
-                "random_string": random_string,
-                "annonymous": anonymous,
-                "timestamp": datetime.now(),
-            }
-
-            if isEscalated:
-                FormeData[
-                    "reason"
-                ] += f"\n-# Automatically escalated to **{action}** from **{Org}**"
-
-            InfractionResult = await interaction.client.db["infractions"].insert_one(
-                FormeData
-            )
-            if not InfractionResult.inserted_id:
-                await interaction.edit_original_response(
-                    content=f"{crisis} **{interaction.user.display_name},** hi I had a issue submitting this infraction please head to support!",
-                    embed=None,
-                    view=None,
-                )
-                return
-
-            if NextType and isEscalated:
-                await interaction.client.db["infractions"].update_many(
-                    {
-                        "guild_id": interaction.guild.id,
-                        "staff": staff.id,
-                        "action": Org,
-                        "Upscaled": {"$exists": False},
-                    },
-                    {"$set": {"Upscaled": True}},
-                )
+        from utils.infractions import IssueBulk
 
-            TypeActions = await interaction.client.db["infractiontypeactions"].find_one(
-                {"guild_id": interaction.guild.id, "name": action}
+        async def Progress(done: int, total: int):
+            await interaction.edit_original_response(
+                content=f"{cpending} **{interaction.user.display_name},** logging infractions `{done}`/`{total}`.",
+                view=None,
             )
 
-            interaction.client.dispatch(
-                "infraction", InfractionResult.inserted_id, Config, TypeActions
+        Result = await IssueBulk(
+            interaction.client,
+            interaction.guild,
+            interaction.user,
+            self.values,
+            action,
+            reason,
+            Config,
+            notes=notes,
+            expiration=expiration,
+            anonymous=anonymous,
+            progress=Progress,
+        )
+        if Result.get("approval"):
+            return await interaction.edit_original_response(
+                content=f"{tick} **{interaction.user.display_name},** I've sent `{Result.get('issued')}` infractions to approval.",
+                view=None,
             )
 
         await interaction.edit_original_response(
@@ -832,9 +804,20 @@ class ManageInfraction(discord.ui.View):
             view=None,
             embed=None,
         )
+        infraction["voided"] = True
+        infraction.pop("expiration", None)
         interaction.client.dispatch("infraction_void", infraction["_id"])
         interaction.client.dispatch(
-            "infraction_log", infraction["_id"], "delete", interaction.user
+            "infraction_log",
+            Event(
+                interaction.client,
+                "infractions",
+                infraction,
+                guild=interaction.guild,
+                MemberKey="staff",
+            ),
+            "delete",
+            interaction.user,
         )
 
 
@@ -963,7 +946,13 @@ class UpdateInfraction(discord.ui.Modal):
         interaction.client.dispatch("infraction_edit", self.infraction)
         interaction.client.dispatch(
             "infraction_log",
-            self.infraction.get("_id"),
+            Event(
+                interaction.client,
+                "infractions",
+                self.infraction,
+                guild=interaction.guild,
+                MemberKey="staff",
+            ),
             "modify",
             interaction.user,
             Org,
@@ -387,6 +387,9 @@ class Link(commands.Cog):
         await interaction.client.db["integrations"].delete_one(
             {"discord_id": str(interaction.user.id)}
         )
+        from utils.roblox import ForgetToken
+
+        ForgetToken(user=interaction.user)
 
         try:
             await asyncio.wait_for(
@@ -10,6 +10,7 @@ import os
 
 from datetime import datetime
 import utils.HelpEmbeds as HelpEmbeds
+from utils.events import Event
 
 from utils.permissions import has_staff_role
 from utils.format import strtotime
@@ -352,39 +353,38 @@ class LOAModule(commands.Cog):
                 content=f"",
                 embed=HelpEmbeds.NoPermissionChannel(CH),
             )
-        R = await self.client.db["loa"].insert_one(
-            {
-                "LoaID": "".join(
-                    random.choices(string.ascii_letters + string.digits, k=8)
+        Document = {
+            "LoaID": "".join(
+                random.choices(string.ascii_letters + string.digits, k=8)
+            ),
+            "user": ctx.author.id,
+            "ExtendedUser": {
+                "id": ctx.author.id,
+                "name": ctx.author.name,
+                "thumbnail": (
+                    ctx.author.display_avatar.url
+                    if ctx.author.display_avatar
+                    else None
                 ),
-                "user": ctx.author.id,
-                "ExtendedUser": {
-                    "id": ctx.author.id,
-                    "name": ctx.author.name,
-                    "thumbnail": (
-                        ctx.author.display_avatar.url
-                        if ctx.author.display_avatar
-                        else None
-                    ),
-                },
-                "guild_id": ctx.guild.id,
-                "start_time": Start,
-                "end_time": Duration,
-                "reason": reason,
-                "active": False,
-                "request": True,
-                "scheduled": S,
-                "AddedTime": {
-                    "Time": 0,
-                    "Reason": None,
-                    "Log": [],
-                },
-                "RemovedTime": {
-                    "Duration": 0,
-                    "Log": [],
-                },
-            }
-        )
+            },
+            "guild_id": ctx.guild.id,
+            "start_time": Start,
+            "end_time": Duration,
+            "reason": reason,
+            "active": False,
+            "request": True,
+            "scheduled": S,
+            "AddedTime": {
+                "Time": 0,
+                "Reason": None,
+                "Log": [],
+            },
+            "RemovedTime": {
+                "Duration": 0,
+                "Log": [],
+            },
+        }
+        R = await self.client.db["loa"].insert_one(Document)
         if not R.acknowledged:
             await MSG.edit(
                 embed=HelpEmbeds.CustomError("Failed to request LOA."),
@@ -393,7 +393,7 @@ class LOAModule(commands.Cog):
             return
         self.client.dispatch(
             "leave_request",
-            R.inserted_id,
+            Event(self.client, "loa", Document, guild=ctx.guild, member=ctx.author),
         )
         try:
             await MSG.edit(
@@ -577,7 +577,10 @@ class LOAManage(discord.ui.View):
             embed=None,
         )
 
-        interaction.client.dispatch("leave_request_cancel", RequestLOA.get("_id"))
+        interaction.client.dispatch(
+            "leave_request_cancel",
+            Event(interaction.client, "loa", RequestLOA, guild=interaction.guild),
+        )
 
     @discord.ui.button(label="Create", style=discord.ButtonStyle.green, row=2)
     async def CreateLOA(
@@ -659,13 +662,12 @@ class LOAManage(discord.ui.View):
                 embed=HelpEmbeds.CustomError("Failed to end LOA."), ephemeral=True
             )
             return
-        interaction.client.dispatch(
-            "leave_end",
-            LOA.get("_id"),
-        )
-        interaction.client.dispatch(
-            "leave_log", LOA.get("_id"), "ForceEnd", interaction.user
+        LOA.update({"end_time": datetime.now(), "active": False})
+        Ended = Event(
+            interaction.client, "loa", LOA, guild=interaction.guild, member=self.target
         )
+        interaction.client.dispatch("leave_end", Ended)
+        interaction.client.dispatch("leave_log", Ended, "ForceEnd", interaction.user)
 
         await interaction.edit_original_response(
             content=(
@@ -818,7 +820,11 @@ class RemoveTime(discord.ui.Modal):
             }
         )
         interaction.client.dispatch(
-            "leave_log", LOA.get("_id"), "modify", interaction.user, Org
+            "leave_log",
+            Event(interaction.client, "loa", LOA, guild=interaction.guild),
+            "modify",
+            interaction.user,
+            Org,
         )
         await interaction.edit_original_response(
             embed=await CurrentLOA(ctx=interaction, loa=LOA, user=self.target),
@@ -927,31 +933,41 @@ class AddTime(discord.ui.Modal):
                     embed=HelpEmbeds.NoPermissionChannel(CH), ephemeral=True
                 )
                 return
-            Z = await interaction.client.db["ExtRequests"].insert_one(
-                {
-                    "LoaID": LOA.get("LoaID"),
-                    "user": self.target.id,
-                    "guild": interaction.guild.id,
-                    "reason": self.reason.value,
-                    "duration": Duration,
-                    "durationstr": self.duration.value,
-                    "requested_by": interaction.user.id,
-                    "requested_at": datetime.now(),
-                    "status": "Pending",
-                    "Accepted": None,
-                    "Declined": None,
-                    "ExtendedUser": {
-                        "id": self.target.id,
-                        "name": self.target.name,
-                        "thumbnail": (
-                            self.target.display_avatar.url
-                            if self.target.display_avatar
-                            else None
-                        ),
-                    },
-                }
+            Document = {
+                "LoaID": LOA.get("LoaID"),
+                "user": self.target.id,
+                "guild": interaction.guild.id,
+                "reason": self.reason.value,
+                "duration": Duration,
+                "durationstr": self.duration.value,
+                "requested_by": interaction.user.id,
+                "requested_at": datetime.now(),
+                "status": "Pending",
+                "Accepted": None,
+                "Declined": None,
+                "ExtendedUser": {
+                    "id": self.target.id,
+                    "name": self.target.name,
+                    "thumbnail": (
+                        self.target.display_avatar.url
+                        if self.target.display_avatar
+                        else None
+                    ),
+                },
+            }
+            Z = await interaction.client.db["ExtRequests"].insert_one(Document)
+            interaction.client.dispatch(
+                "leave_ext_request",
+                Event(
+                    interaction.client,
+                    "ExtRequests",
+                    Document,
+                    guild=interaction.guild,
+                    member=self.target,
+                    config=C,
+                    GuildKey="guild",
+                ),
             )
-            interaction.client.dispatch("leave_ext_request", Z.inserted_id)
             await interaction.followup.send(
                 content=f"{tick} **{interaction.user.display_name}**, I've requested an extension for `{self.duration.value}` on your LOA.",
                 ephemeral=True,
@@ -959,7 +975,16 @@ class AddTime(discord.ui.Modal):
             return
         else:
             interaction.client.dispatch(
-                "leave_log", LOA.get("_id"), "modify", interaction.user, Org
+                "leave_log",
+                Event(
+                    interaction.client,
+                    "loa",
+                    _id=LOA.get("_id"),
+                    guild=interaction.guild,
+                ),
+                "modify",
+                interaction.user,
+                Org,
             )
             LOA = await interaction.client.db["loa"].find_one(
                 {
@@ -1072,47 +1097,46 @@ class CreateLOA(discord.ui.Modal):
         await interaction.response.defer(ephemeral=True)
         Start = datetime.now()
 
-        LOA = await interaction.client.db["loa"].insert_one(
-            {
-                "LoaID": "".join(
-                    random.choices(string.ascii_letters + string.digits, k=8)
+        Document = {
+            "LoaID": "".join(
+                random.choices(string.ascii_letters + string.digits, k=8)
+            ),
+            "user": self.target.id,
+            "ExtendedUser": {
+                "id": self.target.id,
+                "name": self.target.name,
+                "thumbnail": (
+                    self.target.display_avatar.url
+                    if self.target.display_avatar
+                    else None
                 ),
-                "user": self.target.id,
-                "ExtendedUser": {
-                    "id": self.target.id,
-                    "name": self.target.name,
-                    "thumbnail": (
-                        self.target.display_avatar.url
-                        if self.target.display_avatar
-                        else None
-                    ),
-                },
-                "Created": {
-                    "id": self.author.id,
-                    "name": self.author.name,
-                    "thumbnail": (
-                        self.author.display_avatar.url
-                        if self.author.display_avatar
-                        else None
-                    ),
-                },
-                "guild_id": interaction.guild.id,
-                "start_time": Start,
-                "end_time": Duration,
-                "reason": self.reason.value,
-                "active": True,
-                "request": False,
-                "AddedTime": {
-                    "Time": 0,
-                    "Reason": None,
-                    "Log": [],
-                },
-                "RemovedTime": {
-                    "Duration": 0,
-                    "Log": [],
-                },
-            }
-        )
+            },
+            "Created": {
+                "id": self.author.id,
+                "name": self.author.name,
+                "thumbnail": (
+                    self.author.display_avatar.url
+                    if self.author.display_avatar
+                    else None
+                ),
+            },
+            "guild_id": interaction.guild.id,
+            "start_time": Start,
+            "end_time": Duration,
+            "reason": self.reason.value,
+            "active": True,
+            "request": False,
+            "AddedTime": {
+                "Time": 0,
+                "Reason": None,
+                "Log": [],
+            },
+            "RemovedTime": {
+                "Duration": 0,
+                "Log": [],
+            },
+        }
+        LOA = await interaction.client.db["loa"].insert_one(Document)
 
         if not LOA.acknowledged:
             await interaction.followup.send(
@@ -1121,8 +1145,11 @@ class CreateLOA(discord.ui.Modal):
             )
             return
 
-        interaction.client.dispatch("leave_start", LOA.inserted_id)
-        interaction.client.dispatch("leave_create", LOA.inserted_id)
+        Created = Event(
+            interaction.client, "loa", Document, guild=interaction.guild, member=self.target
+        )
+        interaction.client.dispatch("leave_start", Created)
+        interaction.client.dispatch("leave_create", Created)
 
         await interaction.edit_original_response(
             content=f"{tick} **{interaction.user.display_name}**, the LOA has been created.",
@@ -1184,7 +1211,7 @@ class PendingActions(discord.ui.View):
             return
         interaction.client.dispatch(
             "leave_update",
-            LOA.get("_id"),
+            Event(interaction.client, "loa", _id=LOA.get("_id"), guild=interaction.guild),
             "Accepted",
             interaction.user,
         )
@@ -1246,7 +1273,7 @@ class PendingActions(discord.ui.View):
             return
         interaction.client.dispatch(
             "leave_update",
-            LOA.get("_id"),
+            Event(interaction.client, "loa", _id=LOA.get("_id"), guild=interaction.guild),
             "Declined",
             interaction.user,
         )
@@ -8,7 +8,7 @@ import string
 import io
 from datetime import datetime, timedelta
 from typing import Optional
-from utils.emojis import tick, no, greencheck, redx, hammer, page, info, modd, reason as reason_emoji, usr, pen
+from utils.emojis import tick, no, greencheck, redx, hammer, page, info, modd, reason as reason_emoji, usr, pen, alert
 from utils.HelpEmbeds import (
     BotNotConfigured,
     ModuleNotEnabled,
@@ -17,6 +17,9 @@ from utils.HelpEmbeds import (
     NotYourPanel,
 )
 from utils.permissions import has_staff_role, check_admin_and_staff
+from utils.waiters import WaitForReply, WaitForReaction
+from utils.cases import CasePages, Browse
+from utils.indexes import Declare
 
 environment = os.getenv("ENVIRONMENT")
 guildid = os.getenv("CUSTOM_GUILD")
@@ -37,6 +40,15 @@ LOG_CHANNEL_ID = DEFAULT_LOG_CHANNEL_ID
 BAN_REQUEST_CHANNEL_ID = DEFAULT_BAN_REQUEST_CHANNEL_ID
 ACTION_PROOFS_CHANNEL_ID = DEFAULT_ACTION_PROOFS_CHANNEL_ID
 
+Declare(
+    "punishments",
+    "punishment_id",
+    ["guild_id", "timestamp", "_id"],
+    ["guild_id", "target_user_id", "timestamp", "_id"],
+    ["guild_id", "issuer_id", "timestamp", "_id"],
+    database="quotadb",
+)
+
 
 async def get_moderation_config(bot, guild_id: int) -> dict:
     """Get moderation configuration for a guild, returns None if not configured"""
@@ -268,7 +280,7 @@ class PunishmentModal(discord.ui.Modal, title="Issue Punishment"):
                     try:
                         target_user = await interaction.client.fetch_user(target_user_id)
                         dm_embed = discord.Embed(
-                            title=f"<:Alert:1447279662517583923> You have been warned in **{interaction.guild.name}**.",
+                            title=f"{alert} You have been warned in **{interaction.guild.name}**.",
                             description=f"> Moderator: <@{self.issuer_id}>\n> Reason: **{self.reason.value}**",
                             color=discord.Color.from_rgb(255, 0, 0),
                             timestamp=datetime.now()
@@ -591,7 +603,14 @@ class AttachProofsView(discord.ui.View):
                 return False
 
             try:
-                proof_message = await interaction.client.wait_for("message", check=check, timeout=600)
+                proof_message = await WaitForReply(
+                    interaction.client,
+                    ACTION_PROOFS_CHANNEL_ID,
+                    interaction.user.id,
+                    reply_to=instr.id,
+                    check=check,
+                    timeout=600,
+                )
             except Exception:
                 await action_ch.send(f"{interaction.user.mention} Proof upload timed out for punishment `{self.punishment_id}`.")
                 return
@@ -774,7 +793,14 @@ class AttachProofsSelect(discord.ui.Select):
                 return False
 
             try:
-                proof_message = await interaction.client.wait_for("message", check=check, timeout=600)
+                proof_message = await WaitForReply(
+                    interaction.client,
+                    ACTION_PROOFS_CHANNEL_ID,
+                    interaction.user.id,
+                    reply_to=instr.id,
+                    check=check,
+                    timeout=600,
+                )
             except Exception:
                 await action_ch.send(f"{interaction.user.mention} Proof upload timed out for punishment `{punishment_id}`.")
                 return
@@ -1102,7 +1128,7 @@ class PunishmentPanel(commands.Cog):
                     # Send DM to user (best-effort)
                     try:
                         dm_embed = discord.Embed(
-                            title=f"<:Alert:1447279662517583923> You have been warned in **{ctx.guild.name}**.",
+                            title=f"{alert} You have been warned in **{ctx.guild.name}**.",
                             description=f"> Moderator: <@{ctx.author.id}>\n> Reason: **{final_reason}**",
                             color=discord.Color.from_rgb(255, 0, 0),
                             timestamp=datetime.now()
@@ -2302,7 +2328,13 @@ class PunishmentPanel(commands.Cog):
             )
 
         try:
-            proof_message = await interaction.client.wait_for("message", check=check, timeout=300)
+            proof_message = await WaitForReply(
+                interaction.client,
+                interaction.channel.id,
+                interaction.user.id,
+                check=check,
+                timeout=300,
+            )
         except TimeoutError:
             await interaction.followup.send(
                 f"{no} Proof upload timed out (5 minutes).",
@@ -2431,72 +2463,22 @@ class PunishmentPanel(commands.Cog):
 
             if not user_or_id:
                 # No argument: show all server cases with pagination
-                query = {"guild_id": ctx.guild.id}
-                cases = list(await ctx.bot.qdb["punishments"].find(query).sort("timestamp", -1).to_list(None))
-                case_count = len(cases)
+                pages = CasePages(ctx.bot.qdb["punishments"], {"guild_id": ctx.guild.id})
+                case_count = await pages.Load()
                 title = f"{ctx.guild.name} cases ({case_count})"
+                icon = ctx.guild.icon.url if ctx.guild and ctx.guild.icon else None
 
-                if not cases:
+                if not case_count:
                     embed = discord.Embed(
                         description="No modcases found.",
                         color=discord.Color.from_rgb(54, 57, 63),
                     )
-                    embed.set_author(name=title, icon_url=ctx.guild.icon.url if ctx.guild and ctx.guild.icon else None)
+                    embed.set_author(name=title, icon_url=icon)
                     await send_func(embed=embed)
                     return
 
-                # Paginate: 10 cases per page
-                cases_per_page = 10
-                total_pages = (len(cases) + cases_per_page - 1) // cases_per_page
-                current_page = 0
-
-                async def build_page_all(page_num):
-                    start = page_num * cases_per_page
-                    end = start + cases_per_page
-                    page_cases = cases[start:end]
-
-                    case_lines = []
-                    for case in page_cases:
-                        case_type = case['punishment_type'].upper()
-                        time_delta = discord.utils.format_dt(case['timestamp'], style='R')
-                        case_line = f"{greencheck} `{case['punishment_id']}` **[{case_type}]** {time_delta}"
-                        case_lines.append(case_line)
-
-                    description = "\n".join(case_lines)
-                    embed = discord.Embed(
-                        description=description,
-                        color=discord.Color.from_rgb(54, 57, 63),
-                    )
-                    embed.set_author(name=title, icon_url=ctx.guild.icon.url if ctx.guild and ctx.guild.icon else None)
-                    embed.set_footer(text=f"Page: {page_num + 1}/{total_pages}")
-                    return embed
-
-                # Send initial message with pagination controls
-                msg = await send_func(embed=await build_page_all(current_page))
-                await msg.add_reaction("◀")
-                await msg.add_reaction("▶")
-                await msg.add_reaction("❌")
-
-                def check(reaction, user):
-                    return user == ctx.author and str(reaction.emoji) in ["◀", "▶", "❌"] and reaction.message.id == msg.id
-
-                while True:
-                    try:
-                        reaction, user = await ctx.bot.wait_for("reaction_add", timeout=60.0, check=check)
-                        await msg.remove_reaction(reaction, user)
-
-                        if str(reaction.emoji) == "◀":
-                            current_page = max(0, current_page - 1)
-                        elif str(reaction.emoji) == "▶":
-                            current_page = min(total_pages - 1, current_page + 1)
-                        elif str(reaction.emoji) == "❌":
-                            await msg.clear_reactions()
-                            break
-
-                        await msg.edit(embed=await build_page_all(current_page))
-                    except TimeoutError:
-                        await msg.clear_reactions()
-                        break
+                # One page of 10 is fetched per reaction, newest first
+                await Browse(ctx, send_func, pages, title, icon)
                 return
 
             # Try to parse as user mention or user ID
@@ -2509,72 +2491,23 @@ class PunishmentPanel(commands.Cog):
 
             if user:
                 # Query modcases for this user
-                modcases = list(await ctx.bot.qdb["punishments"].find(
-                    {"target_user_id": user.id, "guild_id": ctx.guild.id}
-                ).sort("timestamp", -1).to_list(None))
-                user_case_count = len(modcases)
+                pages = CasePages(
+                    ctx.bot.qdb["punishments"],
+                    {"guild_id": ctx.guild.id, "target_user_id": user.id},
+                )
+                user_case_count = await pages.Load()
+                title = f"{user.display_name} cases ({user_case_count})"
 
-                if not modcases:
+                if not user_case_count:
                     embed = discord.Embed(
                         description="No modcases found.",
                         color=discord.Color.from_rgb(54, 57, 63),
                     )
-                    embed.set_author(name=f"{user.display_name} cases ({user_case_count})", icon_url=user.display_avatar)
+                    embed.set_author(name=title, icon_url=user.display_avatar)
                     await send_func(embed=embed, ephemeral=True)
                     return
 
-                # Paginate: 10 cases per page
-                cases_per_page = 10
-                total_pages = (len(modcases) + cases_per_page - 1) // cases_per_page
-                current_page = 0
-
-                async def build_page_user(page_num):
-                    start = page_num * cases_per_page
-                    end = start + cases_per_page
-                    page_cases = modcases[start:end]
-
-                    case_lines = []
-                    for case in page_cases:
-                        case_type = case['punishment_type'].upper()
-                        time_delta = discord.utils.format_dt(case['timestamp'], style='R')
-                        case_line = f"{greencheck} `{case['punishment_id']}` **[{case_type}]** {time_delta}"
-                        case_lines.append(case_line)
-
-                    description = "\n".join(case_lines)
-                    embed = discord.Embed(
-                        description=description,
-                        color=discord.Color.from_rgb(54, 57, 63),
-                    )
-                    embed.set_author(name=f"{user.display_name} cases ({user_case_count})", icon_url=user.display_avatar)
-                    embed.set_footer(text=f"Page: {page_num + 1}/{total_pages}")
-                    return embed
-
-                # Send initial message with pagination controls
-                msg = await send_func(embed=await build_page_user(current_page))
-                await msg.add_reaction("◀")
-                await msg.add_reaction("▶")
-                await msg.add_reaction("❌")
-
-                def check(reaction, user_):
-                    return user_ == ctx.author and str(reaction.emoji) in ["◀", "▶", "❌"] and reaction.message.id == msg.id
-
-                while True:
-                    try:
-                        reaction, user_ = await ctx.bot.wait_for("reaction_add", timeout=60.0, check=check)
-                        await msg.remove_reaction(reaction, user_)
-
-                        if str(reaction.emoji) == "◀":
-                            current_page = max(0, current_page - 1)
-                        elif str(reaction.emoji) == "▶":
-                            current_page = min(total_pages - 1, current_page + 1)
-                        elif str(reaction.emoji) == "❌":
-                            await msg.clear_reactions()
-                            break
-
-                        await msg.edit(embed=await build_page_user(current_page))
-                    except TimeoutError:
-                        await msg.clear_reactions()
-                        break
+                await Browse(ctx, send_func, pages, title, user.display_avatar)
             else:
                 # Try to find case by ID
                 case = await ctx.bot.qdb["punishments"].find_one(
@@ -2627,72 +2560,23 @@ class PunishmentPanel(commands.Cog):
             target_user = user if user else ctx.author
             
             # Query modcases issued by the target user
-            my_cases = list(await ctx.bot.qdb["punishments"].find(
-                {"issuer_id": target_user.id, "guild_id": ctx.guild.id}
-            ).sort("timestamp", -1).to_list(None))
-            my_case_count = len(my_cases)
+            pages = CasePages(
+                ctx.bot.qdb["punishments"],
+                {"guild_id": ctx.guild.id, "issuer_id": target_user.id},
+            )
+            my_case_count = await pages.Load()
+            title = f"{target_user.display_name} modcases ({my_case_count})"
 
-            if not my_cases:
+            if not my_case_count:
                 embed = discord.Embed(
                     description="No modcases found.",
                     color=discord.Color.from_rgb(54, 57, 63),
                 )
-                embed.set_author(name=f"{target_user.display_name} modcases ({my_case_count})", icon_url=target_user.display_avatar)
+                embed.set_author(name=title, icon_url=target_user.display_avatar)
                 await ctx.send(embed=embed)
                 return
 
-            # Paginate: 10 cases per page
-            cases_per_page = 10
-            total_pages = (len(my_cases) + cases_per_page - 1) // cases_per_page
-            current_page = 0
-
-            async def build_page(page_num):
-                start = page_num * cases_per_page
-                end = start + cases_per_page
-                page_cases = my_cases[start:end]
-
-                case_lines = []
-                for case in page_cases:
-                    case_type = case['punishment_type'].upper()
-                    time_delta = discord.utils.format_dt(case['timestamp'], style='R')
-                    case_line = f"{greencheck} `{case['punishment_id']}` **[{case_type}]** {time_delta}"
-                    case_lines.append(case_line)
-
-                description = "\n".join(case_lines)
-                embed = discord.Embed(
-                    description=description,
-                    color=discord.Color.from_rgb(54, 57, 63),
-                )
-                embed.set_author(name=f"{target_user.display_name} modcases ({my_case_count})", icon_url=target_user.display_avatar)
-                embed.set_footer(text=f"Page: {page_num + 1}/{total_pages}")
-                return embed
-
-            # Send initial message with pagination controls
-            msg = await ctx.send(embed=await build_page(current_page))
-            await msg.add_reaction("◀")
-            await msg.add_reaction("▶")
-            await msg.add_reaction("❌")
-
-            def check(reaction, user):
-                return user == ctx.author and str(reaction.emoji) in ["◀", "▶", "❌"] and reaction.message.id == msg.id
-
-            while True:
-                try:
-                    reaction, user = await ctx.bot.wait_for("reaction_add", timeout=60.0, check=check)
-                    await msg.remove_reaction(reaction, user)
-
-                    if str(reaction.emoji) == "◀":
-                        current_page = max(0, current_page - 1)
-                    elif str(reaction.emoji) == "▶":
-                        current_page = min(total_pages - 1, current_page + 1)
-                    elif str(reaction.emoji) == "❌":
-                        await msg.clear_reactions()
-                        break
-
-                    await msg.edit(embed=await build_page(current_page))
-                except TimeoutError:
-                    await msg.clear_reactions()
-                    break
+            await Browse(ctx, ctx.send, pages, title, target_user.display_avatar)
         except Exception as e:
             print(f"Error in modcases hybrid command: {e}")
             await ctx.send(f"{no} Error: {str(e)}")
@@ -10,6 +10,7 @@ from utils.autocompletes import Snippets
 from discord import app_commands
 from utils.Module import ModuleCheck
 from Cogs.Events.modmail import Close
+from utils.modmail import Active, GuildSettings, ResolveGuild
 
 
 MONGO_URL = os.getenv("MONGO_URL")
@@ -366,10 +367,8 @@ class Modmail(commands.Cog):
             if not isinstance(media, discord.Attachment):
                 media = None
             ChannelID = ctx.channel.id
-            Modmail = await self.client.db["modmail"].find_one(
-                {"channel_id": ChannelID}
-            )
-            Config = await self.client.config.find_one({"_id": ctx.guild.id})
+            Modmail = await Active(self.client, channel_id=ChannelID)
+            Config = await GuildSettings(self.client, ctx.guild.id)
             if not Config:
                 return await ctx.send(
                     embed=BotNotConfigured(),
@@ -379,7 +378,7 @@ class Modmail(commands.Cog):
                 return await ctx.send(
                     content=f"{no} **{ctx.author.display_name},** this isn't a modmail channel."
                 )
-            Server = await self.client.fetch_guild(Modmail.get("guild_id"))
+            Server = await ResolveGuild(self.client, Modmail.get("guild_id"))
             if not Server:
                 return await ctx.send(
                     content=f"{no} **{ctx.author.display_name},** no idea how but the guild can't be found from the modmail."
@@ -10,6 +10,7 @@ import string
 from utils.permissions import has_admin_role, has_staff_role
 from utils.Module import ModuleCheck
 from utils.autocompletes import DepartmentAutocomplete, RoleAutocomplete
+from utils.events import Event
 
 # TODO: Merge the 3 commands together some how, extremely inefficient, and it's hard to update.
 
@@ -186,24 +187,35 @@ async def SingleHierarchy(
         )
         return
 
-    Object = await interaction.client.db["promotions"].insert_one(
-        {
-            "management": interaction.user.id,
-            "staff": user.id,
-            "reason": reason,
-            "random_string": "".join(
-                random.choices(string.ascii_uppercase + string.digits, k=10)
-            ),
-            "guild_id": interaction.guild.id,
-            "jump_url": None,
-            "timestamp": datetime.datetime.now(),
-            "annonymous": False,
-            "Modmail System": "single",
-            "single": {"SkipTo": rank},
-        }
+    Document = {
+        "management": interaction.user.id,
+        "staff": user.id,
+        "reason": reason,
+        "random_string": "".join(
+            random.choices(string.ascii_uppercase + string.digits, k=10)
+        ),
+        "guild_id": interaction.guild.id,
+        "jump_url": None,
+        "timestamp": datetime.datetime.now(),
+        "annonymous": False,
+        "Modmail System": "single",
+        "single": {"SkipTo": rank},
+    }
+    Object = await interaction.client.db["promotions"].insert_one(Document)
+
+    interaction.client.dispatch(
+        "promotion",
+        Event(
+            interaction.client,
+            "promotions",
+            Document,
+            guild=interaction.guild,
+            channel=channel,
+            config=Config,
+            MemberKey="staff",
+        ),
+        Config,
     )
-
-    interaction.client.dispatch("promotion", Object.inserted_id, Config)
     await msg.edit(
         content=f"{tick} **{interaction.user.display_name}**, I've successfully promoted **@{user.display_name}**!",
     )
@@ -349,24 +361,35 @@ async def MultiHireachy(
         )
         return
 
-    Object = await interaction.client.db["promotions"].insert_one(
-        {
-            "management": interaction.user.id,
-            "staff": user.id,
-            "reason": reason,
-            "random_string": "".join(
-                random.choices(string.ascii_uppercase + string.digits, k=10)
-            ),
-            "guild_id": interaction.guild.id,
-            "jump_url": None,
-            "timestamp": datetime.datetime.now(),
-            "annonymous": False,
-            "Modmail System": "Multi Hierarchy",
-            "multi": {"Department": department, "SkipTo": rank},
-        }
+    Document = {
+        "management": interaction.user.id,
+        "staff": user.id,
+        "reason": reason,
+        "random_string": "".join(
+            random.choices(string.ascii_uppercase + string.digits, k=10)
+        ),
+        "guild_id": interaction.guild.id,
+        "jump_url": None,
+        "timestamp": datetime.datetime.now(),
+        "annonymous": False,
+        "Modmail System": "Multi Hierarchy",
+        "multi": {"Department": department, "SkipTo": rank},
+    }
+    Object = await interaction.client.db["promotions"].insert_one(Document)
+
+    interaction.client.dispatch(
+        "promotion",
+        Event(
+            interaction.client,
+            "promotions",
+            Document,
+            guild=interaction.guild,
+            channel=channel,
+            config=Config,
+            MemberKey="staff",
+        ),
+        Config,
     )
-
-    interaction.client.dispatch("promotion", Object.inserted_id, Config)
     await msg.edit(
         content=f"{tick} **{interaction.user.display_name}**, I've successfully promoted **@{user.display_name}**!",
     )
@@ -462,23 +485,34 @@ async def issue(
             content=f"{no} **{interaction.user.display_name}**, **@{staff.display_name}** is on cooldown, you can promote them again <t:{Timestamp}:R>."
         )
 
-    Object = await interaction.client.db["promotions"].insert_one(
-        {
-            "management": interaction.user.id,
-            "staff": staff.id,
-            "reason": reason,
-            "new": new.id,
-            "random_string": "".join(
-                random.choices(string.ascii_uppercase + string.digits, k=10)
-            ),
-            "guild_id": interaction.guild.id,
-            "jump_url": None,
-            "timestamp": datetime.datetime.now(),
-            "annonymous": False,
-        }
+    Document = {
+        "management": interaction.user.id,
+        "staff": staff.id,
+        "reason": reason,
+        "new": new.id,
+        "random_string": "".join(
+            random.choices(string.ascii_uppercase + string.digits, k=10)
+        ),
+        "guild_id": interaction.guild.id,
+        "jump_url": None,
+        "timestamp": datetime.datetime.now(),
+        "annonymous": False,
+    }
+    Object = await interaction.client.db["promotions"].insert_one(Document)
+
+    interaction.client.dispatch(
+        "promotion",
+        Event(
+            interaction.client,
+            "promotions",
+            Document,
+            guild=interaction.guild,
+            channel=channel,
+            config=Config,
+            MemberKey="staff",
+        ),
+        Config,
     )
-
-    interaction.client.dispatch("promotion", Object.inserted_id, Config)
     await msg.edit(
         content=f"{tick} **{interaction.user.display_name}**, I've successfully promoted **@{staff.display_name}** to `{new.name}`!",
     )
@@ -861,9 +895,20 @@ class ManagePromotion(discord.ui.View):
             view=None,
             embed=None,
         )
+        promotion["voided"] = True
+        promotion.pop("expiration", None)
         interaction.client.dispatch("promotion_void", promotion["_id"])
         interaction.client.dispatch(
-            "promotion_log", promotion["_id"], "delete", interaction.user
+            "promotion_log",
+            Event(
+                interaction.client,
+                "promotions",
+                promotion,
+                guild=interaction.guild,
+                MemberKey="staff",
+            ),
+            "delete",
+            interaction.user,
         )
 
 
@@ -941,13 +986,18 @@ class UpdatePromotion(discord.ui.Modal):
             view=view,
         )
 
-        interaction.client.dispatch("promotion", self.infraction, True)
+        Edited = Event(
+            interaction.client,
+            "promotions",
+            self.infraction,
+            guild=interaction.guild,
+            MemberKey="staff",
+        )
+        Config = await Edited.Config()
+        if Config:
+            interaction.client.dispatch("promotion", Edited, Config, True)
         interaction.client.dispatch(
-            "promotion_log",
-            self.infraction.get("_id"),
-            "modify",
-            interaction.user,
-            Org,
+            "promotion_log", Edited, "modify", interaction.user, Org
         )
 
 
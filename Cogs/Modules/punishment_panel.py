@@ -7,7 +7,7 @@ import string
 import io
 from datetime import datetime
 from typing import Optional
-from utils.emojis import tick, no, greencheck, redx, hammer, page, info, modd, reason as reason_emoji, usr
+from utils.emojis import tick, no, greencheck, redx, hammer, page, info, modd, reason as reason_emoji, usr, alert
 from utils.HelpEmbeds import (
     BotNotConfigured,
     ModuleNotEnabled,
@@ -16,6 +16,8 @@ from utils.HelpEmbeds import (
     NotYourPanel,
 )
 from utils.permissions import has_staff_role, check_admin_and_staff
+from utils.waiters import WaitForReply, WaitForReaction
+from utils.cases import CasePages, Browse
 
 environment = os.getenv("ENVIRONMENT")
 guildid = os.getenv("CUSTOM_GUILD")
@@ -176,7 +178,7 @@ class PunishmentModal(discord.ui.Modal, title="Issue Punishment"):
                     try:
                         target_user = await interaction.client.fetch_user(target_user_id)
                         dm_embed = discord.Embed(
-                            title=f"<:Alert:1447279662517583923> You have been warned in **{interaction.guild.name}**.",
+                            title=f"{alert} You have been warned in **{interaction.guild.name}**.",
                             description=f"> Moderator: <@{self.issuer_id}>\n> Reason: **{self.reason.value}**",
                             color=discord.Color.from_rgb(255, 0, 0),
                             timestamp=datetime.utcnow()
@@ -497,7 +499,14 @@ class AttachProofsView(discord.ui.View):
                 return False
 
             try:
-                proof_message = await interaction.client.wait_for("message", check=check, timeout=600)
+                proof_message = await WaitForReply(
+                    interaction.client,
+                    ACTION_PROOFS_CHANNEL_ID,
+                    interaction.user.id,
+                    reply_to=instr.id,
+                    check=check,
+                    timeout=600,
+                )
             except Exception:
                 await action_ch.send(f"{interaction.user.mention} Proof upload timed out for punishment `{self.punishment_id}`.")
                 return
@@ -680,7 +689,14 @@ class AttachProofsSelect(discord.ui.Select):
                 return False
 
             try:
-                proof_message = await interaction.client.wait_for("message", check=check, timeout=600)
+                proof_message = await WaitForReply(
+                    interaction.client,
+                    ACTION_PROOFS_CHANNEL_ID,
+                    interaction.user.id,
+                    reply_to=instr.id,
+                    check=check,
+                    timeout=600,
+                )
             except Exception:
                 await action_ch.send(f"{interaction.user.mention} Proof upload timed out for punishment `{punishment_id}`.")
                 return
@@ -961,7 +977,7 @@ class PunishmentPanel(commands.Cog):
                     # Send DM to user (best-effort)
                     try:
                         dm_embed = discord.Embed(
-                            title=f"<:Alert:1447279662517583923> You have been warned in **{ctx.guild.name}**.",
+                            title=f"{alert} You have been warned in **{ctx.guild.name}**.",
                             description=f"> Moderator: <@{ctx.author.id}>\n> Reason: **{final_reason}**",
                             color=discord.Color.from_rgb(255, 0, 0),
                             timestamp=datetime.utcnow()
@@ -2021,7 +2037,13 @@ class PunishmentPanel(commands.Cog):
             )
 
         try:
-            proof_message = await interaction.client.wait_for("message", check=check, timeout=300)
+            proof_message = await WaitForReply(
+                interaction.client,
+                interaction.channel.id,
+                interaction.user.id,
+                check=check,
+                timeout=300,
+            )
         except TimeoutError:
             await interaction.followup.send(
                 f"{no} Proof upload timed out (5 minutes).",
@@ -2150,11 +2172,10 @@ class PunishmentPanel(commands.Cog):
 
             if not user_or_id:
                 # No argument: show all server cases with pagination
-                query = {"guild_id": ctx.guild.id}
                 title = f"{ctx.guild.name}'s Cases"
-                cases = list(await ctx.bot.qdb["punishments"].find(query).sort("timestamp", -1).to_list(None))
+                pages = CasePages(ctx.bot.qdb["punishments"], {"guild_id": ctx.guild.id})
 
-                if not cases:
+                if not await pages.Load():
                     embed = discord.Embed(
                         title=title,
                         description="No modcases found.",
@@ -2163,58 +2184,8 @@ class PunishmentPanel(commands.Cog):
                     await send_func(embed=embed)
                     return
 
-                # Paginate: 10 cases per page
-                cases_per_page = 10
-                total_pages = (len(cases) + cases_per_page - 1) // cases_per_page
-                current_page = 0
-
-                async def build_page_all(page_num):
-                    start = page_num * cases_per_page
-                    end = start + cases_per_page
-                    page_cases = cases[start:end]
-
-                    case_lines = []
-                    for case in page_cases:
-                        case_type = case['punishment_type'].upper()
-                        time_delta = discord.utils.format_dt(case['timestamp'], style='R')
-                        case_line = f"{greencheck} `{case['punishment_id']}` **[{case_type}]** {time_delta}"
-                        case_lines.append(case_line)
-
-                    description = "\n".join(case_lines)
-                    embed = discord.Embed(
-                        description=description,
-                        color=discord.Color.from_rgb(54, 57, 63),
-                    )
-                    embed.set_author(name=title, icon_url=ctx.author.display_avatar)
-                    embed.set_footer(text=f"Page: {page_num + 1}/{total_pages}")
-                    return embed
-
-                # Send initial message with pagination controls
-                msg = await send_func(embed=await build_page_all(current_page))
-                await msg.add_reaction("◀")
-                await msg.add_reaction("▶")
-                await msg.add_reaction("❌")
-
-                def check(reaction, user):
-                    return user == ctx.author and str(reaction.emoji) in ["◀", "▶", "❌"] and reaction.message.id == msg.id
-
-                while True:
-                    try:
-                        reaction, user = await ctx.bot.wait_for("reaction_add", timeout=60.0, check=check)
-                        await msg.remove_reaction(reaction, user)
-
-                        if str(reaction.emoji) == "◀":
-                            current_page = max(0, current_page - 1)
-                        elif str(reaction.emoji) == "▶":
-                            current_page = min(total_pages - 1, current_page + 1)
-                        elif str(reaction.emoji) == "❌":
-                            await msg.clear_reactions()
-                            break
-
-                        await msg.edit(embed=await build_page_all(current_page))
-                    except TimeoutError:
-                        await msg.clear_reactions()
-                        break
+                # One page of 10 is fetched per reaction, newest first
+                await Browse(ctx, send_func, pages, title, ctx.author.display_avatar)
                 return
 
             # Try to parse as user mention or user ID
@@ -2227,71 +2198,22 @@ class PunishmentPanel(commands.Cog):
 
             if user:
                 # Query modcases for this user
-                modcases = list(await ctx.bot.qdb["punishments"].find(
-                    {"target_user_id": user.id, "guild_id": ctx.guild.id}
-                ).sort("timestamp", -1).to_list(None))
+                pages = CasePages(
+                    ctx.bot.qdb["punishments"],
+                    {"guild_id": ctx.guild.id, "target_user_id": user.id},
+                )
+                title = f"{user.display_name}'s Cases"
 
-                if not modcases:
+                if not await pages.Load():
                     embed = discord.Embed(
                         description="No modcases found.",
                         color=discord.Color.from_rgb(54, 57, 63),
                     )
-                    embed.set_author(name=f"{user.display_name}'s Cases", icon_url=user.display_avatar)
+                    embed.set_author(name=title, icon_url=user.display_avatar)
                     await send_func(embed=embed, ephemeral=True)
                     return
 
-                # Paginate: 10 cases per page
-                cases_per_page = 10
-                total_pages = (len(modcases) + cases_per_page - 1) // cases_per_page
-                current_page = 0
-
-                async def build_page_user(page_num):
-                    start = page_num * cases_per_page
-                    end = start + cases_per_page
-                    page_cases = modcases[start:end]
-
-                    case_lines = []
-                    for case in page_cases:
-                        case_type = case['punishment_type'].upper()
-                        time_delta = discord.utils.format_dt(case['timestamp'], style='R')
-                        case_line = f"{greencheck} `{case['punishment_id']}` **[{case_type}]** {time_delta}"
-                        case_lines.append(case_line)
-
-                    description = "\n".join(case_lines)
-                    embed = discord.Embed(
-                        description=description,
-                        color=discord.Color.from_rgb(54, 57, 63),
-                    )
-                    embed.set_author(name=f"{user.display_name}'s Cases", icon_url=user.display_avatar)
-                    embed.set_footer(text=f"Page: {page_num + 1}/{total_pages}")
-                    return embed
-
-                # Send initial message with pagination controls
-                msg = await send_func(embed=await build_page_user(current_page))
-                await msg.add_reaction("◀")
-                await msg.add_reaction("▶")
-                await msg.add_reaction("❌")
-
-                def check(reaction, user_):
-                    return user_ == ctx.author and str(reaction.emoji) in ["◀", "▶", "❌"] and reaction.message.id == msg.id
-
-                while True:
-                    try:
-                        reaction, user_ = await ctx.bot.wait_for("reaction_add", timeout=60.0, check=check)
-                        await msg.remove_reaction(reaction, user_)
-
-                        if str(reaction.emoji) == "◀":
-                            current_page = max(0, current_page - 1)
-                        elif str(reaction.emoji) == "▶":
-                            current_page = min(total_pages - 1, current_page + 1)
-                        elif str(reaction.emoji) == "❌":
-                            await msg.clear_reactions()
-                            break
-
-                        await msg.edit(embed=await build_page_user(current_page))
-                    except TimeoutError:
-                        await msg.clear_reactions()
-                        break
+                await Browse(ctx, send_func, pages, title, user.display_avatar)
             else:
                 # Try to find case by ID
                 case = await ctx.bot.qdb["punishments"].find_one(
@@ -2338,71 +2260,22 @@ class PunishmentPanel(commands.Cog):
         """View modcases you have issued (paginated)"""
         try:
             # Query modcases issued by this user
-            my_cases = list(await ctx.bot.qdb["punishments"].find(
-                {"issuer_id": ctx.author.id, "guild_id": ctx.guild.id}
-            ).sort("timestamp", -1).to_list(None))
+            pages = CasePages(
+                ctx.bot.qdb["punishments"],
+                {"guild_id": ctx.guild.id, "issuer_id": ctx.author.id},
+            )
+            title = f"{ctx.author.display_name}'s modcases"
 
-            if not my_cases:
+            if not await pages.Load():
                 embed = discord.Embed(
                     description="No modcases found.",
                     color=discord.Color.from_rgb(54, 57, 63),
                 )
-                embed.set_author(name=f"{ctx.author.display_name}'s modcases", icon_url=ctx.author.display_avatar)
+                embed.set_author(name=title, icon_url=ctx.author.display_avatar)
                 await ctx.send(embed=embed)
                 return
 
-            # Paginate: 10 cases per page
-            cases_per_page = 10
-            total_pages = (len(my_cases) + cases_per_page - 1) // cases_per_page
-            current_page = 0
-
-            async def build_page(page_num):
-                start = page_num * cases_per_page
-                end = start + cases_per_page
-                page_cases = my_cases[start:end]
-
-                case_lines = []
-                for case in page_cases:
-                    case_type = case['punishment_type'].upper()
-                    time_delta = discord.utils.format_dt(case['timestamp'], style='R')
-                    case_line = f"{greencheck} `{case['punishment_id']}` **[{case_type}]** {time_delta}"
-                    case_lines.append(case_line)
-
-                description = "\n".join(case_lines)
-                embed = discord.Embed(
-                    description=description,
-                    color=discord.Color.from_rgb(54, 57, 63),
-                )
-                embed.set_author(name=f"{ctx.author.display_name}'s modcases", icon_url=ctx.author.display_avatar)
-                embed.set_footer(text=f"Page: {page_num + 1}/{total_pages}")
-                return embed
-
-            # Send initial message with pagination controls
-            msg = await ctx.send(embed=await build_page(current_page))
-            await msg.add_reaction("◀")
-            await msg.add_reaction("▶")
-            await msg.add_reaction("❌")
-
-            def check(reaction, user):
-                return user == ctx.author and str(reaction.emoji) in ["◀", "▶", "❌"] and reaction.message.id == msg.id
-
-            while True:
-                try:
-                    reaction, user = await ctx.bot.wait_for("reaction_add", timeout=60.0, check=check)
-                    await msg.remove_reaction(reaction, user)
-
-                    if str(reaction.emoji) == "◀":
-                        current_page = max(0, current_page - 1)
-                    elif str(reaction.emoji) == "▶":
-                        current_page = min(total_pages - 1, current_page + 1)
-                    elif str(reaction.emoji) == "❌":
-                        await msg.clear_reactions()
-                        break
-
-                    await msg.edit(embed=await build_page(current_page))
-                except TimeoutError:
-                    await msg.clear_reactions()
-                    break
+            await Browse(ctx, ctx.send, pages, title, ctx.author.display_avatar)
         except Exception as e:
             print(f"Error in modcases hybrid command: {e}")
             await ctx.send(f"{no} Error: {str(e)}")
@@ -12,17 +12,27 @@ from utils.format import IsSeperateBot, PaginatorButtons
 from utils.Module import ModuleCheck
 from datetime import datetime
 import re
+import asyncio
+import csv
+import io
 
 
 from utils.permissions import has_admin_role, has_staff_role
 from utils.Module import ModuleCheck
 from utils.format import ordinal
 from utils.permissions import check_admin_and_staff
+from utils.stafflist import BuildIndex, RenderStaffList
+from utils.membercache import ChunkGuild
+from utils.indexes import Declare
 
 
 environment = os.getenv("ENVIRONMENT")
 guildid = os.getenv("CUSTOM_GUILD")
 
+Declare(
+    "staff database", ["guild_id", "staff_id"], ["guild_id", "name", "staff_id"]
+)
+
 
 from utils.HelpEmbeds import (
     BotNotConfigured,
@@ -449,6 +459,7 @@ class quota(commands.Cog):
             {"$set": {"rank": rank.id}},
             upsert=True,
         )
+        self.client.dispatch("staff_list_edit", ctx.guild.id)
         await ctx.send(
             f"{tick} **{ctx.author.display_name}**, I have added `@{rank.name}` to the staff list.",
         )
@@ -464,6 +475,7 @@ class quota(commands.Cog):
         if not await has_admin_role(ctx, "Staff List Permissions"):
             return
         await self.client.db["Staff List"].delete_one({"rank": rank.id})
+        self.client.dispatch("staff_list_edit", ctx.guild.id)
         await ctx.send(
             f"{tick} **{ctx.author.display_name}**, I have removed `@{rank.name}` from the staff list.",
         )
@@ -479,60 +491,17 @@ class quota(commands.Cog):
         if not await has_admin_role(ctx, "Staff List Permissions"):
             return
 
-        results = (
-            await self.client.db["Staff List"]
-            .find({"guild_id": ctx.guild.id})
-            .to_list(length=None)
-        )
-        if len(results) == 0 or not results:
+        StaffList = self.client.get_cog("StaffList")
+        if StaffList:
+            index = await StaffList.Index(ctx.guild)
+        else:
+            index = await BuildIndex(self.client.db, ctx.guild)
+        if not index["ranks"]:
             return await ctx.send(
                 f"{no} **{ctx.author.display_name}**, there are no ranks in the staff list.\n{replybottom} You can add a rank using `/staff list add <rank> <position>`."
             )
-        results = sorted(results, key=lambda x: int(x.get("position", 0)))
-        member_roles = {}
-        highest_role_seen = {}
-        if not ctx.guild.chunked:
-            await ctx.guild.chunk()
 
-        for member in ctx.guild.members:
-            highest_role = max(
-                (
-                    role
-                    for role in member.roles
-                    if any(role.id == result["rank"] for result in results)
-                ),
-                key=lambda role: role.position,
-                default=None,
-            )
-            member_roles[member] = highest_role
-            highest_role_seen[member] = highest_role
-
-        embed = discord.Embed(
-            title="Staff Team",
-            color=discord.Color.dark_embed(),
-            timestamp=datetime.now(),
-        )
-        embed.set_thumbnail(url=ctx.guild.icon)
-        embed.set_author(name=ctx.guild.name, icon_url=ctx.guild.icon)
-        embed.set_footer(text="Last Updated")
-
-        description = ""
-        for result in results:
-            role = ctx.guild.get_role(result.get("rank"))
-            if role is not None:
-                members = [
-                    member.mention
-                    for member in member_roles
-                    if member_roles[member] == role
-                    and highest_role_seen[member] == role
-                ]
-                if members:
-                    description += (
-                        f"### **{role.mention}** ({len(members)})\n\n> "
-                        + "\n> ".join(members)
-                        + "\n"
-                    )
-        embed.description = description
+        embed, digest = RenderStaffList(ctx.guild, index)
         if ctx.interaction:
             msg = await ctx.channel.send(
                 embed=embed, allowed_mentions=discord.AllowedMentions().none()
@@ -546,7 +515,7 @@ class quota(commands.Cog):
 
         await self.client.db["Active Staff List"].update_one(
             {"guild_id": ctx.guild.id},
-            {"$set": {"msg": msg.id, "channel_id": ctx.channel.id}},
+            {"$set": {"msg": msg.id, "channel_id": ctx.channel.id, "hash": digest}},
             upsert=True,
         )
 
@@ -891,7 +860,7 @@ class quota(commands.Cog):
             # Ensure guild is chunked so members are available
             if not interaction.guild.chunked:
                 try:
-                    await interaction.guild.chunk()
+                    await ChunkGuild(interaction.guild)
                 except:
                     pass
 
@@ -1050,8 +1019,7 @@ class quota(commands.Cog):
             all_staff_ids = set(staff_role_ids + admin_role_ids)
             
             # Iterate through guild members and check if they have staff/admin roles
-            if not interaction.guild.chunked:
-                await interaction.guild.chunk()
+            await ChunkGuild(interaction.guild)
             
             for member in interaction.guild.members:
                 # Check if member has any staff or admin role
@@ -1350,25 +1318,23 @@ class quota(commands.Cog):
             return
         await ctx.defer(ephemeral=True)
         msg = await ctx.send(" Exporting to CSV...")
-        users = (
-            await self.client.qdb["messages"]
-            .find({"guild_id": ctx.guild.id})
-            .sort("message_count", pymongo.DESCENDING)
-            .to_list(length=None)
-        )
         Config = await self.client.config.find_one({"_id": ctx.guild.id})
         if Config is None:
             return await ctx.send(embed=BotNotConfigured(), view=Support())
         if not Config.get("Message Quota"):
             return await ctx.send(embed=ModuleNotEnabled(), view=Support())
 
-        if not users:
-            return await ctx.send(
-                f"{no} **{ctx.author.display_name}**, there are no users in the leaderboard."
-            )
-
-        CSV = "User,Messages,Passed"
-        for user in users:
+        users = (
+            self.client.qdb["messages"]
+            .find({"guild_id": ctx.guild.id}, {"user_id": 1, "message_count": 1})
+            .sort("message_count", pymongo.DESCENDING)
+            .batch_size(500)
+        )
+        File = io.StringIO()
+        CSV = csv.writer(File)
+        CSV.writerow(["User", "Messages", "Passed"])
+        Rows = 0
+        async for user in users:
             member = ctx.guild.get_member(user.get("user_id"))
             if not member:
                 try:
@@ -1383,16 +1349,22 @@ class quota(commands.Cog):
                     if user.get("message_count") >= Quota
                     else "False" if Quota else ""
                 )
-                CSV += f"\n{member.name},{user.get('message_count')},{passed}"
+                CSV.writerow([member.name, user.get("message_count"), passed])
+                Rows += 1
 
-        filename = f"staff_leaderboard_{ctx.guild.id}.csv"
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(CSV)
+        if not Rows:
+            return await ctx.send(
+                f"{no} **{ctx.author.display_name}**, there are no users in the leaderboard."
+            )
         await msg.edit(
-            attachments=[discord.File(filename)],
+            attachments=[
+                discord.File(
+                    io.BytesIO(File.getvalue().encode("utf-8")),
+                    filename=f"staff_leaderboard_{ctx.guild.id}.csv",
+                )
+            ],
             content=f"{tick} **{ctx.author.display_name}**, here's your CSV file.",
         )
-        os.remove(filename)
 
     @staff.command(
         description="View the staff message leaderboard to see if anyone has passed their quota"
@@ -1813,43 +1785,9 @@ class quota(commands.Cog):
             from Cogs.Configuration.Components.EmbedBuilder import DisplayEmbed
 
             embed = await DisplayEmbed(custom, ctx.author)
-        People = (
-            await self.client.db["staff database"]
-            .find({"guild_id": ctx.guild.id})
-            .to_list(length=None)
-        )
-        options = []
-        Added = set()
-        for person in People:
-            member = ctx.guild.get_member(person.get("staff_id"))
-            if not member:
-                try:
-                    member = await ctx.guild.fetch_member(person.get("staff_id"))
-                except (discord.HTTPException, discord.NotFound):
-                    continue
-            if member.id in Added:
-                continue
-            options.append(
-                discord.SelectOption(
-                    label=member.display_name,
-                    value=str(member.id),
-                    description=person.get("rolename"),
-                    emoji = None,
-                )
-            )
-            Added.add(member.id)
-
-            if len(options) == 24:
-                options.append(
-                    discord.SelectOption(
-                        label="View More",
-                        value="more",
-                        emoji = None,
-                        description="View more staff members.",
-                    )
-                )
-                break
-        view = Staffview(options=options)
+        options, cursor = await StaffOptions(self.client, ctx.guild)
+        view = discord.ui.View(timeout=None)
+        view.add_item(StaffPage(cursor, options=options))
 
         try:
             msg = await ctx.channel.send(embed=embed, view=view)
@@ -1939,34 +1877,33 @@ class InfractionTypeSelection(discord.ui.Select):
 
         if expiration:
             expiration = await strtotime(expiration)
-        for user in self.failures:
+        from utils.infractions import IssueBulk
 
-            random_string = "".join(
-                random.choices(string.ascii_uppercase + string.digits, k=10)
-            )
-
-            InfractionResult = await interaction.client.db["infractions"].insert_one(
-                {
-                    "guild_id": interaction.guild.id,
-                    "staff": user.id,
-                    "management": interaction.user.id,
-                    "action": action,
-                    "reason": reason,
-                    "notes": notes,
-                    "expiration": expiration,
-                    "random_string": random_string,
-                    "annonymous": anonymous,
-                    "timestamp": datetime.now(),
-                }
-            )
-            if not InfractionResult.inserted_id:
-                await interaction.response.send_message(
-                    content=f"{crisis} **{interaction.user.display_name},** hi I had a issue submitting this infraction please head to support!",
-                    ephemeral=True,
-                )
-                return
-            interaction.client.dispatch(
-                "infraction", InfractionResult.inserted_id, Config, TypeActions
+        async def Progress(done: int, total: int):
+            await interaction.edit_original_response(
+                embed=None,
+                content=f"{cpending} **{interaction.user.display_name},** punishing failures `{done}`/`{total}`.",
+                view=None,
+            )
+
+        Result = await IssueBulk(
+            interaction.client,
+            interaction.guild,
+            interaction.user,
+            self.failures,
+            action,
+            reason,
+            Config,
+            notes=notes,
+            expiration=expiration,
+            anonymous=anonymous,
+            progress=Progress,
+        )
+        if Result.get("approval"):
+            return await interaction.edit_original_response(
+                embed=None,
+                content=f"{tick} **{interaction.user.display_name},** sent `{Result.get('issued')}` infractions to approval.",
+                view=None,
             )
 
         await interaction.edit_original_response(
@@ -1976,63 +1913,166 @@ class InfractionTypeSelection(discord.ui.Select):
         )
 
 
+# Staff per page, leaving room for "View More" and "Search" in a 25 option select.
+PageSize = 23
+
+
+def StaffState(after: tuple = None, prefix: str = "") -> str:
+    """Select custom_id carrying where "View More" continues from:
+    ``StaffPanel:<staff_id>:<len(prefix)>:<prefix><name>``."""
+    name, StaffID = after or ("", "")
+    return f"StaffPanel:{StaffID}:{len(prefix)}:{prefix}{name}"[:100]
+
+
+async def StaffOptions(
+    client: commands.Bot, guild: discord.Guild, after: tuple = None, prefix: str = ""
+):
+    """One page of the staff directory in ``(name, staff_id)`` order, as select
+    options, plus the state for the next page."""
+    filter = {"guild_id": guild.id}
+    if prefix:
+        filter["name"] = {"$regex": f"^{re.escape(prefix)}", "$options": "i"}
+    if after:
+        name, StaffID = after
+        filter["$or"] = [
+            {"name": {"$gt": name}},
+            {"name": name, "staff_id": {"$gt": StaffID}},
+        ]
+    People = (
+        await client.db["staff database"]
+        .find(filter, {"name": 1, "staff_id": 1, "rolename": 1})
+        .sort([("name", pymongo.ASCENDING), ("staff_id", pymongo.ASCENDING)])
+        .limit(PageSize + 1)
+        .to_list(length=PageSize + 1)
+    )
+    More = len(People) > PageSize
+    People = People[:PageSize]
+
+    Members = {}
+    Missing = []
+    for person in People:
+        member = guild.get_member(person.get("staff_id"))
+        if member:
+            Members[member.id] = member
+        else:
+            Missing.append(person.get("staff_id"))
+    if Missing:
+        try:
+            for member in await guild.query_members(
+                user_ids=Missing, limit=len(Missing), cache=False
+            ):
+                Members[member.id] = member
+        except (asyncio.TimeoutError, discord.ClientException):
+            pass
+
+    options = []
+    # The staff database can hold the same member twice, and Discord rejects a
+    # select with repeated values.
+    Added = set()
+    for person in People:
+        member = Members.get(person.get("staff_id"))
+        if not member or member.id in Added:
+            continue
+        Added.add(member.id)
+        options.append(
+            discord.SelectOption(
+                label=member.display_name,
+                value=str(member.id),
+                description=person.get("rolename"),
+                emoji = None,
+            )
+        )
+    if More:
+        options.append(
+            discord.SelectOption(
+                label="View More",
+                value="more",
+                emoji = None,
+                description="View more staff members.",
+            )
+        )
+    options.append(
+        discord.SelectOption(
+            label="Search",
+            value="search",
+            emoji = None,
+            description="Find a staff member by name.",
+        )
+    )
+    last = People[-1] if More else None
+    return options, StaffState(
+        (last.get("name", ""), last.get("staff_id")) if last else None, prefix
+    )
+
+
+async def SendStaffPage(
+    interaction: discord.Interaction, after: tuple = None, prefix: str = ""
+):
+    options, cursor = await StaffOptions(
+        interaction.client, interaction.guild, after, prefix
+    )
+    view = discord.ui.View(timeout=None)
+    view.add_item(StaffPage(cursor, options=options))
+    await interaction.response.send_message(
+        view=view,
+        ephemeral=True,
+        content=f" **{interaction.user.display_name},** heres more people to view.",
+    )
+
+
+class StaffSearch(discord.ui.Modal, title="Search Staff"):
+    name = discord.ui.TextInput(label="Name starts with", max_length=32)
+
+    async def on_submit(self, interaction: discord.Interaction):
+        await SendStaffPage(interaction, prefix=self.name.value.strip())
+
+
 class Staffview(discord.ui.View):
+    """Panels sent before the directory was paginated use the plain "StaffPanel" id."""
+
     def __init__(self, options: list = None):
         super().__init__(timeout=None)
         self.add_item(StaffPanel(options))
 
 
+class StaffPage(
+    discord.ui.DynamicItem[discord.ui.Select],
+    template=r"StaffPanel:(?P<id>[0-9]*):(?P<length>[0-9]+):(?P<rest>.*)",
+):
+    def __init__(self, custom_id: str, options: list = None):
+        super().__init__(StaffPanel(options, custom_id=custom_id))
+
+    @classmethod
+    async def from_custom_id(
+        cls, interaction: discord.Interaction, item: discord.ui.Select, match
+    ):
+        return cls(item.custom_id)
+
+    async def callback(self, interaction: discord.Interaction):
+        await self.item.callback(interaction)
+
+
 class StaffPanel(discord.ui.Select):
-    def __init__(self, options: list = None):
+    def __init__(self, options: list = None, custom_id: str = "StaffPanel"):
         options = options or []
         super().__init__(
-            placeholder="Select a staff member", options=options, custom_id="StaffPanel"
+            placeholder="Select a staff member", options=options, custom_id=custom_id
         )
 
+    def State(self):
+        parts = self.custom_id.split(":", 3)
+        if len(parts) < 4:
+            return None, ""
+        _, StaffID, length, rest = parts
+        prefix, name = rest[: int(length)], rest[int(length) :]
+        return ((name, int(StaffID)) if StaffID else None), prefix
+
     async def callback(self, interaction: discord.Interaction):
+        if self.values[0] == "search":
+            return await interaction.response.send_modal(StaffSearch())
         if self.values[0] == "more":
-            people = (
-                await interaction.client.db["staff database"]
-                .find({"guild_id": interaction.guild.id})
-                .to_list(length=None)
-            )
-            options = []
-            Existing = {
-                int(option.value) for option in self.options if option.value.isdigit()
-            }
-            Added = set()
-            for person in people:
-                if person.get("staff_id") in Existing:
-                    continue
-                if person.get("staff_id") in Added:
-                    continue
-                member = interaction.guild.get_member(person.get("staff_id"))
-                if not member:
-                    try:
-                        member = await interaction.guild.fetch_member(
-                            person.get("staff_id")
-                        )
-                    except (discord.HTTPException, discord.NotFound):
-                        continue
-                options.append(
-                    discord.SelectOption(
-                        label=member.display_name,
-                        value=str(member.id),
-                        description=person.get("rolename"),
-                        emoji = None,
-                    )
-                )
-                Existing.add(member.id)
-                Added.add(member.id)
-                if len(options) == 25:
-                    break
-            self.options = options
-            await interaction.response.send_message(
-                view=self.view,
-                ephemeral=True,
-                content=f" **{interaction.user.display_name},** heres more people to view.",
-            )
-            return
+            after, prefix = self.State()
+            return await SendStaffPage(interaction, after, prefix)
         member = interaction.guild.get_member(int(self.values[0]))
         if not member:
             try:
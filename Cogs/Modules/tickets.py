@@ -18,6 +18,10 @@ from utils.HelpEmbeds import ModuleNotEnabled, Support, ModuleNotSetup, BotNotCo
 from utils.autocompletes import CloseReason
 from utils.format import ordinal, PaginatorButtons
 from utils.format import strtotime
+from utils.events import Event
+from utils.indexes import Declare
+
+Declare("Panels", ["guild", "name", "type"])
 
 async def AccessControl(interaction: discord.Interaction, Panel: dict):
     if not Panel:
@@ -71,7 +75,17 @@ class TicketForm(discord.ui.Modal):
         self.data["responses"] = responses
         t = await interaction.client.db["Tickets"].insert_one(self.data)
         interaction.client.dispatch(
-            "pticket_open", t.inserted_id, self.data.get("panel")
+            "pticket_open",
+            Event(
+                interaction.client,
+                "Tickets",
+                self.data,
+                _id=t.inserted_id,
+                guild=interaction.guild,
+                member=interaction.user,
+                GuildKey="GuildID", MemberKey="UserID",
+            ),
+            self.data.get("panel"),
         )
 
         await interaction.response.defer()
@@ -182,7 +196,17 @@ class Button(discord.ui.Button):
         if TPanel:
             t = await interaction.client.db["Tickets"].insert_one(Dict)
             interaction.client.dispatch(
-                "pticket_open", t.inserted_id, TPanel.get("name")
+                "pticket_open",
+                Event(
+                    interaction.client,
+                    "Tickets",
+                    Dict,
+                    _id=t.inserted_id,
+                    guild=interaction.guild,
+                    member=interaction.user,
+                    GuildKey="GuildID", MemberKey="UserID",
+                ),
+                TPanel.get("name"),
             )
             TMSG: discord.Message = await interaction.followup.send(
                 content=f" **{interaction.user.display_name}**, hold on while I open the ticket.",
@@ -272,7 +296,13 @@ class Debug(discord.ui.View):
         )
         interaction.client.dispatch(
             "pticket_close",
-            R.get("_id"),
+            Event(
+                interaction.client,
+                "Tickets",
+                _id=R.get("_id"),
+                guild=interaction.guild,
+                GuildKey="GuildID", MemberKey="UserID",
+            ),
             "Ticket Opener hit the debug button",
             interaction.user,
         )
@@ -508,7 +538,17 @@ class TicketsPub(commands.Cog):
                 content=f"{no} This isn't a ticket channel."
             )
         self.client.dispatch(
-            "pticket_close", Result.get("_id"), reason, interaction.user
+            "pticket_close",
+            Event(
+                self.client,
+                "Tickets",
+                _id=Result.get("_id"),
+                guild=interaction.guild,
+                channel=interaction.channel,
+                GuildKey="GuildID", MemberKey="UserID",
+            ),
+            reason,
+            interaction.user,
         )
         await interaction.followup.send(content=f"{tick} Ticket closed.")
 
@@ -864,7 +904,18 @@ class TicketsPub(commands.Cog):
         await interaction.followup.send(
             content=f"{tick} **{interaction.user.display_name},** you've claimed the ticket!"
         )
-        self.client.dispatch("pticket_claim", Result.get("_id"), interaction.user)
+        self.client.dispatch(
+            "pticket_claim",
+            Event(
+                self.client,
+                "Tickets",
+                _id=Result.get("_id"),
+                guild=interaction.guild,
+                channel=interaction.channel,
+                GuildKey="GuildID", MemberKey="UserID",
+            ),
+            interaction.user,
+        )
 
     @tickets.command(description="Unclaim a ticket.")
     async def unclaim(self, interaction: discord.Interaction):
@@ -1077,7 +1128,17 @@ class CloseRequest(discord.ui.View):
             )
         await interaction.message.delete()
         interaction.client.dispatch(
-            "pticket_close", Result.get("_id"), self.reason, interaction.user
+            "pticket_close",
+            Event(
+                interaction.client,
+                "Tickets",
+                _id=Result.get("_id"),
+                guild=interaction.guild,
+                channel=interaction.channel,
+                GuildKey="GuildID", MemberKey="UserID",
+            ),
+            self.reason,
+            interaction.user,
         )
 
     @discord.ui.button(label="Cancel", style=discord.ButtonStyle.gray)
@@ -1,6 +1,7 @@
 from discord.ext import commands, tasks
 import discord
 import os
+from utils.cluster import Aggregate
 
 
 class UpdateChannel(commands.Cog):
@@ -17,9 +18,12 @@ class UpdateChannel(commands.Cog):
         if not channel:
             return
 
-        users = sum(guild.member_count or 0 for guild in self.client.guilds)
+        # Only the cluster that can see the channel gets here, totals come from all of them.
+        clusters = await Aggregate(self.client)
+        guilds = sum(cluster["guilds"] for cluster in clusters)
+        users = sum(cluster["users"] for cluster in clusters)
         try:
-            await channel.edit(name=f"{len(self.client.guilds)} Guilds | {users} Users")
+            await channel.edit(name=f"{guilds} Guilds | {users} Users")
         except (discord.HTTPException, discord.Forbidden):
             pass
 
@@ -12,6 +12,7 @@ from utils.format import strtotime
 from utils.emojis import *
 from utils.Module import ModuleCheck
 from utils.permissions import *
+from utils.cluster import Owns
 from datetime import timedelta, datetime
 
 
@@ -46,6 +47,8 @@ class activityauto(commands.Cog):
         for data in autoactivityresult:
             try:
                 IsGod = bool(data.get("guild_id", 0) == 1092976553752789054)  # Temp
+                if not Owns(data.get("guild_id")):
+                    continue
                 if not data.get("enabled", False):
                     continue
                 if not await ModuleCheck(data.get("guild_id", 0), "Quota"):
@@ -341,113 +344,55 @@ class ActionModal(discord.ui.Modal, title="Action"):
         if expiration:
             expiration = await strtotime(expiration)
 
+        Members = []
         for Ids in self.failures:
-            user = await interaction.guild.fetch_member(Ids)
+            user = interaction.guild.get_member(Ids)
+            if user is None:
+                try:
+                    user = await interaction.guild.fetch_member(Ids)
+                except (discord.NotFound, discord.HTTPException):
+                    user = None
             if user is None:
                 await interaction.followup.send(
                     f"{no} **{interaction.user.display_name}**, user {Ids} not found.",
                     ephemeral=True,
                 )
                 continue
+            Members.append(user)
 
-            Org = action
-            action = Org
-            escalated = False
-
-            if TypeActions and TypeActions.get("Escalation", None):
-                Escalation = TypeActions.get("Escalation")
-                Threshold = Escalation.get("Threshold", None)
-                NextType = Escalation.get("Next Type")
-                if Threshold and NextType:
-                    count = await interaction.client.db["infractions"].count_documents(
-                        {
-                            "guild_id": interaction.guild.id,
-                            "staff": Ids,
-                            "action": Org,
-                            "Upscaled": {"$exists": False},
-                        }
-                    )
-                    if isinstance(Threshold, str):
-                        if count + 1 >= int(Threshold):
-                            escalated = True
-                            action = NextType
-
-            random_string = "".join(
-                random.choices(string.ascii_uppercase + string.digits, k=10)
-            )
-            FormeData = {
-                "guild_id": interaction.guild.id,
-                "staff": user.id,
-                "management": interaction.user.id,
-                "action": action,
-                "reason": reason,
-                "notes": notes if notes else "`N/A`",
-                "expiration": expiration,
-                "random_string": random_string,
-                "annonymous": anonymous,
-                "timestamp": datetime.now(),
-            }
-            if escalated:
-                FormeData[
-                    "reason"
-                ] += f"\n-# Automatically escalated to **{action}** from **{Org}**"
-
-            InfractionResult = await interaction.client.db["infractions"].insert_one(
-                FormeData
-            )
-            if not InfractionResult.inserted_id:
-                await interaction.followup.send(
-                    f"{crisis} **{interaction.user.display_name},** error submitting infraction.",
-                    ephemeral=True,
-                )
-                continue
+        from utils.infractions import IssueBulk
 
-            if (
-                Config.get("Infraction", {}).get("Approval", None)
-                and Config.get("Infraction", {}).get("Approval", {}).get("channel")
-                is not None
-            ):
-                try:
-                    ApprovChannel = await interaction.client.fetch_channel(
-                        int(
-                            Config.get("Infraction", {})
-                            .get("Approval", {})
-                            .get("channel")
-                        )
-                    )
-                except (discord.Forbidden, discord.NotFound):
-                    await interaction.followup.send(
-                        embed=ChannelNotFound(), ephemeral=True
-                    )
-                    continue
-                if not ApprovChannel:
-                    await interaction.followup.send(
-                        embed=ChannelNotFound(), ephemeral=True
-                    )
-                    continue
-                interaction.client.dispatch(
-                    "infraction_approval", InfractionResult.inserted_id, Config
-                )
-                await interaction.followup.send(
-                    f"{tick} **{interaction.user.display_name},** sent infraction to approval.",
-                    ephemeral=True,
-                )
-                continue
+        Status = await interaction.followup.send(
+            f"{cpending} **{interaction.user.display_name},** punishing `{len(Members)}` failures.",
+            ephemeral=True,
+            wait=True,
+        )
 
-            interaction.client.dispatch(
-                "infraction", InfractionResult.inserted_id, Config, TypeActions
+        async def Progress(done: int, total: int):
+            await Status.edit(
+                content=f"{cpending} **{interaction.user.display_name},** punishing failures `{done}`/`{total}`."
             )
 
-            if escalated:
-                await interaction.client.db["infractions"].update_many(
-                    {
-                        "guild_id": interaction.guild.id,
-                        "staff": user.id,
-                        "action": Org,
-                        "Upscaled": {"$exists": False},
-                    },
-                    {"$set": {"Upscaled": True}},
-                )
+        Result = await IssueBulk(
+            interaction.client,
+            interaction.guild,
+            interaction.user,
+            Members,
+            action,
+            reason,
+            Config,
+            notes=notes,
+            expiration=expiration,
+            anonymous=anonymous,
+            progress=Progress,
+        )
+        if Result.get("approval"):
+            return await Status.edit(
+                content=f"{tick} **{interaction.user.display_name},** sent `{Result.get('issued')}` infractions to approval."
+            )
+        await Status.edit(
+            content=f"{tick} **{interaction.user.display_name},** punished `{Result.get('issued')}` failures."
+        )
 
 
 async def setup(client: commands.Bot) -> None:
@@ -1,13 +1,22 @@
 from discord.ext import commands
 import os
+import time
+import asyncio
 import discord
 
 from datetime import datetime
 from discord.ext import tasks
+from utils.indexes import Declare
+from utils.cluster import Owns
+
+Declare("infractions", ["expiration", "expired"])
 
 
 environment = os.getenv("ENVIRONMENT")
 guildid = os.getenv("CUSTOM_GUILD")
+# Log edits running at once per guild, and overall.
+GuildEdits = int(os.getenv("EXPIRY_GUILD_EDITS", 2))
+TotalEdits = int(os.getenv("EXPIRY_EDITS", 20))
 
 
 class expiration(commands.Cog):
@@ -16,101 +25,164 @@ class expiration(commands.Cog):
         self.Task.start()
         client.Tasks.add("Infraction Exp")
 
+    def LogChannel(self, infraction: dict, ActionTypes: dict, Configs: dict):
+        ActionType = ActionTypes.get(
+            (infraction.get("guild_id"), infraction.get("type"))
+        )
+        if ActionType and ActionType.get("channel"):
+            return self.client.get_channel(ActionType.get("channel"))
+        Config = Configs.get(infraction.get("guild_id"))
+        if not Config or not Config.get("Infraction", {}).get("channel", None):
+            return None
+        return self.client.get_channel(
+            int(Config.get("Infraction", {}).get("channel"))
+        )
+
+    async def Webhook(self, Webhooks: dict, WebhookID: int):
+        # Shared per batch so each webhook is fetched once, however many logs it sent.
+        if WebhookID not in Webhooks:
+            Webhooks[WebhookID] = asyncio.ensure_future(
+                self.client.fetch_webhook(WebhookID)
+            )
+        return await Webhooks[WebhookID]
+
+    async def Expire(
+        self,
+        infraction: dict,
+        Channel: discord.abc.Messageable,
+        Webhooks: dict,
+        Limit: asyncio.Semaphore,
+        Total: asyncio.Semaphore,
+    ):
+        """Returns whether the log was ``edited``, ``skipped`` (gone) or ``failed``."""
+        async with Limit, Total:
+            MsgID = infraction.get("msg_id")
+            WebhookID = infraction.get("WebhookID")
+            try:
+                if WebhookID:
+                    webhook = await self.Webhook(Webhooks, WebhookID)
+                    message = await webhook.fetch_message(MsgID)
+                else:
+                    message = await Channel.fetch_message(MsgID)
+            except discord.NotFound:
+                return "skipped"
+            except discord.HTTPException:
+                return "failed"
+
+            if not message or not message.embeds:
+                return "skipped"
+
+            existing = message.embeds
+            exp = discord.Embed(
+                color=discord.Color.orange(),
+            ).set_author(
+                name="Infraction Expired",
+                icon_url="https://cdn.discordapp.com/emojis/1345821183328784506.webp?size=96",
+            )
+            try:
+                await message.edit(
+                    embeds=existing + [exp],
+                )
+            except discord.HTTPException:
+                return "failed"
+            staff = self.client.get_user(int(infraction.get("staff")))
+            if staff:
+                exp.timestamp = discord.utils.utcnow()
+                exp.add_field(
+                    name="Details",
+                    value=f"> **Action:** {infraction.get('action')}\n> **Reason:** {infraction.get('reason')}",
+                )
+                exp.set_footer(text=f"ID: {infraction.get('random_string')}")
+                try:
+                    await staff.send(embed=exp)
+                except discord.HTTPException:
+                    pass
+            return "edited"
+
     @tasks.loop(minutes=30, reconnect=True)
     async def Task(self):
         if self.client.maintenance:
             return
 
+        Started = time.monotonic()
         filter = {
             "expiration": {"$lte": datetime.utcnow()},
             "expired": {"$exists": False},
         }
         if environment == "custom":
-            filter = {
-                "guild_id": int(guildid),
-                "expiration": {"$lte": datetime.utcnow()},
+            filter["guild_id"] = int(guildid)
+        infractions = [
+            infraction
+            for infraction in await self.client.db["infractions"]
+            .find(
+                filter,
+                {
+                    "guild_id": 1,
+                    "type": 1,
+                    "msg_id": 1,
+                    "WebhookID": 1,
+                    "staff": 1,
+                    "action": 1,
+                    "reason": 1,
+                    "random_string": 1,
+                },
+            )
+            .to_list(length=None)
+            if Owns(infraction.get("guild_id"))
+        ]
+        if not infractions:
+            return
+
+        await self.client.db["infractions"].update_many(
+            {
+                "_id": {"$in": [infraction["_id"] for infraction in infractions]},
                 "expired": {"$exists": False},
-            }
-        infractions = (
-            await self.client.db["infractions"].find(filter).to_list(length=None)
+            },
+            {"$set": {"expired": True}},
         )
 
-        if not infractions:
-            return
+        Guilds = list({infraction.get("guild_id") for infraction in infractions})
+        Types = list({infraction.get("type") for infraction in infractions})
+        ActionTypes = {
+            (ActionType.get("guild_id"), ActionType.get("name")): ActionType
+            async for ActionType in self.client.db["infractiontypeactions"].find(
+                {"guild_id": {"$in": Guilds}, "name": {"$in": Types}},
+                {"guild_id": 1, "name": 1, "channel": 1},
+            )
+        }
+        Configs = {
+            Config["_id"]: Config
+            async for Config in self.client.config.find(
+                {"_id": {"$in": Guilds}}, {"Infraction.channel": 1}
+            )
+        }
+
+        Limits = {guild: asyncio.Semaphore(GuildEdits) for guild in Guilds}
+        Total = asyncio.Semaphore(TotalEdits)
+        Webhooks = {}
+        Edits = []
         for infraction in infractions:
-            if not infraction.get("expiration"):
+            Channel = self.LogChannel(infraction, ActionTypes, Configs)
+            if not Channel:
                 continue
-            if infraction.get("expiration") <= datetime.utcnow():
-                await self.client.db["infractions"].update_one(
-                    {"_id": infraction.get("_id")}, {"$set": {"expired": True}}
+            Edits.append(
+                self.Expire(
+                    infraction,
+                    Channel,
+                    Webhooks,
+                    Limits[infraction.get("guild_id")],
+                    Total,
                 )
-                ActionType = await self.client.db["infractiontypeactions"].find_one(
-                    {
-                        "name": infraction.get("type"),
-                        "guild_id": infraction.get("guild_id"),
-                    }
-                )
-                if ActionType and ActionType.get("channel"):
-                    Channel = self.client.get_channel(ActionType.get("channel"))
-                else:
-                    Config = await self.client.config.find_one(
-                        {"_id": infraction.get("guild_id")}
-                    )
-                    if not Config:
-                        return
-                    if not Config.get("Infraction", {}).get("channel", None):
-                        return
-
-                    Channel = self.client.get_channel(
-                        int(Config.get("Infraction", {}).get("channel"))
-                    )
-                if not Channel:
-                    continue
-                try:
-                    MsgID = infraction.get("msg_id")
-                    WebhookID = infraction.get("WebhookID")
-                    message = None
-
-                    if WebhookID:
-                        try:
-                            webhook = await self.client.fetch_webhook(WebhookID)
-                            message = await webhook.fetch_message(MsgID)
-                        except (discord.HTTPException, discord.NotFound):
-                            pass
-                    else:
-                        try:
-                            message = await Channel.fetch_message(MsgID)
-                        except (discord.HTTPException, discord.NotFound):
-                            pass
-
-                    if not message or not message.embeds:
-                        continue
-
-                    existing = message.embeds
-                    exp = discord.Embed(
-                        color=discord.Color.orange(),
-                    ).set_author(
-                        name="Infraction Expired",
-                        icon_url="https://cdn.discordapp.com/emojis/1345821183328784506.webp?size=96",
-                    )
-                    await message.edit(
-                        embeds=existing + [exp],
-                    )
-                    staff = self.client.get_user(int(infraction.get("staff")))
-                    if staff:
-                        exp.timestamp = discord.utils.utcnow()
-                        exp.add_field(
-                            name="Details",
-                            value=f"> **Action:** {infraction.get('action')}\n> **Reason:** {infraction.get('reason')}",
-                        )
-                        exp.set_footer(text=f"ID: {infraction.get('random_string')}")
-                        await staff.send(embed=exp)
-
-                except (discord.HTTPException, discord.NotFound):
-                    pass
-
-                del infraction
-        del infractions
+            )
+        Results = await asyncio.gather(*Edits, return_exceptions=True)
+        Edited = Results.count("edited")
+        Skipped = Results.count("skipped")
+        Failed = len(Results) - Edited - Skipped
+
+        print(
+            f"[⏰] Expired {len(infractions)} infractions across {len(Guilds)} servers "
+            f"({Edited} logs edited, {Skipped} missing, {Failed} failed) in {time.monotonic() - Started:.2f}s"
+        )
 
 
 async def setup(client: commands.Bot) -> None:
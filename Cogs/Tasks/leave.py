@@ -4,6 +4,11 @@ from bson import ObjectId
 from typing import Union
 from discord.ext import commands, tasks
 import os
+from utils.events import Event
+from utils.indexes import Declare
+from utils.cluster import Owns
+
+Declare("loa", ["active", "end_time"], ["guild_id", "user", "active"], "LoaID")
 
 
 async def TimeLeftz(loa: dict) -> Union[int, str]:
@@ -73,9 +78,12 @@ class Leave(commands.Cog):
                     await self.client.db["loa"].update_one(
                         {"_id": ObjectId(loa["_id"])}, {"$set": {"active": False}}
                     )
-                    self.client.dispatch("leave_end", loa.get("_id"))
+                    loa["active"] = False
+                    self.client.dispatch("leave_end", Event(self.client, "loa", loa))
 
-        await asyncio.gather(*(Process(loa) for loa in LOAs))
+        await asyncio.gather(
+            *(Process(loa) for loa in LOAs if Owns(loa.get("guild_id")))
+        )
 
     @tasks.loop(seconds=10)
     async def SchTasks(self):
@@ -122,9 +130,14 @@ class Leave(commands.Cog):
                         {"_id": ObjectId(loa["_id"])},
                         {"$set": {"active": True, "scheduled": False}},
                     )
-                    self.client.dispatch("leave_start", loa.get("_id"))
+                    loa.update({"active": True, "scheduled": False})
+                    self.client.dispatch(
+                        "leave_start", Event(self.client, "loa", loa)
+                    )
 
-        await asyncio.gather(*(Process(loa) for loa in LOAs))
+        await asyncio.gather(
+            *(Process(loa) for loa in LOAs if Owns(loa.get("guild_id")))
+        )
 
 
 async def setup(client: commands.Bot) -> None:
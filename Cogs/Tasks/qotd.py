@@ -4,10 +4,10 @@ from discord.ext import commands, tasks
 import datetime
 from utils.emojis import *
 from utils.permissions import premium
-import random
-import aiohttp
 import asyncio
 from utils.Module import ModuleCheck
+from utils.questions import NextQuestion
+from utils.cluster import Owns
 
 MONGO_URL = os.getenv("MONGO_URL")
 environment = os.getenv("ENVIRONMENT")
@@ -23,20 +23,6 @@ class qotd(commands.Cog):
         self.semaphore = asyncio.Semaphore(10)
         client.Tasks.add("QOTD")
 
-    async def FetchQuestion(self, Used, server: discord.Guild):
-        questionresult = (
-            await self.client.db["Question Database"].find({}).to_list(length=None)
-        )
-        Unusued = [q for q in questionresult if q["question"] not in Used]
-
-        if not Unusued:
-            await self.client.db["qotd"].update_one(
-                {"guild_id": server.id}, {"$set": {"messages": []}}
-            )
-            return random.choice(questionresult).get("question")
-        del questionresult
-        return random.choice(Unusued).get("question")
-
     async def ProcesssQOTD(self, results):
         async with self.semaphore:
             try:
@@ -50,10 +36,12 @@ class qotd(commands.Cog):
                     await self.ProcessErrors(results, "Guild not found")
                     return
 
-                messages = results.get("messages", [])
-                question = await self.FetchQuestion(messages, guild)
-                if question:
-                    messages.append(question)
+                question, cycle = await NextQuestion(
+                    self.client.db, results.get("cycle")
+                )
+                if question is None:
+                    # Nothing in the bank yet, try again next run without using up a day.
+                    return
 
                 ChannelID = results.get("channel_id", None)
                 if ChannelID is None:
@@ -112,13 +100,10 @@ class qotd(commands.Cog):
                     )
 
                     async def CreateHook(channel: discord.TextChannel):
-                        async with aiohttp.ClientSession() as session:
-                            async with session.get(
-                                self.client.user.display_avatar.url
-                            ) as resp:
-                                if resp.status != 200:
-                                    return None
-                                Btyes = await resp.read()
+                        try:
+                            Btyes = await self.client.user.display_avatar.read()
+                        except (discord.HTTPException, discord.NotFound):
+                            return None
                         try:
                             hook = await channel.create_webhook(
                                 name="Birb", avatar=Btyes
@@ -173,14 +158,16 @@ class qotd(commands.Cog):
                         "$set": {
                             "nextdate": datetime.datetime.utcnow()
                             + datetime.timedelta(days=1),
-                            "messages": messages,
+                            "cycle": cycle,
                             "day": day,
                             "LastMessage": {
                                 "id": msg.id,
                                 "channel_id": msg.channel.id,
                                 "question": question,
                             },
-                        }
+                        },
+                        # Replaced by "cycle", the old list of every posted question.
+                        "$unset": {"messages": ""},
                     },
                     upsert=True,
                 )
@@ -212,7 +199,11 @@ class qotd(commands.Cog):
         result = await self.client.db["qotd"].find(filter).to_list(length=None)
         if not result:
             return
-        tasks = [self.ProcesssQOTD(results) for results in result]
+        tasks = [
+            self.ProcesssQOTD(results)
+            for results in result
+            if Owns(results.get("guild_id"))
+        ]
         await asyncio.gather(*tasks)
 
     @commands.Cog.listener()
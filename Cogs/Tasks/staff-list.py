@@ -4,8 +4,9 @@ from discord.ext import commands
 from discord.ext import tasks
 import os
 from utils.emojis import *
-from datetime import datetime
 from utils.Module import ModuleCheck
+from utils.stafflist import BuildIndex, HighestRank, RenderStaffList
+from utils.cluster import Owns
 import asyncio
 
 
@@ -16,12 +17,76 @@ guildid = os.getenv("CUSTOM_GUILD")
 class StaffList(commands.Cog):
     def __init__(self, client: commands.Bot):
         self.client = client
+        self.Indexes = {}  # {guild_id: {"ranks": [rank_id], "highest": {member_id: rank_id}}}
+        self.Dirty = set()
         self.updatelist.start()
         client.Tasks.add("Staff List")
 
+    def cog_unload(self):
+        self.updatelist.cancel()
+
+    async def Index(self, guild: discord.Guild):
+        index = self.Indexes.get(guild.id)
+        if index is None:
+            index = self.Indexes[guild.id] = await BuildIndex(self.client.db, guild)
+            self.Dirty.add(guild.id)
+        return index
+
+    def Invalidate(self, guild_id: int):
+        self.Indexes.pop(guild_id, None)
+        self.Dirty.add(guild_id)
+
+    def UpdateMember(self, member: discord.Member):
+        index = self.Indexes.get(member.guild.id)
+        if index is None:
+            return
+        rank = HighestRank(member, set(index["ranks"]))
+        if index["highest"].get(member.id) == rank:
+            return
+        if rank:
+            index["highest"][member.id] = rank
+        else:
+            index["highest"].pop(member.id, None)
+        self.Dirty.add(member.guild.id)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        if before.roles != after.roles:
+            self.UpdateMember(after)
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        if len(member.roles) > 1:
+            self.UpdateMember(member)
+
+    @commands.Cog.listener()
+    async def on_raw_member_remove(self, payload: discord.RawMemberRemoveEvent):
+        index = self.Indexes.get(payload.guild_id)
+        if index and index["highest"].pop(payload.user.id, None):
+            self.Dirty.add(payload.guild_id)
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        index = self.Indexes.get(after.guild.id)
+        if not index or after.id not in index["ranks"]:
+            return
+        if before.position != after.position:
+            self.Invalidate(after.guild.id)
+        elif before.name != after.name:
+            self.Dirty.add(after.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        index = self.Indexes.get(role.guild.id)
+        if index and role.id in index["ranks"]:
+            self.Invalidate(role.guild.id)
+
+    @commands.Cog.listener()
+    async def on_staff_list_edit(self, guild_id: int):
+        self.Invalidate(guild_id)
+
     @tasks.loop(seconds=360, reconnect=True)
     async def updatelist(self):
-        print("Checking Staff List")
         if environment == "custom":
             activelistresult = (
                 await self.client.db["Active Staff List"]
@@ -41,7 +106,13 @@ class StaffList(commands.Cog):
             async with semaphore:
                 await self.UpdateList(data)
 
-        await asyncio.gather(*(process(data) for data in activelistresult))
+        await asyncio.gather(
+            *(
+                process(data)
+                for data in activelistresult
+                if Owns(data.get("guild_id"))
+            )
+        )
         del activelistresult
 
     async def UpdateList(self, data):
@@ -49,74 +120,33 @@ class StaffList(commands.Cog):
             guild = self.client.get_guild(data.get("guild_id"))
             if not guild:
                 return
+            if guild.id in self.Indexes and guild.id not in self.Dirty:
+                return
             if not await ModuleCheck(guild.id, "Staff List"):
                 return
 
-            results = (
-                await self.client.db["Staff List"]
-                .find({"guild_id": guild.id})
-                .to_list(length=None)
-            )
-            if not results:
+            index = await self.Index(guild)
+            self.Dirty.discard(guild.id)
+            if not index["ranks"]:
                 return
 
-            results = sorted(results, key=lambda x: int(x.get("position", 0)))
-            MemberRoles = {}
-            HighestSeen = {}
-
-            if not guild.chunked:
-                await guild.chunk()
-
-            for member in guild.members:
-                HighestRole = max(
-                    (
-                        role
-                        for role in member.roles
-                        if any(role.id == result["rank"] for result in results)
-                    ),
-                    key=lambda role: role.position,
-                    default=None,
-                )
-                MemberRoles[member] = HighestRole
-                HighestSeen[member] = HighestRole
+            embed, digest = RenderStaffList(guild, index)
+            if digest == data.get("hash"):
+                return
 
-            embed = discord.Embed(
-                title="Staff Team",
-                color=discord.Color.dark_embed(),
-                timestamp=datetime.now(),
-            )
-            embed.set_thumbnail(url=guild.icon)
-            embed.set_author(name=guild.name, icon_url=guild.icon)
-            embed.set_footer(text="Last Updated")
-
-            description = ""
-            for result in results:
-                role = guild.get_role(result.get("rank"))
-                if role:
-                    members = [
-                        member.mention
-                        for member in MemberRoles
-                        if MemberRoles[member] == role and HighestSeen[member] == role
-                    ]
-                    if members:
-                        description += (
-                            f"### **{role.mention}** ({len(members)})\n\n> "
-                            + "\n> ".join(members)
-                            + "\n"
-                        )
-
-            embed.description = description
             ChannelID = data.get("channel_id")
             MessageId = data.get("msg")
 
             if ChannelID and MessageId:
                 try:
-                    channel = await self.client.fetch_channel(ChannelID)
-                    msg = await channel.fetch_message(MessageId)
-                    if msg:
-                        await msg.edit(embed=embed)
+                    await self.client.get_partial_messageable(
+                        ChannelID, guild_id=guild.id
+                    ).get_partial_message(MessageId).edit(embed=embed)
                 except (discord.HTTPException, discord.NotFound):
                     return
+                await self.client.db["Active Staff List"].update_one(
+                    {"_id": data["_id"]}, {"$set": {"hash": digest}}
+                )
         except Exception as e:
             print(f"[ERROR] {e}")
 
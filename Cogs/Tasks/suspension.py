@@ -3,6 +3,7 @@ from discord.ext import commands, tasks
 import os
 from utils.emojis import *
 from datetime import datetime
+from utils.cluster import Owns
 
 
 environment = os.getenv("ENVIRONMENT")
@@ -36,6 +37,9 @@ class EmptyCog(commands.Cog):
             end_time = request["end_time"]
             user_id = request["staff"]
             guild_id = request["guild_id"]
+            # Another cluster serves this guild, get_guild would be None here.
+            if not Owns(guild_id):
+                continue
             guild = self.client.get_guild(guild_id)
 
             if guild is None:
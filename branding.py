@@ -1,29 +1,82 @@
+import hashlib
+import json
 import os
 import re
+import sys
+
+# Run once at image build time (see Dockerfile), never at startup. Emojis that
+# go through utils/emojis.py are resolved at runtime, this only covers custom
+# emoji markup that is still hard-coded in source files.
+Skip = ("branding.py", os.path.join("utils", "emojis.py"))
+Manifest = ".emoji-manifest.json"
+Patterns = [
+    (re.compile(r"<:[a-zA-Z0-9_]+:[0-9]+>"), ""),
+    (re.compile(r"<a:[a-zA-Z0-9_]+:[0-9]+>"), ""),
+    (re.compile(r'emoji\s*=\s*""'), "emoji = None"),
+    (re.compile(r'emoji\s*=\s*"<\s*:[a-zA-Z0-9_]+:[0-9]+\s*>"'), "emoji = None"),
+    (re.compile(r'emoji\s*=\s*"<\s*a:[a-zA-Z0-9_]+:[0-9]+\s*>"'), "emoji = None"),
+]
+
+
+def Hash(content: bytes):
+    return hashlib.sha256(content).hexdigest()
+
+
+def Strip(content: str):
+    for pattern, replacement in Patterns:
+        content = pattern.sub(replacement, content)
+    return content
+
 
 def ClearEmojis(condition, folder_path):
-    if condition:
-        for root, _, files in os.walk(folder_path):
-            for file_name in files:
-                file_path = os.path.join(root, file_name)
-                if file_path.endswith('branding.py'):  
-                    continue
-                
-                if file_name.endswith('.py'):
-                    with open(file_path, 'r', encoding='utf-8') as file:
-                        content = file.read()
-                    
-                    new_content = re.sub(r'<:[a-zA-Z0-9_]+:[0-9]+>', '', content)
-                    new_content = re.sub(r'<a:[a-zA-Z0-9_]+:[0-9]+>', '', new_content)
-                    new_content = re.sub(r'emoji\s*=\s*""', 'emoji = None', new_content)
-                    new_content = re.sub(r'emoji\s*=\s*"<\s*:[a-zA-Z0-9_]+:[0-9]+\s*>"', 'emoji = None', new_content)
-                    new_content = re.sub(r'emoji\s*=\s*"<\s*a:[a-zA-Z0-9_]+:[0-9]+\s*>"', 'emoji = None', new_content)
-
-                    if new_content != content:
-                        with open(file_path, 'w', encoding='utf-8') as file:
-                            file.write(new_content)
-                        print(f"Updated file: {file_path}")
-                    else:
-                        print(f"No changes made in {file_path}")
+    """Strip custom emojis from every ``.py`` file under ``folder_path``.
+
+    Files whose content hash matches ``.emoji-manifest.json`` were already
+    stripped and are skipped, so re-running on an unchanged tree is a no-op."""
+    if not condition:
+        return 0
+    ManifestPath = os.path.join(folder_path, Manifest)
+    try:
+        with open(ManifestPath, "r", encoding="utf-8") as file:
+            Hashes = json.load(file)
+    except (FileNotFoundError, ValueError):
+        Hashes = {}
+
+    Updated = 0
+    Seen = {}
+    for root, dirs, files in os.walk(folder_path):
+        dirs[:] = [d for d in dirs if not d.startswith(".") and d != "__pycache__"]
+        for file_name in files:
+            if not file_name.endswith(".py"):
+                continue
+            file_path = os.path.join(root, file_name)
+            relative = os.path.relpath(file_path, folder_path)
+            if relative.endswith(Skip):
+                continue
+
+            with open(file_path, "rb") as file:
+                raw = file.read()
+            digest = Hash(raw)
+            if Hashes.get(relative) == digest:
+                Seen[relative] = digest
+                continue
+
+            content = raw.decode("utf-8")
+            new_content = Strip(content)
+            if new_content != content:
+                raw = new_content.encode("utf-8")
+                with open(file_path, "wb") as file:
+                    file.write(raw)
+                Updated += 1
+                print(f"Updated file: {file_path}")
+            Seen[relative] = Hash(raw)
+
+    if Seen != Hashes:
+        with open(ManifestPath, "w", encoding="utf-8") as file:
+            json.dump(Seen, file, indent=1, sort_keys=True)
+    print(f"[branding] {Updated} file(s) updated, {len(Seen)} checked.")
+    return Updated
 
 
+if __name__ == "__main__":
+    ClearEmojis(True, sys.argv[1] if len(sys.argv) > 1 else os.getcwd())
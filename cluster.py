@@ -0,0 +1,179 @@
+from dotenv import load_dotenv
+
+load_dotenv()
+
+import asyncio
+import json
+import os
+import signal
+import sys
+import time
+import urllib.request
+from utils.cluster import Ranges
+
+# Runs main.py as CLUSTERS processes, each owning a contiguous range of shards,
+# and coordinates them over a local socket:
+#   python cluster.py
+# SHARDS is the total shard count (asked from Discord when unset).
+
+TOKEN = os.getenv("TOKEN")
+CLUSTERS = int(os.getenv("CLUSTERS", 2))
+HOST = os.getenv("COORDINATOR_HOST", "127.0.0.1")
+PORT = int(os.getenv("COORDINATOR_PORT", 4800))
+# A cluster that hasn't sent a heartbeat for this long (after its startup grace) is restarted.
+HEARTBEAT_TIMEOUT = int(os.getenv("CLUSTER_TIMEOUT", 90))
+STARTUP_GRACE = int(os.getenv("CLUSTER_GRACE", 300))
+
+
+def RecommendedShards() -> int:
+    request = urllib.request.Request(
+        "https://discord.com/api/v10/gateway/bot",
+        headers={"Authorization": f"Bot {TOKEN}", "User-Agent": "DiscordBot"},
+    )
+    with urllib.request.urlopen(request, timeout=15) as response:
+        return int(json.loads(response.read())["shards"])
+
+
+class Cluster:
+    def __init__(self, id: int, shards: list[int], total: int, count: int):
+        self.id = id
+        self.shards = shards
+        self.total = total
+        self.count = count
+        self.process: asyncio.subprocess.Process = None
+        self.started = 0.0
+        self.seen = 0.0
+        self.stats = None
+        self.restarts = 0
+
+    async def Start(self):
+        env = {
+            **os.environ,
+            "CLUSTER_ID": str(self.id),
+            "CLUSTER_COUNT": str(self.count),
+            "SHARD_IDS": ",".join(map(str, self.shards)),
+            "SHARD_COUNT": str(self.total),
+            "COORDINATOR": f"{HOST}:{PORT}",
+        }
+        self.process = await asyncio.create_subprocess_exec(
+            sys.executable, "main.py", env=env
+        )
+        self.started = time.monotonic()
+        self.seen = 0.0
+        self.stats = None
+        print(
+            f"[🧩] Cluster {self.id} started (pid {self.process.pid}, shards {self.shards[0]}-{self.shards[-1]})"
+        )
+
+    async def Stop(self):
+        if self.process and self.process.returncode is None:
+            self.process.terminate()
+            try:
+                await asyncio.wait_for(self.process.wait(), 20)
+            except asyncio.TimeoutError:
+                self.process.kill()
+                await self.process.wait()
+
+    def Healthy(self) -> bool:
+        if self.process is None or self.process.returncode is not None:
+            return False
+        now = time.monotonic()
+        if not self.seen:
+            return now - self.started < STARTUP_GRACE
+        return now - self.seen < HEARTBEAT_TIMEOUT
+
+
+class Coordinator:
+    def __init__(self, clusters: list[Cluster]):
+        self.clusters = {cluster.id: cluster for cluster in clusters}
+        self.closing = False
+        self.links = set()  # writers of every connected cluster
+
+    async def Handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.links.add(writer)
+        try:
+            while line := await reader.readline():
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    continue
+                cluster = self.clusters.get(message.get("cluster"))
+                if message.get("op") == "heartbeat" and cluster:
+                    cluster.seen = time.monotonic()
+                    cluster.stats = message
+                elif message.get("op") == "stats":
+                    reply = {
+                        "nonce": message.get("nonce"),
+                        "clusters": [
+                            c.stats for c in self.clusters.values() if c.stats
+                        ],
+                    }
+                    writer.write(json.dumps(reply).encode() + b"\n")
+                    await writer.drain()
+                elif message.get("op") == "broadcast":
+                    # Relayed as is to every other cluster.
+                    for link in list(self.links):
+                        if link is not writer and not link.is_closing():
+                            link.write(line)
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            self.links.discard(writer)
+            writer.close()
+
+    async def Supervise(self):
+        while not self.closing:
+            await asyncio.sleep(5)
+            for cluster in self.clusters.values():
+                if self.closing or cluster.Healthy():
+                    continue
+                reason = (
+                    f"exited with {cluster.process.returncode}"
+                    if cluster.process and cluster.process.returncode is not None
+                    else "stopped sending heartbeats"
+                )
+                print(f"[⚠️] Cluster {cluster.id} {reason}, restarting.")
+                await cluster.Stop()
+                cluster.restarts += 1
+                # Back off when a cluster keeps failing so it doesn't hammer the gateway.
+                await asyncio.sleep(min(5 * cluster.restarts, 60))
+                await cluster.Start()
+
+    async def Run(self):
+        server = await asyncio.start_server(self.Handle, HOST, PORT)
+        print(f"[🧩] Coordinator listening on {HOST}:{PORT}")
+        for cluster in self.clusters.values():
+            await cluster.Start()
+            # Clusters identify one after another anyway, stagger them.
+            await asyncio.sleep(5)
+
+        loop = asyncio.get_running_loop()
+        stop = asyncio.Event()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop.set)
+            except NotImplementedError:
+                pass
+
+        supervisor = asyncio.create_task(self.Supervise())
+        await stop.wait()
+        self.closing = True
+        supervisor.cancel()
+        await asyncio.gather(*(cluster.Stop() for cluster in self.clusters.values()))
+        server.close()
+        await server.wait_closed()
+
+
+def main():
+    shards = int(os.getenv("SHARDS") or 0) or RecommendedShards()
+    ranges = Ranges(shards, CLUSTERS)
+    clusters = [
+        Cluster(index, shard_ids, shards, len(ranges))
+        for index, shard_ids in enumerate(ranges)
+    ]
+    print(f"[🧩] Launching {len(clusters)} clusters for {shards} shards")
+    asyncio.run(Coordinator(clusters).Run())
+
+
+if __name__ == "__main__":
+    main()
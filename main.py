@@ -6,6 +6,7 @@ load_dotenv()
 import discord
 import platform
 import sys
+import asyncio
 import gc
 import os
 import time
@@ -20,13 +21,17 @@ from Cogs.Events.on_suggestion import Voting as Voti
 
 from Cogs.Modules.commands import Voting
 from Cogs.Tasks.activityauto import ResetLeaderboard
-from Cogs.Modules.staff import Staffview
+from Cogs.Modules.staff import Staffview, StaffPage
 from Cogs.Events.on_infraction_approval import CaseApproval
 from Cogs.Events.on_ticket import PTicketControl
 from Cogs.Tasks.qotd import *
 from Cogs.Events.on_error import Tree
 from Cogs.Events.modmail import ModmailClosure, Links
 from Cogs.Modules.tickets import ButtonHandler
+from utils.http import HTTP
+from utils.membercache import CacheFlags, ChunkGuild, Pin
+from utils.indexes import EnsureIndexes, Monitor
+from utils.cluster import ShardOptions
 
 sys.dont_write_bytecode = True
 
@@ -47,13 +52,24 @@ TOKEN = os.getenv("TOKEN")
 STATUS = os.getenv("STATUS")
 MONGO_URL = os.getenv("MONGO_URL")
 SHARDS = os.getenv("SHARDS")
+# Load cogs in the background while the gateway connects instead of blocking setup_hook.
+LAZY_COGS = os.getenv("LAZY_COGS", "True") == "True"
+# Cogs slower than this (ms) to import and set up are flagged in the startup report.
+COG_BUDGET = float(os.getenv("COG_BUDGET_MS", 250))
+
+
+def EnvFlag(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
 # Environment flags pulled from .env
 environment = os.getenv("ENVIRONMENT", "")
 # CUSTOM_GUILD should be set when running in custom environment. Keep as string for checks
 guildid = os.getenv("CUSTOM_GUILD")
 
 
-client = AsyncIOMotorClient(MONGO_URL)
+client = AsyncIOMotorClient(MONGO_URL, event_listeners=[Monitor])
 # client = pymongo.AsyncMongoClient(MONGO_URL)
 qdb = client["quotadb"]
 db = client["astro"]
@@ -69,11 +85,6 @@ if not (TOKEN or MONGO_URL, PREFIX):
     print("[❌] Missing .env variables. [TOKEN, MONGO_URL]")
     sys.exit(1)
 
-if os.getenv("REMOVE_EMOJIS", False) == "True" or environment == "custom":
-    from branding import ClearEmojis
-
-    ClearEmojis(True, os.getenv("FOLDER_PATH", "/app"))
-
 if os.getenv("SENTRY_URL", None):
     import sentry_sdk
     from sentry_sdk.integrations.aiohttp import AioHttpIntegration
@@ -98,8 +109,13 @@ class Client(commands.AutoShardedBot):
         self.client = client
         self.cogslist = self._initialize_cogslist()
         self.Tasks = set()
+        self.CogsLoading = None
+        self.CogTimings = {}
         if environment != "custom":
-            self.cogslist.extend(["utils.api", "utils.dokploy"])
+            self.cogslist.append("utils.dokploy")
+            # Every cluster serves the API, the primary's port forwards guild
+            # requests to the cluster that has the guild cached.
+            self.cogslist.append("utils.api")
         if os.getenv("STAFF"):
             self.cogslist.append("Cogs.Modules.Developer.admin")
 
@@ -124,6 +140,7 @@ class Client(commands.AutoShardedBot):
                 intents=intents,
                 shard_count=None,
                 chunk_guilds_at_startup=False,
+                member_cache_flags=CacheFlags(),
                 allowed_mentions=discord.AllowedMentions(
                     replied_user=False, everyone=False, roles=False
                 ),
@@ -134,8 +151,9 @@ class Client(commands.AutoShardedBot):
             super().__init__(
                 command_prefix=commands.when_mentioned_or(PREFIX),
                 intents=intents,
-                shard_count=None,
-                chunk_guilds_at_startup=os.getenv("CACHE", True),
+                chunk_guilds_at_startup=EnvFlag("CACHE", True),
+                member_cache_flags=CacheFlags(),
+                **ShardOptions(),
                 allowed_mentions=discord.AllowedMentions(
                     replied_user=False, everyone=False, roles=False
                 ),
@@ -146,7 +164,9 @@ class Client(commands.AutoShardedBot):
             super().__init__(
                 command_prefix=commands.when_mentioned_or(PREFIX),
                 intents=intents,
-                chunk_guilds_at_startup=os.getenv("CACHE", False),
+                chunk_guilds_at_startup=EnvFlag("CACHE", False),
+                member_cache_flags=CacheFlags(),
+                **ShardOptions(),
                 allowed_mentions=discord.AllowedMentions(
                     replied_user=False, everyone=False, roles=False
                 ),
@@ -182,6 +202,13 @@ class Client(commands.AutoShardedBot):
             # Configuration
             "Cogs.Configuration.Configuration",
             # Events
+            "utils.waiters",
+            "utils.router",
+            "utils.modmail",
+            "utils.membercache",
+            "utils.indexes",
+            "utils.cluster",
+            "utils.purge",
             "Cogs.Events.Dev.on_guild",
             "Cogs.Events.Dev.welcome",
             "Cogs.Events.quota",
@@ -237,7 +264,6 @@ class Client(commands.AutoShardedBot):
     async def setup_hook(self):
         await self._load_views()
         await self._load_cogs()
-        await self.CacheCommands()
 
     async def _load_views(self):
         filter = {}
@@ -250,62 +276,10 @@ class Client(commands.AutoShardedBot):
                 except ValueError:
                     print("[❌] CUSTOM_GUILD is not a valid guild ID; skipping view filtering.")
         TicketViews = await self.db["Panels"].find(filter).to_list(length=None)
-        V = await Views.find(filter).to_list(length=None)
-        print("[Views] Loading Any Views")
-        for view in V:
-            if not view:
-                continue
-            if view.get("type") == "staff":
-                await self._load_staff_view(view)
         print("[Views] Loading Ticket Views")
         for view in TicketViews:
             await self._load_ticket_view(view)
         del TicketViews
-        del V
-
-    async def _load_staff_view(self, view):
-        DbResults = await staffdb.find({"guild_id": view.get("guild")}).to_list(
-            length=None
-        )
-        if not DbResults:
-            return
-        options = []
-        guild = self.get_guild(int(view.get("guild")))
-        if not guild:
-            return
-        if not guild.chunked:
-            try:
-                await guild.chunk()
-            except (discord.HTTPException, discord.Forbidden):
-                return
-        for staff in DbResults:
-            member = guild.get_member(staff.get("staff_id"))
-            if not member:
-                continue
-            options.append(
-                discord.SelectOption(
-                    label=member.display_name,
-                    value=str(member.id),
-                    description=member.get("rolename"),
-                    emoji = None,
-                )
-            )
-            if len(options) >= 24:
-                options.append(
-                    discord.SelectOption(
-                        label="View More",
-                        value="more",
-                        description="View more staff members",
-                        emoji = None,
-                    )
-                )
-                break
-
-        view = Staffview(options=options[:25])
-        try:
-            self.add_view(view, msg_id=int(view.get("MsgID")))
-        except:
-            return
 
     async def _load_ticket_view(self, view):
         view_handler = ButtonHandler()
@@ -360,6 +334,8 @@ class Client(commands.AutoShardedBot):
         self.add_view(Voting())
         self.add_view(Voti())
         self.add_view(Staffview())
+        # Staff panels carry their page state in the custom_id.
+        self.add_dynamic_items(StaffPage)
         self.add_view(ResetLeaderboard())
         self.add_view(ModmailClosure())
         self.add_view(Links())
@@ -369,12 +345,53 @@ class Client(commands.AutoShardedBot):
         self.loop.create_task(self.load_jishaku())
         DoNotLoad = os.getenv("DoNotLoad", "").replace(" ", "").split(",")
         self.cogslist = [cog for cog in self.cogslist if cog and cog not in DoNotLoad]
-        for ext in self.cogslist:
-            try:
-                await self.load_extension(ext)
-                print(f"[✅] Loaded cog: {ext}")
-            except Exception as e:
-                print(f"[❌] Failed to load cog {ext}: {e}")
+        # Needed by everything else, so these are always loaded before connecting.
+        Priority = [
+            cog
+            for cog in ("utils.waiters", "Cogs.Events.on_error")
+            if cog in self.cogslist
+        ]
+        for ext in Priority:
+            await self.LoadCog(ext)
+        Remaining = [cog for cog in self.cogslist if cog not in Priority]
+        if LAZY_COGS:
+            self.CogsLoading = self.loop.create_task(self.LoadCogs(Remaining))
+        else:
+            await self.LoadCogs(Remaining)
+
+    async def LoadCog(self, ext: str):
+        start = time.perf_counter()
+        try:
+            await self.load_extension(ext)
+            print(f"[✅] Loaded cog: {ext}")
+        except Exception as e:
+            print(f"[❌] Failed to load cog {ext}: {e}")
+        self.CogTimings[ext] = (time.perf_counter() - start) * 1000
+
+    async def LoadCogs(self, extensions: list[str]):
+        start = time.perf_counter()
+        for ext in extensions:
+            await self.LoadCog(ext)
+            # Let the gateway handshake and heartbeats run between imports.
+            await asyncio.sleep(0)
+        await self.CacheCommands()
+        self.CogReport((time.perf_counter() - start) * 1000)
+        # Every cog has declared its indexes by now.
+        if EnvFlag("SYNC_INDEXES", True):
+            self.loop.create_task(EnsureIndexes(self))
+
+    def CogReport(self, total: float):
+        Slow = sorted(
+            ((ext, ms) for ext, ms in self.CogTimings.items() if ms > COG_BUDGET),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+        print(
+            f"[⏱️] Loaded {len(self.CogTimings)} cogs in {total:.0f}ms "
+            f"({len(Slow)} over the {COG_BUDGET:.0f}ms budget)"
+        )
+        for ext, ms in Slow:
+            print(f"[⏱️]   {ext}: {ms:.0f}ms")
 
     async def GetVersion(self):
         V = await SupportVariables.find_one({"_id": 1})
@@ -396,6 +413,8 @@ class Client(commands.AutoShardedBot):
             recursive_cache(command)
 
     async def on_ready(self):
+        if self.CogsLoading:
+            await self.CogsLoading
         if environment == "custom":
             await self._handle_custom_environment()
         await SyncCommands(self)
@@ -470,13 +489,14 @@ class Client(commands.AutoShardedBot):
 
         Guilds = {int(server["_id"]) for server in Modmail + Enabled if "_id" in server}
         Guilds.update([1092976553752789054])
+        Pin(*Guilds)
 
         cached = 0
         for ID in Guilds:
             try:
                 guild = self.get_guild(ID)
                 if guild:
-                    await guild.chunk()
+                    await ChunkGuild(guild)
                     cached += 1
             except:
                 continue
@@ -485,6 +505,10 @@ class Client(commands.AutoShardedBot):
 
         del Modmail, Enabled, ID
 
+    async def close(self):
+        await HTTP.close()
+        await super().close()
+
     async def on_disconnect(self):
         print("[⚠️] Disconnected from Discord Gateway!")
 
@@ -1,11 +1,13 @@
 import discord
+import aiohttp
+import json as jsonlib
 from fastapi import FastAPI, APIRouter, HTTPException, Request, status
+from fastapi.responses import Response
 from discord.ext import commands
 import os
 from motor.motor_asyncio import AsyncIOMotorClient
 import asyncio
 import ast
-import uvicorn
 import pymongo
 import random
 import string
@@ -13,10 +15,15 @@ from utils.emojis import *
 import time
 from utils.Module import ModuleCheck
 from utils.permissions import check_admin_and_staff
+from utils.telemetry import Summarise
+from utils.http import HTTP
 
 import pymongo
 from datetime import datetime
 from discord.ext import commands
+from utils.membercache import ChunkGuild
+from utils.cluster import Aggregate, ClusterID, Clustered, OwnerOf
+from utils.config import PatchConfig
 
 
 MONGO_URL = os.getenv("MONGO_URL")
@@ -30,6 +37,9 @@ Messages = dbq["messages"]
 infractiontypeactions = db["infractiontypeactions"]
 collection = db["infractions"]
 Tickets = db["Tickets"]
+# Cluster N listens on API_PORT + N, only cluster 0's port is public.
+Port = int(os.getenv("API_PORT", 8000))
+Forwarded = "X-Cluster-Forwarded"
 
 
 async def Validation(key: str, server: int):
@@ -93,15 +103,17 @@ class APIRoutes:
 
     async def GET_shards(self):
         shards = []
-        for shard_id, shard_instance in self.client.shards.items():
-            shard_info = f"{shard_instance.latency * 1000:.0f} ms"
-            guild_count = sum(
-                1 for guild in self.client.guilds if guild.shard_id == shard_id
-            )
-            shards.append(
-                {"id": shard_id, "latency": shard_info, "guilds": guild_count}
-            )
-        return shards
+        for cluster in await Aggregate(self.client):
+            for shard in cluster["shards"]:
+                shards.append(
+                    {
+                        "id": shard["id"],
+                        "latency": f"{shard['latency'] * 1000:.0f} ms",
+                        "guilds": shard["guilds"],
+                        "cluster": cluster["cluster"],
+                    }
+                )
+        return sorted(shards, key=lambda shard: shard["id"])
 
     async def GET_transcript(self, id: str, auth: str):
         if not await RestrictedValidation(auth):
@@ -121,9 +133,11 @@ class APIRoutes:
         }
 
     async def GET_stats(self):
+        clusters = await Aggregate(self.client)
         return {
-            "guilds": len(self.client.guilds),
-            "users": await self.get_total_users(),
+            "guilds": sum(cluster["guilds"] for cluster in clusters),
+            "users": sum(cluster["users"] for cluster in clusters),
+            "clusters": len(clusters),
         }
 
     async def get_total_users(self):
@@ -147,8 +161,7 @@ class APIRoutes:
         guild = self.client.get_guild(server)
         if not guild:
             return {"error": 1000, "message": "Server not found"}
-        if not guild.chunked:
-            await guild.chunk()
+        await ChunkGuild(guild)
 
         staff = guild.get_member(infraction.get("staff"))
         if not staff:
@@ -213,8 +226,7 @@ class APIRoutes:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Server not found"
             )
-        if not guild.chunked:
-            await guild.chunk()
+        await ChunkGuild(guild)
         member = guild.get_member(user)
         if not member:
             raise HTTPException(
@@ -261,8 +273,7 @@ class APIRoutes:
             return []
 
         Infractions = []
-        if not guild.chunked:
-            await guild.chunk()
+        await ChunkGuild(guild)
         for infraction in infractions:
             staff = guild.get_member(infraction.get("staff"))
             management = guild.get_member(infraction.get("management"))
@@ -370,12 +381,22 @@ class APIRoutes:
                 status_code=status.HTTP_400_BAD_REQUEST, detail="Missing guilds or user"
             )
 
+        Local = guilds
+        Remote = {}
+        if Clustered and not request.headers.get(Forwarded):
+            Local = []
+            for GuilID in guilds:
+                Owner = OwnerOf(GuilID)
+                if Owner == ClusterID:
+                    Local.append(GuilID)
+                else:
+                    Remote.setdefault(Owner, []).append(GuilID)
+
         async def Process(GuilID):
             guild = self.client.get_guild(int(GuilID))
             if not guild:
                 return None
-            if not guild.chunked:
-                await guild.chunk()
+            await ChunkGuild(guild)
             member = guild.get_member(int(user))
             if not member:
                 return None
@@ -411,10 +432,28 @@ class APIRoutes:
                 or member.guild_permissions.administrator,
             }
 
-        tasks = [Process(GuilID) for GuilID in guilds]
+        async def Ask(Owner, Subset):
+            # The other clusters answer for the guilds cached on their shards.
+            response = await self.client.get_cog("APICog").Forward(
+                Owner,
+                "POST",
+                "/mutual_servers",
+                {"auth": auth},
+                jsonlib.dumps({"guilds": Subset, "user": user}).encode(),
+            )
+            if response is None or response.status_code != 200:
+                return []
+            return jsonlib.loads(response.body).get("mutual", [])
+
+        tasks = [Process(GuilID) for GuilID in Local]
         results = await asyncio.gather(*tasks)
+        Others = await asyncio.gather(
+            *(Ask(Owner, Subset) for Owner, Subset in Remote.items())
+        )
 
         mutual = [result for result in results if result is not None]
+        for batch in Others:
+            mutual.extend(batch)
 
         return {"status": "success", "mutual": mutual}
 
@@ -477,8 +516,11 @@ class APIRoutes:
             body = self.unstringify_dict(body)
         print("After unstringify:", body)
         print(server)
-        await config.update_one({"_id": int(server)}, {"$set": body}, upsert=True)
-        c = await config.find_one({"_id": int(server)})
+        c = await PatchConfig(
+            self.client,
+            int(server),
+            Set={k: v for k, v in body.items() if k not in ("_id", "version")},
+        )
         print(c)
         return {"status": "success"}
 
@@ -502,8 +544,7 @@ class APIRoutes:
             )
 
         Infractions = []
-        if not guild.chunked:
-            await guild.chunk()
+        await ChunkGuild(guild)
         for infraction in infractions:
             staff = guild.get_member(infraction.get("staff"))
             management = guild.get_member(infraction.get("management"))
@@ -934,6 +975,28 @@ class APIRoutes:
 
         return {"status": "success", "leaderboard": Leaderboard}
 
+    async def GET_telemetry(self, auth: str, command: str = None):
+        if not await RestrictedValidation(auth):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid Key"
+            )
+
+        query = {"command": command} if command else {}
+        result = (
+            await db["Command Telemetry"]
+            .find(query)
+            .sort("count", pymongo.DESCENDING)
+            .to_list(length=None)
+        )
+        return {"status": "success", "commands": [Summarise(x) for x in result]}
+
+    async def GET_http(self, auth: str):
+        if not await RestrictedValidation(auth):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid Key"
+            )
+        return {"status": "success", "hosts": HTTP.Metrics()}
+
     def GET_status(self):
         return {"status": "Connected", "uptime": self.Uptime.timestamp()}
         
@@ -958,20 +1021,81 @@ class APICog(commands.Cog):
         self.client = client
         self.app = FastAPI()
         self.app.include_router(APIRoutes(client).router)
+        self.app.middleware("http")(self.Route)
         self.server_task = None
 
     def cog_unload(self):
         if self.server_task and not self.server_task.done():
             self.server_task.cancel()
 
+    async def Forward(
+        self, cluster: int, method: str, path: str, params, body: bytes = None
+    ) -> Response | None:
+        """Replay a request against another cluster's API."""
+        try:
+            response = await HTTP.request(
+                method,
+                f"http://127.0.0.1:{Port + cluster}{path}",
+                # The caller decides whether to retry, don't replay writes here.
+                retries=0,
+                params=params,
+                data=body,
+                headers={
+                    Forwarded: str(ClusterID),
+                    "Content-Type": "application/json",
+                },
+                timeout=aiohttp.ClientTimeout(total=30),
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return None
+        return Response(
+            content=await response.read(),
+            status_code=response.status,
+            media_type=response.headers.get("Content-Type"),
+        )
+
+    async def Route(self, request: Request, call_next):
+        """Guild routes read this process's cache, so requests for a guild on
+        another cluster's shards are answered by that cluster."""
+        server = request.query_params.get("server")
+        if (
+            not Clustered
+            or request.headers.get(Forwarded)
+            or not server
+            or not server.isdigit()
+            or OwnerOf(int(server)) == ClusterID
+        ):
+            return await call_next(request)
+        response = await self.Forward(
+            OwnerOf(int(server)),
+            request.method,
+            request.url.path,
+            list(request.query_params.multi_items()),
+            await request.body(),
+        )
+        if response is None:
+            # Middleware runs outside FastAPI's exception handlers.
+            return Response(
+                content=jsonlib.dumps({"detail": "Cluster unavailable"}),
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                media_type="application/json",
+            )
+        return response
+
     async def cog_load(self):
         self.server_task = asyncio.create_task(self.start_server())
 
     async def start_server(self):
+        import uvicorn
+
         config = uvicorn.Config(
             app=self.app,
-            host="0.0.0.0" if os.getenv("ENVIRONMENT") == "production" else "127.0.0.1",
-            port=8000,
+            host=(
+                "0.0.0.0"
+                if os.getenv("ENVIRONMENT") == "production" and ClusterID == 0
+                else "127.0.0.1"
+            ),
+            port=Port + ClusterID,
             log_level="info",
         )
         server = uvicorn.Server(config)
@@ -0,0 +1,153 @@
+import gzip
+import os
+import tempfile
+from datetime import datetime
+from bson import json_util
+from discord.ext import commands
+from pymongo import ReplaceOne, UpdateOne
+from pymongo.errors import BulkWriteError
+
+Version = 1
+BatchSize = int(os.getenv("EXPORT_BATCH", 500))
+
+# name: (database attribute on the client, collection, guild key, projection)
+Collections = {
+    "config": ("db", "Config", "_id", None),
+    "infractions": ("db", "infractions", "guild_id", None),
+    "promotions": ("db", "promotions", "guild_id", None),
+    "loa": ("db", "loa", "guild_id", None),
+    "tickets": ("db", "Tickets", "GuildID", {"transcript": 0}),
+    "feedback": ("db", "feedback", "guild_id", None),
+    "suggestions": ("db", "suggestions", "guild_id", None),
+    "quota": ("qdb", "messages", "guild_id", None),
+    "staff database": ("db", "staff database", "guild_id", None),
+}
+
+
+class ArchiveError(Exception):
+    pass
+
+
+def Collection(client: commands.Bot, name: str):
+    database, collection, _, _ = Collections[name]
+    return getattr(client, database)[collection]
+
+
+def Line(record: dict) -> bytes:
+    return json_util.dumps(record).encode("utf-8") + b"\n"
+
+
+async def Export(client: commands.Bot, guild_id: int):
+    """Write every guild-scoped collection to a gzip NDJSON temp file.
+
+    Documents are streamed from cursors in ``EXPORT_BATCH`` batches, so memory
+    stays flat whatever the guild's size. Returns ``(file, counts)``; the file
+    is rewound and deleted once closed."""
+    File = tempfile.TemporaryFile()
+    Counts = {}
+    with gzip.GzipFile(fileobj=File, mode="wb") as archive:
+        archive.write(
+            Line(
+                {
+                    "type": "header",
+                    "version": Version,
+                    "guild": guild_id,
+                    "created": datetime.utcnow(),
+                }
+            )
+        )
+        for name, (_, _, key, projection) in Collections.items():
+            Counts[name] = 0
+            cursor = Collection(client, name).find(
+                {key: guild_id}, projection, batch_size=BatchSize
+            )
+            async for document in cursor:
+                archive.write(Line({"c": name, "d": document}))
+                Counts[name] += 1
+    File.seek(0)
+    return File, Counts
+
+
+async def Import(
+    client: commands.Bot, guild_id: int, fileobj, chunk: int = None
+):
+    """Restore an archive made by ``Export`` for the same guild.
+
+    Documents are upserted by ``_id`` and guild through ``bulk_write`` in chunks,
+    so an ``_id`` belonging to another guild fails as a duplicate instead of being
+    overwritten. Collections exported with a projection are merged with ``$set``
+    so excluded fields (ticket transcripts) survive.
+    Returns ``{collection: restored count}``, plus ``skipped`` for rejected documents."""
+    chunk = chunk or BatchSize
+    Pending = {}
+    Counts = {}
+
+    async def Flush(name: str):
+        operations = Pending.pop(name, [])
+        if not operations:
+            return
+        try:
+            result = await Collection(client, name).bulk_write(
+                operations, ordered=False
+            )
+            Restored = result.upserted_count + result.matched_count
+        except BulkWriteError as e:
+            Errors = e.details.get("writeErrors", [])
+            if any(error.get("code") != 11000 for error in Errors):
+                raise
+            Restored = e.details.get("nUpserted", 0) + e.details.get("nMatched", 0)
+            Counts["skipped"] = Counts.get("skipped", 0) + len(Errors)
+        Counts[name] = Counts.get(name, 0) + Restored
+
+    with gzip.GzipFile(fileobj=fileobj, mode="rb") as archive:
+        header = None
+        for raw in archive:
+            if not raw.strip():
+                continue
+            try:
+                record = json_util.loads(raw)
+            except ValueError:
+                raise ArchiveError("The archive is corrupted.")
+            if header is None:
+                if (
+                    record.get("type") != "header"
+                    or record.get("version") != Version
+                ):
+                    raise ArchiveError("This isn't a data export.")
+                if record.get("guild") != guild_id:
+                    raise ArchiveError("This export belongs to a different server.")
+                header = record
+                continue
+
+            name, document = record.get("c"), record.get("d")
+            if name not in Collections or not isinstance(document, dict):
+                continue
+            _, _, key, projection = Collections[name]
+            # Never let an edited archive write into another guild.
+            if document.get(key) != guild_id or "_id" not in document:
+                continue
+            Filter = {"_id": document["_id"], key: guild_id}
+            if name == "config":
+                # Move the version forward, so panels opened before the import
+                # can't save over it.
+                Current = await Collection(client, name).find_one(
+                    {"_id": guild_id}, {"version": 1}
+                )
+                document["version"] = (Current or {}).get("version", 0) + 1
+            if projection:
+                operation = UpdateOne(
+                    Filter,
+                    {"$set": {k: v for k, v in document.items() if k != "_id"}},
+                    upsert=True,
+                )
+            else:
+                operation = ReplaceOne(Filter, document, upsert=True)
+            Pending.setdefault(name, []).append(operation)
+            if len(Pending[name]) >= chunk:
+                await Flush(name)
+
+    if header is None:
+        raise ArchiveError("The archive is empty.")
+    for name in list(Pending):
+        await Flush(name)
+    return Counts
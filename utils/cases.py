@@ -0,0 +1,124 @@
+import asyncio
+import discord
+from discord.ext import commands
+from utils.emojis import greencheck
+from utils.waiters import WaitForReaction
+
+PerPage = 10
+Controls = ["◀", "▶", "❌"]
+
+
+class CasePages:
+    """Newest-first pages of ``punishments`` matching ``query``.
+
+    Pages are fetched one at a time with keyset pagination on
+    ``(timestamp, _id)``, only the visible page is held in memory."""
+
+    def __init__(self, collection, query: dict, per_page: int = PerPage):
+        self.collection = collection
+        self.query = query
+        self.per_page = per_page
+        self.starts = [None]  # (timestamp, _id) each visited page starts after
+        self.index = 0
+        self.cases = []
+        self.total = 0
+
+    @property
+    def pages(self) -> int:
+        return max((self.total + self.per_page - 1) // self.per_page, 1)
+
+    async def Load(self) -> int:
+        self.total = await self.collection.count_documents(self.query)
+        if self.total:
+            await self.Fetch()
+        return self.total
+
+    async def Fetch(self):
+        query = self.query
+        after = self.starts[self.index]
+        if after:
+            timestamp, _id = after
+            query = {
+                "$and": [
+                    self.query,
+                    {
+                        "$or": [
+                            {"timestamp": {"$lt": timestamp}},
+                            {"timestamp": timestamp, "_id": {"$lt": _id}},
+                        ]
+                    },
+                ]
+            }
+        self.cases = (
+            await self.collection.find(
+                query, {"punishment_id": 1, "punishment_type": 1, "timestamp": 1}
+            )
+            .sort([("timestamp", -1), ("_id", -1)])
+            .limit(self.per_page)
+            .to_list(length=self.per_page)
+        )
+
+    async def Next(self) -> bool:
+        if self.index + 1 >= self.pages or not self.cases:
+            return False
+        if len(self.starts) == self.index + 1:
+            last = self.cases[-1]
+            self.starts.append((last["timestamp"], last["_id"]))
+        self.index += 1
+        await self.Fetch()
+        return True
+
+    async def Previous(self) -> bool:
+        if self.index == 0:
+            return False
+        self.index -= 1
+        await self.Fetch()
+        return True
+
+    def Embed(self, title: str, icon=None) -> discord.Embed:
+        lines = [
+            f"{greencheck} `{case['punishment_id']}` **[{case['punishment_type'].upper()}]** {discord.utils.format_dt(case['timestamp'], style='R')}"
+            for case in self.cases
+        ]
+        embed = discord.Embed(
+            description="\n".join(lines) or "No modcases found.",
+            color=discord.Color.from_rgb(54, 57, 63),
+        )
+        embed.set_author(name=title, icon_url=icon)
+        embed.set_footer(text=f"Page: {self.index + 1}/{self.pages}")
+        return embed
+
+
+async def Browse(
+    ctx: commands.Context, send, pages: CasePages, title: str, icon=None, **kwargs
+):
+    """Send the first page and page through with reactions until ❌ or a minute idle."""
+    msg = await send(embed=pages.Embed(title, icon), **kwargs)
+    for emoji in Controls:
+        await msg.add_reaction(emoji)
+
+    def check(reaction, user):
+        return (
+            user == ctx.author
+            and str(reaction.emoji) in Controls
+            and reaction.message.id == msg.id
+        )
+
+    while True:
+        try:
+            reaction, user = await WaitForReaction(
+                ctx.bot, msg.id, ctx.author.id, check=check, timeout=60.0
+            )
+        except (TimeoutError, asyncio.TimeoutError):
+            await msg.clear_reactions()
+            break
+        await msg.remove_reaction(reaction, user)
+        if str(reaction.emoji) == "❌":
+            await msg.clear_reactions()
+            break
+        if str(reaction.emoji) == "◀":
+            changed = await pages.Previous()
+        else:
+            changed = await pages.Next()
+        if changed:
+            await msg.edit(embed=pages.Embed(title, icon))
@@ -0,0 +1,185 @@
+import asyncio
+import json
+import os
+from discord.ext import commands, tasks
+
+# Set by cluster.py for each process it launches, unset when running main.py directly.
+ClusterID = int(os.getenv("CLUSTER_ID", 0))
+ClusterCount = int(os.getenv("CLUSTER_COUNT", 1))
+ShardIDs = [int(i) for i in os.getenv("SHARD_IDS", "").split(",") if i.strip()]
+ShardCount = int(os.getenv("SHARD_COUNT") or os.getenv("SHARDS") or 0) or None
+Coordinator = os.getenv("COORDINATOR")  # host:port
+Clustered = bool(ShardIDs and ShardCount)
+# Loops that aren't tied to a guild (stats posting, cleanup) only run here.
+Primary = ClusterID == 0
+
+
+def ShardOptions() -> dict:
+    if Clustered:
+        return {"shard_ids": ShardIDs, "shard_count": ShardCount}
+    if ShardCount:
+        return {"shard_count": ShardCount}
+    return {}
+
+
+def Ranges(shards: int, clusters: int) -> list[list[int]]:
+    """Contiguous shard ids for each cluster, as cluster.py hands them out."""
+    clusters = max(1, min(clusters, shards))
+    size, extra = divmod(shards, clusters)
+    ranges, start = [], 0
+    for index in range(clusters):
+        end = start + size + (1 if index < extra else 0)
+        ranges.append(list(range(start, end)))
+        start = end
+    return ranges
+
+
+def OwnerOf(guild_id) -> int:
+    """The cluster whose shards serve ``guild_id``."""
+    if not Clustered or guild_id is None:
+        return ClusterID
+    shard = (int(guild_id) >> 22) % ShardCount
+    for cluster, shards in enumerate(Ranges(ShardCount, ClusterCount)):
+        if shard in shards:
+            return cluster
+    return ClusterID
+
+
+def Owns(guild_id) -> bool:
+    """Whether this cluster's shards serve ``guild_id``. Per-guild task loops run
+    in every cluster and skip documents for guilds owned by another one."""
+    if not Clustered or guild_id is None:
+        return True
+    return (int(guild_id) >> 22) % ShardCount in ShardIDs
+
+
+def Stats(client: commands.Bot) -> dict:
+    return {
+        "cluster": ClusterID,
+        "guilds": len(client.guilds),
+        "users": sum(guild.member_count or 0 for guild in client.guilds),
+        "shards": [
+            {
+                "id": shard_id,
+                "latency": shard.latency,
+                "guilds": sum(
+                    1 for guild in client.guilds if guild.shard_id == shard_id
+                ),
+            }
+            for shard_id, shard in client.shards.items()
+        ],
+    }
+
+
+class ClusterLink(commands.Cog):
+    """Reports this cluster's health to the coordinator and asks it for totals."""
+
+    def __init__(self, client: commands.Bot):
+        self.client = client
+        self.reader: asyncio.StreamReader = None
+        self.writer: asyncio.StreamWriter = None
+        self.pending: dict[int, asyncio.Future] = {}
+        self.nonce = 0
+        self.lock = asyncio.Lock()
+        self.listener = None
+        client.cluster = self
+        self.heartbeat.start()
+
+    def cog_unload(self):
+        self.heartbeat.cancel()
+        if self.listener:
+            self.listener.cancel()
+        if self.writer:
+            self.writer.close()
+        if getattr(self.client, "cluster", None) is self:
+            del self.client.cluster
+
+    async def Connect(self):
+        if self.writer and not self.writer.is_closing():
+            return True
+        host, _, port = Coordinator.rpartition(":")
+        try:
+            self.reader, self.writer = await asyncio.open_connection(host, int(port))
+        except OSError:
+            self.writer = None
+            return False
+        self.listener = asyncio.create_task(self.Listen())
+        return True
+
+    async def Send(self, payload: dict):
+        async with self.lock:
+            if not await self.Connect():
+                return False
+            self.writer.write(json.dumps(payload).encode() + b"\n")
+            try:
+                await self.writer.drain()
+            except (ConnectionError, OSError):
+                self.writer = None
+                return False
+        return True
+
+    async def Listen(self):
+        try:
+            while line := await self.reader.readline():
+                message = json.loads(line)
+                if message.get("op") == "broadcast":
+                    self.client.dispatch(
+                        f"cluster_{message.get('event')}", message.get("data")
+                    )
+                    continue
+                future = self.pending.pop(message.get("nonce"), None)
+                if future and not future.done():
+                    future.set_result(message)
+        except (ConnectionError, OSError, ValueError):
+            pass
+        finally:
+            self.writer = None
+            for future in self.pending.values():
+                if not future.done():
+                    future.set_result(None)
+            self.pending.clear()
+
+    async def Request(self, op: str, timeout: float = 5):
+        self.nonce += 1
+        nonce = self.nonce
+        future = self.pending[nonce] = asyncio.get_running_loop().create_future()
+        if not await self.Send({"op": op, "nonce": nonce, "cluster": ClusterID}):
+            self.pending.pop(nonce, None)
+            return None
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            self.pending.pop(nonce, None)
+            return None
+
+    @tasks.loop(seconds=10)
+    async def heartbeat(self):
+        await self.Send({"op": "heartbeat", **Stats(self.client)})
+
+    @heartbeat.before_loop
+    async def before_heartbeat(self):
+        await self.client.wait_until_ready()
+
+
+async def Broadcast(client: commands.Bot, event: str, data: dict):
+    """Dispatch ``cluster_<event>(data)`` in every other cluster. ``data`` must be JSON."""
+    link: ClusterLink = getattr(client, "cluster", None)
+    if link is not None:
+        await link.Send(
+            {"op": "broadcast", "cluster": ClusterID, "event": event, "data": data}
+        )
+
+
+async def Aggregate(client: commands.Bot) -> list[dict]:
+    """Latest stats from every cluster, or just this process when not clustered."""
+    link: ClusterLink = getattr(client, "cluster", None)
+    if link is not None:
+        response = await link.Request("stats")
+        if response and response.get("clusters"):
+            return response["clusters"]
+    return [Stats(client)]
+
+
+async def setup(client: commands.Bot) -> None:
+    if Coordinator:
+        await client.add_cog(ClusterLink(client))
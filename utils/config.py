@@ -0,0 +1,189 @@
+import copy
+import discord
+from discord.ext import commands
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from utils.emojis import no
+
+Missing = object()
+
+
+class ConfigConflict(Exception):
+    """Someone else changed the same config paths since this copy was loaded."""
+
+    def __init__(self, guild_id: int, paths: list[str]):
+        super().__init__(f"Config for {guild_id} changed at {', '.join(paths)}")
+        self.guild_id = guild_id
+        self.paths = paths
+
+
+class Snapshot(dict):
+    """A guild config document that remembers what it looked like when loaded,
+    so ``SaveConfig`` can write only the fields that were changed."""
+
+    def __init__(self, document: dict):
+        super().__init__(document)
+        self.original = copy.deepcopy(document)
+        self.version = document.get("version", 0)
+
+
+def Flatten(key: str) -> bool:
+    return (
+        isinstance(key, str) and key and "." not in key and not key.startswith("$")
+    )
+
+
+def Diff(old: dict, new: dict, prefix: str = ""):
+    """Dotted ``$set``/``$unset`` paths turning ``old`` into ``new``.
+    Lists and non-dict values are replaced whole."""
+    Set, Unset = {}, []
+    for key, value in new.items():
+        if key in ("_id", "version") and not prefix:
+            continue
+        before = old.get(key, Missing)
+        path = f"{prefix}{key}"
+        if not Flatten(key):
+            if before is Missing or before != value:
+                return None
+            continue
+        if isinstance(value, dict) and isinstance(before, dict) and value:
+            Nested = Diff(before, value, f"{path}.")
+            if Nested is None:
+                Set[path] = value
+                continue
+            Set.update(Nested[0])
+            Unset.extend(Nested[1])
+        elif before is Missing or before != value:
+            Set[path] = value
+    for key in old:
+        if key in ("_id", "version") and not prefix:
+            continue
+        if key not in new:
+            if not Flatten(key):
+                return None
+            Unset.append(f"{prefix}{key}")
+    return Set, Unset
+
+
+def Lookup(document: dict, path: str):
+    value = document
+    for part in path.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return Missing
+        value = value[part]
+    return value
+
+
+async def LoadConfig(client: commands.Bot, guild_id: int) -> Snapshot | None:
+    document = await client.config.find_one({"_id": guild_id})
+    return Snapshot(document) if document is not None else None
+
+
+async def PatchConfig(
+    client: commands.Bot,
+    guild_id: int,
+    Set: dict = None,
+    Unset: list[str] = None,
+    Pull: dict = None,
+    version: int = None,
+    Add: dict = None,
+) -> dict:
+    """Apply dotted-path changes to a guild config and bump its ``version``.
+
+    When ``version`` is given the write only goes through if the stored
+    document is still at that version, otherwise ``ConfigConflict`` is raised.
+    Dispatches ``config_update(guild_id, paths, document)`` on success."""
+    Update = {"$inc": {"version": 1}}
+    if Set:
+        Update["$set"] = Set
+    if Unset:
+        Update["$unset"] = {path: "" for path in Unset}
+    if Pull:
+        Update["$pull"] = Pull
+    if Add:
+        Update["$addToSet"] = Add
+    Paths = list(Set or {}) + list(Unset or []) + list(Pull or {}) + list(Add or {})
+    if not Paths:
+        return None
+
+    Filter = {"_id": guild_id}
+    if version is not None:
+        Filter["version"] = version or None
+    try:
+        document = await client.config.find_one_and_update(
+            Filter, Update, upsert=True, return_document=ReturnDocument.AFTER
+        )
+    except DuplicateKeyError:
+        raise ConfigConflict(guild_id, Paths)
+
+    client.dispatch("config_update", guild_id, Paths, document)
+    return document
+
+
+async def SaveConfig(
+    client: commands.Bot, guild_id: int, config: dict, retries: int = 3
+):
+    """Write back a config loaded with ``LoadConfig`` as a field-level patch.
+
+    Concurrent edits to other paths are kept: on a version mismatch the stored
+    document is re-read and the patch is retried unless one of our paths was
+    changed in the meantime. Returns the stored document after the write."""
+    original = getattr(config, "original", {})
+    version = getattr(config, "version", None)
+    Changes = Diff(original, config)
+    if Changes is None:
+        Changes = (
+            {
+                key: value
+                for key, value in config.items()
+                if key not in ("_id", "version")
+            },
+            [
+                key
+                for key in original
+                if key not in config and key not in ("_id", "version")
+            ],
+        )
+    Set, Unset = Changes
+    if not Set and not Unset:
+        return config
+
+    Paths = list(Set) + Unset
+    for attempt in range(retries + 1):
+        try:
+            document = await PatchConfig(
+                client, guild_id, Set=Set, Unset=Unset, version=version
+            )
+            break
+        except ConfigConflict:
+            if attempt >= retries:
+                raise
+            Current = await client.config.find_one({"_id": guild_id}) or {}
+            Changed = [
+                path
+                for path in Paths
+                if Lookup(Current, path) != Lookup(original, path)
+            ]
+            if Changed:
+                raise ConfigConflict(guild_id, Changed)
+            version = Current.get("version", 0)
+
+    config["version"] = document.get("version", 0)
+    if isinstance(config, Snapshot):
+        config.original = copy.deepcopy(dict(config))
+        config.version = config["version"]
+    return Snapshot(document)
+
+
+async def SavePanel(interaction: discord.Interaction, config: dict) -> dict | None:
+    """``SaveConfig`` for the configuration panels. On a conflict the user is told
+    to reopen the panel and ``None`` is returned."""
+    try:
+        return await SaveConfig(interaction.client, interaction.guild.id, config)
+    except ConfigConflict:
+        content = f"{no} **{interaction.user.display_name},** these settings were changed elsewhere while you were editing them. Reopen the panel and try again."
+        if interaction.response.is_done():
+            await interaction.followup.send(content=content, ephemeral=True)
+        else:
+            await interaction.response.send_message(content=content, ephemeral=True)
+        return None
@@ -3,12 +3,15 @@ from discord.ext import commands, tasks
 import os
 from utils.emojis import *
 from motor.motor_asyncio import AsyncIOMotorClient
-import aiohttp
 import re
+from utils.http import HTTP
 from utils.patreon import SubscriptionUser
 from utils.format import IsSeperateBot
 from datetime import datetime
 from utils.HelpEmbeds import NotYourPanel
+from utils.membercache import ChunkGuild
+from utils.cluster import Primary
+from utils.config import PatchConfig
 
 
 MONGO_URL = os.getenv("MONGO_URL")
@@ -44,15 +47,14 @@ async def Create(name, user: discord.User):
         "environmentId": "env_prod_AnhFqj439TjExphKiI7-x_1757255169.949818"
     }
 
-    async with aiohttp.ClientSession() as session:
-        async with session.post(url, headers=headers, json=data) as response:
-            if response.status == 200:
-                Response = await response.json()
-                print(Response)
-                return Response["applicationId"]
-            else:
-                print(await response.text())
-                return None
+    async with HTTP.post(url, headers=headers, json=data) as response:
+        if response.status == 200:
+            Response = await response.json()
+            print(Response)
+            return Response["applicationId"]
+        else:
+            print(await response.text())
+            return None
 
 
 async def UpdateENV(application_id, env, build_args=None):
@@ -68,120 +70,112 @@ async def UpdateENV(application_id, env, build_args=None):
         "buildArgs": build_args if build_args else "",
     }
 
-    async with aiohttp.ClientSession() as session:
-        async with session.post(url, headers=headers, json=data) as response:
-            if not response.ok:
-                return None
-            return response.status
+    async with HTTP.post(url, headers=headers, json=data) as response:
+        if not response.ok:
+            return None
+        return response.status
 
 
 async def GetProjects():
-    async with aiohttp.ClientSession() as session:
-        async with session.get(
-            f"{os.getenv('DOCKER_URL')}/api/project.one?projectId=AnhFqj439TjExphKiI7-x",
-            headers={"x-api-key": f"{os.getenv('DOCKER_TOKEN')}"},
-        ) as r:
-            if r.status == 200:
-                data = await r.json()
-                return data
-            else:
-                print(await r.text())
+    async with HTTP.get(
+        f"{os.getenv('DOCKER_URL')}/api/project.one?projectId=AnhFqj439TjExphKiI7-x",
+        headers={"x-api-key": f"{os.getenv('DOCKER_TOKEN')}"},
+    ) as r:
+        if r.status == 200:
+            data = await r.json()
+            return data
+        else:
+            print(await r.text())
 
-                return None
+            return None
 
 
 async def DeleteApplication(AppID: int):
-    async with aiohttp.ClientSession() as session:
-        async with session.post(
-            f"{os.getenv('DOCKER_URL')}/api/application.delete",
-            json={"applicationId": AppID},
-            headers={
-                "x-api-key": f"{os.getenv('DOCKER_TOKEN')}",
-                "Content-Type": "application/json",
-            },
-        ) as r:
-            if r.status == 200:
-                return True
-            else:
-                return None
+    async with HTTP.post(
+        f"{os.getenv('DOCKER_URL')}/api/application.delete",
+        json={"applicationId": AppID},
+        headers={
+            "x-api-key": f"{os.getenv('DOCKER_TOKEN')}",
+            "Content-Type": "application/json",
+        },
+    ) as r:
+        if r.status == 200:
+            return True
+        else:
+            return None
 
 
 async def StopApplication(AppID: int):
-    async with aiohttp.ClientSession() as session:
-        async with session.post(
-            f"{os.getenv('DOCKER_URL')}/api/application.stop",
-            json={"applicationId": AppID},
-            headers={
-                "x-api-key": f"{os.getenv('DOCKER_TOKEN')}",
-                "Content-Type": "application/json",
-            },
-        ) as r:
-            if r.status == 200:
-                return True
-            else:
-                return None
+    async with HTTP.post(
+        f"{os.getenv('DOCKER_URL')}/api/application.stop",
+        json={"applicationId": AppID},
+        headers={
+            "x-api-key": f"{os.getenv('DOCKER_TOKEN')}",
+            "Content-Type": "application/json",
+        },
+    ) as r:
+        if r.status == 200:
+            return True
+        else:
+            return None
 
 
 async def GetApplication(AppID: int):
-    async with aiohttp.ClientSession() as session:
-        async with session.get(
-            f"{os.getenv('DOCKER_URL')}/api/application.one?applicationId={AppID}",
-            headers={"x-api-key": f"{os.getenv('DOCKER_TOKEN')}"},
-        ) as r:
-            if r.status == 200:
-                data = await r.json()
-                return data
-            else:
-                return None
+    async with HTTP.get(
+        f"{os.getenv('DOCKER_URL')}/api/application.one?applicationId={AppID}",
+        headers={"x-api-key": f"{os.getenv('DOCKER_TOKEN')}"},
+    ) as r:
+        if r.status == 200:
+            data = await r.json()
+            return data
+        else:
+            return None
 
 
 async def Deploy(applicationId):
-    async with aiohttp.ClientSession() as session:
-        async with session.post(
-            f"{os.getenv('DOCKER_URL')}/api/application.deploy",
-            json={"applicationId": applicationId},
-            headers={
-                "x-api-key": f"{os.getenv('DOCKER_TOKEN')}",
-                "Content-Type": "application/json",
-            },
-        ) as r:
-            if r.status == 200:
-                return True
-            else:
-                return None
+    async with HTTP.post(
+        f"{os.getenv('DOCKER_URL')}/api/application.deploy",
+        json={"applicationId": applicationId},
+        headers={
+            "x-api-key": f"{os.getenv('DOCKER_TOKEN')}",
+            "Content-Type": "application/json",
+        },
+    ) as r:
+        if r.status == 200:
+            return True
+        else:
+            return None
 
 
 async def Reload(applicationId):
-    async with aiohttp.ClientSession() as session:
-        async with session.post(
-            f"{os.getenv('DOCKER_URL')}/api/application.reload",
-            json={"applicationId": applicationId},
-            headers={
-                "x-api-key": f"{os.getenv('DOCKER_TOKEN')}",
-                "Content-Type": "application/json",
-            },
-        ) as r:
-            if r.status == 200:
-                return True
-            else:
-                return None
+    async with HTTP.post(
+        f"{os.getenv('DOCKER_URL')}/api/application.reload",
+        json={"applicationId": applicationId},
+        headers={
+            "x-api-key": f"{os.getenv('DOCKER_TOKEN')}",
+            "Content-Type": "application/json",
+        },
+    ) as r:
+        if r.status == 200:
+            return True
+        else:
+            return None
 
 
 async def Start(applicationId):
-    async with aiohttp.ClientSession() as session:
-        async with session.post(
-            f"{os.getenv('DOCKER_URL')}/api/application.start",
-            json={"applicationId": applicationId},
-            headers={
-                "x-api-key": f"{os.getenv('DOCKER_TOKEN')}",
-                "Content-Type": "application/json",
-            },
-        ) as r:
-            if r.status == 200:
-                data = await r.json()
-                return True
-            else:
-                return None
+    async with HTTP.post(
+        f"{os.getenv('DOCKER_URL')}/api/application.start",
+        json={"applicationId": applicationId},
+        headers={
+            "x-api-key": f"{os.getenv('DOCKER_TOKEN')}",
+            "Content-Type": "application/json",
+        },
+    ) as r:
+        if r.status == 200:
+            data = await r.json()
+            return True
+        else:
+            return None
 
 
 class SelectProject(discord.ui.Select):
@@ -346,7 +340,8 @@ class DeployAllButton(discord.ui.View):
 class Depl(commands.Cog):
     def __init__(self, client: commands.Bot):
         self.client = client
-        self.SubscriptionStatus.start()
+        if Primary:
+            self.SubscriptionStatus.start()
         self.SubscriptionRoles.start()
 
     @tasks.loop(hours=12)
@@ -357,6 +352,8 @@ class Depl(commands.Cog):
         if os.getenv("ENVIRONMENT") in ["custom", "development"]:
             return
         Guild = self.client.get_guild(1092976553752789054)
+        if not Guild:
+            return
         PremiumRole = Guild.get_role(1233945875680596010)
         BrandingRole = Guild.get_role(1182022232407543981)
         if not PremiumRole or not BrandingRole:
@@ -418,12 +415,9 @@ class Depl(commands.Cog):
                 for guild_id in P.get("guilds", []):
                     config = await self.client.db["Config"].find_one({"_id": guild_id})
                     if config is not None:
-                        features = config.get("Features", [])
-                        if "PREMIUM" in features:
-                            features.remove("PREMIUM")
-                            await self.client.db["Config"].update_one(
-                                {"_id": guild_id},
-                                {"$set": {"Features": features}},
+                        if "PREMIUM" in config.get("Features", []):
+                            await PatchConfig(
+                                self.client, guild_id, Pull={"Features": "PREMIUM"}
                             )
                 await premium.delete_one({"user": P.get("user")})
 
@@ -511,8 +505,7 @@ class Depl(commands.Cog):
         if not before.guild.id == 1092976553752789054:
             return
 
-        if not before.guild.chunked:
-            await before.guild.chunk()
+        await ChunkGuild(before.guild)
         if isinstance(before, discord.Member) and isinstance(after, discord.Member):
             if after.guild is None:
                 return
@@ -640,12 +633,11 @@ class Depl(commands.Cog):
                                 {"_id": server}
                             )
                             if Config is not None:
-                                features = Config.get("Features", [])
-                                if "PREMIUM" in features:
-                                    features.remove("PREMIUM")
-                                    await self.client.db["Config"].update_one(
-                                        {"_id": server},
-                                        {"$set": {"Features": features}},
+                                if "PREMIUM" in Config.get("Features", []):
+                                    await PatchConfig(
+                                        self.client,
+                                        server,
+                                        Pull={"Features": "PREMIUM"},
                                     )
                         await premium.delete_one({"user": after.id})
 
@@ -1,6 +1,31 @@
 import os
 
+# Custom emojis only render for the main bot, separately hosted bots can't use
+# them. EMOJI_MODE picks what they resolve to: "custom", "fallback" or "none".
+Mode = os.getenv("EMOJI_MODE") or (
+    "none"
+    if os.getenv("REMOVE_EMOJIS", False) == "True"
+    or os.getenv("ENVIRONMENT") == "custom"
+    else "custom"
+)
 
+# {name: (custom emoji, fallback)}
+Registry = {
+    "greencheck": ("<:success:1447231462066884638>", "`✅`"),
+    "usr": ("<:User:1447229143140794550>", "`👤`"),
+    "reason": ("<:Reason:1447230077157904384>", "`📝`"),
+    "modd": ("<:mod:1447282912696209510>", "`🛡️`"),
+    "alert": ("<:Alert:1447279662517583923>", "`⚠️`"),
+}
+
+
+def Emoji(name: str, default: str = "") -> str:
+    custom, fallback = Registry.get(name, (default, default))
+    if Mode == "custom":
+        return custom
+    if Mode == "fallback":
+        return fallback
+    return ""
 
 
 tick = "`✅`"
@@ -13,7 +38,7 @@ tagsemoji = None
 infractions = "`📄`"
 promotions = "`🎉`"
 dropdown = "`🔽`"
-greencheck = "<:success:1447231462066884638>"
+greencheck = Emoji("greencheck")
 redx = "`❌`"
 cpending = "`⏳`"
 bin = "`🗑️`"
@@ -31,6 +56,7 @@ hammer = "`🔨`"
 info = "`ℹ️`"
 page = "`📃`"
 wave = "`👋`"
-usr = "<:User:1447229143140794550>"
-reason = "<:Reason:1447230077157904384>"
-modd = "<:mod:1447282912696209510>"
\ No newline at end of file
+usr = Emoji("usr")
+reason = Emoji("reason")
+modd = Emoji("modd")
+alert = Emoji("alert")
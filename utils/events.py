@@ -0,0 +1,117 @@
+import discord
+from bson import ObjectId
+from discord.ext import commands
+
+
+class Event:
+    """Envelope for internal domain events (``infraction``, ``promotion``, ``leave_*``...).
+
+    Dispatchers pass whatever they already hold (the document, guild, member,
+    channel and config snapshot) and listeners resolve anything missing lazily,
+    each field at most once per event."""
+
+    def __init__(
+        self,
+        client: commands.Bot,
+        collection: str,
+        document: dict = None,
+        _id: ObjectId = None,
+        guild: discord.Guild = None,
+        member: discord.Member = None,
+        channel: discord.abc.GuildChannel = None,
+        config: dict = None,
+        GuildKey: str = "guild_id",
+        MemberKey: str = "user",
+    ):
+        self.client = client
+        self.collection = collection
+        self.document = document
+        self.id = _id if _id is not None else (document or {}).get("_id")
+        self.guild = guild
+        self.config = config
+        self.GuildKey = GuildKey
+        self.MemberKey = MemberKey
+        self.members = {member.id: member} if member else {}
+        self.member = member
+        self.channels = {channel.id: channel} if channel else {}
+        self.channel = channel
+
+    def __repr__(self):
+        return f"<Event {self.collection} {self.id}>"
+
+    async def Document(self):
+        if self.document is None:
+            self.document = await self.client.db[self.collection].find_one(
+                {"_id": self.id}
+            )
+        return self.document
+
+    async def Guild(self):
+        if self.guild is None:
+            document = await self.Document()
+            if not document or not document.get(self.GuildKey):
+                return None
+            GuildID = int(document.get(self.GuildKey))
+            self.guild = self.client.get_guild(GuildID)
+            if self.guild is None:
+                try:
+                    self.guild = await self.client.fetch_guild(GuildID)
+                except (discord.Forbidden, discord.NotFound, discord.HTTPException):
+                    return None
+        return self.guild
+
+    async def Config(self):
+        if self.config is None:
+            guild = await self.Guild()
+            if guild is None:
+                return None
+            self.config = await self.client.config.find_one({"_id": guild.id})
+        return self.config
+
+    async def Member(self, id: int = None):
+        if id is None:
+            if self.member is not None:
+                return self.member
+            document = await self.Document()
+            if not document or not document.get(self.MemberKey):
+                return None
+            id = document.get(self.MemberKey)
+            member = await self.Member(int(id))
+            self.member = member
+            return member
+
+        if id not in self.members:
+            guild = await self.Guild()
+            if guild is None:
+                return None
+            member = guild.get_member(id)
+            if member is None:
+                try:
+                    member = await guild.fetch_member(id)
+                except (discord.Forbidden, discord.NotFound, discord.HTTPException):
+                    member = None
+            self.members[id] = member
+        return self.members[id]
+
+    async def Channel(self, id: int):
+        if not id:
+            return None
+        id = int(id)
+        if id not in self.channels:
+            channel = self.client.get_channel(id)
+            if channel is None:
+                try:
+                    channel = await self.client.fetch_channel(id)
+                except (discord.Forbidden, discord.NotFound, discord.HTTPException):
+                    channel = None
+            self.channels[id] = channel
+        return self.channels[id]
+
+
+def Hydrate(client: commands.Bot, collection: str, value, **kwargs) -> Event:
+    """Accept an ``Event``, a document or a bare ObjectId from a dispatcher."""
+    if isinstance(value, Event):
+        return value
+    if isinstance(value, dict):
+        return Event(client, collection, document=value, **kwargs)
+    return Event(client, collection, _id=value, **kwargs)
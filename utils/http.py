@@ -0,0 +1,237 @@
+import aiohttp
+import asyncio
+import json as jsonlib
+import random
+import time
+from urllib.parse import urlsplit
+
+# Requests per second and burst size for each host, anything else uses "default".
+Limits = {
+    "apis.roblox.com": (8, 16),
+    "users.roblox.com": (5, 10),
+    "api.blox.link": (2, 4),
+    "www.patreon.com": (2, 5),
+    # Requests forwarded between clusters' APIs.
+    "127.0.0.1": (1000, 1000),
+    "default": (10, 20),
+}
+Idempotent = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+
+class HTTPError(aiohttp.ClientError):
+    def __init__(self, response: "Response"):
+        super().__init__(f"{response.status} for {response.method} {response.url}")
+        self.response = response
+        self.status = response.status
+
+
+class Response:
+    def __init__(self, method: str, url: str, status: int, headers, body: bytes):
+        self.method = method
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    @property
+    def ok(self):
+        return self.status < 400
+
+    async def read(self):
+        return self.body
+
+    async def text(self):
+        return self.body.decode("utf-8", errors="replace")
+
+    async def json(self, **_):
+        if not self.body:
+            return None
+        return jsonlib.loads(self.body)
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise HTTPError(self)
+
+
+class RequestContext:
+    def __init__(self, coro):
+        self.coro = coro
+
+    def __await__(self):
+        return self.coro.__await__()
+
+    async def __aenter__(self) -> Response:
+        return await self.coro
+
+    async def __aexit__(self, *_):
+        return False
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.blocked = 0.0
+        self.lock = asyncio.Lock()
+
+    def Pause(self, seconds: float):
+        self.blocked = max(self.blocked, time.monotonic() + seconds)
+
+    async def Acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                if now < self.blocked:
+                    await asyncio.sleep(self.blocked - now)
+                    continue
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class HostMetrics:
+    __slots__ = ("requests", "errors", "ratelimited", "retries", "latency")
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.ratelimited = 0
+        self.retries = 0
+        self.latency = 0.0
+
+    def Summary(self):
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "ratelimited": self.ratelimited,
+            "retries": self.retries,
+            "average": (
+                round(self.latency / self.requests * 1000, 1) if self.requests else None
+            ),
+        }
+
+
+class HTTPClient:
+    def __init__(
+        self,
+        limits: dict = None,
+        timeout: float = 15,
+        retries: int = 3,
+        backoff: float = 0.5,
+    ):
+        self.limits = limits or Limits
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.retries = retries
+        self.backoff = backoff
+        self.session: aiohttp.ClientSession = None
+        self.buckets: dict[str, TokenBucket] = {}
+        self.metrics: dict[str, HostMetrics] = {}
+
+    def Session(self):
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                timeout=self.timeout,
+                connector=aiohttp.TCPConnector(
+                    limit=100, limit_per_host=20, ttl_dns_cache=300
+                ),
+            )
+        return self.session
+
+    def Bucket(self, host: str):
+        bucket = self.buckets.get(host)
+        if bucket is None:
+            rate, capacity = self.limits.get(host, self.limits["default"])
+            bucket = self.buckets[host] = TokenBucket(rate, capacity)
+        return bucket
+
+    def RetryAfter(self, headers, attempt: int):
+        value = headers.get("Retry-After") or headers.get("x-ratelimit-reset")
+        try:
+            return max(float(value), 0)
+        except (TypeError, ValueError):
+            return self.backoff * 2**attempt
+
+    async def request(self, method: str, url: str, *, retries: int = None, **kwargs):
+        method = method.upper()
+        host = urlsplit(url).hostname or "default"
+        bucket = self.Bucket(host)
+        metrics = self.metrics.setdefault(host, HostMetrics())
+        retries = self.retries if retries is None else retries
+
+        attempt = 0
+        while True:
+            await bucket.Acquire()
+            start = time.perf_counter()
+            try:
+                async with self.Session().request(method, url, **kwargs) as resp:
+                    response = Response(
+                        method, url, resp.status, resp.headers, await resp.read()
+                    )
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                metrics.requests += 1
+                metrics.errors += 1
+                metrics.latency += time.perf_counter() - start
+                if method not in Idempotent or attempt >= retries:
+                    if isinstance(e, asyncio.TimeoutError):
+                        raise aiohttp.ServerTimeoutError(
+                            f"Timed out requesting {url}"
+                        ) from e
+                    raise
+                await self.Sleep(attempt, metrics)
+                attempt += 1
+                continue
+
+            metrics.requests += 1
+            metrics.latency += time.perf_counter() - start
+            if response.status == 429:
+                metrics.ratelimited += 1
+                delay = self.RetryAfter(response.headers, attempt)
+                bucket.Pause(delay)
+                if attempt < retries:
+                    attempt += 1
+                    metrics.retries += 1
+                    continue
+            elif response.status >= 500:
+                metrics.errors += 1
+                if method in Idempotent and attempt < retries:
+                    await self.Sleep(attempt, metrics)
+                    attempt += 1
+                    continue
+            return response
+
+    async def Sleep(self, attempt: int, metrics: HostMetrics):
+        metrics.retries += 1
+        await asyncio.sleep(self.backoff * 2**attempt * random.uniform(0.5, 1.5))
+
+    def get(self, url: str, **kwargs):
+        return RequestContext(self.request("GET", url, **kwargs))
+
+    def post(self, url: str, **kwargs):
+        return RequestContext(self.request("POST", url, **kwargs))
+
+    def patch(self, url: str, **kwargs):
+        return RequestContext(self.request("PATCH", url, **kwargs))
+
+    def put(self, url: str, **kwargs):
+        return RequestContext(self.request("PUT", url, **kwargs))
+
+    def delete(self, url: str, **kwargs):
+        return RequestContext(self.request("DELETE", url, **kwargs))
+
+    def Metrics(self):
+        return {host: metrics.Summary() for host, metrics in self.metrics.items()}
+
+    async def close(self):
+        if self.session and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+
+HTTP = HTTPClient()
@@ -0,0 +1,183 @@
+import logging
+import os
+import threading
+import time
+from discord.ext import commands
+from pymongo import IndexModel, monitoring
+
+# Queries slower than this (ms) are recorded by the command monitor.
+SlowAfter = float(os.getenv("SLOW_QUERY_MS", 100))
+
+Registry = {}  # {(database, collection): {key spec: IndexModel}}
+
+
+def Spec(keys) -> tuple:
+    if isinstance(keys, str):
+        return ((keys, 1),)
+    return tuple((key, 1) if isinstance(key, str) else tuple(key) for key in keys)
+
+
+def Declare(collection: str, *indexes, database: str = "astro", **options):
+    """Register indexes a module relies on, e.g.
+    ``Declare("Tickets", "ChannelID", ["GuildID", "closed"])``."""
+    Models = Registry.setdefault((database, collection), {})
+    for keys in indexes:
+        spec = Spec(keys)
+        Models.setdefault(spec, IndexModel(list(spec), background=True, **options))
+
+
+def Covered(database: str, collection: str, fields: tuple) -> bool:
+    if not fields or fields == ("_id",):
+        return True
+    for spec in Registry.get((database, collection), {}):
+        if spec[0][0] in fields:
+            return True
+    return False
+
+
+async def Missing(client: commands.Bot) -> dict:
+    Result = {}
+    for (database, collection), Models in Registry.items():
+        Collection = client.db.client[database][collection]
+        Existing = set()
+        async for index in Collection.list_indexes():
+            Existing.add(
+                tuple(
+                    (key, int(value) if isinstance(value, (int, float)) else value)
+                    for key, value in index["key"].items()
+                )
+            )
+        Absent = [model for spec, model in Models.items() if spec not in Existing]
+        if Absent:
+            Result[(database, collection)] = Absent
+    return Result
+
+
+async def EnsureIndexes(client: commands.Bot) -> dict:
+    """Create every declared index that doesn't exist yet.
+    Returns ``{"database.collection": [index names]}`` of what was created."""
+    Created = {}
+    for (database, collection), Models in (await Missing(client)).items():
+        try:
+            Names = await client.db.client[database][collection].create_indexes(
+                Models
+            )
+        except Exception as e:
+            logging.warning(
+                f"[Indexes] Failed to create on {database}.{collection}: {e}"
+            )
+            continue
+        Created[f"{database}.{collection}"] = Names
+    if Created:
+        print(f"[🗂️] Created indexes: {Created}")
+    return Created
+
+
+class QueryMonitor(monitoring.CommandListener):
+    """Records slow commands by shape (collection, operation, filtered fields)."""
+
+    Operations = {
+        "find": "filter",
+        "count": "query",
+        "distinct": "query",
+        "findAndModify": "query",
+        "update": "updates",
+        "delete": "deletes",
+        "aggregate": "pipeline",
+    }
+
+    def __init__(self):
+        self.pending = {}
+        self.slow = {}  # {shape: {"count", "total", "max"}}
+        self.lock = threading.Lock()
+
+    def Shape(self, event: monitoring.CommandStartedEvent):
+        command = event.command_name
+        field = self.Operations.get(command)
+        if field is None:
+            return None
+        body = event.command.get(field) or {}
+        if field in ("updates", "deletes"):
+            body = (body[0] if body else {}).get("q") or {}
+        elif field == "pipeline":
+            body = (body[0] if body else {}).get("$match") or {}
+        fields = tuple(sorted(key for key in body if not key.startswith("$")))
+        return (event.database_name, event.command.get(command), command, fields)
+
+    def started(self, event):
+        shape = self.Shape(event)
+        if shape:
+            self.pending[event.request_id] = shape
+
+    def succeeded(self, event):
+        shape = self.pending.pop(event.request_id, None)
+        if shape is None:
+            return
+        ms = event.duration_micros / 1000
+        if ms < SlowAfter:
+            return
+        with self.lock:
+            stats = self.slow.setdefault(
+                shape, {"count": 0, "total": 0.0, "max": 0.0}
+            )
+            stats["count"] += 1
+            stats["total"] += ms
+            stats["max"] = max(stats["max"], ms)
+            stats["at"] = time.time()
+
+    def failed(self, event):
+        self.pending.pop(event.request_id, None)
+
+    def Report(self, limit: int = 15):
+        with self.lock:
+            Items = sorted(
+                self.slow.items(), key=lambda item: item[1]["total"], reverse=True
+            )
+        return [
+            {
+                "database": database,
+                "collection": collection,
+                "operation": operation,
+                "fields": fields,
+                "indexed": Covered(database, collection, fields),
+                **stats,
+            }
+            for (database, collection, operation, fields), stats in Items[:limit]
+        ]
+
+
+Monitor = QueryMonitor()
+
+
+class Indexes(commands.Cog):
+    def __init__(self, client: commands.Bot):
+        self.client = client
+
+    @commands.command()
+    @commands.is_owner()
+    async def indexes(self, ctx: commands.Context, action: str = "check"):
+        if action == "apply":
+            Created = await EnsureIndexes(self.client)
+            return await ctx.send(
+                f"Created: {Created}" if Created else "Every declared index exists."
+            )
+        Absent = await Missing(self.client)
+        lines = [
+            f"`{database}.{collection}` {', '.join(str(model.document['name']) for model in Models)}"
+            for (database, collection), Models in Absent.items()
+        ]
+        Slow = [
+            f"{'' if query['indexed'] else '⚠️ '}`{query['database']}.{query['collection']}` {query['operation']} {list(query['fields'])}: {query['count']}x, max {query['max']:.0f}ms"
+            for query in Monitor.Report()
+        ]
+        content = (
+            "**Missing indexes**\n"
+            + ("\n".join(lines) or "None")
+            + f"\n\n**Slow queries (>{SlowAfter:.0f}ms)**\n"
+            + ("\n".join(Slow) or "None")
+        )
+        await ctx.send(content[:2000])
+
+
+async def setup(client: commands.Bot) -> None:
+    await client.add_cog(Indexes(client))
@@ -0,0 +1,156 @@
+import discord
+import random
+import string
+from datetime import datetime
+from discord.ext import commands
+from utils.events import Event
+
+Alphabet = string.ascii_uppercase + string.digits
+
+
+async def NewIDs(collection, count: int, k: int = 10):
+    IDs = set()
+    while len(IDs) < count:
+        Wanted = {
+            "".join(random.choices(Alphabet, k=k)) for _ in range(count - len(IDs))
+        }
+        Taken = {
+            doc["random_string"]
+            async for doc in collection.find(
+                {"random_string": {"$in": list(Wanted)}}, {"random_string": 1}
+            )
+        }
+        IDs |= Wanted - Taken
+    return list(IDs)
+
+
+async def IssueBulk(
+    client: commands.Bot,
+    guild: discord.Guild,
+    author: discord.Member,
+    members: list[discord.Member],
+    action: str,
+    reason: str,
+    Config: dict,
+    notes: str = None,
+    expiration: datetime = None,
+    anonymous=None,
+    progress=None,
+):
+    """Insert one infraction per member and log them as a single batch.
+
+    Escalations are counted with one aggregate, the documents go in with one
+    ``insert_many`` and the log messages are handed to ``on_infractions.LogBatch``.
+    Returns ``{"issued", "logged", "approval"}``."""
+    members = [member for member in members if member and not member.bot]
+    if not members:
+        return {"issued": 0, "logged": 0, "approval": False}
+    Infractions = client.db["infractions"]
+    TypeActions = await client.db["infractiontypeactions"].find_one(
+        {"guild_id": guild.id, "name": action}
+    )
+
+    Counts = {}
+    Escalation = (TypeActions or {}).get("Escalation") or {}
+    NextType = Escalation.get("Next Type")
+    try:
+        Threshold = int(Escalation.get("Threshold"))
+    except (ValueError, TypeError):
+        Threshold = None
+    if Threshold and NextType:
+        Counts = {
+            doc["_id"]: doc["count"]
+            async for doc in Infractions.aggregate(
+                [
+                    {
+                        "$match": {
+                            "guild_id": guild.id,
+                            "staff": {"$in": [member.id for member in members]},
+                            "action": action,
+                            "Upscaled": {"$exists": False},
+                        }
+                    },
+                    {"$group": {"_id": "$staff", "count": {"$sum": 1}}},
+                ]
+            )
+        }
+
+    isApproval = bool(
+        Config.get("Infraction", {}).get("Approval", None)
+        and Config.get("Infraction", {}).get("Approval", {}).get("channel")
+        is not None
+    )
+    IDs = await NewIDs(Infractions, len(members))
+    Documents = []
+    Escalated = []
+    for member, random_string in zip(members, IDs):
+        FormeData = {
+            "guild_id": guild.id,
+            "staff": member.id,
+            "management": author.id,
+            "action": action,
+            "reason": reason,
+            "notes": notes if notes else "`N/A`",
+            "expiration": expiration,
+            "random_string": random_string,
+            "annonymous": anonymous,
+            "timestamp": datetime.now(),
+        }
+        if Threshold and NextType and Counts.get(member.id, 0) + 1 >= Threshold:
+            FormeData["action"] = NextType
+            FormeData[
+                "reason"
+            ] += f"\n-# Automatically escalated to **{NextType}** from **{action}**"
+            Escalated.append(member.id)
+        if isApproval:
+            FormeData["ApprovalStatus"] = True
+        Documents.append(FormeData)
+
+    await Infractions.insert_many(Documents)
+    if Escalated:
+        await Infractions.update_many(
+            {
+                "guild_id": guild.id,
+                "staff": {"$in": Escalated},
+                "action": action,
+                "Upscaled": {"$exists": False},
+            },
+            {"$set": {"Upscaled": True}},
+        )
+
+    if isApproval:
+        for FormeData in Documents:
+            client.dispatch("infraction_approval", FormeData["_id"], Config)
+        return {"issued": len(Documents), "logged": 0, "approval": True}
+
+    Actions = {
+        doc["name"]: doc
+        async for doc in client.db["infractiontypeactions"].find(
+            {
+                "guild_id": guild.id,
+                "name": {"$in": list({doc["action"] for doc in Documents})},
+            }
+        )
+    }
+    cog = client.get_cog("on_infractions")
+    if cog is None:
+        for FormeData in Documents:
+            client.dispatch(
+                "infraction",
+                Event(
+                    client,
+                    "infractions",
+                    FormeData,
+                    guild=guild,
+                    config=Config,
+                    MemberKey="staff",
+                ),
+                Config,
+                Actions.get(FormeData["action"]),
+            )
+        return {"issued": len(Documents), "logged": 0, "approval": False}
+
+    Logged = await cog.LogBatch(
+        Documents, Config, Actions, members=members + [author], progress=progress
+    )
+    return {"issued": len(Documents), "logged": Logged, "approval": False}
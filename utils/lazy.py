@@ -0,0 +1,30 @@
+import importlib
+
+
+class LazyModule:
+    """Stands in for a heavy optional module and imports it on first use.
+
+    ``setup`` runs right before the import, e.g. to pick a matplotlib backend."""
+
+    def __init__(self, name: str, setup=None):
+        self._name = name
+        self._setup = setup
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            if self._setup:
+                self._setup()
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<LazyModule {self._name} ({state})>"
+
+
+def Lazy(name: str, setup=None) -> LazyModule:
+    return LazyModule(name, setup)
@@ -0,0 +1,191 @@
+import os
+import time
+import discord
+import psutil
+from discord.ext import commands, tasks
+
+# MEMBER_CACHE_FLAGS: all | joined | voice | none (see discord.MemberCacheFlags)
+Flags = os.getenv("MEMBER_CACHE_FLAGS", "all").lower()
+# MEMBER_CACHE: "all" keeps chunked guilds whole, "staff" trims idle guilds down to
+# members holding the configured staff/admin roles, "none" trims them completely.
+Policy = os.getenv("MEMBER_CACHE", "all").lower()
+# Seconds a chunked guild stays whole after its last ChunkGuild call.
+IdleAfter = int(os.getenv("MEMBER_CACHE_TTL", 1800))
+
+Pinned = set()  # guilds that always keep their full member list (modmail, CACHED)
+# Guilds relying on on_member_update for every member (connection roles, staff
+# lists). Uncached members get no update events, so these are never trimmed.
+Features = set()
+LastUsed = {}  # {guild_id: monotonic time of the last ChunkGuild}
+Footprints = {}  # {guild_id: {"members": int, "rss": bytes, "at": timestamp}}
+
+
+def CacheFlags() -> discord.MemberCacheFlags:
+    if Flags == "none":
+        return discord.MemberCacheFlags.none()
+    if Flags == "voice":
+        return discord.MemberCacheFlags(voice=True, joined=False)
+    if Flags == "joined":
+        return discord.MemberCacheFlags(voice=False, joined=True)
+    return discord.MemberCacheFlags.all()
+
+
+def RSS() -> int:
+    return psutil.Process().memory_info().rss
+
+
+async def ChunkGuild(guild: discord.Guild, cache: bool = True):
+    """Chunk ``guild`` if needed, recording how much memory the chunk cost."""
+    LastUsed[guild.id] = time.monotonic()
+    if guild.chunked:
+        return
+    before = RSS()
+    await guild.chunk(cache=cache)
+    Footprints[guild.id] = {
+        "members": len(guild.members),
+        "rss": max(RSS() - before, 0),
+        "at": time.time(),
+    }
+
+
+def Pin(*guild_ids: int):
+    Pinned.update(int(guild_id) for guild_id in guild_ids)
+
+
+def KeepRoles(config: dict) -> set[int]:
+    Permissions = (config or {}).get("Permissions") or {}
+    Roles = set()
+    for key in ("staffrole", "adminrole"):
+        value = Permissions.get(key) or []
+        if not isinstance(value, list):
+            value = [value]
+        Roles.update(int(role) for role in value if role)
+    return Roles
+
+
+class MemberCache(commands.Cog):
+    def __init__(self, client: commands.Bot):
+        self.client = client
+        self.evict.start()
+
+    def cog_unload(self):
+        self.evict.cancel()
+
+    async def FeatureGuilds(self) -> set[int]:
+        Guilds = set(await self.client.db["connectionroles"].distinct("guild"))
+        Guilds.update(await self.client.db["Active Staff List"].distinct("guild_id"))
+        return {int(guild_id) for guild_id in Guilds if guild_id}
+
+    async def Rejoin(self, guild_id: int):
+        """Keep a guild that just started using a member feature whole again."""
+        Features.add(guild_id)
+        guild = self.client.get_guild(guild_id)
+        if guild and not guild.chunked:
+            await ChunkGuild(guild)
+
+    async def Trim(self, guild: discord.Guild) -> int:
+        Keep = set()
+        if Policy == "staff":
+            config = await self.client.config.find_one(
+                {"_id": guild.id}, {"Permissions": 1}
+            )
+            Keep = KeepRoles(config)
+        Removed = 0
+        for member in list(guild.members):
+            if member.id == self.client.user.id:
+                continue
+            if Keep and any(role.id in Keep for role in member.roles):
+                continue
+            guild._remove_member(member)
+            Removed += 1
+        Footprints.pop(guild.id, None)
+        return Removed
+
+    @tasks.loop(minutes=10)
+    async def evict(self):
+        if Policy == "all":
+            return
+        Features.clear()
+        Features.update(await self.FeatureGuilds())
+        now = time.monotonic()
+        Trimmed = 0
+        for guild in self.client.guilds:
+            if guild.id in Pinned or guild.id in Features:
+                continue
+            if now - LastUsed.get(guild.id, 0) < IdleAfter:
+                continue
+            if len(guild.members) <= 1:
+                continue
+            Trimmed += await self.Trim(guild)
+        if Trimmed:
+            print(f"[🧹] Evicted {Trimmed} cached members")
+
+    @evict.before_loop
+    async def before_evict(self):
+        await self.client.wait_until_ready()
+
+    @commands.Cog.listener()
+    async def on_connectionroles_edit(self, guild_id: int):
+        if Policy != "all":
+            await self.Rejoin(guild_id)
+
+    @commands.Cog.listener()
+    async def on_staff_list_edit(self, guild_id: int):
+        if Policy != "all":
+            await self.Rejoin(guild_id)
+
+    @commands.Cog.listener()
+    async def on_config_update(self, guild_id: int, paths: list[str], document: dict):
+        if not any(path.startswith(("Modules", "features")) for path in paths):
+            return
+        if (document.get("Modules") or {}).get("Modmail") or "CACHED" in (
+            document.get("features") or []
+        ):
+            Pin(guild_id)
+        else:
+            Pinned.discard(guild_id)
+
+    @commands.command()
+    @commands.is_owner()
+    async def cachestats(self, ctx: commands.Context, limit: int = 15):
+        Guilds = sorted(self.client.guilds, key=lambda g: len(g.members), reverse=True)
+        Total = sum(len(guild.members) for guild in Guilds)
+        Measured = [f for f in Footprints.values() if f["members"]]
+        PerMember = (
+            sum(f["rss"] for f in Measured) / sum(f["members"] for f in Measured)
+            if Measured
+            else None
+        )
+        lines = []
+        for guild in Guilds[:limit]:
+            Footprint = Footprints.get(guild.id)
+            if Footprint:
+                size = f"{Footprint['rss'] / 1e6:.1f} MB measured"
+            elif PerMember:
+                size = f"~{len(guild.members) * PerMember / 1e6:.1f} MB"
+            else:
+                size = "unmeasured"
+            pinned = " 📌" if guild.id in Pinned or guild.id in Features else ""
+            lines.append(
+                f"> **{guild.name}** `{guild.id}`{pinned}: {len(guild.members)}/{guild.member_count} members, {size}"
+            )
+        embed = discord.Embed(
+            title="Member Cache",
+            description="\n".join(lines) or "Nothing cached.",
+            color=discord.Color.dark_embed(),
+        )
+        embed.add_field(
+            name="Process",
+            value=f"> `RSS:` {RSS() / 1e6:.1f} MB\n> `Cached Members:` {Total}\n> `Per Member:` {f'{PerMember:.0f} B' if PerMember else 'N/A'}",
+            inline=False,
+        )
+        embed.add_field(
+            name="Policy",
+            value=f"> `Flags:` {Flags}\n> `Eviction:` {Policy} after {IdleAfter}s idle\n> `Pinned:` {len(Pinned | Features)} guilds",
+            inline=False,
+        )
+        await ctx.send(embed=embed)
+
+
+async def setup(client: commands.Bot) -> None:
+    await client.add_cog(MemberCache(client))
@@ -0,0 +1,231 @@
+import asyncio
+import os
+import discord
+from bson import ObjectId
+from discord.ext import commands, tasks
+from utils.cluster import Broadcast
+
+# Seconds between full reloads of the routing index. Modmails opened or closed in
+# another cluster, and config edits that bypass SaveConfig, show up after this.
+RefreshAfter = int(os.getenv("MODMAIL_REFRESH", 300))
+# Member fetches running at once for guilds whose members aren't cached here.
+MemberLookups = int(os.getenv("MODMAIL_MEMBER_LOOKUPS", 10))
+
+environment = os.getenv("ENVIRONMENT")
+guildid = os.getenv("CUSTOM_GUILD")
+
+ByUser = {}  # {user_id: active modmail document}
+ByChannel = {}  # {channel_id: active modmail document}
+Enabled = set()  # guilds with the module on and a category to open modmails in
+Settings = {}  # {guild_id: {"Modmail": ..., "Module Options": ...}}
+Guilds = {}  # {guild_id: discord.Guild} fetched for guilds outside this cluster's cache
+Loaded = False
+Replay = None  # opens/closes made while a reload is reading, applied after it
+
+
+def Track(document: dict):
+    if Replay is not None:
+        Replay.append((Track, document))
+    ByUser[document.get("user_id")] = document
+    ByChannel[document.get("channel_id")] = document
+
+
+def Forget(document: dict):
+    if not document:
+        return
+    if Replay is not None:
+        Replay.append((Forget, document))
+    # Only drop entries for this modmail, the user may have opened another since.
+    for index, key in ((ByUser, "user_id"), (ByChannel, "channel_id")):
+        current = index.get(document.get(key))
+        if current and current.get("_id") == document.get("_id"):
+            index.pop(document.get(key), None)
+
+
+def Cache(guild_id: int, config: dict):
+    if (
+        config
+        and (config.get("Modules") or {}).get("Modmail")
+        and (config.get("Modmail") or {}).get("category")
+    ):
+        Enabled.add(guild_id)
+    else:
+        Enabled.discard(guild_id)
+    if config and config.get("Modmail"):
+        Settings[guild_id] = {
+            "Modmail": config.get("Modmail"),
+            "Module Options": config.get("Module Options") or {},
+        }
+    else:
+        Settings.pop(guild_id, None)
+
+
+async def Active(
+    client: commands.Bot, user_id: int = None, channel_id: int = None
+) -> dict | None:
+    """The active modmail for a user or a modmail channel."""
+    if Loaded:
+        return ByUser.get(user_id) if user_id else ByChannel.get(channel_id)
+    query = {"user_id": user_id} if user_id else {"channel_id": channel_id}
+    return await client.db["modmail"].find_one(query)
+
+
+async def GuildSettings(client: commands.Bot, guild_id: int) -> dict | None:
+    if guild_id in Settings:
+        return Settings[guild_id]
+    config = await client.config.find_one(
+        {"_id": guild_id}, {"Modules": 1, "Modmail": 1, "Module Options": 1}
+    )
+    Cache(guild_id, config)
+    return Settings.get(guild_id)
+
+
+async def ResolveGuild(client: commands.Bot, guild_id: int) -> discord.Guild | None:
+    Guild = client.get_guild(guild_id) or Guilds.get(guild_id)
+    if Guild:
+        return Guild
+    try:
+        Guild = Guilds[guild_id] = await client.fetch_guild(guild_id)
+    except (discord.NotFound, discord.HTTPException):
+        return None
+    return Guild
+
+
+def RelayChannel(client: commands.Bot, document: dict):
+    """A sendable handle for the modmail's channel without fetching it."""
+    ChannelID = int(document.get("channel_id", 0))
+    return client.get_channel(ChannelID) or client.get_partial_messageable(
+        ChannelID, guild_id=document.get("guild_id")
+    )
+
+
+async def MutualGuilds(client: commands.Bot, user: discord.User) -> list[discord.Guild]:
+    """Modmail enabled guilds the user is in. ``mutual_guilds`` only covers guilds
+    with members cached here, membership in the rest (other clusters' guilds,
+    unchunked ones) is fetched."""
+    Mutual = [guild for guild in user.mutual_guilds if guild.id in Enabled]
+    Found = {guild.id for guild in Mutual}
+    Limit = asyncio.Semaphore(MemberLookups)
+
+    async def Check(guild_id: int):
+        async with Limit:
+            Guild = await ResolveGuild(client, guild_id)
+            if not Guild:
+                return None
+            try:
+                await Guild.fetch_member(user.id)
+            except (discord.NotFound, discord.HTTPException):
+                return None
+            return Guild
+
+    Unknown = []
+    for guild_id in list(Enabled):
+        Guild = client.get_guild(guild_id)
+        if guild_id not in Found and not (Guild and Guild.chunked):
+            Unknown.append(guild_id)
+    Fetched = await asyncio.gather(*(Check(guild_id) for guild_id in Unknown))
+    Mutual.extend(Guild for Guild in Fetched if Guild)
+    return Mutual
+
+
+def Summary(document: dict) -> dict:
+    return {
+        "_id": str(document.get("_id")),
+        "user_id": document.get("user_id"),
+        "channel_id": document.get("channel_id"),
+    }
+
+
+async def Opened(client: commands.Bot, document: dict):
+    result = await client.db["modmail"].insert_one(document)
+    Track(document)
+    # DMs open modmails here, but staff reply from the cluster owning the guild.
+    await Broadcast(client, "modmail_opened", Summary(document))
+    return result
+
+
+async def Closed(client: commands.Bot, document: dict):
+    await client.db["modmail"].delete_one({"_id": document["_id"]})
+    Forget(document)
+    await Broadcast(client, "modmail_closed", Summary(document))
+
+
+class ModmailRoutes(commands.Cog):
+    def __init__(self, client: commands.Bot):
+        self.client = client
+        self.Refresh.start()
+
+    def cog_unload(self):
+        self.Refresh.cancel()
+
+    async def Load(self):
+        global Loaded, Replay
+        ConfigQuery = {"Modules.Modmail": True}
+        ModmailQuery = {}
+        if environment == "custom" and guildid:
+            ConfigQuery["_id"] = int(guildid)
+            ModmailQuery["guild_id"] = int(guildid)
+
+        Replay = []
+        try:
+            # Relays come in through DMs, which shard 0 receives for every guild,
+            # so the index holds every active modmail rather than just owned ones.
+            Documents = await self.client.db["modmail"].find(ModmailQuery).to_list(
+                length=None
+            )
+            # Guilds that turned the module off still relay their open modmails.
+            Active = list({document.get("guild_id") for document in Documents})
+            Configs = await self.client.config.find(
+                {"$or": [ConfigQuery, {"_id": {"$in": Active}}]},
+                {"Modules": 1, "Modmail": 1, "Module Options": 1},
+            ).to_list(length=None)
+        except Exception:
+            Replay = None
+            raise
+        Changes, Replay = Replay, None
+
+        Enabled.clear()
+        Settings.clear()
+        for config in Configs:
+            Cache(config["_id"], config)
+        ByUser.clear()
+        ByChannel.clear()
+        for document in Documents:
+            Track(document)
+        for apply, document in Changes:
+            apply(document)
+        Loaded = True
+
+    @tasks.loop(seconds=RefreshAfter, reconnect=True)
+    async def Refresh(self):
+        try:
+            await self.Load()
+        except Exception as e:
+            print(f"[❌] Failed to load the modmail index: {e}")
+
+    @Refresh.before_loop
+    async def before_refresh(self):
+        await self.client.wait_until_ready()
+
+    @commands.Cog.listener()
+    async def on_cluster_modmail_opened(self, summary: dict):
+        document = await self.client.db["modmail"].find_one(
+            {"_id": ObjectId(summary["_id"])}
+        )
+        if document:
+            Track(document)
+
+    @commands.Cog.listener()
+    async def on_cluster_modmail_closed(self, summary: dict):
+        Forget({**summary, "_id": ObjectId(summary["_id"])})
+
+    @commands.Cog.listener()
+    async def on_config_update(self, guild_id: int, paths: list[str], document: dict):
+        if any(
+            path.startswith(("Modules", "Modmail", "Module Options")) for path in paths
+        ):
+            Cache(guild_id, document)
+
+
+async def setup(client: commands.Bot) -> None:
+    await client.add_cog(ModmailRoutes(client))
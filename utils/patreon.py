@@ -1,7 +1,6 @@
-import aiohttp
-
 import os
 from motor.motor_asyncio import AsyncIOMotorClient
+from utils.http import HTTP
 
 ClientID = os.getenv("PatreonClientID")
 ClientSecret = os.getenv("PatreonClientSecret")
@@ -12,9 +11,6 @@ db = client["astro"]
 Patreon = db["Patreon"]
 
 
-import aiohttp
-
-
 async def RefreshToken(ClientID: str, ClientSecret: str, RefreshTokenValue: str):
     url = "https://www.patreon.com/api/oauth2/token"
     data = {
@@ -27,11 +23,10 @@ async def RefreshToken(ClientID: str, ClientSecret: str, RefreshTokenValue: str)
         "Content-Type": "application/x-www-form-urlencoded",
     }
 
-    async with aiohttp.ClientSession() as Session:
-        async with Session.post(url, data=data, headers=headers) as Resp:
-            if Resp.status != 200:
-                return None
-            return await Resp.json()
+    async with HTTP.post(url, data=data, headers=headers) as Resp:
+        if Resp.status != 200:
+            return None
+        return await Resp.json()
 
 
 async def GetAccessToken():
@@ -45,28 +40,27 @@ async def GetAccessToken():
     url = "https://www.patreon.com/api/oauth2/v2/identity"
     headers = {"Authorization": f"Bearer {AccessToken}"}
 
-    async with aiohttp.ClientSession() as Session:
-        async with Session.get(url, headers=headers) as Resp:
-            if Resp.status == 401:
-                TokenData = await RefreshToken(
-                    ClientID, ClientSecret, RefreshTokenValue
-                )
-                if not TokenData or "access_token" not in TokenData:
-                    return None
-                AccessToken = TokenData["access_token"]
-                NewRefresh = TokenData.get("refresh_token", RefreshTokenValue)
-                await Patreon.update_one(
-                    {"_id": 0},
-                    {
-                        "$set": {
-                            "access_token": AccessToken,
-                            "refresh_token": NewRefresh,
-                        }
-                    },
-                    upsert=True,
-                )
-            elif Resp.status != 200:
+    async with HTTP.get(url, headers=headers) as Resp:
+        if Resp.status == 401:
+            TokenData = await RefreshToken(
+                ClientID, ClientSecret, RefreshTokenValue
+            )
+            if not TokenData or "access_token" not in TokenData:
                 return None
+            AccessToken = TokenData["access_token"]
+            NewRefresh = TokenData.get("refresh_token", RefreshTokenValue)
+            await Patreon.update_one(
+                {"_id": 0},
+                {
+                    "$set": {
+                        "access_token": AccessToken,
+                        "refresh_token": NewRefresh,
+                    }
+                },
+                upsert=True,
+            )
+        elif Resp.status != 200:
+            return None
     return AccessToken
 
 
@@ -92,54 +86,53 @@ async def SubscriptionUser(UserID: int, Sub: str = "22855340", Tiers: list = Non
         "Content-Type": "application/json",
     }
 
-    async with aiohttp.ClientSession() as Session:
-        while URL:
-            async with Session.get(URL, headers=Headers, params=Params) as Resp:
-                if Resp.status != 200:
-                    return
+    while URL:
+        async with HTTP.get(URL, headers=Headers, params=Params) as Resp:
+            if Resp.status != 200:
+                return
 
-                Data = await Resp.json()
-                Included = Data.get("included", [])
-                Users = {U["id"]: U for U in Included if U.get("type") == "user"}
+            Data = await Resp.json()
+            Included = Data.get("included", [])
+            Users = {U["id"]: U for U in Included if U.get("type") == "user"}
 
-                for Member in Data.get("data", []):
-                    PatronStatus = Member.get("attributes", {}).get("patron_status")
-                    if PatronStatus != "active_patron":
-                        continue
+            for Member in Data.get("data", []):
+                PatronStatus = Member.get("attributes", {}).get("patron_status")
+                if PatronStatus != "active_patron":
+                    continue
 
-                    UserRef = (
-                        Member.get("relationships", {}).get("user", {}).get("data", {})
-                    )
-                    UserID_ = UserRef.get("id")
-                    User = Users.get(UserID_)
-                    if not User:
-                        continue
+                UserRef = (
+                    Member.get("relationships", {}).get("user", {}).get("data", {})
+                )
+                UserID_ = UserRef.get("id")
+                User = Users.get(UserID_)
+                if not User:
+                    continue
 
-                    SocialConnections = User.get("attributes", {}).get(
-                        "social_connections", {}
-                    )
-                    DiscordInfo = SocialConnections.get("discord")
-                    if not DiscordInfo:
-                        continue
-                    if str(DiscordInfo.get("user_id")) != str(UserID):
-                        continue
-
-                    EntitledTiers = (
-                        Member.get("relationships", {})
-                        .get("currently_entitled_tiers", {})
-                        .get("data", [])
-                    )
-                    TierIDs = [Tier.get("id") for Tier in EntitledTiers]
+                SocialConnections = User.get("attributes", {}).get(
+                    "social_connections", {}
+                )
+                DiscordInfo = SocialConnections.get("discord")
+                if not DiscordInfo:
+                    continue
+                if str(DiscordInfo.get("user_id")) != str(UserID):
+                    continue
+
+                EntitledTiers = (
+                    Member.get("relationships", {})
+                    .get("currently_entitled_tiers", {})
+                    .get("data", [])
+                )
+                TierIDs = [Tier.get("id") for Tier in EntitledTiers]
 
-                    HasPremium = Sub in TierIDs
-                    InTiers = False
-                    if Tiers:
-                        InTiers = any(tier in TierIDs for tier in Tiers)
+                HasPremium = Sub in TierIDs
+                InTiers = False
+                if Tiers:
+                    InTiers = any(tier in TierIDs for tier in Tiers)
 
-                    return User, HasPremium, InTiers
+                return User, HasPremium, InTiers
 
-                URL = Data.get("links", {}).get("next")
-                Params = None
+            URL = Data.get("links", {}).get("next")
+            Params = None
 
     return None, False, False
 
@@ -151,14 +144,13 @@ async def GetCampaignID(AccessToken: str):
         "Content-Type": "application/json",
     }
 
-    async with aiohttp.ClientSession() as Session:
-        async with Session.get(url, headers=headers) as Resp:
-            if Resp.status != 200:
-                return None
-            Data = await Resp.json()
-            for Item in Data.get("included", []):
-                if Item.get("type") == "campaign":
-                    return Item.get("id")
+    async with HTTP.get(url, headers=headers) as Resp:
+        if Resp.status != 200:
+            return None
+        Data = await Resp.json()
+        for Item in Data.get("included", []):
+            if Item.get("type") == "campaign":
+                return Item.get("id")
     return None
 
 
@@ -194,56 +186,55 @@ async def PremiumMembers():
 
     NextURL = BaseURL
 
-    async with aiohttp.ClientSession() as Session:
-        while NextURL:
-            async with Session.get(NextURL, headers=headers, params=Params) as Resp:
-                if Resp.status != 200:
-                    print("Failed to get members:", Resp.status)
-                    break
-
-                Data = await Resp.json()
-                Included = Data.get("included", [])
-                Users = {
-                    item["id"]: item for item in Included if item.get("type") == "user"
-                }
-
-                for Member in Data.get("data", []):
-                    PatronStatus = Member.get("attributes", {}).get("patron_status")
-                    if PatronStatus != "active_patron":
-                        continue
-
-                    UserRef = (
-                        Member.get("relationships", {}).get("user", {}).get("data", {})
-                    )
-                    UserID = UserRef.get("id")
-                    User = Users.get(UserID)
-                    if not User:
-                        continue
-
-                    DiscordInfo = (
-                        User.get("attributes", {})
-                        .get("social_connections", {})
-                        .get("discord")
+    while NextURL:
+        async with HTTP.get(NextURL, headers=headers, params=Params) as Resp:
+            if Resp.status != 200:
+                print("Failed to get members:", Resp.status)
+                break
+
+            Data = await Resp.json()
+            Included = Data.get("included", [])
+            Users = {
+                item["id"]: item for item in Included if item.get("type") == "user"
+            }
+
+            for Member in Data.get("data", []):
+                PatronStatus = Member.get("attributes", {}).get("patron_status")
+                if PatronStatus != "active_patron":
+                    continue
+
+                UserRef = (
+                    Member.get("relationships", {}).get("user", {}).get("data", {})
+                )
+                UserID = UserRef.get("id")
+                User = Users.get(UserID)
+                if not User:
+                    continue
+
+                DiscordInfo = (
+                    User.get("attributes", {})
+                    .get("social_connections", {})
+                    .get("discord")
+                )
+                if not DiscordInfo or not DiscordInfo.get("user_id"):
+                    continue
+
+                TierIDs = [
+                    t.get("id")
+                    for t in Member.get("relationships", {})
+                    .get("currently_entitled_tiers", {})
+                    .get("data", [])
+                ]
+
+                if 22855340 in TierIDs:
+                    Members.append(
+                        {
+                            "discord_id": DiscordInfo["user_id"],
+                            "tier_ids": TierIDs,
+                            "patron_status": PatronStatus,
+                        }
                     )
-                    if not DiscordInfo or not DiscordInfo.get("user_id"):
-                        continue
-
-                    TierIDs = [
-                        t.get("id")
-                        for t in Member.get("relationships", {})
-                        .get("currently_entitled_tiers", {})
-                        .get("data", [])
-                    ]
-
-                    if 22855340 in TierIDs:
-                        Members.append(
-                            {
-                                "discord_id": DiscordInfo["user_id"],
-                                "tier_ids": TierIDs,
-                                "patron_status": PatronStatus,
-                            }
-                        )
-
-                NextURL = Data.get("links", {}).get("next")
+
+            NextURL = Data.get("links", {}).get("next")
 
     return Members
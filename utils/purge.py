@@ -0,0 +1,239 @@
+import asyncio
+import logging
+import os
+import time
+import discord
+from datetime import datetime, timedelta
+from discord.ext import commands, tasks
+from pymongo import ReturnDocument
+from utils.backup import Collections
+from utils.cluster import Primary
+from utils.emojis import *
+from utils.indexes import Declare
+
+Declare("Purges", ["status", "due"], ["guild_id", "status"])
+
+# Documents per delete_many and the most deleted per second, per job.
+BatchSize = int(os.getenv("PURGE_BATCH", 500))
+Rate = float(os.getenv("PURGE_RATE", 2000))
+# Days after the bot leaves a guild before its data is purged, 0 keeps it forever.
+AfterLeave = int(os.getenv("PURGE_AFTER_LEAVE", 30))
+# A running job whose worker hasn't checked in for this long is picked up again.
+StaleAfter = timedelta(minutes=10)
+
+# name: (database attribute on the client, collection, guild key)
+Targets = {
+    **{
+        name: (database, collection, key)
+        for name, (database, collection, key, _) in Collections.items()
+    },
+    "custom commands": ("db", "Custom Commands", "guild_id"),
+    "responders": ("db", "Auto Responders", "guild_id"),
+    "forums": ("db", "Forum Configuration", "guild_id"),
+    "suspensions": ("db", "Suspensions", "guild_id"),
+    "connection roles": ("db", "connectionroles", "guild"),
+}
+
+
+async def Schedule(
+    client: commands.Bot,
+    guild_id: int,
+    targets: list[str] = None,
+    after: timedelta = None,
+    user: discord.abc.User = None,
+    reason: str = "erase",
+):
+    """Queue a purge of ``targets`` (every collection by default) for ``guild_id``.
+
+    ``user`` gets a DM that is edited as the job progresses."""
+    targets = targets or list(Targets)
+    Job = {
+        "guild_id": guild_id,
+        "targets": targets,
+        "reason": reason,
+        "status": "pending",
+        "due": datetime.utcnow() + (after or timedelta()),
+        "created": datetime.utcnow(),
+        "requester": user.id if user else None,
+        "progress": {name: 0 for name in targets},
+        "cursor": {},
+    }
+    result = await client.db["Purges"].insert_one(Job)
+    return result.inserted_id
+
+
+async def Cancel(client: commands.Bot, guild_id: int, reason: str = None) -> int:
+    filter = {"guild_id": guild_id, "status": "pending"}
+    if reason:
+        filter["reason"] = reason
+    result = await client.db["Purges"].update_many(
+        filter, {"$set": {"status": "cancelled"}}
+    )
+    return result.modified_count
+
+
+class Purge(commands.Cog):
+    def __init__(self, client: commands.Bot):
+        self.client = client
+        self.Running = set()
+        # Jobs are database-only work, one cluster runs them.
+        if Primary:
+            self.worker.start()
+
+    def cog_unload(self):
+        self.worker.cancel()
+
+    async def Report(self, Job: dict, content: str):
+        if not Job.get("requester"):
+            return
+        try:
+            if not Job.get("_message"):
+                user = await self.client.fetch_user(Job["requester"])
+                Job["_message"] = await user.send(content)
+            else:
+                await Job["_message"].edit(content=content)
+        except (discord.HTTPException, discord.Forbidden):
+            Job["requester"] = None
+
+    def Summary(self, Job: dict, done: bool = False) -> str:
+        lines = "\n".join(
+            f"> **{name.title()}:** {count} deleted"
+            for name, count in Job["progress"].items()
+        )
+        state = f"{tick} Finished erasing" if done else "Erasing"
+        return f"{state} data for server `{Job['guild_id']}`.\n{lines}"
+
+    async def Run(self, Job: dict):
+        Purges = self.client.db["Purges"]
+        reported = 0.0
+        for name in Job["targets"]:
+            if name not in Targets:
+                continue
+            database, collection, key = Targets[name]
+            Collection = getattr(self.client, database)[collection]
+            last = Job["cursor"].get(name)
+            while True:
+                filter = {key: Job["guild_id"]}
+                if last is not None:
+                    # $and, the guild key is "_id" itself for Config.
+                    filter = {"$and": [filter, {"_id": {"$gt": last}}]}
+                Batch = (
+                    await Collection.find(filter, {"_id": 1})
+                    .sort("_id", 1)
+                    .limit(BatchSize)
+                    .to_list(length=BatchSize)
+                )
+                if not Batch:
+                    break
+                first, last = Batch[0]["_id"], Batch[-1]["_id"]
+                started = time.monotonic()
+                result = await Collection.delete_many(
+                    {
+                        "$and": [
+                            {key: Job["guild_id"]},
+                            {"_id": {"$gte": first, "$lte": last}},
+                        ]
+                    }
+                )
+                Job["progress"][name] += result.deleted_count
+                Job["cursor"][name] = last
+                State = await Purges.find_one_and_update(
+                    {"_id": Job["_id"]},
+                    {
+                        "$set": {
+                            f"progress.{name}": Job["progress"][name],
+                            f"cursor.{name}": last,
+                            "heartbeat": datetime.utcnow(),
+                        }
+                    },
+                    projection={"status": 1},
+                    return_document=ReturnDocument.AFTER,
+                )
+                if not State or State.get("status") != "running":
+                    return False
+                if time.monotonic() - reported > 5:
+                    reported = time.monotonic()
+                    await self.Report(Job, self.Summary(Job))
+                if len(Batch) < BatchSize:
+                    break
+                # Keep the delete rate under PURGE_RATE documents per second.
+                await asyncio.sleep(
+                    max(len(Batch) / Rate - (time.monotonic() - started), 0)
+                )
+        return True
+
+    async def Process(self, Job: dict):
+        try:
+            if not await self.Run(Job):
+                return
+        except Exception as e:
+            logging.warning(f"[Purge] Job {Job['_id']} failed: {e}")
+            await self.client.db["Purges"].update_one(
+                {"_id": Job["_id"]},
+                {
+                    "$set": {
+                        "status": "pending",
+                        "due": datetime.utcnow() + timedelta(minutes=5),
+                    }
+                },
+            )
+            return
+        finally:
+            self.Running.discard(Job["_id"])
+        await self.client.db["Purges"].update_one(
+            {"_id": Job["_id"]},
+            {"$set": {"status": "done", "finished": datetime.utcnow()}},
+        )
+        await self.Report(Job, self.Summary(Job, done=True))
+        self.client.dispatch("purge_complete", Job["guild_id"], Job["targets"])
+
+    @tasks.loop(seconds=15)
+    async def worker(self):
+        now = datetime.utcnow()
+        while True:
+            Job = await self.client.db["Purges"].find_one_and_update(
+                {
+                    "$or": [
+                        {"status": "pending", "due": {"$lte": now}},
+                        {
+                            "status": "running",
+                            "heartbeat": {"$lt": now - StaleAfter},
+                        },
+                    ],
+                    "_id": {"$nin": list(self.Running)},
+                },
+                {"$set": {"status": "running", "heartbeat": now}},
+                sort=[("due", 1)],
+                return_document=ReturnDocument.AFTER,
+            )
+            if not Job:
+                return
+            self.Running.add(Job["_id"])
+            asyncio.create_task(self.Process(Job))
+
+    @worker.before_loop
+    async def before_worker(self):
+        await self.client.wait_until_ready()
+
+    @commands.Cog.listener()
+    async def on_purge_complete(self, guild_id: int, targets: list[str]):
+        if "connection roles" in targets:
+            self.client.dispatch("connectionroles_edit", guild_id)
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: discord.Guild):
+        if await Cancel(self.client, guild.id, "leave"):
+            print(f"[🗑️] Re-invited to {guild.id}, cancelled its scheduled purge.")
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        if not AfterLeave or os.getenv("ENVIRONMENT") == "custom":
+            return
+        await Cancel(self.client, guild.id, "leave")
+        await Schedule(
+            self.client, guild.id, after=timedelta(days=AfterLeave), reason="leave"
+        )
+
+
+async def setup(client: commands.Bot) -> None:
+    await client.add_cog(Purge(client))
@@ -0,0 +1,97 @@
+import asyncio
+import math
+import os
+import random
+import time
+from pymongo.errors import DuplicateKeyError
+from utils.cluster import Primary
+from utils.indexes import Declare
+
+Declare("Question Database", "qid", unique=True, sparse=True)
+
+# Seconds before the in-memory bank is re-read to pick up added questions.
+RefreshAfter = int(os.getenv("QOTD_REFRESH", 3600))
+
+Bank = {}  # {qid: question}
+Size = 0  # highest qid + 1
+Loaded = 0.0
+Lock = asyncio.Lock()
+
+
+async def AssignIDs(db, documents: list) -> None:
+    """Give questions without a ``qid`` the next free integer, in insertion order.
+
+    Only the primary cluster numbers questions, so two clusters loading at once
+    can't hand out the same qid before the unique index exists."""
+    Next = max((doc["qid"] for doc in documents if "qid" in doc), default=-1) + 1
+    for doc in documents:
+        if "qid" in doc:
+            continue
+        try:
+            Result = await db["Question Database"].update_one(
+                {"_id": doc["_id"], "qid": {"$exists": False}},
+                {"$set": {"qid": Next}},
+            )
+        except DuplicateKeyError:
+            # Another process numbered a question first, pick it up next load.
+            continue
+        if Result.modified_count:
+            doc["qid"] = Next
+            Next += 1
+
+
+async def Load(db, force: bool = False) -> dict:
+    global Bank, Size, Loaded
+    async with Lock:
+        if Bank and not force and time.monotonic() - Loaded < RefreshAfter:
+            return Bank
+        documents = (
+            await db["Question Database"]
+            .find({}, {"question": 1, "qid": 1})
+            .sort("_id", 1)
+            .to_list(length=None)
+        )
+        if Primary:
+            await AssignIDs(db, documents)
+        Bank = {
+            doc["qid"]: doc["question"]
+            for doc in documents
+            if "qid" in doc and doc.get("question")
+        }
+        Size = max(Bank, default=-1) + 1
+        Loaded = time.monotonic()
+        return Bank
+
+
+def NewCycle() -> dict:
+    """An affine permutation ``(step * i + offset) % size`` of every qid, so a
+    guild walks the whole bank once, in shuffled order, before repeating."""
+    step = 1
+    if Size > 2:
+        step = random.randrange(1, Size)
+        while math.gcd(step, Size) != 1:
+            step = random.randrange(1, Size)
+    return {
+        "size": Size,
+        "step": step,
+        "offset": random.randrange(Size) if Size else 0,
+        "cursor": 0,
+    }
+
+
+async def NextQuestion(db, cycle: dict = None):
+    """Returns ``(question, cycle)``, store ``cycle`` back on the guild's qotd document."""
+    await Load(db)
+    if not Bank:
+        return None, cycle
+    cycle = dict(cycle) if cycle and cycle.get("size") else NewCycle()
+    # Questions added mid-cycle are picked up once the current cycle ends,
+    # removed ones leave gaps that are skipped.
+    for _ in range(cycle["size"] + Size + 1):
+        if cycle["cursor"] >= cycle["size"]:
+            cycle = NewCycle()
+        qid = (cycle["step"] * cycle["cursor"] + cycle["offset"]) % cycle["size"]
+        cycle["cursor"] += 1
+        if qid in Bank:
+            return Bank[qid], cycle
+    return None, cycle
@@ -1,18 +1,25 @@
-import aioboto3
-from botocore.config import Config
+from utils.lazy import Lazy
 
-from PIL import Image
+aioboto3 = Lazy("aioboto3")
+botocore = Lazy("botocore.config")
+Image = Lazy("PIL.Image")
 from io import BytesIO
 import discord
 import logging
 import os
 from datetime import datetime, timezone, timedelta
 import asyncio
+import secrets
 
 
 
 logger = logging.getLogger(__name__)
 
+# Kept for good, ClearOldFiles skips anything under this prefix.
+TranscriptPrefix = "transcripts/"
+# Guild data exports, removed by ClearOldFiles after EXPORT_DAYS.
+ExportPrefix = "exports/"
+
 s3_client = None
 if (
     os.getenv("R2_URL")
@@ -55,55 +62,93 @@ async def CompressVideo(video_bytes: bytes) -> bytes:
     output_file.write(stdout)
     return output_file.getvalue()
 
-async def upload_file_to_r2(
-    file_bytes: bytes, filename: str, message: discord.Message
-) -> str:
-    if s3_client is None:
-        return ""
-
-    async with s3_client.client(
+def Bucket():
+    return s3_client.client(
         service_name="s3",
         endpoint_url=os.getenv("R2_URL"),
         aws_access_key_id=os.getenv("ACCESS_KEY_ID"),
         aws_secret_access_key=os.getenv("SECRET_ACCESS_KEY"),
-        config=Config(signature_version="s3v4"),
+        config=botocore.Config(signature_version="s3v4"),
         region_name="weur",
-    ) as client:
-
-        if filename.lower().endswith(("png", "jpg", "jpeg", "gif", "bmp")):
-            file_bytes = await CompressImage(file_bytes)
-            content_type = "image/jpeg"
-        elif filename.lower().endswith(("mp4", "avi", "mov", "webm", "mkv")):
-            content_type = "video/mp4"
-            max_size = int(os.getenv('MAX_FILE_SIZE', 25 * 1024 * 1024))
-            if len(file_bytes) > max_size:
-                return ""
-        elif filename.lower().endswith(("mp3", "wav", "ogg")):
-            content_type = "audio/mpeg"
-        else:
-            content_type = "application/octet-stream"
+    )
+
+
+def PrivateKey(prefix: str, filename: str) -> str:
+    """A key nobody can guess from ids or timestamps, for files that aren't public."""
+    return f"{prefix}{secrets.token_urlsafe(32)}/{filename}"
+
+
+async def UploadFileObj(fileobj, key: str, content_type: str) -> str:
+    """Upload a file-like object to the bucket in parts, without reading it into memory."""
+    if s3_client is None:
+        return ""
+
+    async with Bucket() as client:
+        await client.upload_fileobj(
+            fileobj,
+            os.getenv("BUCKET"),
+            key,
+            ExtraArgs={"ContentType": content_type},
+        )
+
+    return f"{os.getenv('FILE_URL')}/{key}"
+
 
+async def UploadPrivate(fileobj, key: str, content_type: str) -> bool:
+    """Upload without handing out the public url, share it through ``PresignedURL``."""
+    if s3_client is None:
+        return False
+
+    async with Bucket() as client:
         await client.upload_fileobj(
-            BytesIO(file_bytes),
+            fileobj,
             os.getenv("BUCKET"),
-            f"{message.id}/{filename}",
+            key,
             ExtraArgs={"ContentType": content_type},
         )
+    return True
+
 
-        return f"{os.getenv('FILE_URL')}/{message.id}/{filename}"
+async def PresignedURL(key: str, expires: int = 3600) -> str:
+    if s3_client is None:
+        return ""
+
+    async with Bucket() as client:
+        return await client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": os.getenv("BUCKET"), "Key": key},
+            ExpiresIn=expires,
+        )
+
+
+async def upload_file_to_r2(
+    file_bytes: bytes, filename: str, message: discord.Message
+) -> str:
+    if s3_client is None:
+        return ""
+
+    if filename.lower().endswith(("png", "jpg", "jpeg", "gif", "bmp")):
+        file_bytes = await CompressImage(file_bytes)
+        content_type = "image/jpeg"
+    elif filename.lower().endswith(("mp4", "avi", "mov", "webm", "mkv")):
+        content_type = "video/mp4"
+        max_size = int(os.getenv('MAX_FILE_SIZE', 25 * 1024 * 1024))
+        if len(file_bytes) > max_size:
+            return ""
+    elif filename.lower().endswith(("mp3", "wav", "ogg")):
+        content_type = "audio/mpeg"
+    else:
+        content_type = "application/octet-stream"
+
+    return await UploadFileObj(
+        BytesIO(file_bytes), f"{message.id}/{filename}", content_type
+    )
 
 async def ClearOldFiles():
     if s3_client is None:
         return
 
-    async with s3_client.client(
-        service_name="s3",
-        endpoint_url=os.getenv("R2_URL"),
-        aws_access_key_id=os.getenv("ACCESS_KEY_ID"),
-        aws_secret_access_key=os.getenv("SECRET_ACCESS_KEY"),
-        config=Config(signature_version="s3v4"),
-        region_name="weur",
-    ) as client:
+    async with Bucket() as client:
 
         continuation_token = None
 
@@ -117,7 +162,15 @@ async def ClearOldFiles():
             if "Contents" in response:
                 delete_keys = []
                 for obj in response["Contents"]:
+                    if obj["Key"].startswith(TranscriptPrefix):
+                        continue
                     last_modified = obj["LastModified"]
+                    if obj["Key"].startswith(ExportPrefix):
+                        if datetime.now(timezone.utc) - last_modified > timedelta(
+                            days=int(os.getenv("EXPORT_DAYS", 1))
+                        ):
+                            delete_keys.append({"Key": obj["Key"]})
+                        continue
                     file_extension = obj["Key"].split(".")[-1].lower()
 
                     if file_extension in ["mp4", "avi", "mov", "webm"] and (
@@ -1,9 +1,10 @@
-import aiohttp
 from motor.motor_asyncio import AsyncIOMotorClient
+import asyncio
 import discord
 import os
 from discord.ext import commands
 import time
+from utils.http import HTTP
 
 MONGO_URL = os.getenv("MONGO_URL")
 client = AsyncIOMotorClient(MONGO_URL)
@@ -15,48 +16,128 @@ Tokens = db["integrations"]
 PendingUsers = db["Pending"]
 config = db["Config"]
 
+# Access tokens are refreshed this many seconds before they actually expire.
+RefreshMargin = 60
+BatchSize = 100
+Missing = object()
 
-async def GetValidToken(user: discord.User = None, server: int = None):
+
+class TTLCache:
+    def __init__(self, ttl: float, size: int = 5000):
+        self.ttl = ttl
+        self.size = size
+        self.entries = {}  # {key: (value, expires)}
+
+    def Get(self, key, default=Missing):
+        entry = self.entries.get(key)
+        if entry is None:
+            return default
+        if time.monotonic() > entry[1]:
+            self.entries.pop(key, None)
+            return default
+        return entry[0]
+
+    def Set(self, key, value, ttl: float = None):
+        if len(self.entries) >= self.size and key not in self.entries:
+            now = time.monotonic()
+            self.entries = {k: v for k, v in self.entries.items() if v[1] > now}
+            if len(self.entries) >= self.size:
+                self.entries.pop(next(iter(self.entries)))
+        self.entries[key] = (value, time.monotonic() + (ttl or self.ttl))
+
+    def Forget(self, key):
+        self.entries.pop(key, None)
+
+    def Clear(self):
+        self.entries.clear()
+
+
+TokenCache = {}  # {("user" | "server", id): (access_token, token_expiration)}
+Refreshing = {}  # {("user" | "server", id): Future}
+Identities = TTLCache(600)  # {discord_id: userinfo | bloxlink}
+Roles = TTLCache(300)  # {group_id: roles}
+Usernames = TTLCache(3600)  # {lowercase username: user}
+UserIDs = TTLCache(3600)  # {roblox_id: user}
+
+
+def TokenKey(user: discord.User = None, server: int = None):
+    return ("user", str(user.id)) if user else ("server", str(server))
+
+
+def TokenFilter(user: discord.User = None, server: int = None):
+    return {"discord_id": str(user.id)} if user else {"server": str(server)}
+
+
+def ForgetToken(user: discord.User = None, server: int = None):
+    TokenCache.pop(TokenKey(user, server), None)
     if user:
-        user_result = await Tokens.find_one({"discord_id": str(user.id)})
-    else:
-        user_result = await Tokens.find_one({"server": str(server)})
+        Identities.Forget(str(user.id))
+
+
+async def GetValidToken(user: discord.User = None, server: int = None):
+    key = TokenKey(user, server)
+    cached = TokenCache.get(key)
+    if cached and time.time() < cached[1] - RefreshMargin:
+        return cached[0]
+
+    pending = Refreshing.get(key)
+    if pending is None:
+        pending = Refreshing[key] = asyncio.ensure_future(LoadToken(user, server))
+
+        def Done(future):
+            if Refreshing.get(key) is future:
+                del Refreshing[key]
+
+        pending.add_done_callback(Done)
+    return await asyncio.shield(pending)
+
+
+async def LoadToken(user: discord.User = None, server: int = None):
+    key = TokenKey(user, server)
+    user_result = await Tokens.find_one(TokenFilter(user, server))
 
     if not user_result:
+        TokenCache.pop(key, None)
         print("[GetValidToken] No token found.")
         return None
 
     token = user_result.get("access_token")
     token_expiration = user_result.get("token_expiration")
-    if not token or not token_expiration or time.time() > token_expiration:
-        print("[Oauth Refresh] Token expired, refreshing...")
-        if await RefreshToken(user, server) != 0:
-            print("[Oauth Refresh] Token refresh failed.")
-            return None
-
-        user_result = (
-            await Tokens.find_one({"discord_id": str(user.id)})
-            if user
-            else await Tokens.find_one({"server": str(server)})
-        )
-        token = user_result.get("access_token")
+    if (
+        not token
+        or not token_expiration
+        or time.time() > token_expiration - RefreshMargin
+    ):
+        print("[Oauth Refresh] Token expiring, refreshing...")
+        if await RefreshToken(user, server, user_result) == 0:
+            return TokenCache[key][0]
+        if token and token_expiration and time.time() < token_expiration:
+            TokenCache[key] = (token, token_expiration)
+            return token
+        print("[Oauth Refresh] Token refresh failed.")
+        TokenCache.pop(key, None)
+        return None
 
+    TokenCache[key] = (token, token_expiration)
     return token
 
 
 async def Fallback(user: discord.User):
     url = f"https://api.blox.link/v4/public/discord-to-roblox/{user.id}"
     headers = {"Authorization": os.getenv("bloxlink")}
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url, headers=headers) as response:
-            if response.status == 200:
-                data = await response.json()
-                print("[Fallback] Successfully retrieved Bloxlink data.")
-                return data.get("resolved")
+    async with HTTP.get(url, headers=headers) as response:
+        if response.status == 200:
+            data = await response.json()
+            print("[Fallback] Successfully retrieved Bloxlink data.")
+            return data.get("resolved")
     return None
 
 
 async def GetUser(user: discord.User):
+    cached = Identities.Get(str(user.id))
+    if cached is not Missing:
+        return cached
+
     token = await GetValidToken(user=user)
     user_info = None
     if (token):
@@ -66,6 +147,8 @@ async def GetUser(user: discord.User):
         print("[Unknown Token] Falling back to Bloxlink.")
         user_info = await Fallback(user)
 
+    # Misses are only remembered briefly so a fresh link shows up quickly.
+    Identities.Set(str(user.id), user_info, None if user_info else 60)
     return user_info
 
 
@@ -74,30 +157,29 @@ async def GetInfo(token: str = None):
         return None
     url = "https://apis.roblox.com/oauth/v1/userinfo"
     headers = {"Authorization": f"Bearer {token}"}
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url, headers=headers) as response:
-            return await response.json()
+    async with HTTP.get(url, headers=headers) as response:
+        if not response.ok:
+            return None
+        return await response.json()
 
 
 async def GetGroup2(group: int, user: discord.User):
-    result = await Tokens.find_one({"discord_id": str(user.id)})
-    if not result:
+    token = await GetValidToken(user=user)
+    if not token:
         print("[GetGroup] No token found in DB.")
         return None
 
-    token = await GetValidToken(user=user)
     url = f"https://apis.roblox.com/cloud/v2/groups/{group}"
     headers = {"Authorization": f"Bearer {token}"}
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url, headers=headers) as response:
-            if response.status == 200:
-                print("[GetGroup2] Successfully retrieved group data.")
-                return await response.json()
-            else:
-                print(
-                    f"[GetGroup2] Failed to fetch group data. Status: {response.status}"
-                )
-                return None
+    async with HTTP.get(url, headers=headers) as response:
+        if response.status == 200:
+            print("[GetGroup2] Successfully retrieved group data.")
+            return await response.json()
+        else:
+            print(
+                f"[GetGroup2] Failed to fetch group data. Status: {response.status}"
+            )
+            return None
 
 
 async def GetGroup(server):
@@ -123,24 +205,20 @@ async def GetGroup(server):
     headers = {"Authorization": f"Bearer {token}"}
 
     print(f"[GetGroup] Making request to {url}")
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url, headers=headers) as response:
-            if response.status == 200:
-                print("[GetGroup] Successfully retrieved group data.")
-                return await response.json()
-            else:
-                print(
-                    f"[GetGroup] Failed to fetch group data. Status: {response.status}"
-                )
-                return None
+    async with HTTP.get(url, headers=headers) as response:
+        if response.status == 200:
+            print("[GetGroup] Successfully retrieved group data.")
+            return await response.json()
+        else:
+            print(
+                f"[GetGroup] Failed to fetch group data. Status: {response.status}"
+            )
+            return None
 
 
-async def RefreshToken(user: discord.User = None, server=None):
-    result = (
-        await Tokens.find_one({"discord_id": str(user.id)})
-        if user
-        else await Tokens.find_one({"server": str(server)})
-    )
+async def RefreshToken(user: discord.User = None, server=None, result: dict = None):
+    if result is None:
+        result = await Tokens.find_one(TokenFilter(user, server))
 
     if not result:
         print("[RefreshToken] No token found in DB.")
@@ -153,7 +231,11 @@ async def RefreshToken(user: discord.User = None, server=None):
 
     token_expiration = result.get("token_expiration")
 
-    if token_expiration and time.time() < token_expiration:
+    if token_expiration and time.time() < token_expiration - RefreshMargin:
+        TokenCache[TokenKey(user, server)] = (
+            result.get("access_token"),
+            token_expiration,
+        )
         return 0
 
     url = "https://apis.roblox.com/oauth/v1/token"
@@ -165,32 +247,31 @@ async def RefreshToken(user: discord.User = None, server=None):
         "client_secret": os.getenv("CLIENT_SECRET"),
     }
 
-    async with aiohttp.ClientSession() as session:
-        async with session.post(url, headers=headers, data=data) as response:
-            if response.status != 200:
-                print(
-                    f"[RefreshToken] Refresh failed: {response.status} {await response.json()}"
-                )
-                return 3
-
-            New = await response.json()
-            expires_in = New.get("expires_in", 899)
-
+    async with HTTP.post(url, headers=headers, data=data) as response:
+        if response.status != 200:
             print(
-                f"[RefreshToken] Token refreshed. New Expiration: {time.time() + expires_in}"
-            )
-
-            await Tokens.update_one(
-                {"discord_id": str(user.id)} if user else {"server": str(server)},
-                {
-                    "$set": {
-                        "access_token": New.get("access_token"),
-                        "refresh_token": New.get("refresh_token"),
-                        "token_expiration": time.time() + expires_in,
-                    }
-                },
+                f"[RefreshToken] Refresh failed: {response.status} {await response.json()}"
             )
-            return 0
+            return 3
+
+        New = await response.json()
+        expires_in = New.get("expires_in", 899)
+        expiration = time.time() + expires_in
+
+        print(f"[RefreshToken] Token refreshed. New Expiration: {expiration}")
+
+        await Tokens.update_one(
+            TokenFilter(user, server),
+            {
+                "$set": {
+                    "access_token": New.get("access_token"),
+                    "refresh_token": New.get("refresh_token"),
+                    "token_expiration": expiration,
+                }
+            },
+        )
+        TokenCache[TokenKey(user, server)] = (New.get("access_token"), expiration)
+        return 0
 
 
 # GET /cloud/v2/groups/{group_id}/join-requests filter="user == 'users/{roblox_id}'"
@@ -203,16 +284,15 @@ async def GetRequest(group_id: int, roblox_id: int, user: discord.User):
     url = f"https://apis.roblox.com/cloud/v2/groups/{group_id}/join-requests?filter=user == 'users/{roblox_id}'"
     headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
 
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url, headers=headers) as response:
-            if response.status == 200:
-                print("[GetRequest] Successfully retrieved join request data.")
-                return await response.json()
-            else:
-                print(
-                    f"[GetRequest] Failed to fetch join request data. Status: {response.status}"
-                )
-                return None
+    async with HTTP.get(url, headers=headers) as response:
+        if response.status == 200:
+            print("[GetRequest] Successfully retrieved join request data.")
+            return await response.json()
+        else:
+            print(
+                f"[GetRequest] Failed to fetch join request data. Status: {response.status}"
+            )
+            return None
 
 
 async def GetRequests(interaction: discord.Interaction):
@@ -230,19 +310,18 @@ async def GetRequests(interaction: discord.Interaction):
     url = f"https://apis.roblox.com/cloud/v2/groups/{group}/join-requests"
     headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
 
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url, headers=headers) as response:
-            if response.status == 200:
-                print("[GetRequests] Successfully retrieved join requests.")
-                resp = await response.json()
+    async with HTTP.get(url, headers=headers) as response:
+        if response.status == 200:
+            print("[GetRequests] Successfully retrieved join requests.")
+            resp = await response.json()
 
-                return resp.get("groupJoinRequests", None)
-            else:
-                print(await response.json())
-                print(
-                    f"[GetRequests] Failed to fetch join requests. Status: {response.status}"
-                )
-                return response.status
+            return resp.get("groupJoinRequests", None)
+        else:
+            print(await response.json())
+            print(
+                f"[GetRequests] Failed to fetch join requests. Status: {response.status}"
+            )
+            return response.status
 
 
 # POST /cloud/v2/groups/{group_id}/join-requests/{join_request_id}:decline
@@ -255,15 +334,14 @@ async def RejectRequest(group_id: int, join_request_id: int, user: discord.User)
     url = f"https://apis.roblox.com/cloud/v2/groups/{str(group_id)}/join-requests/{str(join_request_id)}:decline"
     headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
 
-    async with aiohttp.ClientSession() as session:
-        async with session.post(url, headers=headers, data='{}') as response:
-            if response.status == 200:
-                print("[AcceptRequest] Successfully accepted join request.")
-                return True
-            else:
-                print(f"[AcceptRequest] Failed to accept join request. Status: {response.status}")
-                print(await response.json())  
-                return None
+    async with HTTP.post(url, headers=headers, data='{}') as response:
+        if response.status == 200:
+            print("[AcceptRequest] Successfully accepted join request.")
+            return True
+        else:
+            print(f"[AcceptRequest] Failed to accept join request. Status: {response.status}")
+            print(await response.json())  
+            return None
 
 
 # POST /cloud/v2/groups/{group_id}/join-requests/{join_request_id}:accept
@@ -279,15 +357,14 @@ async def AcceptRequest(group_id: int, join_request_id: int, user: discord.User)
     print(url)
     headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
 
-    async with aiohttp.ClientSession() as session:
-        async with session.post(url, headers=headers, data='{}') as response:
-            if response.status == 200:
-                print("[AcceptRequest] Successfully accepted join request.")
-                return True
-            else:
-                print(f"[AcceptRequest] Failed to accept join request. Status: {response.status}")
-                print(await response.json())  
-                return None
+    async with HTTP.post(url, headers=headers, data='{}') as response:
+        if response.status == 200:
+            print("[AcceptRequest] Successfully accepted join request.")
+            return True
+        else:
+            print(f"[AcceptRequest] Failed to accept join request. Status: {response.status}")
+            print(await response.json())  
+            return None
 
 
 
@@ -298,15 +375,10 @@ async def UpdateMembership(
     user: discord.User = None,
     roblox_id: int = None,
 ):
-    result = await Tokens.find_one({"discord_id": str(author.id)})
-    if not result:
-        print("[UpdateMembership] No token found for author.")
-        return 0
-
     token = await GetValidToken(user=author)
     if not token:
         print("[UpdateMembership] No access token found.")
-        return 2
+        return 0
 
     if user:
         roblox_result = await GetUser(user)
@@ -341,64 +413,75 @@ async def UpdateMembership(
     headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
     data = {"role": role}
 
-    async with aiohttp.ClientSession() as session:
-        async with session.patch(url, headers=headers, json=data) as response:
-            response_data = await response.json()
-            print(f"[UpdateMembership] Response: {response_data}")
-            if response.ok:
-                print(
-                    f"[Updated Membership] {name} role has successfully been changed."
-                )
-                return 200
-            else:
+    async with HTTP.patch(url, headers=headers, json=data) as response:
+        response_data = await response.json()
+        print(f"[UpdateMembership] Response: {response_data}")
+        if response.ok:
+            print(
+                f"[Updated Membership] {name} role has successfully been changed."
+            )
+            return 200
+        else:
+            print(
+                f"[UpdateMembership] Failed to update role. Status: {response.status}"
+            )
+            return 404
+
+
+async def LookupUsers(url: str, field: str, keys: list, cache: TTLCache, name):
+    Found = {}
+    Wanted = []
+    for key in keys:
+        cached = cache.Get(name(key))
+        if cached is Missing:
+            Wanted.append(key)
+        else:
+            Found[name(key)] = cached
+
+    for index in range(0, len(Wanted), BatchSize):
+        data = {field: Wanted[index : index + BatchSize]}
+        async with HTTP.post(url, json=data) as response:
+            if response.status != 200:
                 print(
-                    f"[UpdateMembership] Failed to update role. Status: {response.status}"
+                    f"[FetchRobloxUser] Failed to fetch user data. Status: {response.status}"
                 )
-                return 404
+                continue
+            response_data = await response.json()
+        for user in response_data.get("data") or []:
+            UserIDs.Set(user["id"], user)
+            if user.get("requestedUsername"):
+                Usernames.Set(user["requestedUsername"].lower(), user)
+            Found[name(user.get("requestedUsername") or user["id"])] = user
+
+    Users = []
+    for key in keys:
+        user = Found.get(name(key))
+        if user and user not in Users:
+            Users.append(user)
+    if not Users:
+        print("[FetchRobloxUser] No user data found.")
+        return None
+    return Users
 
 
 # /v1/users
 async def FetchUsersByID(ids):
-    url = "https://users.roblox.com/v1/users"
-    headers = {"Content-Type": "application/json"}
-    data = {"userIds": ids if isinstance(ids, list) else [ids]}
-
-    async with aiohttp.ClientSession() as session:
-        async with session.post(url, headers=headers, json=data) as response:
-            if response.status == 200:
-                response_data = await response.json()
-                if response_data.get("data"):
-                    return response_data["data"]
-                else:
-                    print("[FetchRobloxUser] No user data found.")
-                    return None
-            else:
-                print(
-                    f"[FetchRobloxUser] Failed to fetch user data. Status: {response.status}"
-                )
-                return None
+    ids = [int(i) for i in (ids if isinstance(ids, list) else [ids])]
+    return await LookupUsers(
+        "https://users.roblox.com/v1/users", "userIds", ids, UserIDs, int
+    )
 
 
 # /v1/usernames/users
 async def FetchRobloxUser(roblox):
-    url = "https://users.roblox.com/v1/usernames/users"
-    headers = {"Content-Type": "application/json"}
-    data = {"usernames": roblox if isinstance(roblox, list) else [roblox]}
-
-    async with aiohttp.ClientSession() as session:
-        async with session.post(url, headers=headers, json=data) as response:
-            if response.status == 200:
-                response_data = await response.json()
-                if response_data.get("data"):
-                    return response_data["data"]
-                else:
-                    print("[FetchRobloxUser] No user data found.")
-                    return None
-            else:
-                print(
-                    f"[FetchRobloxUser] Failed to fetch user data. Status: {response.status}"
-                )
-                return None
+    names = roblox if isinstance(roblox, list) else [roblox]
+    return await LookupUsers(
+        "https://users.roblox.com/v1/usernames/users",
+        "usernames",
+        names,
+        Usernames,
+        lambda name: str(name).lower(),
+    )
 
 
 # 'https://apis.roblox.com/cloud/v2/groups/{group_id}/memberships?maxPageSize=10&pageToken={string}&filter={string}' filter = filter="user == 'users/{id}'"
@@ -418,16 +501,15 @@ async def GetGroupMembership(
     url = f"https://apis.roblox.com/cloud/v2/groups/{group_id}/memberships?filter=user == 'users/{roblox}'"
     headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
 
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url, headers=headers) as response:
-            if response.status == 200:
-                print("[GetGroupMembership] Successfully retrieved membership data.")
-                return await response.json()
-            else:
-                print(
-                    f"[GetGroupMembership] Failed to fetch membership data. Status: {response.status}"
-                )
-                return None
+    async with HTTP.get(url, headers=headers) as response:
+        if response.status == 200:
+            print("[GetGroupMembership] Successfully retrieved membership data.")
+            return await response.json()
+        else:
+            print(
+                f"[GetGroupMembership] Failed to fetch membership data. Status: {response.status}"
+            )
+            return None
 
 
 async def GroupRoles(interaction: discord.Interaction):
@@ -452,11 +534,18 @@ async def GroupRoles(interaction: discord.Interaction):
     if not group:
         return 2
 
+    cached = Roles.Get(str(group))
+    if cached is not Missing:
+        return cached
+
     url = f"https://apis.roblox.com/cloud/v2/groups/{group}/roles?maxPageSize=50"
     headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
 
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url, headers=headers) as response:
-            if response.status == 401:
-                return 1
-            return await response.json()
+    async with HTTP.get(url, headers=headers) as response:
+        if response.status == 401:
+            ForgetToken(user=author)
+            return 1
+        roles = await response.json()
+        if response.ok:
+            Roles.Set(str(group), roles)
+        return roles
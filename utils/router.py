@@ -0,0 +1,170 @@
+import asyncio
+import logging
+import os
+import time
+import discord
+from discord.ext import commands
+from utils.modmail import Active
+
+# Seconds a guild config or premium lookup is reused across messages.
+ConfigTTL = int(os.getenv("MESSAGE_CONFIG_TTL", 60))
+
+Categories = ("guild", "dm")
+Handlers = {}  # {name: (handler, categories)}
+Configs = {}  # {guild_id: (monotonic time, config)}
+Premiums = {}  # {guild_id: (monotonic time, bool)}
+Unset = object()
+
+
+def Subscribe(name: str, handler, *categories: str):
+    """Route messages in ``categories`` (every category by default) to
+    ``handler(ctx: MessageContext)``. ``name`` is also the telemetry key."""
+    categories = set(categories or Categories)
+    unknown = categories - set(Categories)
+    if unknown:
+        raise ValueError(f"Unknown message categories: {', '.join(unknown)}")
+    Handlers[name] = (handler, categories)
+
+
+def Unsubscribe(name: str):
+    Handlers.pop(name, None)
+
+
+def Roles(config: dict, key: str) -> list:
+    value = ((config or {}).get("Permissions") or {}).get(key, [])
+    return value if isinstance(value, list) else [value]
+
+
+class MessageContext:
+    """What a routed message's handlers share. Lookups run at most once per
+    message, and only if some handler asks for them. Each is kept as a task, so
+    handlers asking at the same time all wait for the one lookup."""
+
+    def __init__(self, client: commands.Bot, message: discord.Message):
+        self.client = client
+        self.message = message
+        self.guild = message.guild
+        self.author = message.author
+        self.channel = message.channel
+        self.category = "dm" if message.guild is None else "guild"
+        self._config = Unset
+        self._premium = Unset
+        self._ticket = Unset
+        self._modmail = Unset
+
+    async def LoadConfig(self) -> dict | None:
+        if not self.guild:
+            return None
+        cached = Configs.get(self.guild.id)
+        if cached is None or time.monotonic() - cached[0] > ConfigTTL:
+            document = await self.client.config.find_one({"_id": self.guild.id})
+            cached = Configs[self.guild.id] = (time.monotonic(), document)
+        return cached[1]
+
+    async def LoadPremium(self) -> bool:
+        if not self.guild:
+            return False
+        cached = Premiums.get(self.guild.id)
+        if cached is None or time.monotonic() - cached[0] > ConfigTTL:
+            config = await self.Config()
+            premium = "PREMIUM" in ((config or {}).get("Features") or [])
+            if not premium:
+                premium = bool(
+                    await self.client.db["Subscriptions"].find_one(
+                        {"guilds": {"$in": [self.guild.id]}}, {"_id": 1}
+                    )
+                )
+            cached = Premiums[self.guild.id] = (time.monotonic(), premium)
+        return cached[1]
+
+    async def LoadTicket(self) -> dict | None:
+        if not self.guild:
+            return None
+        return await self.client.db["Tickets"].find_one({"ChannelID": self.channel.id})
+
+    async def LoadModmail(self) -> dict | None:
+        if self.category == "dm":
+            return await Active(self.client, user_id=self.author.id)
+        return await Active(self.client, channel_id=self.channel.id)
+
+    async def Config(self) -> dict | None:
+        if self._config is Unset:
+            self._config = asyncio.ensure_future(self.LoadConfig())
+        return await self._config
+
+    async def Premium(self) -> bool:
+        if self._premium is Unset:
+            self._premium = asyncio.ensure_future(self.LoadPremium())
+        return await self._premium
+
+    async def Staff(self) -> bool:
+        if not self.guild or not isinstance(self.author, discord.Member):
+            return False
+        roles = Roles(await self.Config(), "staffrole")
+        return any(role.id in roles for role in self.author.roles)
+
+    async def Admin(self) -> bool:
+        if not self.guild or not isinstance(self.author, discord.Member):
+            return False
+        roles = Roles(await self.Config(), "adminrole")
+        return any(role.id in roles for role in self.author.roles)
+
+    async def Ticket(self) -> dict | None:
+        """The open ticket this channel belongs to, if it's a ticket channel."""
+        if self._ticket is Unset:
+            self._ticket = asyncio.ensure_future(self.LoadTicket())
+        return await self._ticket
+
+    async def Modmail(self) -> dict | None:
+        """The modmail thread for this channel, or for the author when in DMs."""
+        if self._modmail is Unset:
+            self._modmail = asyncio.ensure_future(self.LoadModmail())
+        return await self._modmail
+
+
+class MessageRouter(commands.Cog):
+    """The only ``on_message`` listener for feature cogs: guards run once and the
+    subscribed handlers share one ``MessageContext``."""
+
+    def __init__(self, client: commands.Bot):
+        self.client = client
+
+    async def Run(self, name: str, handler, ctx: MessageContext):
+        started = time.perf_counter()
+        failed = False
+        try:
+            await handler(ctx)
+        except Exception as e:
+            failed = True
+            logging.warning(f"[Router] {name} failed on message {ctx.message.id}: {e}")
+        finally:
+            telemetry = getattr(self.client, "telemetry", None)
+            if telemetry:
+                telemetry.Record(
+                    name,
+                    "message",
+                    (time.perf_counter() - started) * 1000,
+                    failed=failed,
+                )
+
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message):
+        if message.author is None or message.author.bot or message.channel is None:
+            return
+        ctx = MessageContext(self.client, message)
+        Routed = [
+            self.Run(name, handler, ctx)
+            for name, (handler, categories) in list(Handlers.items())
+            if ctx.category in categories
+        ]
+        if Routed:
+            await asyncio.gather(*Routed)
+
+    @commands.Cog.listener()
+    async def on_config_update(self, guild_id: int, paths: list[str], document: dict):
+        Configs.pop(guild_id, None)
+        Premiums.pop(guild_id, None)
+
+
+async def setup(client: commands.Bot) -> None:
+    await client.add_cog(MessageRouter(client))
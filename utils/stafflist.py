@@ -0,0 +1,62 @@
+import discord
+import hashlib
+from datetime import datetime
+from utils.membercache import ChunkGuild
+
+
+def HighestRank(member: discord.Member, ranks: set):
+    role = max(
+        (role for role in member.roles if role.id in ranks),
+        key=lambda role: role.position,
+        default=None,
+    )
+    return role.id if role else None
+
+
+async def BuildIndex(db, guild: discord.Guild):
+    results = await db["Staff List"].find({"guild_id": guild.id}).to_list(length=None)
+    results = sorted(results, key=lambda x: int(x.get("position", 0)))
+    ranks = [result["rank"] for result in results if result.get("rank")]
+    if not ranks:
+        return {"ranks": [], "highest": {}}
+
+    await ChunkGuild(guild)
+
+    rankset = set(ranks)
+    highest = {}
+    for member in guild.members:
+        rank = HighestRank(member, rankset)
+        if rank:
+            highest[member.id] = rank
+    return {"ranks": ranks, "highest": highest}
+
+
+def RenderStaffList(guild: discord.Guild, index: dict):
+    grouped = {}
+    for member_id, rank in index["highest"].items():
+        grouped.setdefault(rank, []).append(f"<@{member_id}>")
+
+    description = ""
+    for rank in index["ranks"]:
+        role = guild.get_role(rank)
+        members = grouped.get(rank)
+        if role and members:
+            description += (
+                f"### **{role.mention}** ({len(members)})\n\n> "
+                + "\n> ".join(members)
+                + "\n"
+            )
+
+    embed = discord.Embed(
+        title="Staff Team",
+        description=description,
+        color=discord.Color.dark_embed(),
+        timestamp=datetime.now(),
+    )
+    embed.set_thumbnail(url=guild.icon)
+    embed.set_author(name=guild.name, icon_url=guild.icon)
+    embed.set_footer(text="Last Updated")
+    digest = hashlib.sha1(
+        f"{guild.name}{guild.icon}{description}".encode("utf-8")
+    ).hexdigest()
+    return embed, digest
@@ -0,0 +1,124 @@
+import bisect
+import time
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+# Upper bounds (ms) of each latency bucket, the last bucket catches everything above.
+Buckets = [25, 50, 100, 250, 500, 750, 1000, 2500, 5000, 10000, 30000]
+
+
+class CommandStats:
+    __slots__ = ("count", "errors", "total", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.buckets = [0] * (len(Buckets) + 1)
+
+
+class Telemetry:
+    def __init__(self):
+        self.pending: dict[str, CommandStats] = {}
+        self.LastFlush = time.time()
+
+    def Record(self, command: str, kind: str, latency: float, failed: bool = False):
+        key = f"{kind}:{command}"
+        stats = self.pending.get(key)
+        if stats is None:
+            stats = self.pending[key] = CommandStats()
+        latency = max(latency, 0.0)
+        stats.count += 1
+        stats.total += latency
+        stats.buckets[bisect.bisect_left(Buckets, latency)] += 1
+        if failed:
+            stats.errors += 1
+
+    def Drain(self):
+        pending, self.pending = self.pending, {}
+        self.LastFlush = time.time()
+        return pending
+
+    def Merge(self, pending: dict):
+        """Put drained stats back, for a flush that didn't make it to Mongo."""
+        for key, stats in pending.items():
+            current = self.pending.get(key)
+            if current is None:
+                self.pending[key] = stats
+                continue
+            current.count += stats.count
+            current.errors += stats.errors
+            current.total += stats.total
+            for index, hits in enumerate(stats.buckets):
+                current.buckets[index] += hits
+
+    async def Flush(self, collection):
+        pending = self.Drain()
+        if not pending:
+            return 0
+        Keys = list(pending)
+        Operations = []
+        for key in Keys:
+            stats = pending[key]
+            kind, command = key.split(":", 1)
+            increment = {
+                "count": stats.count,
+                "errors": stats.errors,
+                "total": stats.total,
+            }
+            for index, hits in enumerate(stats.buckets):
+                if hits:
+                    increment[f"buckets.{index}"] = hits
+            Operations.append(
+                UpdateOne(
+                    {"_id": key},
+                    {
+                        "$inc": increment,
+                        "$set": {"command": command, "kind": kind},
+                    },
+                    upsert=True,
+                )
+            )
+        try:
+            await collection.bulk_write(Operations, ordered=False)
+        except BulkWriteError as e:
+            # The rest were applied, only keep the ones that failed.
+            Failed = {error["index"] for error in e.details.get("writeErrors", [])}
+            self.Merge({Keys[i]: pending[Keys[i]] for i in Failed})
+            raise
+        except Exception:
+            self.Merge(pending)
+            raise
+        return len(Operations)
+
+
+def Percentile(buckets: dict | list, percentile: float):
+    if isinstance(buckets, dict):
+        counts = [int(buckets.get(str(i), 0)) for i in range(len(Buckets) + 1)]
+    else:
+        counts = list(buckets)
+    total = sum(counts)
+    if not total:
+        return None
+    target = total * percentile / 100
+    seen = 0
+    for index, hits in enumerate(counts):
+        seen += hits
+        if seen >= target:
+            return Buckets[index] if index < len(Buckets) else f">{Buckets[-1]}"
+    return f">{Buckets[-1]}"
+
+
+def Summarise(document: dict):
+    count = document.get("count", 0)
+    buckets = document.get("buckets", {})
+    return {
+        "command": document.get("command"),
+        "kind": document.get("kind"),
+        "count": count,
+        "errors": document.get("errors", 0),
+        "average": round(document.get("total", 0) / count, 1) if count else None,
+        "p50": Percentile(buckets, 50),
+        "p95": Percentile(buckets, 95),
+        "p99": Percentile(buckets, 99),
+    }
@@ -0,0 +1,156 @@
+import asyncio
+import gzip
+import io
+import logging
+import os
+import tempfile
+import discord
+from bson import Binary
+from discord.ext import commands
+from utils.http import HTTP
+from utils.lazy import Lazy
+from utils.r2 import (
+    PresignedURL,
+    PrivateKey,
+    TranscriptPrefix as Prefix,
+    UploadPrivate,
+)
+
+chat_exporter = Lazy("chat_exporter")
+
+# Compressed transcripts up to this many bytes are kept in Mongo, bigger ones go to R2.
+InlineLimit = int(os.getenv("TRANSCRIPT_INLINE", 256 * 1024))
+# When R2 is unavailable bigger ones are still kept inline up to this size, well under
+# Mongo's 16MB document limit. Past it the transcript is dropped.
+InlineMax = int(os.getenv("TRANSCRIPT_INLINE_MAX", 8 * 1024 * 1024))
+# Seconds a shared transcript link stays valid.
+LinkExpiry = int(os.getenv("TRANSCRIPT_LINK_EXPIRY", 3600))
+# Transcripts spill from memory to a temp file past this size while being written.
+SpoolSize = 1024 * 1024
+# Also render an HTML transcript with chat_exporter, after the modmail is closed.
+RenderHTML = os.getenv("TRANSCRIPT_HTML", "false").lower() == "true"
+
+
+def Line(message: discord.Message) -> str:
+    text = message.content
+    author = message.author.name
+    if not text and message.embeds:
+        embed = message.embeds[0]
+        if embed.title:
+            author = embed.title
+
+        if embed.description:
+            text = embed.description.strip("`")
+        else:
+            text = "No content"
+    time = message.created_at.strftime("%d/%m/%Y %H:%M:%S")
+    return f"{time} | @{author}: {text}\n"
+
+
+class TranscriptWriter:
+    """Gzips transcript lines as they're written, spooling to disk once large."""
+
+    def __init__(self):
+        self.file = tempfile.SpooledTemporaryFile(max_size=SpoolSize)
+        self.archive = gzip.GzipFile(fileobj=self.file, mode="wb")
+        self.lines = 0
+        self.size = 0
+
+    def Write(self, line: str):
+        self.archive.write(line.encode("utf-8"))
+        self.lines += 1
+
+    def Finish(self) -> int:
+        """Closes the gzip stream, rewinds and returns the compressed size."""
+        self.archive.close()
+        self.size = self.file.tell()
+        self.file.seek(0)
+        return self.size
+
+    def close(self):
+        self.archive.close()
+        self.file.close()
+
+
+async def Write(channel: discord.abc.Messageable, messages: list = None):
+    """Stream ``channel``'s history into a ``TranscriptWriter``.
+
+    ``messages`` collects the messages too, for the HTML render."""
+    writer = TranscriptWriter()
+    async for message in channel.history(limit=None, oldest_first=True):
+        writer.Write(Line(message))
+        if messages is not None:
+            messages.append(message)
+    writer.Finish()
+    return writer
+
+
+async def Store(writer: TranscriptWriter, document_id) -> dict:
+    """Fields for the transcript document: the gzip inline when small, else a
+    private R2 key that's only shared through presigned urls."""
+    if writer.size > InlineLimit:
+        key = PrivateKey(Prefix, "transcript.txt.gz")
+        try:
+            if await UploadPrivate(writer.file, key, "application/gzip"):
+                return {"transcript_key": key, "lines": writer.lines}
+        except Exception as e:
+            logging.warning(f"[Transcripts] Upload for {document_id} failed: {e}")
+        if writer.size > InlineMax:
+            logging.warning(
+                f"[Transcripts] {document_id} is {writer.size} bytes compressed, too large to keep inline"
+            )
+            return {"lines": writer.lines}
+        writer.file.seek(0)
+    return {"text_gz": Binary(writer.file.read()), "lines": writer.lines}
+
+
+async def Read(document: dict) -> bytes | None:
+    """The plain text transcript for a Transcripts document, whichever way it's stored."""
+    if isinstance(document.get("text"), str):
+        return document["text"].encode()
+    if document.get("text_gz"):
+        return await asyncio.to_thread(gzip.decompress, bytes(document["text_gz"]))
+    url = document.get("transcript_url")
+    if document.get("transcript_key"):
+        url = await PresignedURL(document["transcript_key"], LinkExpiry)
+    if url:
+        response = await HTTP.get(url)
+        if not response.ok:
+            return None
+        return await asyncio.to_thread(gzip.decompress, await response.read())
+    return None
+
+
+async def Link(document: dict) -> str | None:
+    """A temporary link to the HTML render, or else the stored text transcript."""
+    for key, legacy in (("html_key", "html_url"), ("transcript_key", "transcript_url")):
+        if document.get(key):
+            return await PresignedURL(document[key], LinkExpiry) or None
+        if document.get(legacy):
+            return document[legacy]
+    return None
+
+
+async def Render(
+    client: commands.Bot,
+    document_id,
+    channel: discord.abc.Messageable,
+    messages: list,
+    guild: discord.Guild,
+):
+    """Render an HTML transcript from already fetched messages and attach its key."""
+    try:
+        html = await chat_exporter.raw_export(
+            channel, messages, guild=guild, bot=client
+        )
+        if not html:
+            return
+        key = PrivateKey(Prefix, "transcript.html")
+        if await UploadPrivate(
+            io.BytesIO(html.encode("utf-8")), key, "text/html"
+        ):
+            await client.db["Transcripts"].update_one(
+                {"_id": document_id}, {"$set": {"html_key": key}}
+            )
+    except Exception as e:
+        logging.warning(f"[Transcripts] HTML render for {document_id} failed: {e}")
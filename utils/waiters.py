@@ -0,0 +1,115 @@
+import asyncio
+import discord
+from discord.ext import commands
+
+
+class Waiters(commands.Cog):
+    def __init__(self, client: commands.Bot):
+        self.client = client
+        self.messages = {}  # {(channel_id, author_id, reply_to_id | None): [(future, check)]}
+        self.reactions = {}  # {(message_id, user_id): [(future, check)]}
+        client.waiters = self
+
+    def cog_unload(self):
+        for index in (self.messages, self.reactions):
+            for pending in index.values():
+                for future, _ in pending:
+                    if not future.done():
+                        future.cancel()
+            index.clear()
+        if getattr(self.client, "waiters", None) is self:
+            del self.client.waiters
+
+    async def Wait(self, index: dict, key: tuple, check=None, timeout: float = None):
+        future = self.client.loop.create_future()
+        entry = (future, check)
+        index.setdefault(key, []).append(entry)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            pending = index.get(key)
+            if pending is not None:
+                if entry in pending:
+                    pending.remove(entry)
+                if not pending:
+                    index.pop(key, None)
+
+    def Resolve(self, index: dict, key: tuple, *args):
+        pending = index.get(key)
+        if not pending:
+            return
+        result = args[0] if len(args) == 1 else args
+        for future, check in list(pending):
+            if future.done():
+                continue
+            try:
+                if check is not None and not check(*args):
+                    continue
+            except Exception as e:
+                future.set_exception(e)
+                continue
+            future.set_result(result)
+
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message):
+        if not self.messages:
+            return
+        key = (message.channel.id, message.author.id)
+        if message.reference and message.reference.message_id:
+            self.Resolve(self.messages, key + (message.reference.message_id,), message)
+        self.Resolve(self.messages, key + (None,), message)
+
+    @commands.Cog.listener()
+    async def on_reaction_add(self, reaction: discord.Reaction, user: discord.User):
+        if not self.reactions:
+            return
+        self.Resolve(self.reactions, (reaction.message.id, user.id), reaction, user)
+
+
+async def WaitForReply(
+    client: commands.Bot,
+    channel_id: int,
+    author_id: int,
+    reply_to: int = None,
+    check=None,
+    timeout: float = None,
+) -> discord.Message:
+    waiters: Waiters = getattr(client, "waiters", None)
+    if waiters is None:
+
+        def Fallback(msg: discord.Message):
+            if msg.channel.id != channel_id or msg.author.id != author_id:
+                return False
+            if reply_to and not (
+                msg.reference and msg.reference.message_id == reply_to
+            ):
+                return False
+            return check is None or check(msg)
+
+        return await client.wait_for("message", check=Fallback, timeout=timeout)
+    return await waiters.Wait(
+        waiters.messages, (channel_id, author_id, reply_to), check, timeout
+    )
+
+
+async def WaitForReaction(
+    client: commands.Bot,
+    message_id: int,
+    user_id: int,
+    check=None,
+    timeout: float = None,
+) -> tuple[discord.Reaction, discord.User]:
+    waiters: Waiters = getattr(client, "waiters", None)
+    if waiters is None:
+
+        def Fallback(reaction: discord.Reaction, user: discord.User):
+            if reaction.message.id != message_id or user.id != user_id:
+                return False
+            return check is None or check(reaction, user)
+
+        return await client.wait_for("reaction_add", check=Fallback, timeout=timeout)
+    return await waiters.Wait(waiters.reactions, (message_id, user_id), check, timeout)
+
+
+async def setup(client: commands.Bot) -> None:
+    await client.add_cog(Waiters(client))